@@ -1,39 +1,72 @@
-"""MCP Memory Bank - Structured documentation system for AI assistants."""
+"""MCP Memory Bank - Structured documentation system for AI assistants.
 
-# Core infrastructure (Phase 1)
-from cortex.analysis.insight_engine import InsightEngine
+The public classes below are imported on first access, so importing a single
+submodule (as the server does at startup) does not load every manager.
+"""
 
-# Analysis (Phase 5.1)
-from cortex.analysis.pattern_analyzer import PatternAnalyzer
-from cortex.core.file_system import FileSystemManager
-from cortex.core.metadata_index import MetadataIndex
+import importlib
+from typing import TYPE_CHECKING
 
-# Linking (Phase 2)
-from cortex.linking.link_parser import LinkParser
-from cortex.linking.transclusion_engine import TransclusionEngine
+if TYPE_CHECKING:
+    from cortex.analysis.insight_engine import InsightEngine
+    from cortex.analysis.pattern_analyzer import PatternAnalyzer
+    from cortex.core.file_system import FileSystemManager
+    from cortex.core.metadata_index import MetadataIndex
+    from cortex.linking.link_parser import LinkParser
+    from cortex.linking.transclusion_engine import TransclusionEngine
+    from cortex.managers.initialization import get_managers
+    from cortex.optimization.context_optimizer import ContextOptimizer
+    from cortex.optimization.rules_manager import RulesManager
+    from cortex.refactoring.refactoring_engine import RefactoringEngine
+    from cortex.refactoring.refactoring_executor import RefactoringExecutor
+    from cortex.rules.synapse_manager import SynapseManager
+    from cortex.structure.structure_manager import StructureManager
+    from cortex.validation.quality_metrics import QualityMetrics
+    from cortex.validation.schema_validator import SchemaValidator
 
-# Managers
-from cortex.managers.initialization import get_managers
+__version__ = "0.2.0"
 
-# Optimization (Phase 4)
-from cortex.optimization.context_optimizer import ContextOptimizer
-from cortex.optimization.rules_manager import RulesManager
+# Public name -> defining module, imported on first attribute access
+_EXPORTS: dict[str, str] = {
+    # Analysis (Phase 5.1)
+    "InsightEngine": "cortex.analysis.insight_engine",
+    "PatternAnalyzer": "cortex.analysis.pattern_analyzer",
+    # Core infrastructure (Phase 1)
+    "FileSystemManager": "cortex.core.file_system",
+    "MetadataIndex": "cortex.core.metadata_index",
+    # Linking (Phase 2)
+    "LinkParser": "cortex.linking.link_parser",
+    "TransclusionEngine": "cortex.linking.transclusion_engine",
+    # Managers
+    "get_managers": "cortex.managers.initialization",
+    # Optimization (Phase 4)
+    "ContextOptimizer": "cortex.optimization.context_optimizer",
+    "RulesManager": "cortex.optimization.rules_manager",
+    # Refactoring (Phase 5.2-5.4)
+    "RefactoringEngine": "cortex.refactoring.refactoring_engine",
+    "RefactoringExecutor": "cortex.refactoring.refactoring_executor",
+    # Rules (Phase 6)
+    "SynapseManager": "cortex.rules.synapse_manager",
+    # Structure (Phase 8)
+    "StructureManager": "cortex.structure.structure_manager",
+    # Validation (Phase 3)
+    "QualityMetrics": "cortex.validation.quality_metrics",
+    "SchemaValidator": "cortex.validation.schema_validator",
+}
 
-# Refactoring (Phase 5.2-5.4)
-from cortex.refactoring.refactoring_engine import RefactoringEngine
-from cortex.refactoring.refactoring_executor import RefactoringExecutor
 
-# Rules (Phase 6)
-from cortex.rules.synapse_manager import SynapseManager
+def __getattr__(name: str) -> object:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
 
-# Structure (Phase 8)
-from cortex.structure.structure_manager import StructureManager
-from cortex.validation.quality_metrics import QualityMetrics
 
-# Validation (Phase 3)
-from cortex.validation.schema_validator import SchemaValidator
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_EXPORTS])
 
-__version__ = "0.2.0"
 
 __all__ = [
     # Analysis
@@ -0,0 +1,188 @@
+"""
+Chain Analysis - Dependency depth and chain extraction on a condensed graph.
+
+This module answers depth and longest-chain questions for a dependency graph
+in polynomial time. The graph is condensed into strongly connected components
+first, so every query is a longest-path DP over a DAG instead of an
+enumeration of simple paths. Only the top-k chains are ever materialized.
+"""
+
+import heapq
+
+from cortex.analysis.models import DependencyChainResult
+from cortex.core.graph_index import IncrementalGraphIndex
+
+MIN_LINEAR_CHAIN_LENGTH = 3
+DEFAULT_CHAIN_LIMIT = 20
+
+
+def build_chain_index(
+    graph: dict[str, dict[str, list[str]]],
+) -> IncrementalGraphIndex:
+    """Build a graph index from an analysis graph dictionary.
+
+    Args:
+        graph: Mapping of file name to its dependencies and dependents
+
+    Returns:
+        Index with components of the dependency edges
+    """
+    edges = [
+        (file_name, dep)
+        for file_name, data in graph.items()
+        for dep in data.get("dependencies", [])
+    ]
+    return IncrementalGraphIndex.build(graph.keys(), edges)
+
+
+def calculate_dependency_depths(
+    graph: dict[str, dict[str, list[str]]],
+    index: IncrementalGraphIndex | None = None,
+) -> tuple[dict[str, int], int]:
+    """Calculate the maximum dependency depth of every file.
+
+    A file without dependencies has depth 0. Files in a cycle share the
+    depth of their component, counting each member of the cycle once.
+
+    Args:
+        graph: Dependency graph
+        index: Prebuilt index for the same graph, built when omitted
+
+    Returns:
+        Tuple of (depth_map, max_depth)
+    """
+    index = index or build_chain_index(graph)
+    components = index.components()
+    position = _component_positions(components)
+
+    comp_depth: list[int] = []
+    for members in components:
+        below = [
+            comp_depth[position[dep]]
+            for member in members
+            for dep in index.dependencies(member)
+            if position[dep] != position[member]
+        ]
+        comp_depth.append(len(members) - 1 + (1 + max(below) if below else 0))
+
+    depth_map = {
+        node: comp_depth[comp_position] for node, comp_position in position.items()
+    }
+    return depth_map, max(comp_depth, default=0)
+
+
+def find_dependency_chains(
+    graph: dict[str, dict[str, list[str]]],
+    max_chain_length: int = 10,
+    limit: int | None = DEFAULT_CHAIN_LIMIT,
+    index: IncrementalGraphIndex | None = None,
+) -> list[DependencyChainResult]:
+    """Find the longest dependency chains, longest first.
+
+    Linear chains are maximal paths through the condensed graph, truncated
+    to ``max_chain_length``. Circular chains are one shortest cycle per
+    strongly connected component, closed by repeating the first file.
+
+    Args:
+        graph: Dependency graph
+        max_chain_length: Maximum number of files reported per chain
+        limit: Maximum number of chains to return, or None for all
+        index: Prebuilt index for the same graph, built when omitted
+
+    Returns:
+        Chains sorted by length in descending order
+    """
+    index = index or build_chain_index(graph)
+    chain_len, best_next = _longest_chains(index)
+
+    continued = set(best_next.values())
+    starts = [
+        node
+        for node in sorted(chain_len)
+        if chain_len[node] >= MIN_LINEAR_CHAIN_LENGTH and node not in continued
+    ]
+
+    candidates: list[tuple[int, str | None, list[str] | None]] = [
+        (min(chain_len[node], max_chain_length), node, None) for node in starts
+    ]
+    candidates.extend(
+        (len(cycle), None, cycle)
+        for cycle in index.cycles()
+        if len(cycle) <= max_chain_length
+    )
+
+    if limit is None:
+        selected = sorted(candidates, key=lambda item: item[0], reverse=True)
+    else:
+        selected = heapq.nlargest(limit, candidates, key=lambda item: item[0])
+
+    chains: list[DependencyChainResult] = []
+    for length, start, cycle in selected:
+        if cycle is not None:
+            chains.append(
+                DependencyChainResult(chain=cycle, length=length, is_linear=False)
+            )
+        elif start is not None:
+            chain = _expand_chain(start, best_next, length)
+            chains.append(
+                DependencyChainResult(chain=chain, length=length, is_linear=True)
+            )
+    return chains
+
+
+def _component_positions(components: list[list[str]]) -> dict[str, int]:
+    """Map each node to the position of its component in topological order."""
+    return {
+        node: comp_position
+        for comp_position, members in enumerate(components)
+        for node in members
+    }
+
+
+def _longest_chains(
+    index: IncrementalGraphIndex,
+) -> tuple[dict[str, int], dict[str, str]]:
+    """Compute the longest acyclic chain starting at every node.
+
+    Edges inside a component are skipped so every chain is a simple path.
+    Ties are broken by file name to keep results deterministic.
+
+    Args:
+        index: Graph index
+
+    Returns:
+        Tuple of (chain length per node, next node on the longest chain)
+    """
+    components = index.components()
+    position = _component_positions(components)
+    chain_len: dict[str, int] = {}
+    best_next: dict[str, str] = {}
+
+    for members in components:
+        for node in members:
+            best: tuple[int, str] | None = None
+            for dep in index.dependencies(node):
+                if position[dep] == position[node]:
+                    continue
+                key = (chain_len[dep], dep)
+                if (
+                    best is None
+                    or key[0] > best[0]
+                    or (key[0] == best[0] and dep < best[1])
+                ):
+                    best = key
+            if best is None:
+                chain_len[node] = 1
+            else:
+                chain_len[node] = best[0] + 1
+                best_next[node] = best[1]
+
+    return chain_len, best_next
+
+
+def _expand_chain(start: str, best_next: dict[str, str], length: int) -> list[str]:
+    """Follow next pointers from a start node for at most ``length`` files."""
+    chain = [start]
+    while len(chain) < length and chain[-1] in best_next:
+        chain.append(best_next[chain[-1]])
+    return chain
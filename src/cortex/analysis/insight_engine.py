@@ -4,17 +4,35 @@ This module combines pattern and structure analysis to generate human-readable
 insights with specific recommendations for improvement.
 """
 
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
 from datetime import UTC, datetime
 
 from .insight_dep_quality import DependencyQualityInsights
 from .insight_formatter import InsightFormatter
 from .insight_summary import InsightSummaryGenerator
-from .insight_types import InsightDict, InsightsResultDict, SummaryDict
+from .insight_types import (
+    InsightCacheStats,
+    InsightDict,
+    InsightsResultDict,
+    SummaryDict,
+)
 from .insight_usage_org import UsageOrganizationInsights
 from .models import InsightModel, InsightStatistics
 from .pattern_analyzer import PatternAnalyzer
 from .structure_analyzer import StructureAnalyzer
 
+# Input each category is derived from: the memory bank corpus (files and
+# links) or the access log. A category is regenerated only when its input
+# version changes.
+CATEGORY_SOURCES: dict[str, str] = {
+    "usage": "access",
+    "organization": "corpus",
+    "redundancy": "corpus",
+    "dependencies": "corpus",
+    "quality": "corpus",
+}
+
 
 class InsightEngine:
     """
@@ -26,6 +44,7 @@ class InsightEngine:
     - Provide evidence for each insight
     - Estimate token savings potential
     - Suggest specific actions
+    - Generate categories concurrently and reuse unchanged ones
     """
 
     def __init__(
@@ -50,6 +69,7 @@ class InsightEngine:
             structure_analyzer
         )
         self.summary_generator: InsightSummaryGenerator = InsightSummaryGenerator()
+        self._category_cache: dict[str, tuple[Hashable, list[InsightDict]]] = {}
 
     async def generate_insights(
         self,
@@ -70,14 +90,26 @@ class InsightEngine:
         """
         selected_categories = self._get_selected_categories(categories)
 
-        # Generate insights by category
-        insights = await self._generate_insights_by_category(selected_categories)
+        # Generate insights by category over one shared structure snapshot
+        async with self.structure_analyzer.analysis_session() as session:
+            versions: dict[str, Hashable] = {
+                "corpus": session.corpus_version,
+                "access": (
+                    self.pattern_analyzer.access_watermark,
+                    datetime.now(UTC).date(),
+                ),
+            }
+            insights, cache_stats = await self._generate_insights_by_category(
+                selected_categories, versions
+            )
 
         # Filter, sort, and build result
         filtered_insights = self._filter_and_sort_insights(insights, min_impact_score)
         statistics = self._calculate_insight_statistics(filtered_insights)
 
-        return self._build_insights_result(filtered_insights, statistics)
+        result = self._build_insights_result(filtered_insights, statistics)
+        result.cache = cache_stats
+        return result
 
     def _get_selected_categories(self, categories: list[str] | None) -> list[str]:
         """Get selected categories or default to all.
@@ -88,49 +120,62 @@ class InsightEngine:
         Returns:
             List of selected categories
         """
-        all_categories = [
-            "usage",
-            "organization",
-            "redundancy",
-            "dependencies",
-            "quality",
-        ]
-        return categories if categories else all_categories
+        return categories if categories else list(CATEGORY_SOURCES)
 
     async def _generate_insights_by_category(
-        self, selected_categories: list[str]
-    ) -> list[InsightDict]:
+        self, selected_categories: list[str], versions: dict[str, Hashable]
+    ) -> tuple[list[InsightDict], InsightCacheStats]:
         """Generate insights for selected categories.
 
+        Categories whose input version is unchanged since the last call are
+        served from cache; the rest are generated concurrently.
+
         Args:
             selected_categories: List of categories to generate insights for
+            versions: Current version of each input ("corpus", "access")
 
         Returns:
-            List of generated insights
+            Tuple of (generated insights, cache statistics)
         """
-        insights: list[InsightDict] = []
-
-        if "usage" in selected_categories:
-            usage_insights = await self.usage_org.generate_usage_insights()
-            insights.extend(usage_insights)
-
-        if "organization" in selected_categories:
-            org_insights = await self.usage_org.generate_organization_insights()
-            insights.extend(org_insights)
-
-        if "redundancy" in selected_categories:
-            redundancy_insights = await self.usage_org.generate_redundancy_insights()
-            insights.extend(redundancy_insights)
+        generators = self._category_generators()
+        keys = {
+            category: versions[source]
+            for category, source in CATEGORY_SOURCES.items()
+            if category in selected_categories
+        }
+        stale = [
+            category
+            for category, key in keys.items()
+            if category not in self._category_cache
+            or self._category_cache[category][0] != key
+        ]
 
-        if "dependencies" in selected_categories:
-            dep_insights = await self.dep_quality.generate_dependency_insights()
-            insights.extend(dep_insights)
+        results = await asyncio.gather(*(generators[c]() for c in stale))
+        for category, category_insights in zip(stale, results, strict=True):
+            self._category_cache[category] = (keys[category], category_insights)
 
-        if "quality" in selected_categories:
-            quality_insights = await self.dep_quality.generate_quality_insights()
-            insights.extend(quality_insights)
+        insights = [
+            insight
+            for category in keys
+            for insight in self._category_cache[category][1]
+        ]
+        cache_stats = InsightCacheStats(
+            recomputed_categories=stale,
+            cached_categories=[c for c in keys if c not in stale],
+        )
+        return insights, cache_stats
 
-        return insights
+    def _category_generators(
+        self,
+    ) -> dict[str, Callable[[], Awaitable[list[InsightDict]]]]:
+        """Map each category to its insight generator."""
+        return {
+            "usage": self.usage_org.generate_usage_insights,
+            "organization": self.usage_org.generate_organization_insights,
+            "redundancy": self.usage_org.generate_redundancy_insights,
+            "dependencies": self.dep_quality.generate_dependency_insights,
+            "quality": self.dep_quality.generate_quality_insights,
+        }
 
     def _filter_and_sort_insights(
         self, insights: list[InsightDict], min_impact_score: float
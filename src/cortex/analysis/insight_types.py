@@ -48,6 +48,19 @@ class SummaryDict(BaseModel):
     )
 
 
+class InsightCacheStats(BaseModel):
+    """Which insight categories were recomputed or served from cache."""
+
+    model_config = ConfigDict(extra="forbid", validate_assignment=True)
+
+    recomputed_categories: list[str] = Field(
+        default_factory=list, description="Categories generated in this call"
+    )
+    cached_categories: list[str] = Field(
+        default_factory=list, description="Categories reused from a previous call"
+    )
+
+
 class InsightsResultDict(BaseModel):
     """Type definition for generate_insights return value."""
 
@@ -66,3 +79,6 @@ class InsightsResultDict(BaseModel):
         description="List of insights",
     )
     summary: SummaryDict = Field(description="Summary information")
+    cache: InsightCacheStats | None = Field(
+        default=None, description="Category cache statistics"
+    )
@@ -6,6 +6,8 @@ detects unused content, and analyzes task-based access patterns.
 """
 
 import json
+import sqlite3
+import uuid
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 
@@ -46,6 +48,7 @@ from cortex.analysis.pattern_types import (
 from cortex.core.async_file_utils import open_async_text_file
 from cortex.core.exceptions import MemoryBankError
 from cortex.core.models import JsonValue
+from cortex.core.state_store import StateRow, StateStore
 
 # Re-export types for convenience
 __all__ = [
@@ -61,6 +64,12 @@ __all__ = [
     "normalize_access_log",
 ]
 
+# State store record kinds
+_ACCESS_RECORDS = "access_records"
+_FILE_STATS = "access_file_stats"
+_CO_ACCESS = "access_co_access"
+_TASK_PATTERNS = "access_task_patterns"
+
 
 class PatternAnalyzer:
     """
@@ -74,53 +83,156 @@ class PatternAnalyzer:
     - Track temporal access patterns (daily/weekly trends)
     """
 
-    def __init__(self, project_root: Path):
+    def __init__(self, project_root: Path, state_store: StateStore | None = None):
         """
         Initialize pattern analyzer.
 
         Args:
             project_root: Root directory of the project
+            state_store: Shared state store of the project (opened from the
+                project's .cortex directory if omitted)
         """
         self.project_root: Path = Path(project_root)
+        # Access data lives in the state store; access-log.json is a legacy
+        # import source and the target of export_access_log()
         self.access_log_path: Path = self.project_root / ".cortex" / "access-log.json"
+        self.state_store: StateStore = state_store or StateStore.in_directory(
+            self.project_root / ".cortex"
+        )
         self.access_data: AccessLog = self._load_access_log()
+        self.access_revision: int = 0
+
+    @property
+    def access_watermark(self) -> tuple[int, int]:
+        """
+        Watermark of the access log for cache invalidation.
+
+        Changes whenever an access is recorded or old data is cleaned up.
+
+        Returns:
+            Tuple of (in-process revision, number of access records)
+        """
+        return self.access_revision, len(self.access_data.accesses)
 
     def _load_access_log(self) -> AccessLog:
         """
-        Load access log from disk.
+        Import the legacy access log once, then load from the store.
 
         Note:
             This method uses synchronous I/O during initialization for simplicity.
             For performance-critical paths, consider using async alternatives.
         """
-        if not self.access_log_path.exists():
-            return create_default_access_log()
-
         try:
-            with open(self.access_log_path, encoding="utf-8") as f:
-                data_raw: JsonValue = json.load(f)
-                return normalize_access_log(data_raw)
+            _ = self.state_store.import_legacy(
+                self.access_log_path, _read_legacy_access_rows
+            )
         except (OSError, json.JSONDecodeError):
             # If corrupted, start fresh but keep backup
             if self.access_log_path.exists():
                 backup_path = self.access_log_path.with_suffix(".json.backup")
                 _ = self.access_log_path.rename(backup_path)
 
-            return create_default_access_log()
+        store = self.state_store
+        access_log = create_default_access_log()
+        access_log.accesses = [
+            AccessRecord.model_validate_json(data)
+            for _, _, data in store.rows(_ACCESS_RECORDS)
+        ]
+        access_log.file_stats = {
+            key: FileStatsEntry.model_validate_json(data)
+            for key, _, data in store.rows(_FILE_STATS)
+        }
+        access_log.co_access_patterns = {
+            key: int(data) for key, _, data in store.rows(_CO_ACCESS)
+        }
+        access_log.task_patterns = {
+            key: TaskPatternEntry.model_validate_json(data)
+            for key, _, data in store.rows(_TASK_PATTERNS)
+        }
+        return access_log
 
-    async def _save_access_log(self):
-        """Save access log to disk."""
+    async def _save_access(
+        self,
+        access_record: AccessRecord,
+        context_files: list[str],
+    ) -> None:
+        """Upsert the rows touched by one access event."""
+        file_path = access_record.file
+        data = self.access_data
+        co_access_keys = {
+            "|".join(sorted([file_path, other_file]))
+            for other_file in context_files
+            if other_file != file_path
+        }
+        writes: list[tuple[str, list[StateRow]]] = [
+            (
+                _ACCESS_RECORDS,
+                [
+                    (
+                        uuid.uuid4().hex,
+                        access_record.timestamp,
+                        access_record.model_dump_json(),
+                    )
+                ],
+            ),
+            (
+                _FILE_STATS,
+                [(file_path, "", data.file_stats[file_path].model_dump_json())],
+            ),
+            (
+                _CO_ACCESS,
+                [
+                    (key, "", str(data.co_access_patterns[key]))
+                    for key in sorted(co_access_keys)
+                ],
+            ),
+        ]
+        task_id = access_record.task_id
+        if task_id:
+            task_entry = data.task_patterns[task_id]
+            writes.append(
+                (
+                    _TASK_PATTERNS,
+                    [(task_id, task_entry.timestamp, task_entry.model_dump_json())],
+                )
+            )
         try:
-            # Ensure parent directory exists
-            self.access_log_path.parent.mkdir(parents=True, exist_ok=True)
-            async with open_async_text_file(
-                self.access_log_path, "w", "utf-8"
-            ) as file_handle:
+            await self.state_store.run(self._write_rows, writes)
+        except sqlite3.Error as e:
+            raise MemoryBankError(f"Failed to save access log: {e}") from e
+
+    def _write_rows(self, writes: list[tuple[str, list[StateRow]]]) -> None:
+        """Upsert rows of several record kinds in one transaction."""
+        with self.state_store.transaction():
+            for kind, rows in writes:
+                _ = self.state_store.upsert_many(kind, rows)
+
+    def _delete_rows_before(self, cutoff_str: str, removed_tasks: list[str]) -> None:
+        """Delete aged access records and task patterns in one transaction."""
+        with self.state_store.transaction():
+            _ = self.state_store.delete_before(_ACCESS_RECORDS, cutoff_str)
+            _ = self.state_store.delete(_TASK_PATTERNS, removed_tasks)
+
+    async def export_access_log(self, export_path: Path | None = None) -> Path:
+        """
+        Export the access log as JSON.
+
+        Args:
+            export_path: Target file, defaults to the legacy access-log.json
+
+        Returns:
+            Path of the written file
+        """
+        target = export_path or self.access_log_path
+        try:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            async with open_async_text_file(target, "w", "utf-8") as file_handle:
                 _ = await file_handle.write(
                     json.dumps(self.access_data.model_dump(mode="json"), indent=2)
                 )
         except OSError as e:
-            raise MemoryBankError(f"Failed to save access log: {e}") from e
+            raise MemoryBankError(f"Failed to export access log: {e}") from e
+        return target
 
     def _update_file_stats(self, file_path: str, timestamp: str, task_id: str | None):
         """Update file statistics for an access event."""
@@ -204,8 +316,9 @@ class PatternAnalyzer:
             self._update_co_access_patterns(file_path, context_files)
         if task_id:
             self._update_task_patterns(file_path, task_id, task_description, timestamp)
+        self.access_revision += 1
 
-        await self._save_access_log()
+        await self._save_access(access_record, context_files or [])
 
     async def get_access_frequency(
         self, time_range_days: int = 30, min_access_count: int = 1
@@ -333,12 +446,48 @@ class PatternAnalyzer:
         filtered_task_patterns = self._filter_task_patterns_by_cutoff(
             self.access_data.task_patterns, cutoff_str
         )
+        removed_tasks = [
+            task_id
+            for task_id in self.access_data.task_patterns
+            if task_id not in filtered_task_patterns
+        ]
         self.access_data.task_patterns = filtered_task_patterns
+        self.access_revision += 1
 
-        await self._save_access_log()
+        try:
+            await self.state_store.run(
+                self._delete_rows_before, cutoff_str, removed_tasks
+            )
+        except sqlite3.Error as e:
+            raise MemoryBankError(f"Failed to save access log: {e}") from e
 
         return {
             "removed_accesses": removed_count,
             "remaining_accesses": len(filtered_accesses),
             "remaining_tasks": len(filtered_task_patterns),
         }
+
+
+def _read_legacy_access_rows(source: Path) -> dict[str, list[StateRow]]:
+    """Parse a legacy access-log.json file into state store rows."""
+    with open(source, encoding="utf-8") as f:
+        data_raw: JsonValue = json.load(f)
+    access_log = normalize_access_log(data_raw)
+    return {
+        _ACCESS_RECORDS: [
+            (uuid.uuid4().hex, record.timestamp, record.model_dump_json())
+            for record in access_log.accesses
+        ],
+        _FILE_STATS: [
+            (file_path, "", stats.model_dump_json())
+            for file_path, stats in access_log.file_stats.items()
+        ],
+        _CO_ACCESS: [
+            (key, "", str(count))
+            for key, count in access_log.co_access_patterns.items()
+        ],
+        _TASK_PATTERNS: [
+            (task_id, entry.timestamp, entry.model_dump_json())
+            for task_id, entry in access_log.task_patterns.items()
+        ],
+    }
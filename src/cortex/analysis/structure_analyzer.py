@@ -5,15 +5,24 @@ This module analyzes the Memory Bank structure to identify organizational issues
 complexity metrics, and anti-patterns.
 """
 
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import cast
 
+from cortex.analysis import chain_analysis
 from cortex.analysis.models import (
     AntiPatternInfo,
     ComplexityAnalysisResult,
     ComplexityAssessment,
     ComplexityHotspot,
     ComplexityMetrics,
+    DependencyChainResult,
+)
+from cortex.analysis.structure_session import (
+    StructureAnalysisSession,
+    get_active_session,
+    open_session,
 )
 from cortex.core.dependency_graph import DependencyGraph
 from cortex.core.exceptions import MemoryBankError
@@ -61,6 +70,36 @@ class StructureAnalyzer:
         self.file_system: FileSystemManager = file_system
         self.metadata_index: MetadataIndex = metadata_index
 
+    @asynccontextmanager
+    async def analysis_session(self) -> AsyncGenerator[StructureAnalysisSession]:
+        """
+        Share one snapshot of files and dependencies across several reports.
+
+        Reports requested inside the block reuse the same file scan and graph
+        build, and each report is computed at most once. Nested blocks join
+        the session that is already open.
+
+        Yields:
+            The active analysis session
+        """
+        async with open_session(
+            self, self._memory_bank_dir(), self.dependency_graph
+        ) as session:
+            yield session
+
+    def _memory_bank_dir(self) -> Path:
+        """Get the memory bank directory for this project."""
+        return get_cortex_path(self.project_root, CortexResourceType.MEMORY_BANK)
+
+    def _current_session(self) -> StructureAnalysisSession:
+        """Get the open session, or a one-off snapshot outside a session."""
+        session = get_active_session(self)
+        if session is None:
+            session = StructureAnalysisSession(
+                self, self._memory_bank_dir(), self.dependency_graph
+            )
+        return session
+
     async def analyze_file_organization(self) -> FileOrganizationResult:
         """
         Analyze the overall file organization.
@@ -68,20 +107,25 @@ class StructureAnalyzer:
         Returns:
             File organization analysis result model
         """
-        memory_bank_dir = get_cortex_path(
-            self.project_root, CortexResourceType.MEMORY_BANK
-        )
-
-        if not memory_bank_dir.exists():
-            raise MemoryBankError(f"Memory bank directory not found: {memory_bank_dir}")
+        session = self._current_session()
+        if not session.memory_bank_exists:
+            raise MemoryBankError(
+                f"Memory bank directory not found: {session.memory_bank_dir}"
+            )
 
-        all_files = list(memory_bank_dir.glob("*.md"))
-        file_count = len(all_files)
+        if session.organization is None:
+            session.organization = self._build_organization_result(session)
+        return session.organization
 
+    def _build_organization_result(
+        self, session: StructureAnalysisSession
+    ) -> FileOrganizationResult:
+        """Build the organization report from a session snapshot."""
+        file_count = len(session.file_names)
         if file_count == 0:
             return _build_empty_organization_result()
 
-        file_sizes = self._collect_file_sizes(all_files)
+        file_sizes = session.file_sizes
         stats = _calculate_size_statistics(file_sizes, file_count)
         issues = _identify_size_issues(file_sizes)
 
@@ -89,129 +133,69 @@ class StructureAnalyzer:
             file_count, stats, file_sizes, issues
         )
 
-    def _collect_file_sizes(self, all_files: list[Path]) -> list[FileSizeEntry]:
-        """Collect file size information for all files."""
-
-        def _get_file_size(file_path: Path) -> FileSizeEntry | None:
-            """Get file size info, returning None on error."""
-            try:
-                size = file_path.stat().st_size
-                return FileSizeEntry(
-                    file=file_path.name,
-                    size_bytes=size,
-                    tokens=0,  # Will be populated if needed
-                )
-            except OSError:
-                return None
-
-        file_sizes = [
-            size_info
-            for file_path in all_files
-            if (size_info := _get_file_size(file_path)) is not None
-        ]
-        file_sizes.sort(key=lambda x: x.size_bytes, reverse=True)
-        return file_sizes
-
-    def _detect_oversized_files(self, all_files: list[Path]) -> list[AntiPatternInfo]:
+    def _detect_oversized_files(
+        self, file_sizes: list[FileSizeEntry]
+    ) -> list[AntiPatternInfo]:
         """
         Detect oversized files (>100KB).
 
         Args:
-            all_files: List of file paths to check
+            file_sizes: Size entries of the files to check
 
         Returns:
             List of oversized file anti-patterns
         """
-
-        def _check_oversized(file_path: Path) -> AntiPatternInfo | None:
-            """Check if file is oversized, returning pattern model or None."""
-            try:
-                size = file_path.stat().st_size
-                if size > 100000:  # > 100KB
-                    return AntiPatternInfo(
-                        type="oversized_file",
-                        severity="high",
-                        file=file_path.name,
-                        description=f"File is very large ({round(size / 1024, 2)}KB)",
-                        recommendation="Consider splitting into multiple smaller files",
-                    )
-            except OSError:
-                pass
-            return None
-
         return [
-            pattern
-            for file_path in all_files
-            if (pattern := _check_oversized(file_path)) is not None
+            AntiPatternInfo(
+                type="oversized_file",
+                severity="high",
+                file=entry.file,
+                description=(
+                    f"File is very large ({round(entry.size_bytes / 1024, 2)}KB)"
+                ),
+                recommendation="Consider splitting into multiple smaller files",
+            )
+            for entry in file_sizes
+            if entry.size_bytes > 100000  # > 100KB
         ]
 
-    def _build_dependency_graph(self) -> dict[str, dict[str, list[str]]]:
-        """
-        Build dependency graph from DependencyGraph manager.
-
-        Returns:
-            Dictionary mapping file names to their dependencies and dependents
-        """
-        all_file_names = self.dependency_graph.get_all_files()
-        graph: dict[str, dict[str, list[str]]] = {}
-
-        for file_name in all_file_names:
-            graph[file_name] = {
-                "dependencies": self.dependency_graph.get_dependencies(file_name),
-                "dependents": self.dependency_graph.get_dependents(file_name),
-            }
-
-        return graph
-
     def _detect_orphaned_files(
-        self, all_files: list[Path], graph: dict[str, dict[str, list[str]]]
+        self, file_names: list[str], session: StructureAnalysisSession
     ) -> list[AntiPatternInfo]:
         """
         Detect orphaned files (no dependencies or dependents).
 
         Args:
-            all_files: List of file paths to check
-            graph: Dependency graph
+            file_names: Names of the files to check
+            session: Session holding the dependency graph snapshot
 
         Returns:
             List of orphaned file anti-patterns
         """
-        from cortex.analysis.models import AntiPatternInfo
-
-        patterns: list[AntiPatternInfo] = [
+        return [
             AntiPatternInfo(
                 type="orphaned_file",
                 severity="medium",
-                file=file_path.name,
+                file=file_name,
                 description="File has no dependencies or dependents",
                 recommendation="Link to other files or consider if it's still needed",
             )
-            for file_path in all_files
-            if not (
-                file_path.name in graph
-                and (
-                    graph[file_path.name].get("dependencies")
-                    or graph[file_path.name].get("dependents")
-                )
-            )
+            for file_name in file_names
+            if file_name not in session.graph or file_name in session.isolated_files
         ]
 
-        return patterns
-
     def _detect_excessive_dependencies(
-        self, graph: dict[str, dict[str, list[str]]]
+        self, fan_out: dict[str, int]
     ) -> list[AntiPatternInfo]:
         """
         Detect files with excessive dependencies (>15).
 
         Args:
-            graph: Dependency graph
+            fan_out: Map of file names to dependency counts
 
         Returns:
             List of excessive dependency anti-patterns
         """
-        from cortex.analysis.models import AntiPatternInfo
-
         return [
             AntiPatternInfo(
                 type="excessive_dependencies",
@@ -221,24 +205,22 @@ class StructureAnalyzer:
                 description=f"File depends on {dep_count} other files",
                 recommendation="Consider reducing dependencies or splitting file",
             )
-            for file_name, file_data in graph.items()
-            if (dep_count := len(file_data.get("dependencies", []))) > 15
+            for file_name, dep_count in fan_out.items()
+            if dep_count > 15
         ]
 
     def _detect_excessive_dependents(
-        self, graph: dict[str, dict[str, list[str]]]
+        self, fan_in: dict[str, int]
     ) -> list[AntiPatternInfo]:
         """
         Detect files with excessive dependents (>15).
 
         Args:
-            graph: Dependency graph
+            fan_in: Map of file names to dependent counts
 
         Returns:
             List of excessive dependent anti-patterns
         """
-        from cortex.analysis.models import AntiPatternInfo
-
         return [
             AntiPatternInfo(
                 type="excessive_dependents",
@@ -250,23 +232,23 @@ class StructureAnalyzer:
                     "This is a central file - ensure it's stable and " "well-maintained"
                 ),
             )
-            for file_name, file_data in graph.items()
-            if (dependent_count := len(file_data.get("dependents", []))) > 15
+            for file_name, dependent_count in fan_in.items()
+            if dependent_count > 15
         ]
 
-    def _detect_similar_filenames(self, all_files: list[Path]) -> list[AntiPatternInfo]:
+    def _detect_similar_filenames(
+        self, all_file_names: list[str]
+    ) -> list[AntiPatternInfo]:
         """
         Detect files with similar names (potential duplication).
 
         Args:
-            all_files: List of file paths to check
+            all_file_names: Names of the files to check
 
         Returns:
             List of similar filename anti-patterns
         """
-        from cortex.analysis.models import AntiPatternInfo
-
-        file_names: list[str] = [f.stem for f in all_files]
+        file_names: list[str] = [Path(name).stem for name in all_file_names]
 
         # Optimize: Sort names and use sorted order to reduce comparisons
         # Only check adjacent and nearby names in sorted order, as similar
@@ -332,23 +314,18 @@ class StructureAnalyzer:
         Returns:
             List of detected anti-patterns with details
         """
-        from cortex.analysis.models import AntiPatternInfo
-
-        memory_bank_dir = get_cortex_path(
-            self.project_root, CortexResourceType.MEMORY_BANK
-        )
-        all_files = list(memory_bank_dir.glob("*.md"))
-
-        graph = self._build_dependency_graph()
-
-        anti_patterns: list[AntiPatternInfo] = []
-        anti_patterns.extend(self._detect_oversized_files(all_files))
-        anti_patterns.extend(self._detect_orphaned_files(all_files, graph))
-        anti_patterns.extend(self._detect_excessive_dependencies(graph))
-        anti_patterns.extend(self._detect_excessive_dependents(graph))
-        anti_patterns.extend(self._detect_similar_filenames(all_files))
-
-        return self._sort_patterns_by_severity(anti_patterns)
+        session = self._current_session()
+        if session.anti_patterns is None:
+            anti_patterns: list[AntiPatternInfo] = []
+            anti_patterns.extend(self._detect_oversized_files(session.file_sizes))
+            anti_patterns.extend(
+                self._detect_orphaned_files(session.file_names, session)
+            )
+            anti_patterns.extend(self._detect_excessive_dependencies(session.fan_out))
+            anti_patterns.extend(self._detect_excessive_dependents(session.fan_in))
+            anti_patterns.extend(self._detect_similar_filenames(session.file_names))
+            session.anti_patterns = self._sort_patterns_by_severity(anti_patterns)
+        return list(session.anti_patterns)
 
     async def measure_complexity_metrics(self) -> ComplexityAnalysisResult:
         """
@@ -357,16 +334,26 @@ class StructureAnalyzer:
         Returns:
             ComplexityAnalysisResult model with complexity metrics
         """
-        graph = self._build_complexity_graph()
+        session = self._current_session()
+        if session.complexity is None:
+            session.complexity = self._measure_complexity(session)
+        return session.complexity
+
+    def _measure_complexity(
+        self, session: StructureAnalysisSession
+    ) -> ComplexityAnalysisResult:
+        """Compute complexity metrics from a session snapshot."""
+        graph = session.graph
         if not graph:
             return ComplexityAnalysisResult(status="no_files")
 
-        depth_map, max_depth = self._calculate_dependency_depths(graph)
+        depth_map, max_depth = session.depths
         edge_count, node_count, cyclomatic_complexity, avg_dependencies = (
-            self._calculate_cyclomatic_metrics(graph)
+            self._calculate_cyclomatic_metrics(session)
         )
-        fan_in, fan_out, max_fan_in, max_fan_out, avg_fan_in, avg_fan_out = (
-            self._calculate_fan_metrics(graph)
+        fan_in, fan_out = session.fan_in, session.fan_out
+        max_fan_in, max_fan_out, avg_fan_in, avg_fan_out = self._calculate_fan_metrics(
+            fan_in, fan_out
         )
         hotspots = self._identify_complexity_hotspots(graph, depth_map, fan_in, fan_out)
         metrics = self._build_complexity_metrics(
@@ -424,103 +411,41 @@ class StructureAnalyzer:
             total_nodes=node_count,
         )
 
-    def _build_complexity_graph(self) -> dict[str, dict[str, list[str]]]:
-        """Build graph from dependency graph for complexity analysis.
-
-        Returns:
-            Graph dictionary mapping file names to dependencies and dependents
-        """
-        all_file_names = self.dependency_graph.get_all_files()
-        graph: dict[str, dict[str, list[str]]] = {}
-        for file_name in all_file_names:
-            graph[file_name] = {
-                "dependencies": self.dependency_graph.get_dependencies(file_name),
-                "dependents": self.dependency_graph.get_dependents(file_name),
-            }
-        return graph
-
-    def _calculate_dependency_depths(
-        self, graph: dict[str, dict[str, list[str]]]
-    ) -> tuple[dict[str, int], int]:
-        """Calculate dependency depths for all files.
-
-        Args:
-            graph: Dependency graph
-
-        Returns:
-            Tuple of (depth_map, max_depth)
-        """
-        max_depth = 0
-        depth_map: dict[str, int] = {}
-
-        def calculate_depth(file_name: str, visited: set[str]) -> int:
-            """Calculate maximum dependency depth for a file."""
-            if file_name in depth_map:
-                return depth_map[file_name]
-
-            if file_name in visited:
-                return 0  # Circular dependency
-
-            visited.add(file_name)
-
-            dependencies = graph.get(file_name, {}).get("dependencies", [])
-            if not dependencies:
-                depth = 0
-            else:
-                depth = 1 + max(
-                    calculate_depth(dep, visited.copy()) for dep in dependencies
-                )
-
-            depth_map[file_name] = depth
-            return depth
-
-        for file_name in graph.keys():
-            depth = calculate_depth(file_name, set())
-            max_depth = max(max_depth, depth)
-
-        return depth_map, max_depth
-
     def _calculate_cyclomatic_metrics(
-        self, graph: dict[str, dict[str, list[str]]]
+        self, session: StructureAnalysisSession
     ) -> tuple[int, int, int, float]:
         """Calculate cyclomatic complexity metrics.
 
         Args:
-            graph: Dependency graph
+            session: Session holding the dependency graph snapshot
 
         Returns:
             Tuple of (edge_count, node_count, cyclomatic_complexity, avg_dependencies)
         """
-        edge_count = sum(len(data.get("dependencies", [])) for data in graph.values())
-        node_count = len(graph)
+        edge_count = session.edge_count
+        node_count = len(session.graph)
         cyclomatic_complexity = edge_count - node_count + 1 if node_count > 0 else 0
         avg_dependencies = edge_count / node_count if node_count > 0 else 0
         return edge_count, node_count, cyclomatic_complexity, avg_dependencies
 
     def _calculate_fan_metrics(
-        self, graph: dict[str, dict[str, list[str]]]
-    ) -> tuple[dict[str, int], dict[str, int], int, int, float, float]:
-        """Calculate fan-in and fan-out metrics.
+        self, fan_in: dict[str, int], fan_out: dict[str, int]
+    ) -> tuple[int, int, float, float]:
+        """Calculate fan-in and fan-out aggregates.
 
         Args:
-            graph: Dependency graph
+            fan_in: Map of file names to fan-in counts
+            fan_out: Map of file names to fan-out counts
 
         Returns:
-            Tuple of (fan_in, fan_out, max_fan_in, max_fan_out, avg_fan_in, avg_fan_out)
+            Tuple of (max_fan_in, max_fan_out, avg_fan_in, avg_fan_out)
         """
-        fan_in: dict[str, int] = {}
-        fan_out: dict[str, int] = {}
-
-        for file_name, data in graph.items():
-            fan_out[file_name] = len(data.get("dependencies", []))
-            fan_in[file_name] = len(data.get("dependents", []))
-
         max_fan_in = max(fan_in.values()) if fan_in else 0
         max_fan_out = max(fan_out.values()) if fan_out else 0
         avg_fan_in = sum(fan_in.values()) / len(fan_in) if fan_in else 0
         avg_fan_out = sum(fan_out.values()) / len(fan_out) if fan_out else 0
 
-        return fan_in, fan_out, max_fan_in, max_fan_out, avg_fan_in, avg_fan_out
+        return max_fan_in, max_fan_out, avg_fan_in, avg_fan_out
 
     def _identify_complexity_hotspots(
         self,
@@ -722,90 +647,14 @@ class StructureAnalyzer:
         Returns:
             List of dependency chains
         """
-        graph = self._build_dependency_graph()
-        chains = self._find_all_chains(graph, max_chain_length)
-        unique_chains = self._deduplicate_and_sort_chains(chains)
-        return unique_chains[:20]
-
-    def _find_all_chains(
-        self, graph: dict[str, dict[str, list[str]]], max_chain_length: int
-    ) -> list[ModelDict]:
-        """Find all dependency chains in the graph.
-
-        Args:
-            graph: Dependency graph structure
-            max_chain_length: Maximum chain length to search for
-
-        Returns:
-            List of found chains
-        """
-        chains: list[ModelDict] = []
-
-        def find_chains_from_file(
-            start_file: str, current_path: list[str], visited: set[str]
-        ) -> None:
-            """Recursively find chains from a starting file."""
-            if len(current_path) > max_chain_length:
-                return
-
-            if start_file in visited:
-                if len(current_path) >= 2:
-                    chains.append(_create_circular_chain_dict(current_path, start_file))
-                return
-
-            visited.add(start_file)
-            dependencies = graph.get(start_file, {}).get("dependencies", [])
-
-            if not dependencies:
-                if len(current_path) >= 3:
-                    chains.append(_create_linear_chain_dict(current_path))
-            else:
-                for dep in dependencies:
-                    find_chains_from_file(dep, current_path + [dep], visited.copy())
-
-        for file_name in graph.keys():
-            find_chains_from_file(file_name, [file_name], set())
-
-        return chains
-
-    def _deduplicate_and_sort_chains(self, chains: list[ModelDict]) -> list[ModelDict]:
-        """Remove duplicate chains and sort by length.
-
-        Args:
-            chains: List of chains to deduplicate and sort
-
-        Returns:
-            Deduplicated and sorted chains
-        """
-        seen: set[tuple[str, ...]] = set()
-
-        def _is_unique_chain(chain: dict[str, JsonValue]) -> bool:
-            """Check if chain is unique and add to seen set."""
-            chain_list = chain.get("chain", [])
-            if not isinstance(chain_list, list):
-                return False
-            chain_list_values = cast(list[JsonValue], chain_list)
-            chain_items = [
-                str(item)
-                for item in chain_list_values
-                if isinstance(item, (str, int, float))
-            ]
-            chain_key = tuple(chain_items)
-            if chain_key and chain_key not in seen:
-                seen.add(chain_key)
-                return True
-            return False
-
-        unique_chains: list[ModelDict] = [
-            chain for chain in chains if _is_unique_chain(chain)
-        ]
-
-        def _chain_length(chain: dict[str, JsonValue]) -> int:
-            raw_length = chain.get("length", 0)
-            return int(raw_length) if isinstance(raw_length, (int, float, str)) else 0
-
-        unique_chains.sort(key=_chain_length, reverse=True)
-        return unique_chains
+        session = self._current_session()
+        chains = session.chains.get(max_chain_length)
+        if chains is None:
+            chains = chain_analysis.find_dependency_chains(
+                session.graph, max_chain_length, index=session.index
+            )
+            session.chains[max_chain_length] = chains
+        return [_chain_result_to_dict(chain) for chain in chains]
 
 
 def _build_empty_organization_result() -> FileOrganizationResult:
@@ -886,39 +735,18 @@ def _identify_size_issues(file_sizes: list[FileSizeEntry]) -> list[str]:
     return issues
 
 
-def _create_circular_chain_dict(current_path: list[str], start_file: str) -> ModelDict:
-    """Create a circular chain dict.
-
-    Args:
-        current_path: Current path in the chain
-        start_file: Starting file that creates the cycle
-
-    Returns:
-        Chain dict
-    """
-    full_chain = current_path + [start_file]
-    full_chain_json = cast(list[JsonValue], full_chain)
-    return {
-        "type": "circular",
-        "chain": full_chain_json,
-        "length": len(full_chain),
-        "is_linear": False,
-    }
-
-
-def _create_linear_chain_dict(current_path: list[str]) -> ModelDict:
-    """Create a linear chain dict.
+def _chain_result_to_dict(chain: DependencyChainResult) -> ModelDict:
+    """Convert a chain result to the dict shape returned by the analyzer.
 
     Args:
-        current_path: Current path in the chain
+        chain: Chain result model
 
     Returns:
         Chain dict
     """
-    current_path_json = cast(list[JsonValue], current_path)
     return {
-        "type": "linear",
-        "chain": current_path_json,
-        "length": len(current_path),
-        "is_linear": True,
+        "type": "linear" if chain.is_linear else "circular",
+        "chain": cast(list[JsonValue], chain.chain),
+        "length": chain.length,
+        "is_linear": chain.is_linear,
     }
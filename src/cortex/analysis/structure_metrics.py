@@ -5,6 +5,7 @@ This module calculates structural complexity metrics including
 dependency depth, cyclomatic complexity, fan-in/fan-out, and hotspots.
 """
 
+from cortex.analysis import chain_analysis
 from cortex.analysis.models import ComplexityHotspot, DependencyChainResult
 from cortex.core.dependency_graph import DependencyGraph
 
@@ -41,35 +42,7 @@ def calculate_dependency_depths(
     Returns:
         Tuple of (depth_map, max_depth)
     """
-    max_depth = 0
-    depth_map: dict[str, int] = {}
-
-    def calculate_depth(file_name: str, visited: set[str]) -> int:
-        """Calculate maximum dependency depth for a file."""
-        if file_name in depth_map:
-            return depth_map[file_name]
-
-        if file_name in visited:
-            return 0  # Circular dependency
-
-        visited.add(file_name)
-
-        dependencies = graph.get(file_name, {}).get("dependencies", [])
-        if not dependencies:
-            depth = 0
-        else:
-            depth = 1 + max(
-                calculate_depth(dep, visited.copy()) for dep in dependencies
-            )
-
-        depth_map[file_name] = depth
-        return depth
-
-    for file_name in graph:
-        depth = calculate_depth(file_name, set())
-        max_depth = max(max_depth, depth)
-
-    return depth_map, max_depth
+    return chain_analysis.calculate_dependency_depths(graph)
 
 
 def calculate_cyclomatic_metrics(
@@ -276,34 +249,7 @@ def find_all_chains(
     Returns:
         List of found chains
     """
-    chains: list[DependencyChainResult] = []
-
-    def find_chains_from_file(
-        start_file: str, current_path: list[str], visited: set[str]
-    ) -> None:
-        """Recursively find chains from a starting file."""
-        if len(current_path) > max_chain_length:
-            return
-
-        if start_file in visited:
-            if len(current_path) >= 2:
-                chains.append(create_circular_chain(current_path, start_file))
-            return
-
-        visited.add(start_file)
-        dependencies = graph.get(start_file, {}).get("dependencies", [])
-
-        if not dependencies:
-            if len(current_path) >= 3:
-                chains.append(create_linear_chain(current_path))
-        else:
-            for dep in dependencies:
-                find_chains_from_file(dep, [*current_path, dep], visited.copy())
-
-    for file_name in graph:
-        find_chains_from_file(file_name, [file_name], set())
-
-    return chains
+    return chain_analysis.find_dependency_chains(graph, max_chain_length, limit=None)
 
 
 def deduplicate_and_sort_chains(
@@ -0,0 +1,179 @@
+"""
+Structure Session - One snapshot of files and dependencies per analysis run.
+
+The structure reports (organization, anti-patterns, complexity, chains) all
+look at the same memory bank files and the same dependency graph. A session
+captures both once - a single directory scan, a single stat per file and a
+single graph build - and derives fan-in/fan-out, isolated files and depths
+from it, so back-to-back reports never repeat that work.
+"""
+
+import hashlib
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from pathlib import Path
+
+from cortex.analysis import chain_analysis
+from cortex.analysis.models import (
+    AntiPatternInfo,
+    ComplexityAnalysisResult,
+    DependencyChainResult,
+)
+from cortex.core.dependency_graph import DependencyGraph
+from cortex.core.graph_index import IncrementalGraphIndex
+from cortex.core.models import FileOrganizationResult, FileSizeEntry
+
+_active_session: ContextVar["StructureAnalysisSession | None"] = ContextVar(
+    "structure_analysis_session", default=None
+)
+
+
+class StructureAnalysisSession:
+    """
+    Snapshot of memory bank files and dependency graph shared by reports.
+
+    Features:
+    - One directory scan and one stat per file
+    - One dependency graph build with fan-in/fan-out in the same pass
+    - Lazily built condensed-graph index and dependency depths
+    - Memoized report results for the lifetime of the session
+    """
+
+    def __init__(
+        self,
+        owner: object,
+        memory_bank_dir: Path,
+        dependency_graph: DependencyGraph,
+    ) -> None:
+        """
+        Capture files, sizes and the dependency graph.
+
+        Args:
+            owner: Analyzer that opened the session
+            memory_bank_dir: Memory bank directory to scan
+            dependency_graph: Dependency graph manager to snapshot
+        """
+        self.owner: object = owner
+        self.memory_bank_dir: Path = memory_bank_dir
+        self.memory_bank_exists: bool = memory_bank_dir.exists()
+        self.file_names: list[str] = []
+        self.file_sizes: list[FileSizeEntry] = []
+        self.graph: dict[str, dict[str, list[str]]] = {}
+        self.fan_in: dict[str, int] = {}
+        self.fan_out: dict[str, int] = {}
+        self.edge_count: int = 0
+        self.isolated_files: set[str] = set()
+        self._file_stamps: list[tuple[str, int, int]] = []
+
+        self.organization: FileOrganizationResult | None = None
+        self.anti_patterns: list[AntiPatternInfo] | None = None
+        self.complexity: ComplexityAnalysisResult | None = None
+        self.chains: dict[int, list[DependencyChainResult]] = {}
+
+        self._index: IncrementalGraphIndex | None = None
+        self._depths: tuple[dict[str, int], int] | None = None
+        self._corpus_version: str | None = None
+
+        self._scan_files()
+        self._snapshot_graph(dependency_graph)
+
+    @property
+    def index(self) -> IncrementalGraphIndex:
+        """Condensed-graph index of the snapshot, built on first use."""
+        if self._index is None:
+            self._index = chain_analysis.build_chain_index(self.graph)
+        return self._index
+
+    @property
+    def corpus_version(self) -> str:
+        """Digest of file names, sizes, mtimes and dependency edges."""
+        if self._corpus_version is None:
+            digest = hashlib.sha256()
+            for name, size, mtime_ns in sorted(self._file_stamps):
+                digest.update(f"{name}\0{size}\0{mtime_ns}\n".encode())
+            for file_name in sorted(self.graph):
+                dependencies = ",".join(sorted(self.graph[file_name]["dependencies"]))
+                digest.update(f"{file_name}>{dependencies}\n".encode())
+            self._corpus_version = digest.hexdigest()[:16]
+        return self._corpus_version
+
+    @property
+    def depths(self) -> tuple[dict[str, int], int]:
+        """Dependency depth per file and the maximum depth."""
+        if self._depths is None:
+            self._depths = chain_analysis.calculate_dependency_depths(
+                self.graph, self.index
+            )
+        return self._depths
+
+    def _scan_files(self) -> None:
+        """List memory bank files and stat each one once."""
+        if not self.memory_bank_exists:
+            return
+
+        for file_path in self.memory_bank_dir.glob("*.md"):
+            self.file_names.append(file_path.name)
+            try:
+                stat_result = file_path.stat()
+            except OSError:
+                continue
+            size = stat_result.st_size
+            self._file_stamps.append((file_path.name, size, stat_result.st_mtime_ns))
+            self.file_sizes.append(
+                FileSizeEntry(file=file_path.name, size_bytes=size, tokens=0)
+            )
+        self.file_sizes.sort(key=lambda x: x.size_bytes, reverse=True)
+
+    def _snapshot_graph(self, dependency_graph: DependencyGraph) -> None:
+        """Copy the dependency graph and derive per-file degree data."""
+        for file_name in dependency_graph.get_all_files():
+            dependencies = dependency_graph.get_dependencies(file_name)
+            dependents = dependency_graph.get_dependents(file_name)
+            self.graph[file_name] = {
+                "dependencies": dependencies,
+                "dependents": dependents,
+            }
+            self.fan_out[file_name] = len(dependencies)
+            self.fan_in[file_name] = len(dependents)
+            self.edge_count += len(dependencies)
+            if not dependencies and not dependents:
+                self.isolated_files.add(file_name)
+
+
+def get_active_session(owner: object) -> StructureAnalysisSession | None:
+    """Get the session opened by ``owner`` in the current context, if any."""
+    session = _active_session.get()
+    if session is not None and session.owner is owner:
+        return session
+    return None
+
+
+@asynccontextmanager
+async def open_session(
+    owner: object, memory_bank_dir: Path, dependency_graph: DependencyGraph
+) -> AsyncGenerator[StructureAnalysisSession]:
+    """
+    Open a session for ``owner``, or join the one already open in this context.
+
+    Tasks spawned inside the block inherit the session through the context.
+
+    Args:
+        owner: Analyzer opening the session
+        memory_bank_dir: Memory bank directory to scan
+        dependency_graph: Dependency graph manager to snapshot
+
+    Yields:
+        The active session
+    """
+    existing = get_active_session(owner)
+    if existing is not None:
+        yield existing
+        return
+
+    session = StructureAnalysisSession(owner, memory_bank_dir, dependency_graph)
+    token = _active_session.set(session)
+    try:
+        yield session
+    finally:
+        _active_session.reset(token)
@@ -4,6 +4,7 @@ This module contains benchmarks for pattern analysis, structure analysis,
 and other analytical operations.
 """
 
+import random
 import tempfile
 from pathlib import Path
 
@@ -117,6 +118,66 @@ class StructureAnalysisBenchmark(Benchmark):
             _ = await self.analyzer.analyze_file_organization()
 
 
+class DependencyChainBenchmark(Benchmark):
+    """Benchmark dependency chain and depth analysis on random graphs."""
+
+    def __init__(self, num_files: int = 1000, avg_dependencies: int = 4):
+        """Initialize dependency chain benchmark.
+
+        Args:
+            num_files: Number of files in the random graph
+            avg_dependencies: Average outgoing links per file
+        """
+        super().__init__(
+            name=f"Dependency Chains ({num_files} files)",
+            description=(
+                f"Measure chain and depth analysis on a random graph with "
+                f"{num_files} files"
+            ),
+            iterations=5,
+            warmup_iterations=1,
+        )
+        self.num_files = num_files
+        self.avg_dependencies = avg_dependencies
+        self.analyzer: StructureAnalyzer | None = None
+        self.temp_dir: tempfile.TemporaryDirectory[str] | None = None
+
+    async def setup(self) -> None:
+        """Set up structure analyzer over a seeded random dependency graph."""
+        self.temp_dir = tempfile.TemporaryDirectory[str]()
+        base_path = Path(self.temp_dir.name)
+
+        rng = random.Random(self.num_files)
+        dep_graph = DependencyGraph()
+        for i in range(self.num_files):
+            for _ in range(rng.randint(0, 2 * self.avg_dependencies)):
+                target = rng.randrange(self.num_files)
+                if target != i:
+                    dep_graph.add_dynamic_dependency(
+                        f"file_{i}.md", f"file_{target}.md"
+                    )
+
+        from ..core.metadata_index import MetadataIndex
+
+        self.analyzer = StructureAnalyzer(
+            project_root=base_path,
+            dependency_graph=dep_graph,
+            file_system=FileSystemManager(base_path),
+            metadata_index=MetadataIndex(base_path),
+        )
+
+    async def teardown(self) -> None:
+        """Clean up temp directory."""
+        if self.temp_dir:
+            self.temp_dir.cleanup()
+
+    async def run_iteration(self) -> None:
+        """Run single chain and complexity analysis iteration."""
+        if self.analyzer:
+            _ = await self.analyzer.find_dependency_chains()
+            _ = await self.analyzer.measure_complexity_metrics()
+
+
 class CoAccessPatternBenchmark(Benchmark):
     """Benchmark co-access pattern calculation."""
 
@@ -175,6 +236,7 @@ def create_analysis_benchmark_suite() -> BenchmarkSuite:
     suite.add_benchmark(StructureAnalysisBenchmark(num_files=10))
     suite.add_benchmark(StructureAnalysisBenchmark(num_files=20))
     suite.add_benchmark(StructureAnalysisBenchmark(num_files=30))
+    suite.add_benchmark(DependencyChainBenchmark(num_files=1000))
 
     # Co-access pattern benchmarks
     suite.add_benchmark(CoAccessPatternBenchmark(num_files=20))
@@ -0,0 +1,235 @@
+"""Benchmark baselines and regression comparison.
+
+A baseline is a JSON file of benchmark results saved from a reference run.
+Comparing a new run against it classifies each benchmark as a regression,
+an improvement or unchanged, using a relative threshold that can be set per
+benchmark with glob patterns, plus an absolute floor so that noise on very
+fast operations does not count as a regression.
+"""
+
+import fnmatch
+import json
+import time
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Literal, cast
+
+from ..core.models import JsonValue
+from .framework import BenchmarkResult
+
+BASELINE_VERSION = 1
+DEFAULT_REGRESSION_THRESHOLD = 0.25
+DEFAULT_MIN_DELTA_MS = 1.0
+
+type Metric = Literal["mean_time", "median_time", "p95_time", "min_time"]
+type ComparisonStatus = Literal[
+    "regression", "improvement", "unchanged", "new", "missing", "failed"
+]
+
+
+def save_baseline(results: Sequence[BenchmarkResult], path: Path) -> None:
+    """
+    Save benchmark results as a baseline.
+
+    Args:
+        results: Results of the reference run
+        path: Baseline file to write
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    baseline = {
+        "version": BASELINE_VERSION,
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "results": [result.to_dict() for result in results if result.error is None],
+    }
+    _ = path.write_text(json.dumps(baseline, indent=2) + "\n", encoding="utf-8")
+
+
+def load_baseline(path: Path) -> dict[str, dict[str, JsonValue]]:
+    """
+    Load a baseline saved by save_baseline.
+
+    Args:
+        path: Baseline file
+
+    Returns:
+        Result dictionaries by benchmark name
+
+    Raises:
+        ValueError: If the file is not a supported baseline
+    """
+    data: object = json.loads(path.read_text(encoding="utf-8"))
+    if not isinstance(data, dict):
+        raise ValueError(f"{path} is not a benchmark baseline")
+    baseline = cast(dict[str, JsonValue], data)
+    if baseline.get("version") != BASELINE_VERSION:
+        raise ValueError(
+            f"Unsupported baseline version {baseline.get('version')!r} in {path}"
+        )
+    results = baseline.get("results")
+    if not isinstance(results, list):
+        raise ValueError(f"{path} has no results")
+    by_name: dict[str, dict[str, JsonValue]] = {}
+    for entry in results:
+        if isinstance(entry, dict) and isinstance(entry.get("name"), str):
+            by_name[str(entry["name"])] = entry
+    return by_name
+
+
+@dataclass
+class BenchmarkComparison:
+    """Comparison of one benchmark against its baseline."""
+
+    name: str
+    status: ComparisonStatus
+    baseline_ms: float | None = None
+    current_ms: float | None = None
+    threshold: float = DEFAULT_REGRESSION_THRESHOLD
+
+    @property
+    def change_percent(self) -> float | None:
+        """Relative change from the baseline in percent."""
+        if not self.baseline_ms or self.current_ms is None:
+            return None
+        return (self.current_ms - self.baseline_ms) / self.baseline_ms * 100
+
+
+@dataclass
+class ComparisonReport:
+    """Comparison of a benchmark run against a baseline."""
+
+    metric: Metric
+    comparisons: list[BenchmarkComparison] = field(
+        default_factory=lambda: list[BenchmarkComparison]()
+    )
+
+    @property
+    def regressions(self) -> list[BenchmarkComparison]:
+        """Benchmarks slower than their threshold allows."""
+        return [c for c in self.comparisons if c.status == "regression"]
+
+    @property
+    def failures(self) -> list[BenchmarkComparison]:
+        """Benchmarks that raised instead of finishing."""
+        return [c for c in self.comparisons if c.status == "failed"]
+
+    @property
+    def passed(self) -> bool:
+        """Whether no benchmark regressed or failed."""
+        return not self.regressions and not self.failures
+
+    def to_markdown(self) -> str:
+        """Render the comparison as a markdown table."""
+        lines = [
+            f"# Benchmark Comparison ({self.metric})",
+            "",
+            "| Benchmark | Baseline (ms) | Current (ms) | Change | Threshold | Status |",
+            "|-----------|---------------|--------------|--------|-----------|--------|",
+        ]
+        for c in self.comparisons:
+            change = c.change_percent
+            cells = [
+                c.name,
+                _format_ms(c.baseline_ms),
+                _format_ms(c.current_ms),
+                "-" if change is None else f"{change:+.1f}%",
+                f"{c.threshold * 100:.0f}%",
+                c.status,
+            ]
+            lines.append(f"| {' | '.join(cells)} |")
+        verdict = (
+            "PASSED"
+            if self.passed
+            else f"FAILED: {len(self.regressions)} regression(s), "
+            + f"{len(self.failures)} failed benchmark(s)"
+        )
+        lines.extend(["", f"**{verdict}**", ""])
+        return "\n".join(lines)
+
+
+def _format_ms(value: float | None) -> str:
+    return "-" if value is None else f"{value:.2f}"
+
+
+def threshold_for(
+    name: str, default: float, overrides: Mapping[str, float] | None = None
+) -> float:
+    """
+    Select the regression threshold of a benchmark.
+
+    Args:
+        name: Benchmark name
+        default: Threshold when no override matches
+        overrides: Thresholds by glob pattern; the first match wins
+
+    Returns:
+        Allowed relative slowdown (0.25 = 25%)
+    """
+    for pattern, threshold in (overrides or {}).items():
+        if fnmatch.fnmatchcase(name, pattern):
+            return threshold
+    return default
+
+
+def compare_results(
+    current: Sequence[BenchmarkResult],
+    baseline: Mapping[str, Mapping[str, JsonValue]],
+    metric: Metric = "median_time",
+    threshold: float = DEFAULT_REGRESSION_THRESHOLD,
+    overrides: Mapping[str, float] | None = None,
+    min_delta_ms: float = DEFAULT_MIN_DELTA_MS,
+) -> ComparisonReport:
+    """
+    Compare benchmark results against a baseline.
+
+    A benchmark regresses when its metric grew by more than its threshold
+    and by more than min_delta_ms; it improves when it shrank by as much.
+    A benchmark that raised is reported as failed and fails the report.
+
+    Args:
+        current: Results of the new run
+        baseline: Baseline results by benchmark name (see load_baseline)
+        metric: Result field to compare
+        threshold: Default allowed relative slowdown (0.25 = 25%)
+        overrides: Thresholds by benchmark name glob pattern
+        min_delta_ms: Smallest absolute change that can count as a regression
+
+    Returns:
+        Comparison report
+    """
+    report = ComparisonReport(metric=metric)
+    for result in current:
+        allowed = threshold_for(result.name, threshold, overrides)
+        if result.error is not None:
+            report.comparisons.append(
+                BenchmarkComparison(result.name, "failed", threshold=allowed)
+            )
+            continue
+        current_ms = float(getattr(result, metric)) * 1000
+        reference = baseline.get(result.name)
+        value = reference.get(metric) if reference is not None else None
+        if not isinstance(value, (int, float)):
+            report.comparisons.append(
+                BenchmarkComparison(
+                    result.name, "new", current_ms=current_ms, threshold=allowed
+                )
+            )
+            continue
+        baseline_ms = float(value) * 1000
+        delta_ms = current_ms - baseline_ms
+        status: ComparisonStatus = "unchanged"
+        if abs(delta_ms) > min_delta_ms and abs(delta_ms) > baseline_ms * allowed:
+            status = "regression" if delta_ms > 0 else "improvement"
+        report.comparisons.append(
+            BenchmarkComparison(result.name, status, baseline_ms, current_ms, allowed)
+        )
+
+    measured = {result.name for result in current}
+    for name in baseline:
+        if name not in measured:
+            report.comparisons.append(
+                BenchmarkComparison(
+                    name, "missing", threshold=threshold_for(name, threshold, overrides)
+                )
+            )
+    return report
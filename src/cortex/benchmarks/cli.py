@@ -0,0 +1,199 @@
+"""cortex-bench - run tool workflow benchmarks and gate on regressions.
+
+Examples:
+    cortex-bench --save-baseline benchmarks/baseline.json
+    cortex-bench --baseline benchmarks/baseline.json --threshold 20
+    cortex-bench --sizes 10000 --workflows load_context --iterations 3
+    cortex-bench --baseline base.json --threshold-override "validate_all*=50"
+    cortex-bench --workflows load_context --concurrency 8 --track-allocations
+
+Every run writes results.json and appends to the results.csv trend file in
+the output directory.
+
+The exit status is 1 when a benchmark failed or regressed past its
+threshold, 2 on invalid arguments.
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+from typing import cast, get_args
+
+from .baseline import (
+    DEFAULT_MIN_DELTA_MS,
+    DEFAULT_REGRESSION_THRESHOLD,
+    Metric,
+    compare_results,
+    load_baseline,
+    save_baseline,
+)
+from .framework import BenchmarkResult, BenchmarkRunner
+from .workflow_benchmarks import (
+    DEFAULT_BANK_SIZES,
+    WORKFLOWS,
+    create_workflow_benchmark_suite,
+)
+
+
+def _parse_sizes(value: str) -> list[int]:
+    try:
+        sizes = [int(part) for part in value.split(",") if part.strip()]
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(f"invalid sizes {value!r}") from e
+    if not sizes or any(size < 1 for size in sizes):
+        raise argparse.ArgumentTypeError("sizes must be positive integers")
+    return sizes
+
+
+def _parse_override(value: str) -> tuple[str, float]:
+    pattern, separator, percent = value.rpartition("=")
+    try:
+        threshold = float(percent) / 100
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(f"invalid override {value!r}") from e
+    if not separator or not pattern:
+        raise argparse.ArgumentTypeError("overrides are written PATTERN=PERCENT")
+    return pattern, threshold
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Create the cortex-bench argument parser."""
+    parser = argparse.ArgumentParser(
+        prog="cortex-bench",
+        description="Benchmark MCP tool workflows on generated memory banks",
+    )
+    _ = parser.add_argument(
+        "--sizes",
+        type=_parse_sizes,
+        default=list(DEFAULT_BANK_SIZES),
+        help="comma-separated memory bank sizes in files (default: 10,100,1000)",
+    )
+    _ = parser.add_argument(
+        "--workflows",
+        nargs="+",
+        choices=list(WORKFLOWS),
+        help="workflows to run (default: all)",
+    )
+    _ = parser.add_argument(
+        "--links-per-file", type=float, default=2.0, help="average links per file"
+    )
+    _ = parser.add_argument(
+        "--transclusions-per-file",
+        type=float,
+        default=0.2,
+        help="average transclusion directives per file",
+    )
+    _ = parser.add_argument("--iterations", type=int, default=10)
+    _ = parser.add_argument("--warmup-iterations", type=int, default=2)
+    _ = parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="concurrent calls per benchmark, to measure throughput (default: 1)",
+    )
+    _ = parser.add_argument(
+        "--track-allocations",
+        action="store_true",
+        help="record tracemalloc allocation peaks (slows iterations down)",
+    )
+    _ = parser.add_argument(
+        "--output-dir",
+        type=Path,
+        default=Path("benchmark_results"),
+        help="directory for results.json and comparison.md",
+    )
+    _ = parser.add_argument(
+        "--save-baseline", type=Path, help="write the results as a new baseline"
+    )
+    _ = parser.add_argument(
+        "--baseline", type=Path, help="compare against this baseline"
+    )
+    _ = parser.add_argument(
+        "--metric",
+        choices=get_args(Metric.__value__),
+        default="median_time",
+        help="result field to compare (default: median_time)",
+    )
+    _ = parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_REGRESSION_THRESHOLD * 100,
+        help="allowed slowdown in percent (default: 25)",
+    )
+    _ = parser.add_argument(
+        "--threshold-override",
+        type=_parse_override,
+        action="append",
+        default=[],
+        metavar="PATTERN=PERCENT",
+        help="allowed slowdown for benchmarks matching a glob pattern",
+    )
+    _ = parser.add_argument(
+        "--min-delta-ms",
+        type=float,
+        default=DEFAULT_MIN_DELTA_MS,
+        help="smallest slowdown in ms that can fail the run (default: 1)",
+    )
+    return parser
+
+
+async def run_benchmarks(args: argparse.Namespace) -> list[BenchmarkResult]:
+    """Run the workflow suite selected by the arguments."""
+    runner = BenchmarkRunner(output_dir=cast(Path, args.output_dir))
+    runner.add_suite(
+        create_workflow_benchmark_suite(
+            sizes=cast(list[int], args.sizes),
+            workflows=cast(list[str] | None, args.workflows),
+            links_per_file=cast(float, args.links_per_file),
+            transclusions_per_file=cast(float, args.transclusions_per_file),
+            iterations=cast(int, args.iterations),
+            warmup_iterations=cast(int, args.warmup_iterations),
+            concurrency=cast(int, args.concurrency),
+            track_allocations=cast(bool, args.track_allocations),
+        )
+    )
+    results = await runner.run_all()
+    runner.save_results(results)
+    runner.export_csv(results)
+    return [result for suite in results.values() for result in suite]
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmarks, then save a baseline or compare against one."""
+    args = build_parser().parse_args(argv)
+    baseline_path = cast(Path | None, args.baseline)
+    # Fail on an unreadable baseline before spending minutes on benchmarks
+    try:
+        baseline = load_baseline(baseline_path) if baseline_path else None
+    except (OSError, ValueError) as e:
+        print(f"Cannot load baseline: {e}", file=sys.stderr)
+        return 2
+
+    results = asyncio.run(run_benchmarks(args))
+
+    save_path = cast(Path | None, args.save_baseline)
+    if save_path:
+        save_baseline(results, save_path)
+        print(f"Baseline saved to: {save_path}")
+    if baseline is None:
+        return 1 if any(result.error is not None for result in results) else 0
+
+    report = compare_results(
+        results,
+        baseline,
+        metric=cast(Metric, args.metric),
+        threshold=cast(float, args.threshold) / 100,
+        overrides=dict(cast(list[tuple[str, float]], args.threshold_override)),
+        min_delta_ms=cast(float, args.min_delta_ms),
+    )
+    markdown = report.to_markdown()
+    output_dir = cast(Path, args.output_dir)
+    _ = (output_dir / "comparison.md").write_text(markdown, encoding="utf-8")
+    print()
+    print(markdown)
+    return 0 if report.passed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
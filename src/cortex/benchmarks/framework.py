@@ -2,14 +2,85 @@
 
 Provides core classes and utilities for defining, running, and reporting
 performance benchmarks.
+
+Besides wall-clock latency, a run records the CPU time spent in measured
+iterations, the process's peak resident set size and, when allocation
+tracking is enabled, tracemalloc allocation peaks. Iterations run serially
+by default; with concurrency > 1 they are spread over that many coroutines
+sharing the benchmark's state, so ops_per_second becomes throughput under
+contention. Results can be saved as JSON or appended to a CSV trend file.
+A benchmark that raises is recorded as a failed result carrying the error,
+and the rest of its suite still runs.
 """
 
+import asyncio
+import csv
+import statistics
+import sys
 import time
+import tracemalloc
 from dataclasses import dataclass, field
 from pathlib import Path
 
 from cortex.core.models import JsonValue, ModelDict
 
+# Columns of CSV exports, after the recorded_at and suite columns
+CSV_FIELDS: tuple[str, ...] = (
+    "name",
+    "iterations",
+    "concurrency",
+    "total_time",
+    "min_time",
+    "max_time",
+    "mean_time",
+    "median_time",
+    "std_dev",
+    "p95_time",
+    "p99_time",
+    "ops_per_second",
+    "mean_cpu_time",
+    "cpu_ratio",
+    "peak_rss_bytes",
+    "rss_growth_bytes",
+    "peak_alloc_bytes",
+    "mean_alloc_bytes",
+)
+
+
+def peak_rss_bytes() -> int | None:
+    """
+    Get the peak resident set size of this process.
+
+    Returns:
+        High-water mark of the process's RSS in bytes, or None where the
+        resource module is unavailable (Windows)
+    """
+    if sys.platform == "win32":
+        return None
+    import resource
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    """
+    Percentile of ascending values, interpolating between closest ranks.
+
+    Args:
+        sorted_values: Values in ascending order (at least one)
+        fraction: Percentile as a fraction (0.95 = p95)
+
+    Returns:
+        Interpolated percentile
+    """
+    position = (len(sorted_values) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    weight = position - lower
+    return sorted_values[lower] * (1 - weight) + sorted_values[upper] * weight
+
 
 @dataclass
 class BenchmarkResult:
@@ -28,10 +99,35 @@ class BenchmarkResult:
     metadata: dict[str, JsonValue] = field(
         default_factory=lambda: dict[str, JsonValue]()
     )
+    concurrency: int = 1
+    mean_cpu_time: float = 0.0
+    cpu_ratio: float = 0.0
+    peak_rss_bytes: int | None = None
+    rss_growth_bytes: int | None = None
+    peak_alloc_bytes: int | None = None
+    mean_alloc_bytes: float | None = None
+    error: str | None = None
+
+    @classmethod
+    def failed(cls, name: str, iterations: int, error: str) -> "BenchmarkResult":
+        """Create the result of a benchmark that raised instead of finishing."""
+        return cls(
+            name=name,
+            iterations=iterations,
+            total_time=0.0,
+            min_time=0.0,
+            max_time=0.0,
+            mean_time=0.0,
+            median_time=0.0,
+            std_dev=0.0,
+            p95_time=0.0,
+            p99_time=0.0,
+            error=error,
+        )
 
     @property
     def ops_per_second(self) -> float:
-        """Calculate operations per second."""
+        """Calculate operations per second (throughput when concurrent)."""
         return self.iterations / self.total_time if self.total_time > 0 else 0.0
 
     def to_dict(self) -> ModelDict:
@@ -48,12 +144,43 @@ class BenchmarkResult:
             "p95_time": self.p95_time,
             "p99_time": self.p99_time,
             "ops_per_second": self.ops_per_second,
+            "concurrency": self.concurrency,
+            "mean_cpu_time": self.mean_cpu_time,
+            "cpu_ratio": self.cpu_ratio,
+            "peak_rss_bytes": self.peak_rss_bytes,
+            "rss_growth_bytes": self.rss_growth_bytes,
+            "peak_alloc_bytes": self.peak_alloc_bytes,
+            "mean_alloc_bytes": self.mean_alloc_bytes,
+            "error": self.error,
             "metadata": self.metadata,
         }
 
 
+@dataclass
+class _Measurement:
+    """Raw measurements of a benchmark's measurement phase."""
+
+    times: list[float]
+    total_time: float
+    cpu_time: float
+    busy_time: float
+    peak_alloc_bytes: int | None = None
+    mean_alloc_bytes: float | None = None
+
+
 class Benchmark:
-    """Base class for performance benchmarks."""
+    """
+    Base class for performance benchmarks.
+
+    Features:
+    - Wall-clock latency percentiles per iteration
+    - CPU time vs wall time of measured iterations (a low CPU ratio means
+      the benchmark mostly waits on I/O, locks or sleeps)
+    - Peak RSS of the process and how much the run raised it
+    - Optional tracemalloc allocation peaks (slows iterations down, so
+      timings of such runs are not comparable with untracked runs)
+    - Concurrent-load mode running iterations on several coroutines
+    """
 
     def __init__(
         self,
@@ -61,6 +188,8 @@ class Benchmark:
         description: str,
         iterations: int = 100,
         warmup_iterations: int = 10,
+        concurrency: int = 1,
+        track_allocations: bool = False,
     ):
         """Initialize benchmark.
 
@@ -69,11 +198,15 @@ class Benchmark:
             description: Benchmark description
             iterations: Number of iterations to run
             warmup_iterations: Number of warmup iterations
+            concurrency: Coroutines sharing the measured iterations
+            track_allocations: Record allocations with tracemalloc
         """
         self.name = name
         self.description = description
         self.iterations = iterations
         self.warmup_iterations = warmup_iterations
+        self.concurrency = max(1, concurrency)
+        self.track_allocations = track_allocations
 
     async def setup(self) -> None:
         """Set up benchmark environment (called once before all runs)."""
@@ -98,15 +231,19 @@ class Benchmark:
     async def run(self) -> BenchmarkResult:
         """Run the benchmark and return results."""
         await self.setup()
-        await self._run_warmup_phase()
-        times, total_time = await self._run_measurement_phase()
-        await self.teardown()
-        stats = self._calculate_statistics(times)
+        try:
+            await self._run_warmup_phase()
+            rss_before = peak_rss_bytes()
+            measurement = await self._run_measurement_phase()
+            rss_after = peak_rss_bytes()
+        finally:
+            await self.teardown()
+        stats = self._calculate_statistics(measurement.times)
 
         return BenchmarkResult(
             name=self.name,
             iterations=self.iterations,
-            total_time=total_time,
+            total_time=measurement.total_time,
             min_time=stats["min"],
             max_time=stats["max"],
             mean_time=stats["mean"],
@@ -115,6 +252,21 @@ class Benchmark:
             p95_time=stats["p95"],
             p99_time=stats["p99"],
             metadata={"description": self.description},
+            concurrency=self.concurrency,
+            mean_cpu_time=measurement.cpu_time / len(measurement.times),
+            cpu_ratio=(
+                measurement.cpu_time / measurement.busy_time
+                if measurement.busy_time > 0
+                else 0.0
+            ),
+            peak_rss_bytes=rss_after,
+            rss_growth_bytes=(
+                rss_after - rss_before
+                if rss_after is not None and rss_before is not None
+                else None
+            ),
+            peak_alloc_bytes=measurement.peak_alloc_bytes,
+            mean_alloc_bytes=measurement.mean_alloc_bytes,
         )
 
     async def _run_warmup_phase(self) -> None:
@@ -124,39 +276,102 @@ class Benchmark:
             await self.run_iteration()
             await self.after_each()
 
-    async def _run_measurement_phase(
-        self,
-    ) -> tuple[list[float], float]:
-        """Run measurement phase and return times and total time."""
+    async def _run_measurement_phase(self) -> _Measurement:
+        """Run measurement phase on the configured number of coroutines."""
+        started_tracing = self.track_allocations and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        try:
+            if self.concurrency == 1:
+                return await self._run_serial()
+            return await self._run_concurrent()
+        finally:
+            if started_tracing:
+                tracemalloc.stop()
+
+    async def _run_serial(self) -> _Measurement:
+        """Run iterations one after another, measuring each separately."""
         times: list[float] = []
+        cpu_time = 0.0
+        alloc_peaks: list[int] = []
+        alloc_net: list[int] = []
+        tracing = tracemalloc.is_tracing() and self.track_allocations
         total_start = time.perf_counter()
         for _ in range(self.iterations):
             await self.before_each()
+            if tracing:
+                tracemalloc.reset_peak()
+                traced_before = tracemalloc.get_traced_memory()[0]
+            else:
+                traced_before = 0
+            cpu_start = time.process_time()
             start = time.perf_counter()
             await self.run_iteration()
             end = time.perf_counter()
+            cpu_time += time.process_time() - cpu_start
+            if tracing:
+                traced_after, traced_peak = tracemalloc.get_traced_memory()
+                alloc_peaks.append(traced_peak - traced_before)
+                alloc_net.append(traced_after - traced_before)
             await self.after_each()
             times.append(end - start)
-        total_end = time.perf_counter()
-        return times, total_end - total_start
+        total_time = time.perf_counter() - total_start
+        return _Measurement(
+            times=times,
+            total_time=total_time,
+            cpu_time=cpu_time,
+            busy_time=sum(times),
+            peak_alloc_bytes=max(alloc_peaks) if alloc_peaks else None,
+            mean_alloc_bytes=statistics.fmean(alloc_net) if alloc_net else None,
+        )
+
+    async def _run_concurrent(self) -> _Measurement:
+        """Run iterations on concurrent coroutines pulling from one counter.
+
+        Per-iteration CPU time and allocations cannot be told apart while
+        iterations overlap, so they are measured over the whole phase.
+        """
+        times: list[float] = []
+        remaining = iter(range(self.iterations))
+
+        async def worker() -> None:
+            for _ in remaining:
+                await self.before_each()
+                start = time.perf_counter()
+                await self.run_iteration()
+                times.append(time.perf_counter() - start)
+                await self.after_each()
+
+        tracing = tracemalloc.is_tracing() and self.track_allocations
+        traced_before = 0
+        if tracing:
+            tracemalloc.reset_peak()
+            traced_before = tracemalloc.get_traced_memory()[0]
+        cpu_start = time.process_time()
+        total_start = time.perf_counter()
+        _ = await asyncio.gather(*(worker() for _ in range(self.concurrency)))
+        total_time = time.perf_counter() - total_start
+        cpu_time = time.process_time() - cpu_start
+        measurement = _Measurement(
+            times=times, total_time=total_time, cpu_time=cpu_time, busy_time=total_time
+        )
+        if tracing:
+            traced_after, traced_peak = tracemalloc.get_traced_memory()
+            measurement.peak_alloc_bytes = traced_peak - traced_before
+            measurement.mean_alloc_bytes = (traced_after - traced_before) / len(times)
+        return measurement
 
     def _calculate_statistics(self, times: list[float]) -> dict[str, float]:
         """Calculate benchmark statistics."""
         sorted_times = sorted(times)
-        mean_time = sum(times) / len(times)
-        median_time = sorted_times[len(sorted_times) // 2]
-        p95_index = int(len(sorted_times) * 0.95)
-        p99_index = int(len(sorted_times) * 0.99)
-        variance = sum((t - mean_time) ** 2 for t in times) / len(times)
-        std_dev = variance**0.5
         return {
-            "min": min(times),
-            "max": max(times),
-            "mean": mean_time,
-            "median": median_time,
-            "std_dev": std_dev,
-            "p95": sorted_times[p95_index],
-            "p99": sorted_times[p99_index],
+            "min": sorted_times[0],
+            "max": sorted_times[-1],
+            "mean": statistics.fmean(times),
+            "median": statistics.median(sorted_times),
+            "std_dev": statistics.pstdev(times),
+            "p95": percentile(sorted_times, 0.95),
+            "p99": percentile(sorted_times, 0.99),
         }
 
 
@@ -179,10 +394,15 @@ class BenchmarkSuite:
         self.benchmarks.append(benchmark)
 
     async def run_all(self) -> list[BenchmarkResult]:
-        """Run all benchmarks in the suite."""
+        """Run all benchmarks in the suite, recording failures as results."""
         results: list[BenchmarkResult] = []
         for benchmark in self.benchmarks:
-            result = await benchmark.run()
+            try:
+                result = await benchmark.run()
+            except Exception as e:
+                result = BenchmarkResult.failed(
+                    benchmark.name, benchmark.iterations, f"{type(e).__name__}: {e}"
+                )
             results.append(result)
         return results
 
@@ -219,6 +439,9 @@ class BenchmarkRunner:
             # Print results
             for result in results:
                 print(f"\n{result.name}:")
+                if result.error is not None:
+                    print(f"  FAILED: {result.error}")
+                    continue
                 print(f"  Iterations: {result.iterations}")
                 print(f"  Total time: {result.total_time:.3f}s")
                 print(f"  Mean time: {result.mean_time * 1000:.2f}ms")
@@ -229,6 +452,14 @@ class BenchmarkRunner:
                 print(f"  P95 time: {result.p95_time * 1000:.2f}ms")
                 print(f"  P99 time: {result.p99_time * 1000:.2f}ms")
                 print(f"  Ops/sec: {result.ops_per_second:.2f}")
+                if result.concurrency > 1:
+                    print(f"  Concurrency: {result.concurrency}")
+                print(f"  Mean CPU time: {result.mean_cpu_time * 1000:.2f}ms")
+                print(f"  CPU/wall: {result.cpu_ratio:.2f}")
+                if result.peak_rss_bytes is not None:
+                    print(f"  Peak RSS: {_format_mb(result.peak_rss_bytes)}")
+                if result.peak_alloc_bytes is not None:
+                    print(f"  Peak alloc: {_format_mb(result.peak_alloc_bytes)}")
 
         return all_results
 
@@ -250,6 +481,43 @@ class BenchmarkRunner:
 
         print(f"\nResults saved to: {output_path}")
 
+    def export_csv(
+        self, results: dict[str, list[BenchmarkResult]], filename: str = "results.csv"
+    ) -> None:
+        """Append benchmark results to a CSV file for trend tracking.
+
+        Each row is stamped with the time of the export, so repeated runs
+        accumulate in one file. The header is written when the file is new.
+
+        Args:
+            results: Results by suite name
+            filename: CSV file in the output directory
+        """
+        output_path = self.output_dir / filename
+        write_header = not output_path.exists() or output_path.stat().st_size == 0
+        recorded_at = time.strftime("%Y-%m-%dT%H:%M:%S")
+
+        with open(output_path, "a", newline="") as f:
+            writer = csv.writer(f)
+            if write_header:
+                writer.writerow(["recorded_at", "suite", *CSV_FIELDS])
+            for suite_name, suite_results in results.items():
+                # Failed runs have no timings to trend
+                for result in (r for r in suite_results if r.error is None):
+                    row = result.to_dict()
+                    writer.writerow(
+                        [
+                            recorded_at,
+                            suite_name,
+                            *(
+                                "" if row[key] is None else row[key]
+                                for key in CSV_FIELDS
+                            ),
+                        ]
+                    )
+
+        print(f"CSV results appended to: {output_path}")
+
     def generate_markdown_report(
         self,
         results: dict[str, list[BenchmarkResult]],
@@ -267,19 +535,37 @@ class BenchmarkRunner:
 
                 # Create table
                 _ = f.write("| Benchmark | Iterations | Mean (ms) | Median (ms) | ")
-                _ = f.write("P95 (ms) | P99 (ms) | Ops/sec |\n")
+                _ = f.write("P95 (ms) | P99 (ms) | Ops/sec | CPU (ms) | CPU/wall | ")
+                _ = f.write("Peak RSS (MB) | Peak alloc (MB) |\n")
                 _ = f.write("|-----------|------------|-----------|-------------|")
-                _ = f.write("----------|----------|----------|\n")
+                _ = f.write("----------|----------|----------|----------|----------|")
+                _ = f.write("---------------|-----------------|\n")
 
                 for result in suite_results:
                     _ = f.write(f"| {result.name} | ")
+                    if result.error is not None:
+                        _ = f.write(f"FAILED: {result.error} |\n")
+                        continue
                     _ = f.write(f"{result.iterations} | ")
                     _ = f.write(f"{result.mean_time * 1000:.2f} | ")
                     _ = f.write(f"{result.median_time * 1000:.2f} | ")
                     _ = f.write(f"{result.p95_time * 1000:.2f} | ")
                     _ = f.write(f"{result.p99_time * 1000:.2f} | ")
-                    _ = f.write(f"{result.ops_per_second:.2f} |\n")
+                    _ = f.write(f"{result.ops_per_second:.2f} | ")
+                    _ = f.write(f"{result.mean_cpu_time * 1000:.2f} | ")
+                    _ = f.write(f"{result.cpu_ratio:.2f} | ")
+                    _ = f.write(f"{_format_mb(result.peak_rss_bytes, unit=False)} | ")
+                    _ = f.write(
+                        f"{_format_mb(result.peak_alloc_bytes, unit=False)} |\n"
+                    )
 
                 _ = f.write("\n")
 
         print(f"Markdown report saved to: {output_path}")
+
+
+def _format_mb(value: float | None, unit: bool = True) -> str:
+    """Format a byte count in megabytes ("-" when not measured)."""
+    if value is None:
+        return "-"
+    return f"{value / 1_000_000:.1f}" + (" MB" if unit else "")
@@ -0,0 +1,242 @@
+"""Synthetic memory banks for end-to-end tool benchmarks.
+
+Generates a project whose memory bank has a given number of markdown files,
+with configurable densities of markdown links and transclusion directives,
+and registers every file in the metadata index the way manage_file would,
+so tools see a bank indistinguishable from one built through the server.
+Generation is deterministic for a given spec.
+"""
+
+import random
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from ..core.file_system import FileSystemManager
+from ..core.metadata_index import MetadataIndex
+from ..core.path_resolver import CortexResourceType, get_cortex_path
+from ..core.token_counter import TokenCounter
+
+CORE_FILES: tuple[str, ...] = (
+    "projectBrief.md",
+    "productContext.md",
+    "activeContext.md",
+    "systemPatterns.md",
+    "techContext.md",
+    "progress.md",
+    "roadmap.md",
+)
+
+_VOCABULARY: tuple[str, ...] = (
+    "authentication",
+    "authorization",
+    "database",
+    "migration",
+    "cache",
+    "latency",
+    "throughput",
+    "deployment",
+    "pipeline",
+    "session",
+    "token",
+    "budget",
+    "schema",
+    "validation",
+    "index",
+    "query",
+    "queue",
+    "worker",
+    "scheduler",
+    "retry",
+    "timeout",
+    "logging",
+    "metrics",
+    "tracing",
+    "api",
+    "endpoint",
+    "client",
+    "server",
+    "storage",
+    "encryption",
+    "config",
+    "release",
+)
+
+# Transclusion chains are at most this deep, so resolution never hits max_depth
+_TRANSCLUSION_LEVELS = 4
+
+
+@dataclass(frozen=True)
+class MemoryBankSpec:
+    """Shape of a generated memory bank."""
+
+    num_files: int
+    links_per_file: float = 2.0
+    transclusions_per_file: float = 0.2
+    sections_per_file: int = 4
+    paragraphs_per_section: int = 2
+    seed: int = 42
+
+    @property
+    def label(self) -> str:
+        """Short description used in benchmark names."""
+        return (
+            f"{self.num_files} files, {self.links_per_file:g} links/file, "
+            f"{self.transclusions_per_file:g} transclusions/file"
+        )
+
+
+@dataclass
+class GeneratedMemoryBank:
+    """Files of a generated memory bank."""
+
+    project_root: Path
+    file_names: list[str]
+    transcluding_files: list[str] = field(default_factory=lambda: list[str]())
+    total_links: int = 0
+    total_transclusions: int = 0
+
+
+def memory_bank_file_names(num_files: int) -> list[str]:
+    """
+    Name the files of a memory bank: core files first, then topic files.
+
+    Args:
+        num_files: Number of files
+
+    Returns:
+        File names
+    """
+    names = list(CORE_FILES[:num_files])
+    names.extend(f"topic-{i:05d}.md" for i in range(num_files - len(names)))
+    return names
+
+
+def _count(rng: random.Random, mean: float) -> int:
+    """Draw a whole count whose expected value is mean."""
+    whole = int(mean)
+    return whole + (1 if rng.random() < mean - whole else 0)
+
+
+def _paragraph(rng: random.Random, topic: list[str]) -> str:
+    """Write a paragraph biased towards a file's topic words."""
+    words = [
+        rng.choice(topic) if rng.random() < 0.3 else rng.choice(_VOCABULARY)
+        for _ in range(rng.randint(25, 45))
+    ]
+    return " ".join(words).capitalize() + "."
+
+
+def transclusion_levels(file_names: list[str]) -> list[list[str]]:
+    """
+    Group files into transclusion levels.
+
+    A file only transcludes files of the next level, so include chains are
+    acyclic and at most _TRANSCLUSION_LEVELS deep.
+
+    Args:
+        file_names: All file names of the bank
+
+    Returns:
+        File names per level
+    """
+    return [
+        file_names[level::_TRANSCLUSION_LEVELS] for level in range(_TRANSCLUSION_LEVELS)
+    ]
+
+
+def render_file(
+    spec: MemoryBankSpec,
+    rng: random.Random,
+    file_name: str,
+    file_names: list[str],
+    transclusion_targets: list[str],
+) -> tuple[str, int, int]:
+    """
+    Render one generated markdown file.
+
+    Args:
+        spec: Memory bank spec
+        rng: Random source shared by the whole bank
+        file_name: Name of the file
+        file_names: All file names of the bank, as link targets
+        transclusion_targets: Files this file may transclude
+
+    Returns:
+        Tuple of (content, links written, transclusions written)
+    """
+    topic = rng.sample(_VOCABULARY, 3)
+    lines = [f"# {file_name.removesuffix('.md')}", ""]
+    headings = ["Overview"] + [
+        f"{word.capitalize()} Notes"
+        for word in rng.sample(_VOCABULARY, spec.sections_per_file - 1)
+    ]
+    for heading in headings:
+        lines.extend([f"## {heading}", ""])
+        for _ in range(spec.paragraphs_per_section):
+            lines.extend([_paragraph(rng, topic), ""])
+
+    links = min(len(file_names) - 1, _count(rng, spec.links_per_file))
+    if links:
+        # Sample one extra target in case the file itself is drawn
+        targets = [n for n in rng.sample(file_names, links + 1) if n != file_name]
+        lines.extend(["## Related", ""])
+        lines.extend(f"- [{name}]({name})" for name in targets[:links])
+        lines.append("")
+
+    transclusions = min(
+        len(transclusion_targets), _count(rng, spec.transclusions_per_file)
+    )
+    if transclusions:
+        lines.extend(["## Included", ""])
+        for name in rng.sample(transclusion_targets, transclusions):
+            lines.extend([f"{{{{include: {name}}}}}", ""])
+    return "\n".join(lines), links, transclusions
+
+
+async def generate_memory_bank(
+    project_root: Path, spec: MemoryBankSpec
+) -> GeneratedMemoryBank:
+    """
+    Write a memory bank and register its files in the metadata index.
+
+    Args:
+        project_root: Project root to create the memory bank in
+        spec: Memory bank spec
+
+    Returns:
+        Description of the generated files
+    """
+    memory_bank = get_cortex_path(project_root, CortexResourceType.MEMORY_BANK)
+    memory_bank.mkdir(parents=True, exist_ok=True)
+    rng = random.Random(spec.seed)
+    file_names = memory_bank_file_names(spec.num_files)
+    bank = GeneratedMemoryBank(project_root=project_root, file_names=file_names)
+
+    fs = FileSystemManager(project_root)
+    index = MetadataIndex(project_root)
+    tokens = TokenCounter()
+    levels = [*transclusion_levels(file_names), []]
+    async with index.batch_updates():
+        for position, file_name in enumerate(file_names):
+            deeper = levels[position % _TRANSCLUSION_LEVELS + 1]
+            content, links, transclusions = render_file(
+                spec, rng, file_name, file_names, deeper
+            )
+            path = memory_bank / file_name
+            _ = path.write_text(content, encoding="utf-8")
+            bank.total_links += links
+            bank.total_transclusions += transclusions
+            if transclusions:
+                bank.transcluding_files.append(file_name)
+            await index.update_file_metadata(
+                file_name=file_name,
+                path=path,
+                exists=True,
+                size_bytes=len(content.encode("utf-8")),
+                token_count=tokens.count_tokens(content),
+                content_hash=fs.compute_hash(content),
+                sections=[
+                    s.model_dump(mode="json") for s in fs.parse_sections(content)
+                ],
+            )
+    return bank
@@ -0,0 +1,161 @@
+"""Server startup benchmarks based on ``python -X importtime``.
+
+Each measurement imports the server entry point in a fresh interpreter, so
+nothing is cached in ``sys.modules``, and parses the import-time report to
+split the time spent in Cortex's own modules from third-party imports.
+"""
+
+import os
+import re
+import subprocess
+import sys
+from dataclasses import dataclass, field
+
+from .framework import Benchmark, BenchmarkResult, BenchmarkSuite
+
+# Import-time budget for Cortex's own modules at server startup (lazy tools)
+CORTEX_IMPORT_BUDGET_MS = 100.0
+
+_IMPORT_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+
+@dataclass
+class ImportTimeProfile:
+    """Parsed ``-X importtime`` report of one interpreter start."""
+
+    module: str
+    total_us: int = 0
+    self_us_by_package: dict[str, int] = field(default_factory=lambda: dict[str, int]())
+    imported_modules: list[str] = field(default_factory=lambda: list[str]())
+
+    @property
+    def total_ms(self) -> float:
+        """Cumulative import time of the measured module in milliseconds."""
+        return self.total_us / 1000
+
+    def package_ms(self, package: str) -> float:
+        """Self time of all modules of a top-level package in milliseconds."""
+        return self.self_us_by_package.get(package, 0) / 1000
+
+
+def parse_import_time(report: str, module: str) -> ImportTimeProfile:
+    """
+    Parse the stderr of ``python -X importtime``.
+
+    Args:
+        report: Import-time report
+        module: Module whose cumulative time is the total
+
+    Returns:
+        Import time profile
+    """
+    profile = ImportTimeProfile(module=module)
+    for line in report.splitlines():
+        match = _IMPORT_LINE.match(line)
+        if match is None:
+            continue
+        self_us, cumulative_us, _, name = match.groups()
+        package = name.split(".", 1)[0]
+        profile.self_us_by_package[package] = profile.self_us_by_package.get(
+            package, 0
+        ) + int(self_us)
+        profile.imported_modules.append(name)
+        if name == module:
+            profile.total_us = int(cumulative_us)
+    return profile
+
+
+def measure_import_time(
+    module: str = "cortex.main", eager_tools: bool = False
+) -> ImportTimeProfile:
+    """
+    Import a module in a fresh interpreter and profile the import.
+
+    Args:
+        module: Module to import
+        eager_tools: Import every tool module instead of using the manifest
+
+    Returns:
+        Import time profile
+
+    Raises:
+        RuntimeError: If the import fails
+    """
+    env = dict(os.environ)
+    env["CORTEX_EAGER_TOOLS"] = "1" if eager_tools else "0"
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=False,
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{completed.stderr}")
+    return parse_import_time(completed.stderr, module)
+
+
+class ImportTimeBenchmark(Benchmark):
+    """Benchmark cold import time of the server entry point."""
+
+    def __init__(
+        self,
+        eager_tools: bool = False,
+        module: str = "cortex.main",
+        budget_ms: float | None = CORTEX_IMPORT_BUDGET_MS,
+        iterations: int = 5,
+    ):
+        """Initialize import time benchmark.
+
+        Args:
+            eager_tools: Import every tool module instead of using the manifest
+            module: Module to import
+            budget_ms: Budget for Cortex's own import time, or None
+            iterations: Number of fresh interpreters to measure
+        """
+        mode = "eager tools" if eager_tools else "lazy tools"
+        super().__init__(
+            name=f"Import Time ({module}, {mode})",
+            description=f"Cold import of {module} with {mode} (-X importtime)",
+            iterations=iterations,
+            warmup_iterations=1,
+        )
+        self.eager_tools = eager_tools
+        self.module = module
+        self.budget_ms = budget_ms
+        self.profiles: list[ImportTimeProfile] = []
+
+    async def setup(self) -> None:
+        """Forget profiles of earlier runs."""
+        self.profiles = []
+
+    async def run_iteration(self) -> None:
+        """Import the module in a fresh interpreter."""
+        self.profiles.append(measure_import_time(self.module, self.eager_tools))
+
+    async def run(self) -> BenchmarkResult:
+        """Run the benchmark and add import-time details to the result."""
+        result = await super().run()
+        measured = self.profiles[self.warmup_iterations :]
+        cortex_ms = sorted(profile.package_ms("cortex") for profile in measured)
+        median_cortex_ms = cortex_ms[len(cortex_ms) // 2]
+        result.metadata["import_time_ms"] = sorted(p.total_ms for p in measured)[
+            len(measured) // 2
+        ]
+        result.metadata["cortex_import_ms"] = median_cortex_ms
+        result.metadata["modules_imported"] = len(measured[-1].imported_modules)
+        if self.budget_ms is not None:
+            result.metadata["cortex_budget_ms"] = self.budget_ms
+            result.metadata["within_budget"] = median_cortex_ms <= self.budget_ms
+        return result
+
+
+def create_startup_benchmark_suite() -> BenchmarkSuite:
+    """Create server startup benchmark suite."""
+    suite = BenchmarkSuite(
+        name="Startup Benchmarks",
+        description="Cold import time of the MCP server entry point",
+    )
+    suite.add_benchmark(ImportTimeBenchmark(eager_tools=False))
+    suite.add_benchmark(ImportTimeBenchmark(eager_tools=True, budget_ms=None))
+    return suite
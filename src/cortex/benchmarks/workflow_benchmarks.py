@@ -0,0 +1,281 @@
+"""End-to-end benchmarks of MCP tool workflows on generated memory banks.
+
+Each benchmark calls a tool through the MCP server, exactly as a client
+would (argument validation, stability wrapper, result conversion), on a
+memory bank generated by memory_bank_generator. Managers are created once in
+setup, like in a long-running server, so iterations measure warm calls.
+"""
+
+import json
+import tempfile
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, cast
+
+from mcp.types import TextContent
+
+from ..core.manager_registry import get_default_registry
+from ..core.session_logger import flush_session_logs
+from ..server import CortexMCP, mcp
+from .framework import Benchmark, BenchmarkResult, BenchmarkSuite
+from .memory_bank_generator import (
+    GeneratedMemoryBank,
+    MemoryBankSpec,
+    generate_memory_bank,
+)
+
+DEFAULT_BANK_SIZES: tuple[int, ...] = (10, 100, 1000)
+ALL_BANK_SIZES: tuple[int, ...] = (10, 100, 1000, 10000)
+
+
+@dataclass(frozen=True)
+class ToolWorkflow:
+    """Tool call (or calls) measured as one iteration.
+
+    Arguments are built from the memory bank, the iteration number and the
+    call's slot: an index below the benchmark's concurrency that no other
+    call in flight holds, so writing workflows can give each concurrent
+    call its own file. Serial runs always use slot 0.
+    """
+
+    name: str
+    tool: str
+    arguments: Callable[[GeneratedMemoryBank, int, int], list[dict[str, Any]]]
+
+
+def _load_context(bank: GeneratedMemoryBank, *_: int) -> list[dict[str, Any]]:
+    return [{"task_description": "Fix authentication token cache timeout"}]
+
+
+def _validate_all(bank: GeneratedMemoryBank, *_: int) -> list[dict[str, Any]]:
+    return [
+        {"check_type": check_type}
+        for check_type in ("schema", "duplications", "quality")
+    ]
+
+
+def _resolve_transclusions(bank: GeneratedMemoryBank, *_: int) -> list[dict[str, Any]]:
+    file_name = (bank.transcluding_files or bank.file_names)[0]
+    return [{"file_name": file_name}]
+
+
+def _suggest_refactoring(bank: GeneratedMemoryBank, *_: int) -> list[dict[str, Any]]:
+    return [{"type": "all"}]
+
+
+def _manage_file_write(
+    bank: GeneratedMemoryBank, iteration: int, slot: int
+) -> list[dict[str, Any]]:
+    content = f"# Active Context\n\n## Current Work\n\nIteration {iteration}.\n"
+    # Concurrent writes to one file fail the conflict check by design, so
+    # each slot writes its own file (slots beyond the bank size share files)
+    names = bank.file_names
+    file_name = names[(min(2, len(names) - 1) + slot) % len(names)]
+    return [{"file_name": file_name, "operation": "write", "content": content}]
+
+
+def _memory_bank_stats(bank: GeneratedMemoryBank, *_: int) -> list[dict[str, Any]]:
+    return [{}]
+
+
+WORKFLOWS: dict[str, ToolWorkflow] = {
+    workflow.name: workflow
+    for workflow in (
+        ToolWorkflow("load_context", "load_context", _load_context),
+        ToolWorkflow("validate_all", "validate", _validate_all),
+        ToolWorkflow(
+            "resolve_transclusions", "resolve_transclusions", _resolve_transclusions
+        ),
+        ToolWorkflow(
+            "suggest_refactoring", "suggest_refactoring", _suggest_refactoring
+        ),
+        ToolWorkflow("manage_file_write", "manage_file", _manage_file_write),
+        ToolWorkflow(
+            "get_memory_bank_stats", "get_memory_bank_stats", _memory_bank_stats
+        ),
+    )
+}
+
+
+def tool_response(result: object) -> dict[str, Any]:
+    """
+    Decode the JSON response of a tool called through the server.
+
+    Args:
+        result: Return value of CortexMCP.call_tool
+
+    Returns:
+        Decoded response (empty if the tool returned no JSON text)
+    """
+    # call_tool returns (content, structured output) for tools with a schema
+    content: object = result
+    if isinstance(result, tuple):
+        content = cast(tuple[object, ...], result)[0]
+    if isinstance(content, list):
+        for block in cast(list[object], content):
+            if isinstance(block, TextContent):
+                decoded: object = json.loads(block.text)
+                if isinstance(decoded, dict):
+                    return cast(dict[str, Any], decoded)
+    return {}
+
+
+def ensure_tools_registered(server: CortexMCP = mcp) -> None:
+    """Register the MCP tools if nothing registered them yet."""
+    if not any(server.registered_tools()):
+        from ..tools import register_tools
+
+        _ = register_tools()
+
+
+class ToolWorkflowBenchmark(Benchmark):
+    """Benchmark one tool workflow on a generated memory bank."""
+
+    def __init__(
+        self,
+        workflow: ToolWorkflow,
+        spec: MemoryBankSpec,
+        iterations: int = 10,
+        warmup_iterations: int = 2,
+        concurrency: int = 1,
+        track_allocations: bool = False,
+        server: CortexMCP = mcp,
+    ):
+        """Initialize tool workflow benchmark.
+
+        Args:
+            workflow: Tool workflow to measure
+            spec: Memory bank to generate
+            iterations: Number of iterations to run
+            warmup_iterations: Number of warmup iterations
+            concurrency: Concurrent calls sharing the project's managers
+            track_allocations: Record allocations with tracemalloc
+            server: Server to call the tool through
+        """
+        load = f", {concurrency} concurrent" if concurrency > 1 else ""
+        super().__init__(
+            name=f"{workflow.name} ({spec.num_files} files{load})",
+            description=f"{workflow.tool} end to end on {spec.label}",
+            iterations=iterations,
+            warmup_iterations=warmup_iterations,
+            concurrency=concurrency,
+            track_allocations=track_allocations,
+        )
+        self.workflow = workflow
+        self.spec = spec
+        self.server = server
+        self.temp_dir: tempfile.TemporaryDirectory[str] | None = None
+        self.bank: GeneratedMemoryBank | None = None
+        self.calls = 0
+        self._free_slots: list[int] = list(range(self.concurrency))
+
+    async def setup(self) -> None:
+        """Generate the memory bank and create its managers."""
+        ensure_tools_registered(self.server)
+        self.temp_dir = tempfile.TemporaryDirectory[str]()
+        root = Path(self.temp_dir.name)
+        self.bank = await generate_memory_bank(root, self.spec)
+        _ = await get_default_registry().get_managers(root)
+
+    async def teardown(self) -> None:
+        """Drop the managers and the memory bank."""
+        if self.temp_dir:
+            get_default_registry().clear_cache(Path(self.temp_dir.name))
+            # Session log lines are appended by a background thread
+            flush_session_logs()
+            self.temp_dir.cleanup()
+            self.temp_dir = None
+
+    async def run_iteration(self) -> None:
+        """Call the workflow's tool through the server.
+
+        Raises:
+            RuntimeError: If the tool reports an error
+        """
+        if self.bank is None:
+            return
+        self.calls += 1
+        slot = self._free_slots.pop(0)
+        try:
+            for arguments in self.workflow.arguments(self.bank, self.calls, slot):
+                result = await self.server.call_tool(
+                    self.workflow.tool,
+                    {**arguments, "project_root": str(self.bank.project_root)},
+                )
+                response = tool_response(result)
+                if response.get("status") == "error":
+                    raise RuntimeError(
+                        f"{self.workflow.tool} failed: {response.get('error')}"
+                    )
+        finally:
+            self._free_slots.append(slot)
+            self._free_slots.sort()
+
+    async def run(self) -> BenchmarkResult:
+        """Run the benchmark and describe the memory bank in the result."""
+        result = await super().run()
+        result.metadata["workflow"] = self.workflow.name
+        result.metadata["num_files"] = self.spec.num_files
+        result.metadata["links_per_file"] = self.spec.links_per_file
+        result.metadata["transclusions_per_file"] = self.spec.transclusions_per_file
+        return result
+
+
+def create_workflow_benchmark_suite(
+    sizes: Sequence[int] = DEFAULT_BANK_SIZES,
+    workflows: Sequence[str] | None = None,
+    links_per_file: float = 2.0,
+    transclusions_per_file: float = 0.2,
+    iterations: int = 10,
+    warmup_iterations: int = 2,
+    concurrency: int = 1,
+    track_allocations: bool = False,
+) -> BenchmarkSuite:
+    """Create end-to-end tool workflow benchmark suite.
+
+    Args:
+        sizes: Memory bank sizes (number of files)
+        workflows: Workflow names from WORKFLOWS (default: all)
+        links_per_file: Average markdown links per generated file
+        transclusions_per_file: Average transclusion directives per file
+        iterations: Iterations per benchmark
+        warmup_iterations: Warmup iterations per benchmark
+        concurrency: Concurrent calls per benchmark (1 = serial)
+        track_allocations: Record allocations with tracemalloc
+
+    Returns:
+        Suite with one benchmark per workflow and size
+
+    Raises:
+        ValueError: If a workflow name is unknown
+    """
+    selected = list(workflows) if workflows is not None else list(WORKFLOWS)
+    unknown = [name for name in selected if name not in WORKFLOWS]
+    if unknown:
+        raise ValueError(
+            f"Unknown workflows: {', '.join(unknown)}. "
+            + f"Available: {', '.join(WORKFLOWS)}"
+        )
+    suite = BenchmarkSuite(
+        name="Tool Workflow Benchmarks",
+        description="End-to-end MCP tool calls on generated memory banks",
+    )
+    for size in sizes:
+        spec = MemoryBankSpec(
+            num_files=size,
+            links_per_file=links_per_file,
+            transclusions_per_file=transclusions_per_file,
+        )
+        for name in selected:
+            suite.add_benchmark(
+                ToolWorkflowBenchmark(
+                    WORKFLOWS[name],
+                    spec,
+                    iterations=iterations,
+                    warmup_iterations=warmup_iterations,
+                    concurrency=concurrency,
+                    track_allocations=track_allocations,
+                )
+            )
+    return suite
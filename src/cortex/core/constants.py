@@ -75,7 +75,6 @@ GIT_OPERATION_TIMEOUT_SECONDS = 30  # Timeout for git operations
 
 MCP_TOOL_TIMEOUT_SECONDS = 300  # Maximum time for MCP tool execution (5 minutes)
 MCP_CONNECTION_TIMEOUT_SECONDS = 30  # Timeout for stdio connection operations
-MCP_MAX_CONCURRENT_TOOLS = 5  # Maximum concurrent MCP tool executions
 MCP_CONNECTION_RETRY_ATTEMPTS = 3  # Maximum retry attempts for transient failures
 MCP_CONNECTION_RETRY_DELAY_SECONDS = 1.0  # Delay between retry attempts
 MCP_HEALTH_CHECK_INTERVAL_SECONDS = 60  # Interval for connection health checks
@@ -87,6 +86,25 @@ MCP_TOOL_TIMEOUT_COMPLEX = 300.0  # Complex operations: analysis, multi-file ops
 MCP_TOOL_TIMEOUT_VERY_COMPLEX = 600.0  # Very complex: full tests, large refactors
 MCP_TOOL_TIMEOUT_EXTERNAL = 120.0  # External operations: network, git sync
 
+# MCP tool concurrency pools per cost class (matching the timeout tiers above)
+MCP_CONCURRENCY_FAST = 4  # Health checks, simple queries
+MCP_CONCURRENCY_MEDIUM = 3  # File reads, single validations
+MCP_CONCURRENCY_COMPLEX = 2  # Analysis, multi-file ops, full test runs
+MCP_CONCURRENCY_EXTERNAL = 2  # Subprocesses, network, git sync
+MCP_QUEUE_AGING_SECONDS = 1.0  # Queue wait that earns one priority level
+
+# MCP tool call tracing and profiling
+MCP_TRACE_BUFFER_SIZE = 200  # Recent tool call traces kept in memory
+MCP_TRACE_MAX_SPANS = 500  # Spans stored per trace; further spans are counted
+MCP_TRACE_LATENCY_SAMPLES = 1000  # Latency samples kept per tool and span name
+MCP_PROFILE_TOP_FUNCTIONS = 30  # Functions listed in a cProfile capture
+
+# Per-project manager pool (one server process serving many projects)
+MANAGER_POOL_MAX_PROJECTS = 16  # Projects with managers kept in memory
+MANAGER_POOL_IDLE_SECONDS = 1800.0  # Idle time before HTTP mode drops a project
+MANAGER_POOL_MEMORY_LIMIT_MB = 1024  # Memory ceiling of the pool in HTTP mode
+MANAGER_POOL_MEASURE_SECONDS = 60.0  # Re-estimate a project's memory this often
+
 # =============================================================================
 # Performance Thresholds
 # =============================================================================
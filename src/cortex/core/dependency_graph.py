@@ -1,6 +1,6 @@
 """Dependency graph for memory bank files with static and dynamic relationships."""
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from pathlib import Path
 from typing import cast
 
@@ -11,11 +11,15 @@ from cortex.linking.link_parser import LinkParser
 
 from .async_file_utils import open_async_text_file
 from .graph_algorithms import GraphAlgorithms
+from .graph_index import IncrementalGraphIndex
+from .graph_query import iter_compact_mermaid, query_graph
 from .models import (
+    CompactGraph,
     DependencyEdge,
     DependencyNode,
     FileDependencyDetail,
     GraphDict,
+    GraphQuery,
     ReferenceEdge,
     ReferenceGraph,
     TransclusionEdge,
@@ -94,6 +98,11 @@ class DependencyGraph:
         self.link_types: dict[str, dict[str, str]] = (
             {}
         )  # {from_file: {to_file: "reference"|"transclusion"}}
+        # Derived SCC/order/closure index, built lazily on first query and
+        # kept up to date by the mutation methods below
+        self._index: IncrementalGraphIndex | None = None
+        self._index_shape: tuple[int, int] = (0, 0)
+        self._loading_order_cache: tuple[tuple[int, bool], list[str]] | None = None
 
     def compute_loading_order(self, files: list[str] | None = None) -> list[str]:
         """
@@ -106,7 +115,13 @@ class DependencyGraph:
             Files in order where dependencies are loaded first.
         """
         if files is None:
-            files = list(self.static_deps.keys())
+            cache_key = (self._get_index().revision, bool(self.dynamic_deps))
+            cached = self._loading_order_cache
+            if cached is not None and cached[0] == cache_key:
+                return list(cached[1])
+            order = self.compute_loading_order(list(self.static_deps.keys()))
+            self._loading_order_cache = (cache_key, order)
+            return list(order)
 
         # If we have dynamic dependencies, use topological sort
         if self.dynamic_deps:
@@ -165,26 +180,14 @@ class DependencyGraph:
         Returns:
             List of file names that depend on this file
         """
-        # Check static dependencies
-        static_dependents = [
-            fname
-            for fname, info in self.static_deps.items()
-            if file_name in info.depends_on
-        ]
-
-        # Check dynamic dependencies (Phase 2+)
-        dynamic_dependents = [
-            fname for fname, deps in self.dynamic_deps.items() if file_name in deps
-        ]
-
-        return list(set(static_dependents + dynamic_dependents))
+        return list(self._get_index().dependents(file_name))
 
     def get_minimal_context(self, target_file: str) -> list[str]:
         """
         Get minimal set of files needed to understand target file.
         Foundation for smart context selection in Phase 4.
 
-        Uses depth-first search to find all transitive dependencies.
+        Transitive dependencies come from the cached closure index.
 
         Args:
             target_file: File to get context for
@@ -192,16 +195,28 @@ class DependencyGraph:
         Returns:
             List of files needed (including target), in loading order
         """
-        # Get all transitive dependencies
-        needed = GraphAlgorithms.get_transitive_dependencies(
-            target_file, self.get_dependencies
-        )
+        needed = self.get_transitive_dependencies(target_file)
         needed.add(target_file)
 
         # Return in proper loading order
         loading_order = self.compute_loading_order()
         return [f for f in loading_order if f in needed]
 
+    def get_transitive_dependencies(self, file_name: str) -> set[str]:
+        """
+        Get all transitive dependencies of a file.
+
+        Closures are memoized per strongly connected component and only
+        invalidated for components whose reachability changes.
+
+        Args:
+            file_name: File to resolve
+
+        Returns:
+            Set of all files reachable through dependencies (not including file)
+        """
+        return self._get_index().transitive_dependencies(file_name)
+
     def get_file_category(self, file_name: str) -> str:
         """
         Get category of a file.
@@ -252,11 +267,13 @@ class DependencyGraph:
             from_file: File that has the dependency
             to_file: File that is depended upon
         """
+        fresh = self._index_is_fresh()
         if from_file not in self.dynamic_deps:
             self.dynamic_deps[from_file] = []
 
         if to_file not in self.dynamic_deps[from_file]:
             self.dynamic_deps[from_file].append(to_file)
+            self._index_add_edge(from_file, to_file, fresh)
 
     def remove_dynamic_dependency(self, from_file: str, to_file: str):
         """
@@ -266,9 +283,11 @@ class DependencyGraph:
             from_file: File that has the dependency
             to_file: File that is depended upon
         """
+        fresh = self._index_is_fresh()
         if from_file in self.dynamic_deps:
             if to_file in self.dynamic_deps[from_file]:
                 self.dynamic_deps[from_file].remove(to_file)
+                self._index_remove_edge(from_file, to_file, fresh)
 
     def clear_dynamic_dependencies(self, file_name: str | None = None):
         """
@@ -278,9 +297,15 @@ class DependencyGraph:
             file_name: File to clear dependencies for. If None, clears all.
         """
         if file_name:
-            _ = self.dynamic_deps.pop(file_name, None)
+            fresh = self._index_is_fresh()
+            removed = self.dynamic_deps.pop(file_name, None)
+            for to_file in removed or []:
+                self._index_remove_edge(file_name, to_file, fresh)
+            if fresh:
+                self._index_shape = self._current_shape()
         else:
             self.dynamic_deps.clear()
+            self.invalidate_index()
 
     def has_circular_dependency(self) -> bool:
         """
@@ -290,17 +315,7 @@ class DependencyGraph:
         Returns:
             True if circular dependency detected
         """
-        visited: set[str] = set()
-        rec_stack: set[str] = set()
-
-        for file in self.static_deps.keys():
-            if file not in visited:
-                if GraphAlgorithms.has_cycle_dfs(
-                    file, visited, rec_stack, self.get_dependencies
-                ):
-                    return True
-
-        return False
+        return self._get_index().has_cycles()
 
     def to_dict(self) -> DependencyGraphExport:
         """
@@ -340,14 +355,73 @@ class DependencyGraph:
         Returns:
             Mermaid flowchart syntax
         """
-        lines = ["flowchart TD"]
-        self._add_mermaid_nodes(lines)
-        self._add_mermaid_edges(lines)
-        self._add_mermaid_styling(lines)
-        return "\n".join(lines)
+        return "\n".join(self.iter_mermaid())
+
+    def iter_mermaid(self) -> Iterator[str]:
+        """
+        Generate the Mermaid diagram of the whole graph line by line.
+
+        Yields:
+            Mermaid flowchart lines
+        """
+        yield "flowchart TD"
+        yield from self._iter_mermaid_nodes()
+        yield from self._iter_mermaid_edges()
+        yield from self._iter_mermaid_styling()
+
+    def query(self, query: GraphQuery) -> CompactGraph:
+        """
+        Get a filtered, paginated subgraph as a compact edge list.
+
+        Args:
+            query: Root/depth/link type/category filters and paging
+
+        Returns:
+            Compact graph for the requested page
+        """
+        return query_graph(
+            self.get_all_files(),
+            self.iter_typed_edges(),
+            self.get_file_category,
+            query,
+        )
+
+    def query_mermaid(self, query: GraphQuery) -> Iterator[str]:
+        """
+        Generate the Mermaid diagram of a graph query line by line.
+
+        Args:
+            query: Root/depth/link type/category filters and paging
+
+        Returns:
+            Iterator over Mermaid flowchart lines
+        """
+        return iter_compact_mermaid(self.query(query), self.get_file_category)
+
+    def iter_typed_edges(self) -> Iterator[tuple[str, str, str]]:
+        """
+        Iterate every edge once with its type, in a stable order.
+
+        The type is the parsed link type ("reference" or "transclusion")
+        when known, otherwise "links" for dynamic and "informs" for static
+        dependencies.
+
+        Yields:
+            (source, target, type) where source depends on target
+        """
+        for source in sorted(self.get_all_files()):
+            dynamic = self.dynamic_deps.get(source, [])
+            link_types = self.link_types.get(source, {})
+            for target in sorted(self.get_dependencies(source)):
+                if target in link_types:
+                    yield source, target, link_types[target]
+                elif target in dynamic:
+                    yield source, target, "links"
+                else:
+                    yield source, target, "informs"
 
-    def _add_mermaid_nodes(self, lines: list[str]) -> None:
-        """Add nodes to Mermaid diagram."""
+    def _iter_mermaid_nodes(self) -> Iterator[str]:
+        """Generate node lines of the Mermaid diagram."""
 
         def _format_node(file_name: str, category: str) -> str:
             """Format a single node line."""
@@ -360,38 +434,22 @@ class DependencyGraph:
             }
             return style_map.get(category, f'    {node_id}["{label}"]')
 
-        node_lines = [
-            _format_node(file_name, info.category)
-            for file_name, info in self.static_deps.items()
-        ]
-        lines.extend(node_lines)
+        for file_name, info in self.static_deps.items():
+            yield _format_node(file_name, info.category)
 
-    def _add_mermaid_edges(self, lines: list[str]) -> None:
-        """Add edges to Mermaid diagram."""
-        all_dependencies = {
-            file_name: self.get_dependencies(file_name)
-            for file_name in self.static_deps.keys()
-        }
-        edge_lines = [
-            (
-                f"    {dep.replace('.md', '').replace('-', '')} --> "
-                f"{file_name.replace('.md', '').replace('-', '')}"
-            )
-            for file_name, deps in all_dependencies.items()
-            for dep in deps
-        ]
-        lines.extend(edge_lines)
-
-    def _add_mermaid_styling(self, lines: list[str]) -> None:
-        """Add styling to Mermaid diagram."""
-        lines.extend(
-            [
-                "",
-                "    classDef meta fill:#e1f5ff,stroke:#01579b",
-                "    classDef foundation fill:#fff9c4,stroke:#f57f17",
-                "    classDef active fill:#f3e5f5,stroke:#4a148c",
-            ]
-        )
+    def _iter_mermaid_edges(self) -> Iterator[str]:
+        """Generate edge lines of the Mermaid diagram."""
+        for file_name in self.static_deps:
+            file_id = file_name.replace(".md", "").replace("-", "")
+            for dep in self.get_dependencies(file_name):
+                yield f"    {dep.replace('.md', '').replace('-', '')} --> {file_id}"
+
+    def _iter_mermaid_styling(self) -> Iterator[str]:
+        """Generate styling lines of the Mermaid diagram."""
+        yield ""
+        yield "    classDef meta fill:#e1f5ff,stroke:#01579b"
+        yield "    classDef foundation fill:#fff9c4,stroke:#f57f17"
+        yield "    classDef active fill:#f3e5f5,stroke:#4a148c"
 
     # Phase 2: Dynamic link-based dependency methods
 
@@ -412,6 +470,7 @@ class DependencyGraph:
         """
         self.dynamic_deps.clear()
         self.link_types.clear()
+        self.invalidate_index()
         md_files = list(memory_bank_dir.glob("*.md"))
         for file_path in md_files:
             await self._process_file_links(file_path, link_parser)
@@ -475,11 +534,13 @@ class DependencyGraph:
             link_type: "reference" or "transclusion"
         """
         # Add to dynamic dependencies
+        fresh = self._index_is_fresh()
         if source_file not in self.dynamic_deps:
             self.dynamic_deps[source_file] = []
 
         if target_file not in self.dynamic_deps[source_file]:
             self.dynamic_deps[source_file].append(target_file)
+            self._index_add_edge(source_file, target_file, fresh)
 
         # Track link type
         if source_file not in self.link_types:
@@ -534,11 +595,12 @@ class DependencyGraph:
         """
         Detect circular dependencies in the graph.
 
+        One representative cycle is reported per strongly connected component.
+
         Returns:
             List of cycles, each as a list of files forming the cycle
         """
-        all_files = set(self.static_deps.keys()) | set(self.dynamic_deps.keys())
-        return GraphAlgorithms.detect_cycles(list(all_files), self.get_dependencies)
+        return self._get_index().cycles()
 
     def get_all_files(self) -> list[str]:
         """
@@ -549,6 +611,60 @@ class DependencyGraph:
         """
         return list(set(self.static_deps.keys()) | set(self.dynamic_deps.keys()))
 
+    def invalidate_index(self) -> None:
+        """
+        Drop the derived graph index so it is rebuilt on the next query.
+
+        Call this after mutating ``static_deps`` or ``dynamic_deps`` directly
+        instead of through the dependency methods.
+        """
+        self._index = None
+        self._loading_order_cache = None
+
+    def _current_shape(self) -> tuple[int, int]:
+        """Cheap fingerprint used to notice direct dictionary mutations."""
+        return (len(self.static_deps), len(self.dynamic_deps))
+
+    def _index_is_fresh(self) -> bool:
+        """Check whether the index exists and matches the dictionaries."""
+        return self._index is not None and self._index_shape == self._current_shape()
+
+    def _get_index(self) -> IncrementalGraphIndex:
+        """Get the graph index, building it from scratch when missing or stale."""
+        if self._index is None or not self._index_is_fresh():
+            all_files = self.get_all_files()
+            edges = [
+                (file_name, dep)
+                for file_name in all_files
+                for dep in self._iter_edge_targets(file_name)
+            ]
+            self._index = IncrementalGraphIndex.build(all_files, edges)
+            self._index_shape = self._current_shape()
+            self._loading_order_cache = None
+        return self._index
+
+    def _iter_edge_targets(self, file_name: str) -> list[str]:
+        """List dependency targets of a file, counting static and dynamic edges."""
+        file_info = self.static_deps.get(file_name)
+        static = file_info.depends_on if file_info else []
+        return [*dict.fromkeys(static), *self.dynamic_deps.get(file_name, [])]
+
+    def _index_add_edge(self, from_file: str, to_file: str, fresh: bool) -> None:
+        """Apply a new dynamic edge to the index, or drop a stale index."""
+        if self._index is None or not fresh:
+            self.invalidate_index()
+            return
+        self._index.add_edge(from_file, to_file)
+        self._index_shape = self._current_shape()
+
+    def _index_remove_edge(self, from_file: str, to_file: str, fresh: bool) -> None:
+        """Apply a removed dynamic edge to the index, or drop a stale index."""
+        if self._index is None or not fresh:
+            self.invalidate_index()
+            return
+        self._index.remove_edge(from_file, to_file)
+        self._index_shape = self._current_shape()
+
     def get_transclusion_graph(self) -> TransclusionGraph:
         """
         Get a graph containing only transclusion links.
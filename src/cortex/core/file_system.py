@@ -17,6 +17,7 @@ from .exceptions import FileConflictError, FileLockTimeoutError, GitConflictErro
 from .path_resolver import CortexResourceType, get_cortex_path
 from .retry import retry_async
 from .security import InputValidator, RateLimiter
+from .tracing import span, traced
 
 
 class FileSystemManager:
@@ -119,6 +120,7 @@ class FileSystemManager:
 
         return file_path
 
+    @traced("fs.read_file")
     async def read_file(self, file_path: Path) -> tuple[str, str]:
         """
         Read file content and compute hash with retry logic.
@@ -134,7 +136,8 @@ class FileSystemManager:
             PermissionError: If file cannot be read
         """
         # Rate limiting
-        await self.rate_limiter.acquire()
+        with span("fs.rate_limit_wait"):
+            await self.rate_limiter.acquire()
 
         if not self.validate_path(file_path):
             raise PermissionError(
@@ -159,6 +162,7 @@ class FileSystemManager:
             exceptions=(OSError, IOError, PermissionError),
         )
 
+    @traced("fs.write_file")
     async def write_file(
         self,
         file_path: Path,
@@ -181,10 +185,10 @@ class FileSystemManager:
             FileLockTimeoutError: If unable to acquire lock
             PermissionError: If path is invalid
         """
-        await self.rate_limiter.acquire()
-        self._validate_write_path(file_path)
-        self._validate_write_content(file_path, content)
-        lock_path = file_path.with_suffix(file_path.suffix + ".lock")
+        with span("fs.rate_limit_wait"):
+            await self.rate_limiter.acquire()
+        self.validate_write(file_path, content)
+        lock_path = self.lock_path_for(file_path)
         write_operation = self._create_write_operation(
             file_path, content, expected_hash, lock_path
         )
@@ -195,6 +199,25 @@ class FileSystemManager:
             exceptions=(OSError, IOError, PermissionError, BlockingIOError),
         )
 
+    def validate_write(self, file_path: Path, content: str) -> None:
+        """
+        Check that content may be written to a path.
+
+        Args:
+            file_path: Path to file to write
+            content: Content to write
+
+        Raises:
+            PermissionError: If path is invalid
+            GitConflictError: If content contains git conflict markers
+        """
+        self._validate_write_path(file_path)
+        self._validate_write_content(file_path, content)
+
+    def lock_path_for(self, file_path: Path) -> Path:
+        """Get the lock file guarding writes to a file."""
+        return file_path.with_suffix(file_path.suffix + ".lock")
+
     def _create_write_operation(
         self,
         file_path: Path,
@@ -5,7 +5,8 @@ This module provides algorithmic operations for analyzing dependency graphs,
 including cycle detection, topological sorting, and path finding.
 """
 
-from collections.abc import Callable
+from collections import deque
+from collections.abc import Callable, Iterable
 
 
 class GraphAlgorithms:
@@ -14,6 +15,7 @@ class GraphAlgorithms:
 
     Features:
     - Cycle detection using DFS
+    - Strongly connected components using Tarjan's algorithm
     - Topological sorting using Kahn's algorithm
     - Reachability analysis
     - Graph traversal utilities
@@ -118,16 +120,16 @@ class GraphAlgorithms:
 
         for file in files:
             for dep in get_dependencies_fn(file):
-                if dep in files:
+                if dep in in_degree:
                     adj_list[dep].append(file)
                     in_degree[file] += 1
 
         # Kahn's algorithm
-        queue: list[str] = [f for f in files if in_degree[f] == 0]
+        queue: deque[str] = deque(f for f in files if in_degree[f] == 0)
         result: list[str] = []
 
         while queue:
-            current = queue.pop(0)
+            current = queue.popleft()
             result.append(current)
 
             neighbors = adj_list[current]
@@ -140,6 +142,39 @@ class GraphAlgorithms:
         # Return partial order
         return result
 
+    @staticmethod
+    def strongly_connected_components(
+        nodes: Iterable[str], get_dependencies_fn: Callable[[str], Iterable[str]]
+    ) -> list[list[str]]:
+        """
+        Find strongly connected components using iterative Tarjan's algorithm.
+
+        Components are returned dependencies-first: every component appears
+        after all components it depends on, which makes the result a valid
+        topological order of the condensed graph.
+
+        Args:
+            nodes: Nodes to start the search from
+            get_dependencies_fn: Function that returns dependencies for a node
+
+        Returns:
+            List of components, each as a list of node names
+        """
+        index: dict[str, int] = {}
+        low_link: dict[str, int] = {}
+        on_stack: set[str] = set()
+        stack: list[str] = []
+        components: list[list[str]] = []
+
+        for root in nodes:
+            if root in index:
+                continue
+            _tarjan_visit(
+                root, get_dependencies_fn, index, low_link, on_stack, stack, components
+            )
+
+        return components
+
     @staticmethod
     def get_reachable_nodes(
         start_node: str,
@@ -201,11 +236,11 @@ class GraphAlgorithms:
             Set of all transitive dependencies (not including target)
         """
         dependencies: set[str] = set()
-        to_process: list[str] = [target]
+        to_process: deque[str] = deque([target])
         visited: set[str] = {target}
 
         while to_process:
-            current = to_process.pop(0)
+            current = to_process.popleft()
             deps = get_dependencies_fn(current)
 
             for dep in deps:
@@ -268,3 +303,46 @@ def _should_visit_neighbor(
     if filter_fn is not None and not filter_fn(current, neighbor):
         return False
     return True
+
+
+def _tarjan_visit(
+    root: str,
+    get_dependencies_fn: Callable[[str], Iterable[str]],
+    index: dict[str, int],
+    low_link: dict[str, int],
+    on_stack: set[str],
+    stack: list[str],
+    components: list[list[str]],
+) -> None:
+    """Run one iterative Tarjan DFS from root, appending finished components."""
+    work: list[tuple[str, list[str]]] = [(root, list(get_dependencies_fn(root)))]
+    index[root] = low_link[root] = len(index)
+    stack.append(root)
+    on_stack.add(root)
+
+    while work:
+        node, pending = work[-1]
+        if pending:
+            dep = pending.pop()
+            if dep not in index:
+                index[dep] = low_link[dep] = len(index)
+                stack.append(dep)
+                on_stack.add(dep)
+                work.append((dep, list(get_dependencies_fn(dep))))
+            elif dep in on_stack:
+                low_link[node] = min(low_link[node], index[dep])
+            continue
+
+        _ = work.pop()
+        if work:
+            parent = work[-1][0]
+            low_link[parent] = min(low_link[parent], low_link[node])
+        if low_link[node] == index[node]:
+            component: list[str] = []
+            while True:
+                member = stack.pop()
+                on_stack.discard(member)
+                component.append(member)
+                if member == node:
+                    break
+            components.append(component)
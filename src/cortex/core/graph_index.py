@@ -0,0 +1,441 @@
+"""
+Incremental Graph Index for Dependency Analysis.
+
+This module maintains derived structures for a dependency graph so that
+repeated queries do not rerun full traversals:
+- Strongly connected components (bulk Tarjan, merged on edge insertion)
+- A topological order of the condensed graph (Pearce-Kelly dynamic ordering)
+- Transitive closures cached per component and invalidated only for the
+  components whose reachability actually changed
+
+Edges point from a file to the file it depends on. The order keeps every
+dependency before its dependents.
+"""
+
+from collections.abc import Callable, Iterable
+
+from .graph_algorithms import GraphAlgorithms
+
+
+class IncrementalGraphIndex:
+    """
+    Dependency graph index with incremental SCC and closure maintenance.
+
+    Features:
+    - O(1) cycle checks and component lookups
+    - Incremental topological order on edge insertion
+    - Local SCC recomputation on edge removal
+    - Memoized transitive dependencies with per-component invalidation
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self.revision: int = 0
+        self._edge_refs: dict[tuple[str, str], int] = {}
+        self._deps: dict[str, set[str]] = {}
+        self._rdeps: dict[str, set[str]] = {}
+        self._comp_of: dict[str, int] = {}
+        self._members: dict[int, set[str]] = {}
+        self._comp_deps: dict[int, dict[int, int]] = {}
+        self._comp_rdeps: dict[int, dict[int, int]] = {}
+        self._ord: dict[int, int] = {}
+        self._cyclic: set[int] = set()
+        self._closures: dict[int, frozenset[str]] = {}
+        self._next_comp: int = 0
+        self._next_ord: int = 0
+        self._order_cache: tuple[int, list[str]] | None = None
+        self._cycles_cache: tuple[int, list[list[str]]] | None = None
+
+    @classmethod
+    def build(
+        cls, nodes: Iterable[str], edges: Iterable[tuple[str, str]]
+    ) -> "IncrementalGraphIndex":
+        """
+        Build an index in bulk from nodes and (source, dependency) edges.
+
+        Args:
+            nodes: Nodes to include even if they have no edges
+            edges: Pairs of (file, file it depends on); duplicates are counted
+
+        Returns:
+            Populated index
+        """
+        index = cls()
+        for node in nodes:
+            index._register_node(node)
+        for source, target in edges:
+            index._register_node(source)
+            index._register_node(target)
+            key = (source, target)
+            index._edge_refs[key] = index._edge_refs.get(key, 0) + 1
+            index._deps[source].add(target)
+            index._rdeps[target].add(source)
+
+        components = GraphAlgorithms.strongly_connected_components(
+            list(index._deps), index._deps.__getitem__
+        )
+        for position, members in enumerate(components):
+            comp = index._new_component(set(members))
+            index._ord[comp] = position
+        index._next_ord = len(components)
+        index._rebuild_component_edges(set(index._members))
+        return index
+
+    # Mutation
+
+    def add_edge(self, source: str, target: str) -> None:
+        """
+        Add a dependency edge, merging components if a cycle is closed.
+
+        Args:
+            source: File that has the dependency
+            target: File that is depended upon
+        """
+        key = (source, target)
+        refs = self._edge_refs.get(key, 0)
+        self._edge_refs[key] = refs + 1
+        if refs:
+            return
+
+        self._ensure_node(source)
+        self._ensure_node(target)
+        self._deps[source].add(target)
+        self._rdeps[target].add(source)
+        self.revision += 1
+
+        src_comp = self._comp_of[source]
+        dst_comp = self._comp_of[target]
+        self._invalidate_closures(src_comp)
+        if src_comp == dst_comp:
+            if source == target:
+                self._cyclic.add(src_comp)
+            return
+
+        self._link_components(src_comp, dst_comp, 1)
+        if self._ord[dst_comp] > self._ord[src_comp]:
+            self._reorder(src_comp, dst_comp)
+
+    def remove_edge(self, source: str, target: str) -> None:
+        """
+        Remove a dependency edge, splitting its component if needed.
+
+        Args:
+            source: File that has the dependency
+            target: File that is depended upon
+        """
+        key = (source, target)
+        refs = self._edge_refs.get(key, 0)
+        if refs == 0:
+            return
+        if refs > 1:
+            self._edge_refs[key] = refs - 1
+            return
+
+        del self._edge_refs[key]
+        self._deps[source].discard(target)
+        self._rdeps[target].discard(source)
+        self.revision += 1
+
+        src_comp = self._comp_of[source]
+        dst_comp = self._comp_of[target]
+        self._invalidate_closures(src_comp)
+        if src_comp != dst_comp:
+            self._link_components(src_comp, dst_comp, -1)
+        elif len(self._members[src_comp]) == 1:
+            self._cyclic.discard(src_comp)
+        else:
+            self._split_component(src_comp)
+
+    # Queries
+
+    def has_node(self, node: str) -> bool:
+        """Check whether a node is known to the index."""
+        return node in self._comp_of
+
+    def dependencies(self, node: str) -> set[str]:
+        """Get direct dependencies of a node."""
+        return set(self._deps.get(node, ()))
+
+    def dependents(self, node: str) -> set[str]:
+        """Get nodes that directly depend on a node."""
+        return set(self._rdeps.get(node, ()))
+
+    def component(self, node: str) -> frozenset[str]:
+        """Get the strongly connected component containing a node."""
+        comp = self._comp_of.get(node)
+        if comp is None:
+            return frozenset({node})
+        return frozenset(self._members[comp])
+
+    def has_cycles(self) -> bool:
+        """Check whether any component contains a cycle."""
+        return bool(self._cyclic)
+
+    def is_cyclic(self, node: str) -> bool:
+        """Check whether a node is part of a cycle."""
+        comp = self._comp_of.get(node)
+        return comp is not None and comp in self._cyclic
+
+    def transitive_dependencies(self, node: str) -> set[str]:
+        """
+        Get all transitive dependencies of a node (not including itself).
+
+        Args:
+            node: Node to resolve
+
+        Returns:
+            Set of every node reachable through dependency edges
+        """
+        comp = self._comp_of.get(node)
+        if comp is None:
+            return set()
+        closure = set(self._closure(comp))
+        closure.discard(node)
+        return closure
+
+    def topological_order(self) -> list[str]:
+        """
+        Get all nodes ordered so dependencies come before dependents.
+
+        Members of the same component are grouped and sorted by name.
+
+        Returns:
+            Ordered list of node names
+        """
+        if self._order_cache is not None and self._order_cache[0] == self.revision:
+            return list(self._order_cache[1])
+        order = [
+            member
+            for comp in sorted(self._members, key=self._ord.__getitem__)
+            for member in sorted(self._members[comp])
+        ]
+        self._order_cache = (self.revision, order)
+        return list(order)
+
+    def components(self) -> list[list[str]]:
+        """
+        Get all components ordered so dependencies come before dependents.
+
+        Returns:
+            List of components, each as a name-sorted list of nodes
+        """
+        return [
+            sorted(self._members[comp])
+            for comp in sorted(self._members, key=self._ord.__getitem__)
+        ]
+
+    def cycles(self) -> list[list[str]]:
+        """
+        Get one representative cycle per cyclic component.
+
+        Each cycle starts and ends with the same node, e.g. ``[a, b, a]``.
+
+        Returns:
+            List of cycles in topological order of their components
+        """
+        if self._cycles_cache is not None and self._cycles_cache[0] == self.revision:
+            return [list(cycle) for cycle in self._cycles_cache[1]]
+        cycles = [
+            self._extract_cycle(comp)
+            for comp in sorted(self._cyclic, key=self._ord.__getitem__)
+        ]
+        self._cycles_cache = (self.revision, cycles)
+        return [list(cycle) for cycle in cycles]
+
+    # Internal helpers
+
+    def _register_node(self, node: str) -> None:
+        """Register adjacency entries for a node without assigning a component."""
+        if node not in self._deps:
+            self._deps[node] = set()
+            self._rdeps[node] = set()
+
+    def _ensure_node(self, node: str) -> None:
+        """Add a node as a new singleton component at the end of the order."""
+        if node in self._comp_of:
+            return
+        self._register_node(node)
+        comp = self._new_component({node})
+        self._ord[comp] = self._next_ord
+        self._next_ord += 1
+
+    def _new_component(self, members: set[str]) -> int:
+        """Create a component for members and record cycle status."""
+        comp = self._next_comp
+        self._next_comp += 1
+        self._members[comp] = members
+        self._comp_deps[comp] = {}
+        self._comp_rdeps[comp] = {}
+        for member in members:
+            self._comp_of[member] = comp
+        if len(members) > 1 or any(m in self._deps[m] for m in members):
+            self._cyclic.add(comp)
+        return comp
+
+    def _drop_component(self, comp: int) -> None:
+        """Remove a component and its condensed edges."""
+        for dep in self._comp_deps.pop(comp):
+            _ = self._comp_rdeps[dep].pop(comp, None)
+        for dependent in self._comp_rdeps.pop(comp):
+            _ = self._comp_deps[dependent].pop(comp, None)
+        del self._members[comp]
+        del self._ord[comp]
+        self._cyclic.discard(comp)
+        _ = self._closures.pop(comp, None)
+
+    def _link_components(self, src: int, dst: int, delta: int) -> None:
+        """Adjust the multiplicity of a condensed edge."""
+        count = self._comp_deps[src].get(dst, 0) + delta
+        if count > 0:
+            self._comp_deps[src][dst] = count
+            self._comp_rdeps[dst][src] = count
+        else:
+            _ = self._comp_deps[src].pop(dst, None)
+            _ = self._comp_rdeps[dst].pop(src, None)
+
+    def _rebuild_component_edges(self, comps: set[int]) -> None:
+        """Recompute condensed edges touching the given components."""
+        for comp in comps:
+            for member in self._members[comp]:
+                for dep in self._deps[member]:
+                    dep_comp = self._comp_of[dep]
+                    if dep_comp != comp:
+                        self._link_components(comp, dep_comp, 1)
+                for dependent in self._rdeps[member]:
+                    dependent_comp = self._comp_of[dependent]
+                    if dependent_comp != comp and dependent_comp not in comps:
+                        self._link_components(dependent_comp, comp, 1)
+
+    def _reorder(self, src: int, dst: int) -> None:
+        """
+        Restore the order after adding src -> dst with ord[dst] > ord[src].
+
+        Pearce-Kelly: collect dependents of src and dependencies of dst inside
+        the affected window, then reassign their positions. If the two sets
+        intersect the new edge closed a cycle and the intersection is merged.
+        """
+        lower, upper = self._ord[src], self._ord[dst]
+        forward = self._bounded_search(src, self._comp_rdeps, lambda o: o <= upper)
+        backward = self._bounded_search(dst, self._comp_deps, lambda o: o >= lower)
+        merged = forward & backward
+
+        positions = sorted(self._ord[c] for c in forward | backward)
+        before = sorted(backward - merged, key=self._ord.__getitem__)
+        after = sorted(forward - merged, key=self._ord.__getitem__)
+
+        for position, comp in zip(positions, before, strict=False):
+            self._ord[comp] = position
+        tail = positions[len(positions) - len(after) :]
+        for position, comp in zip(tail, after, strict=True):
+            self._ord[comp] = position
+        if merged:
+            self._merge_components(merged, positions[len(before)])
+
+    def _bounded_search(
+        self,
+        start: int,
+        edges: dict[int, dict[int, int]],
+        in_window: Callable[[int], bool],
+    ) -> set[int]:
+        """Collect components reachable from start whose order is in window."""
+        found: set[int] = {start}
+        stack = [start]
+        while stack:
+            comp = stack.pop()
+            for neighbor in edges[comp]:
+                if neighbor not in found and in_window(self._ord[neighbor]):
+                    found.add(neighbor)
+                    stack.append(neighbor)
+        return found
+
+    def _merge_components(self, comps: set[int], position: int) -> None:
+        """Merge components that now form one cycle into a single component."""
+        members: set[str] = set()
+        for comp in comps:
+            members |= self._members[comp]
+        for comp in comps:
+            self._drop_component(comp)
+        merged = self._new_component(members)
+        self._ord[merged] = position
+        self._rebuild_component_edges({merged})
+
+    def _split_component(self, comp: int) -> None:
+        """Recompute SCCs inside a component after an internal edge removal."""
+        members = self._members[comp]
+        parts = GraphAlgorithms.strongly_connected_components(
+            sorted(members), lambda n: [d for d in self._deps[n] if d in members]
+        )
+        if len(parts) == 1:
+            return
+
+        ordered = sorted(self._members, key=self._ord.__getitem__)
+        self._drop_component(comp)
+        new_comps = [self._new_component(set(part)) for part in parts]
+        self._rebuild_component_edges(set(new_comps))
+
+        at = ordered.index(comp)
+        ordered[at : at + 1] = new_comps
+        for offset, current in enumerate(ordered):
+            self._ord[current] = offset
+        self._next_ord = len(ordered)
+
+    def _invalidate_closures(self, comp: int) -> None:
+        """Drop cached closures of comp and every component depending on it."""
+        if comp not in self._closures:
+            return
+        stack = [comp]
+        _ = self._closures.pop(comp)
+        while stack:
+            current = stack.pop()
+            for dependent in self._comp_rdeps[current]:
+                if self._closures.pop(dependent, None) is not None:
+                    stack.append(dependent)
+
+    def _closure(self, comp: int) -> frozenset[str]:
+        """Get the memoized set of nodes reachable from a component."""
+        cached = self._closures.get(comp)
+        if cached is not None:
+            return cached
+
+        stack: list[tuple[int, bool]] = [(comp, False)]
+        while stack:
+            current, expanded = stack.pop()
+            if current in self._closures:
+                continue
+            if expanded:
+                reachable = set(self._members[current])
+                for dep in self._comp_deps[current]:
+                    reachable |= self._closures[dep]
+                self._closures[current] = frozenset(reachable)
+                continue
+            stack.append((current, True))
+            stack.extend(
+                (dep, False)
+                for dep in self._comp_deps[current]
+                if dep not in self._closures
+            )
+        return self._closures[comp]
+
+    def _extract_cycle(self, comp: int) -> list[str]:
+        """Find a shortest cycle through the smallest member of a component."""
+        members = self._members[comp]
+        start = min(members)
+        if start in self._deps[start]:
+            return [start, start]
+
+        parents: dict[str, str] = {}
+        frontier = [start]
+        while frontier:
+            next_frontier: list[str] = []
+            for node in frontier:
+                for dep in sorted(self._deps[node]):
+                    if dep == start:
+                        path = [node]
+                        while path[-1] != start:
+                            path.append(parents[path[-1]])
+                        return [start, *reversed(path[:-1]), start]
+                    if dep in members and dep not in parents:
+                        parents[dep] = node
+                        next_frontier.append(dep)
+            frontier = next_frontier
+        return [start, start]
@@ -0,0 +1,171 @@
+"""
+Graph Query - Filtered, paginated views of a dependency graph.
+
+Large memory banks produce link graphs with thousands of edges. Instead of
+serializing the whole graph, callers describe the neighborhood they need
+(root file, depth, link types, categories, page) and get back a compact
+edge list: each file name appears once in a node table and edges are
+integer triples. Mermaid output for a query result is generated lazily,
+one line at a time.
+"""
+
+from collections import Counter, deque
+from collections.abc import Callable, Iterable, Iterator
+
+from .models import CompactGraph, GraphQuery
+
+# Mermaid arrow per edge type; unknown types use a plain arrow
+_MERMAID_ARROWS: dict[str, str] = {
+    "reference": "-->",
+    "transclusion": "-.->",
+    "links": "-->",
+    "informs": "==>",
+}
+
+_MERMAID_CLASSES: tuple[str, ...] = (
+    "    classDef meta fill:#e1f5ff,stroke:#01579b",
+    "    classDef foundation fill:#fff9c4,stroke:#f57f17",
+    "    classDef active fill:#f3e5f5,stroke:#4a148c",
+)
+
+
+def query_graph(
+    files: Iterable[str],
+    edges: Iterable[tuple[str, str, str]],
+    category_of: Callable[[str], str],
+    query: GraphQuery,
+) -> CompactGraph:
+    """
+    Select a filtered, paginated subgraph as a compact edge list.
+
+    Args:
+        files: All files in the graph
+        edges: (source, target, type) triples in a stable order
+        category_of: Function returning the category of a file
+        query: Filters and paging
+
+    Returns:
+        Compact graph for the requested page
+    """
+    allowed_types = set(query.link_types) if query.link_types is not None else None
+    allowed_categories = set(query.categories) if query.categories is not None else None
+
+    def _keep_node(node: str) -> bool:
+        return allowed_categories is None or category_of(node) in allowed_categories
+
+    nodes = {node for node in files if _keep_node(node)}
+    matched = [
+        (source, target, edge_type)
+        for source, target, edge_type in edges
+        if (allowed_types is None or edge_type in allowed_types)
+        and _keep_node(source)
+        and _keep_node(target)
+    ]
+    nodes.update(node for source, target, _ in matched for node in (source, target))
+
+    if query.root is not None and query.root not in nodes:
+        nodes, matched = set[str](), []
+    elif query.root is not None:
+        nodes = _neighborhood(query.root, matched, query.depth, query.direction)
+        matched = [edge for edge in matched if edge[0] in nodes and edge[1] in nodes]
+
+    end = None if query.limit is None else query.offset + query.limit
+    page = matched[query.offset : end]
+    return _encode_page(query, nodes, matched, page, end)
+
+
+def _neighborhood(
+    root: str,
+    edges: list[tuple[str, str, str]],
+    depth: int | None,
+    direction: str,
+) -> set[str]:
+    """Collect nodes within ``depth`` hops of ``root`` along matched edges."""
+    adjacency: dict[str, list[str]] = {}
+    for source, target, _ in edges:
+        if direction in ("out", "both"):
+            adjacency.setdefault(source, []).append(target)
+        if direction in ("in", "both"):
+            adjacency.setdefault(target, []).append(source)
+
+    seen = {root}
+    frontier: deque[tuple[str, int]] = deque([(root, 0)])
+    while frontier:
+        node, distance = frontier.popleft()
+        if depth is not None and distance >= depth:
+            continue
+        for neighbor in adjacency.get(node, ()):
+            if neighbor not in seen:
+                seen.add(neighbor)
+                frontier.append((neighbor, distance + 1))
+    return seen
+
+
+def _encode_page(
+    query: GraphQuery,
+    nodes: set[str],
+    matched: list[tuple[str, str, str]],
+    page: list[tuple[str, str, str]],
+    end: int | None,
+) -> CompactGraph:
+    """Encode a page of edges against node and edge-type tables.
+
+    Nodes without any matching edge appear on no edge page, so the first
+    page lists them too; every node counted in total_nodes is then named
+    on some page.
+    """
+    node_ids: dict[str, int] = {}
+    type_ids: dict[str, int] = {}
+    if query.root is not None and query.root in nodes:
+        node_ids[query.root] = 0
+
+    encoded: list[tuple[int, int, int]] = []
+    for source, target, edge_type in page:
+        source_id = node_ids.setdefault(source, len(node_ids))
+        target_id = node_ids.setdefault(target, len(node_ids))
+        type_id = type_ids.setdefault(edge_type, len(type_ids))
+        encoded.append((source_id, target_id, type_id))
+    if query.offset == 0:
+        linked = {node for source, target, _ in matched for node in (source, target)}
+        for node in sorted(nodes - linked):
+            _ = node_ids.setdefault(node, len(node_ids))
+
+    return CompactGraph(
+        nodes=list(node_ids),
+        edge_types=list(type_ids),
+        edges=encoded,
+        total_nodes=len(nodes),
+        total_edges=len(matched),
+        edges_by_type=dict(Counter(edge_type for _, _, edge_type in matched)),
+        offset=query.offset,
+        next_offset=end if end is not None and end < len(matched) else None,
+    )
+
+
+def iter_compact_mermaid(
+    graph: CompactGraph, category_of: Callable[[str], str]
+) -> Iterator[str]:
+    """
+    Generate a Mermaid flowchart for a compact graph line by line.
+
+    Node ids are table indexes, so file names never need escaping.
+
+    Args:
+        graph: Compact graph to render
+        category_of: Function returning the category of a file
+
+    Yields:
+        Mermaid diagram lines
+    """
+    yield "flowchart TD"
+    for node_id, file_name in enumerate(graph.nodes):
+        label = file_name.removesuffix(".md").replace('"', "'")
+        category = category_of(file_name)
+        style = f":::{category}" if category in ("meta", "foundation", "active") else ""
+        yield f'    n{node_id}["{label}"]{style}'
+    for source_id, target_id, type_id in graph.edges:
+        edge_type = graph.edge_types[type_id]
+        arrow = _MERMAID_ARROWS.get(edge_type, "-->")
+        yield f"    n{source_id} {arrow}|{edge_type}| n{target_id}"
+    yield ""
+    yield from _MERMAID_CLASSES
@@ -4,12 +4,38 @@
 This module provides a centralized registry for manager instances, replacing
 the previous module-level global cache. This improves testability and follows
 proper dependency injection patterns.
+
+MCP tools share one process-wide registry (see get_default_registry), so the
+managers a background warm-up initializes are the ones the tools later use.
+When one server process serves many projects (HTTP transports), the registry
+is a pool: it keeps the managers of the most recently used projects and
+releases those of projects that fell out of the pool, went idle or pushed
+the pool's estimated memory past its ceiling.
 """
 
+import asyncio
+import logging
+import time
+from collections import Counter, OrderedDict
+from collections.abc import Callable
 from pathlib import Path
+from typing import Literal
 
+from cortex.core.constants import (
+    MANAGER_POOL_MAX_PROJECTS,
+    MANAGER_POOL_MEASURE_SECONDS,
+)
+from cortex.core.memory_accounting import estimate_size, reachable_objects
+from cortex.core.models import ManagerPoolStats, PooledProjectStats
+from cortex.core.state_store import StateTable
+from cortex.core.token_counter import loaded_encodings
+from cortex.managers.lazy_manager import LazyManager
 from cortex.managers.types import ManagersDict
 
+logger = logging.getLogger(__name__)
+
+type EvictionReason = Literal["capacity", "idle", "memory"]
+
 
 class ManagerRegistry:
     """Registry for manager instances with project-scoped caching.
@@ -18,15 +44,84 @@ class ManagerRegistry:
     container for manager instances. Each registry instance maintains its own
     cache of managers per project root.
 
+    Features:
+    - LRU-bounded pool: initializing managers for one project too many
+      evicts the least recently used project
+    - Optional idle eviction of projects unused for idle_timeout seconds,
+      checked whenever managers are requested
+    - Per-project memory estimates, refreshed at most every
+      measure_interval seconds in a worker thread, and an optional memory
+      ceiling enforced by evicting least recently used projects; requests
+      only ever read the cached estimates
+    - Evicted managers are released: their file watcher and rules
+      re-indexing are stopped, cached state records are flushed and the
+      project's shared state store is closed; calls still holding them
+      finish normally (a closed store reopens its connection on next use)
+
     Example:
         >>> registry = ManagerRegistry()
         >>> managers = await registry.get_managers(project_root)
         >>> fs = managers["fs"]
     """
 
-    def __init__(self) -> None:
-        """Initialize an empty manager registry."""
-        self._managers: dict[str, ManagersDict] = {}
+    def __init__(
+        self,
+        max_projects: int = MANAGER_POOL_MAX_PROJECTS,
+        idle_timeout: float | None = None,
+        memory_limit_bytes: int | None = None,
+        measure_interval: float = MANAGER_POOL_MEASURE_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize an empty manager registry.
+
+        Args:
+            max_projects: Projects whose managers are kept
+            idle_timeout: Seconds after which an unused project is evicted
+                (None keeps projects until they fall out of the pool)
+            memory_limit_bytes: Estimated memory of all pooled projects above
+                which least recently used projects are evicted (None: no limit)
+            measure_interval: Seconds a project's memory estimate is reused
+            clock: Monotonic clock, replaceable in tests
+        """
+        self._managers: OrderedDict[str, ManagersDict] = OrderedDict()
+        self._pending: dict[str, asyncio.Future[ManagersDict]] = {}
+        self._last_used: dict[str, float] = {}
+        # Memory estimate and measurement time per project root
+        self._memory: dict[str, tuple[int, float]] = {}
+        self._evictions: Counter[str] = Counter()
+        # Background tasks stopping evicted projects' rules re-indexing
+        self._releases: set[asyncio.Task[None]] = set()
+        # Background re-measurement started by a request, if any
+        self._measuring: asyncio.Task[dict[str, int]] | None = None
+        self._clock = clock
+        self.max_projects = max(1, max_projects)
+        self.idle_timeout = idle_timeout
+        self.memory_limit_bytes = memory_limit_bytes
+        self.measure_interval = measure_interval
+
+    def configure(
+        self,
+        max_projects: int | None = None,
+        idle_timeout: float | None = None,
+        memory_limit_bytes: int | None = None,
+    ) -> None:
+        """Change the pool bounds, evicting projects beyond the new bounds.
+
+        Args:
+            max_projects: Projects whose managers are kept (None: unchanged)
+            idle_timeout: Seconds after which an unused project is evicted
+                (None: unchanged)
+            memory_limit_bytes: Memory ceiling of the pool (None: unchanged)
+        """
+        if max_projects is not None:
+            self.max_projects = max(1, max_projects)
+        if idle_timeout is not None:
+            self.idle_timeout = idle_timeout
+        if memory_limit_bytes is not None:
+            self.memory_limit_bytes = memory_limit_bytes
+        self._evict_over_capacity()
+        if self.memory_limit_bytes is not None:
+            self._evict_over_memory_limit(self.memory_usage())
 
     async def get_managers(self, project_root: Path) -> ManagersDict:
         """Get or initialize managers for a project with lazy loading.
@@ -40,19 +135,235 @@ class ManagerRegistry:
         Returns:
             Managers dictionary with type-safe access
         """
+        root_str = str(project_root)
+        _ = self.evict_idle(keep=root_str)
+        managers = self._managers.get(root_str)
+        if managers is not None:
+            self._managers.move_to_end(root_str)
+            self._last_used[root_str] = self._clock()
+            self._evict_over_memory_limit(self._cached_usage(), keep=root_str)
+            self._schedule_memory_refresh()
+            return managers
+
+        # Concurrent callers (e.g. the warm-up and a first tool call) share one
+        # initialization; a future from another event loop cannot be awaited
+        pending = self._pending.get(root_str)
+        if pending is None or pending.get_loop() is not asyncio.get_running_loop():
+            pending = asyncio.ensure_future(self._initialize(project_root))
+            self._pending[root_str] = pending
+        return await asyncio.shield(pending)
+
+    async def _initialize(self, project_root: Path) -> ManagersDict:
         from cortex.managers.initialization import initialize_managers
 
         root_str = str(project_root)
-
-        if root_str not in self._managers:
+        try:
             managers = await initialize_managers(project_root)
             # Convert to ManagersDict if needed
             if isinstance(managers, dict):
-                self._managers[root_str] = ManagersDict.model_validate(managers)
-            else:
-                self._managers[root_str] = managers
+                managers = ManagersDict.model_validate(managers)
+            self._managers[root_str] = managers
+            self._managers.move_to_end(root_str)
+            self._last_used[root_str] = self._clock()
+            self._evict_over_capacity()
+            self._evict_over_memory_limit(self._cached_usage(), keep=root_str)
+            self._schedule_memory_refresh()
+            return managers
+        finally:
+            _ = self._pending.pop(root_str, None)
+
+    def evict_idle(self, keep: str | None = None) -> list[str]:
+        """Evict projects unused for longer than the idle timeout.
+
+        Args:
+            keep: Project root never to evict (the one being requested)
+
+        Returns:
+            Evicted project roots
+        """
+        if self.idle_timeout is None:
+            return []
+        deadline = self._clock() - self.idle_timeout
+        idle = [
+            root
+            for root in self._managers
+            if root != keep and self._last_used.get(root, deadline) < deadline
+        ]
+        for root in idle:
+            self._evict(root, "idle")
+        return idle
+
+    def projects(self) -> list[str]:
+        """Get the pooled project roots, least recently used first."""
+        return list(self._managers)
+
+    def memory_usage(self) -> dict[str, int]:
+        """Estimate the memory retained by each pooled project.
+
+        Estimates younger than measure_interval are reused. Measuring walks
+        the managers' object graphs, so requests leave it to
+        refresh_memory_usage, which runs it on a snapshot of the pool in a
+        worker thread.
+
+        Returns:
+            Estimated bytes by project root, least recently used first
+        """
+        now = self._clock()
+        usage: dict[str, int] = {}
+        for root_str, managers in list(self._managers.items()):
+            measured = self._memory.get(root_str)
+            if measured is None or now - measured[1] >= self.measure_interval:
+                measured = (estimate_size(managers, loaded_encodings()), now)
+                self._memory[root_str] = measured
+            usage[root_str] = measured[0]
+        return usage
+
+    async def refresh_memory_usage(self) -> dict[str, int]:
+        """Re-measure stale estimates off the event loop and enforce the limit.
 
-        return self._managers[root_str]
+        Waits for a re-measurement already started by a request first. The
+        most recently used project is never evicted.
+
+        Returns:
+            Estimated bytes by project root, least recently used first
+        """
+        measuring = self._measuring
+        if measuring is not None and not measuring.done():
+            _ = await asyncio.shield(measuring)
+        return await self._measure_and_evict()
+
+    async def _measure_and_evict(self) -> dict[str, int]:
+        """Measure in a worker thread, then evict over the memory limit."""
+        usage = await asyncio.to_thread(self.memory_usage)
+        # Drop estimates of projects evicted while measuring
+        for root_str in set(self._memory) - set(self._managers):
+            _ = self._memory.pop(root_str, None)
+        keep = next(reversed(self._managers), None)
+        self._evict_over_memory_limit(self._cached_usage(), keep=keep)
+        return usage
+
+    def _schedule_memory_refresh(self) -> None:
+        """Start a background re-measurement if an estimate is stale."""
+        if self.memory_limit_bytes is None:
+            return
+        if self._measuring is not None and not self._measuring.done():
+            return
+        now = self._clock()
+        stale = any(
+            (measured := self._memory.get(root_str)) is None
+            or now - measured[1] >= self.measure_interval
+            for root_str in self._managers
+        )
+        if stale:
+            self._measuring = asyncio.get_running_loop().create_task(
+                self._measure_and_evict()
+            )
+
+    def _cached_usage(self) -> dict[str, int]:
+        """Latest estimates of the pooled projects, 0 when never measured."""
+        return {
+            root_str: measured[0] if (measured := self._memory.get(root_str)) else 0
+            for root_str in self._managers
+        }
+
+    def stats(self, include_projects: bool = False) -> ManagerPoolStats:
+        """Get the size, memory and evictions of the pool.
+
+        Reports the latest memory estimates without measuring; refresh them
+        with memory_usage first. Project roots are only listed on request,
+        since a pool serving several clients holds other clients' projects.
+
+        Args:
+            include_projects: List each pooled project with its root path
+
+        Returns:
+            Pool statistics
+        """
+        now = self._clock()
+        usage = self._cached_usage()
+        return ManagerPoolStats(
+            projects=len(self._managers),
+            max_projects=self.max_projects,
+            idle_timeout_seconds=self.idle_timeout,
+            estimated_bytes=sum(usage.values()),
+            memory_limit_bytes=self.memory_limit_bytes,
+            evictions=dict(self._evictions),
+            pooled=[
+                PooledProjectStats(
+                    project_root=root_str,
+                    estimated_bytes=usage[root_str],
+                    idle_seconds=max(0.0, now - self._last_used.get(root_str, now)),
+                    initialized_managers=_count_initialized(managers),
+                )
+                for root_str, managers in self._managers.items()
+                if include_projects
+            ],
+        )
+
+    def _evict_over_capacity(self) -> None:
+        """Evict least recently used projects beyond max_projects."""
+        while len(self._managers) > self.max_projects:
+            self._evict(next(iter(self._managers)), "capacity")
+
+    def _evict_over_memory_limit(
+        self, usage: dict[str, int], keep: str | None = None
+    ) -> None:
+        """Evict least recently used projects while over the memory limit.
+
+        Args:
+            usage: Estimated bytes by project root, least recently used first
+            keep: Project root never to evict (the one being requested)
+        """
+        if self.memory_limit_bytes is None:
+            return
+        total = sum(usage.values())
+        for root_str, size in usage.items():
+            if total <= self.memory_limit_bytes:
+                return
+            if root_str != keep:
+                self._evict(root_str, "memory")
+                total -= size
+
+    def _evict(self, root_str: str, reason: EvictionReason) -> None:
+        """Remove a project from the pool and release its managers."""
+        managers = self._managers.pop(root_str, None)
+        _ = self._last_used.pop(root_str, None)
+        _ = self._memory.pop(root_str, None)
+        if managers is None:
+            return
+        self._evictions[reason] += 1
+        logger.info(f"Evicting managers of {root_str} ({reason})")
+        try:
+            managers.watcher.stop()
+            self._stop_rules_reindex(managers)
+            _flush_state_tables(managers)
+            if managers.state is not None:
+                managers.state.close()
+        except Exception:
+            logger.exception(f"Failed to release managers of {root_str}")
+
+    def _stop_rules_reindex(self, managers: ManagersDict) -> None:
+        """Stop the auto re-index task of an initialized rules manager."""
+        rules_manager = managers.rules_manager
+        if isinstance(rules_manager, LazyManager):
+            rules_manager = rules_manager.instance
+        if rules_manager is None:
+            return
+        indexer = rules_manager.indexer
+        task = indexer.reindex_task
+        if task is None or task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        if loop is None or task.get_loop() is not loop:
+            # Outside the task's loop it can only be cancelled, not awaited
+            _ = task.cancel()
+            return
+        release = loop.create_task(indexer.stop_auto_reindex())
+        self._releases.add(release)
+        release.add_done_callback(self._releases.discard)
 
     def clear_cache(self, project_root: Path | None = None) -> None:
         """Clear cached managers for testing or cleanup.
@@ -62,9 +373,13 @@ class ManagerRegistry:
         """
         if project_root is None:
             self._managers.clear()
+            self._last_used.clear()
+            self._memory.clear()
         else:
             root_str = str(project_root)
             _ = self._managers.pop(root_str, None)
+            _ = self._last_used.pop(root_str, None)
+            _ = self._memory.pop(root_str, None)
 
     def has_managers(self, project_root: Path) -> bool:
         """Check if managers are cached for a project root.
@@ -76,3 +391,30 @@ class ManagerRegistry:
             True if managers are cached for this project
         """
         return str(project_root) in self._managers
+
+
+def _count_initialized(managers: ManagersDict) -> int:
+    """Count the managers of a project that have been created."""
+    return sum(
+        1
+        for name in ManagersDict.model_fields
+        if (manager := getattr(managers, name)) is not None
+        and not (isinstance(manager, LazyManager) and not manager.is_initialized)
+    )
+
+
+def _flush_state_tables(managers: ManagersDict) -> None:
+    """Write the cached state records of a project's managers."""
+    for obj in list(reachable_objects(managers, loaded_encodings())):
+        if isinstance(obj, StateTable):
+            _ = obj.flush()
+
+
+# Process-wide registry used by MCP tools (framework requirement, like the
+# FastMCP server instance); inject a ManagerRegistry in your own code instead
+_default_registry = ManagerRegistry()
+
+
+def get_default_registry() -> ManagerRegistry:
+    """Get the process-wide registry shared by MCP tools and warm-up."""
+    return _default_registry
@@ -2,7 +2,8 @@
 
 This module provides connection stability features for MCP tool handlers:
 - Timeout protection for long-running operations
-- Resource limit enforcement (concurrent operations)
+- Resource limit enforcement (concurrent operations per cost class)
+- Single-flight deduplication of concurrent identical read-only calls
 - Connection error handling and recovery
 - Connection health monitoring
 """
@@ -11,7 +12,7 @@ import asyncio
 import logging
 from collections.abc import Awaitable, Callable
 from inspect import Signature
-from types import TracebackType
+from pathlib import Path
 from typing import Protocol, cast
 
 import anyio
@@ -19,10 +20,12 @@ import anyio
 from cortex.core.constants import (
     MCP_CONNECTION_RETRY_ATTEMPTS,
     MCP_CONNECTION_RETRY_DELAY_SECONDS,
-    MCP_MAX_CONCURRENT_TOOLS,
     MCP_TOOL_TIMEOUT_SECONDS,
 )
 from cortex.core.models import ConnectionHealth, JsonValue, MCPToolArguments
+from cortex.core.single_flight import SingleFlight, call_key, memory_bank_version
+from cortex.core.tool_scheduler import CostClass, ToolScheduler, cost_class_for_timeout
+from cortex.core.tracing import span
 
 logger = logging.getLogger(__name__)
 
@@ -31,65 +34,55 @@ class _SignatureAware(Protocol):
     __signature__: Signature
 
 
-class TrackedSemaphore:
-    """Semaphore wrapper that tracks available count without accessing
-    private attributes."""
+# Global scheduler for limiting concurrent tool executions per cost class
+_tool_scheduler: ToolScheduler | None = None
 
-    def __init__(self, value: int) -> None:
-        """Initialize semaphore with initial value.
 
-        Args:
-            value: Initial semaphore value
-        """
-        self._semaphore = asyncio.Semaphore(value)
-        self._max_value = value
-        self._current_count = value
+def get_tool_scheduler() -> ToolScheduler:
+    """Get or create the global scheduler for concurrent tool limits."""
+    global _tool_scheduler
+    if _tool_scheduler is None:
+        _tool_scheduler = ToolScheduler()
+    return _tool_scheduler
 
-    async def acquire(self) -> None:
-        """Acquire semaphore, decrementing available count."""
-        _ = await self._semaphore.acquire()
-        self._current_count -= 1
 
-    def release(self) -> None:
-        """Release semaphore, incrementing available count."""
-        self._semaphore.release()
-        self._current_count += 1
+# Global registry of in-flight calls of single-flight tools
+_single_flight: SingleFlight | None = None
 
-    async def __aenter__(self) -> "TrackedSemaphore":
-        """Async context manager entry."""
-        await self.acquire()
-        return self
 
-    async def __aexit__(
-        self,
-        exc_type: type[BaseException] | None,
-        exc_val: BaseException | None,
-        exc_tb: TracebackType | None,
-    ) -> None:
-        """Async context manager exit."""
-        self.release()
+def get_single_flight() -> SingleFlight:
+    """Get or create the global single-flight registry."""
+    global _single_flight
+    if _single_flight is None:
+        _single_flight = SingleFlight()
+    return _single_flight
 
-    @property
-    def available(self) -> int:
-        """Get available semaphore slots."""
-        return max(0, self._current_count)
 
-    @property
-    def current(self) -> int:
-        """Get current concurrent operations."""
-        return self._max_value - self.available
+async def _resolve_project_root(kwargs: dict[str, JsonValue]) -> Path:
+    """Resolve the project a call works on, as the tool itself would.
 
+    Tools are usually called without project_root and detect the project
+    themselves, so the raw argument cannot tell projects apart.
+    """
+    from cortex.managers.initialization import get_project_root
 
-# Global semaphore for limiting concurrent tool executions
-_concurrent_tools_semaphore: TrackedSemaphore | None = None
+    project_root_arg = kwargs.get("project_root")
+    return await asyncio.to_thread(
+        get_project_root,
+        project_root_arg if isinstance(project_root_arg, str) else None,
+    )
 
 
-def _get_semaphore() -> TrackedSemaphore:
-    """Get or create the global semaphore for concurrent tool limits."""
-    global _concurrent_tools_semaphore
-    if _concurrent_tools_semaphore is None:
-        _concurrent_tools_semaphore = TrackedSemaphore(MCP_MAX_CONCURRENT_TOOLS)
-    return _concurrent_tools_semaphore
+async def _single_flight_key(
+    func: Callable[..., Awaitable[object]],
+    args: tuple[JsonValue, ...],
+    kwargs: dict[str, JsonValue],
+    root: Path,
+) -> tuple[str, str, str, str]:
+    """Build the key under which identical calls share one execution."""
+    version = await asyncio.to_thread(memory_bank_version, root)
+    tool = f"{func.__module__}.{func.__qualname__}"
+    return call_key(tool, args, kwargs, root, version)
 
 
 async def _handle_timeout_error(
@@ -150,15 +143,17 @@ async def _handle_connection_error(
 
 async def _execute_single_attempt[T](
     func: Callable[..., Awaitable[T]],
-    semaphore: TrackedSemaphore,
+    cost_class: CostClass,
+    project: str,
     timeout: float,
     args: tuple[JsonValue, ...],
     kwargs: MCPToolArguments,
 ) -> T:
     """Execute function once with timeout and resource limits."""
-    async with semaphore:
+    async with get_tool_scheduler().slot(cost_class, project=project):
         async with asyncio.timeout(timeout):
-            return await func(*args, **kwargs.model_dump(exclude_none=True))
+            with span("stability.attempt"):
+                return await func(*args, **kwargs.model_dump(exclude_none=True))
 
 
 def _is_connection_error(e: Exception) -> bool:
@@ -226,7 +221,8 @@ async def _handle_retry_exception(
 
 async def _execute_with_retry[T](
     func: Callable[..., Awaitable[T]],
-    semaphore: TrackedSemaphore,
+    cost_class: CostClass,
+    project: str,
     timeout: float,
     args: tuple[JsonValue, ...],
     kwargs: MCPToolArguments,
@@ -237,7 +233,9 @@ async def _execute_with_retry[T](
 
     for attempt in range(1, MCP_CONNECTION_RETRY_ATTEMPTS + 1):
         try:
-            return await _execute_single_attempt(func, semaphore, timeout, args, kwargs)
+            return await _execute_single_attempt(
+                func, cost_class, project, timeout, args, kwargs
+            )
         except Exception as e:
             _, last_exception = await _handle_retry_exception(
                 func_name, timeout, attempt, e, last_exception
@@ -276,21 +274,28 @@ async def with_mcp_stability[T](
     *args: JsonValue,
     timeout: JsonValue | None = None,
     stability_timeout: JsonValue | None = None,
+    cost_class: CostClass | None = None,
+    single_flight: bool = False,
     **kwargs: JsonValue,
 ) -> T:
     """Execute MCP tool with stability protections.
 
     Provides:
     - Timeout protection (prevents hanging operations)
-    - Resource limit enforcement (concurrent operations)
+    - Resource limit enforcement (concurrency pool of the tool's cost class)
     - Connection error handling
     - Automatic retry for transient failures
+    - Optional sharing of one execution among concurrent identical calls
 
     Args:
         func: Async function to execute
         *args: Positional arguments for func
         timeout: Maximum execution time in seconds (public API)
         stability_timeout: Internal timeout override (used by wrappers)
+        cost_class: Concurrency pool (default: derived from the timeout tier)
+        single_flight: Let concurrent identical calls (same function,
+            arguments, project root and memory bank version) share one
+            execution; only for read-only tools
         **kwargs: Keyword arguments for func
 
     Returns:
@@ -300,8 +305,6 @@ async def with_mcp_stability[T](
         TimeoutError: If operation exceeds timeout
         RuntimeError: If resource limits exceeded or connection fails
     """
-    semaphore = _get_semaphore()
-
     stability_timeout_value = _to_timeout_value(stability_timeout)
     timeout_value = _to_timeout_value(timeout)
 
@@ -315,17 +318,29 @@ async def with_mcp_stability[T](
         if key not in {"timeout", "stability_timeout"}
     }
     kwargs_model = MCPToolArguments.model_validate(func_kwargs)
-    return await _execute_with_retry(
-        func,
-        semaphore,
-        effective_timeout,
-        args,
-        kwargs_model,
-    )
+    root = await _resolve_project_root(func_kwargs)
+
+    async def execute() -> T:
+        return await _execute_with_retry(
+            func,
+            cost_class or cost_class_for_timeout(effective_timeout),
+            str(root),
+            effective_timeout,
+            args,
+            kwargs_model,
+        )
+
+    if not single_flight:
+        return await execute()
+    with span("stability.single_flight"):
+        key = await _single_flight_key(func, args, func_kwargs, root)
+        return await get_single_flight().run(key, execute)
 
 
 def mcp_tool_wrapper[T](
     timeout: float = MCP_TOOL_TIMEOUT_SECONDS,
+    cost_class: CostClass | None = None,
+    single_flight: bool = False,
 ) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
     """Decorator for MCP tools to add stability protections.
 
@@ -337,6 +352,9 @@ def mcp_tool_wrapper[T](
 
     Args:
         timeout: Maximum execution time in seconds
+        cost_class: Concurrency pool (default: derived from the timeout tier)
+        single_flight: Share one execution among concurrent identical calls
+            (read-only tools only)
 
     Returns:
         Decorator function
@@ -351,7 +369,12 @@ def mcp_tool_wrapper[T](
         async def wrapper(*args: JsonValue, **kwargs: JsonValue) -> T:
             """Wrapped function with stability protections."""
             return await with_mcp_stability(
-                func, *args, stability_timeout=timeout, **kwargs
+                func,
+                *args,
+                stability_timeout=timeout,
+                cost_class=cost_class,
+                single_flight=single_flight,
+                **kwargs,
             )
 
         # Explicitly preserve signature for FastMCP
@@ -368,13 +391,15 @@ async def execute_tool_with_stability[T](
     func: Callable[..., Awaitable[T]],
     *args: JsonValue,
     timeout: float = MCP_TOOL_TIMEOUT_SECONDS,
+    cost_class: CostClass | None = None,
+    single_flight: bool = False,
     **kwargs: JsonValue,
 ) -> T:
     """Execute MCP tool function with stability protections.
 
     This is a convenience wrapper for tool execution that provides:
     - Timeout protection (prevents hanging operations)
-    - Resource limit enforcement (concurrent operations)
+    - Resource limit enforcement (concurrency pool of the tool's cost class)
     - Connection error handling
     - Automatic retry for transient failures
 
@@ -382,6 +407,9 @@ async def execute_tool_with_stability[T](
         func: Async function to execute (the tool's business logic)
         *args: Positional arguments for func
         timeout: Maximum execution time in seconds
+        cost_class: Concurrency pool (default: derived from the timeout tier)
+        single_flight: Share one execution among concurrent identical calls
+            (read-only tools only)
         **kwargs: Keyword arguments for func
 
     Returns:
@@ -391,27 +419,45 @@ async def execute_tool_with_stability[T](
         TimeoutError: If operation exceeds timeout
         RuntimeError: If resource limits exceeded or connection fails
     """
-    return await with_mcp_stability(func, *args, stability_timeout=timeout, **kwargs)
+    return await with_mcp_stability(
+        func,
+        *args,
+        stability_timeout=timeout,
+        cost_class=cost_class,
+        single_flight=single_flight,
+        **kwargs,
+    )
 
 
-async def check_connection_health() -> ConnectionHealth:
+async def check_connection_health(include_projects: bool = False) -> ConnectionHealth:
     """Check MCP connection health status.
 
+    Args:
+        include_projects: List each pooled project with its root path
+
     Returns:
-        Connection health metrics
+        Connection health metrics, totals over all concurrency pools, and
+        the state of the per-project manager pool
     """
-    semaphore = _get_semaphore()
-    available = semaphore.available
-    current = semaphore.current
+    from cortex.core.manager_registry import get_default_registry
+
+    registry = get_default_registry()
+    # Walking the managers' object graphs is slow; keep it off the event loop
+    _ = await asyncio.to_thread(registry.memory_usage)
+    pools = get_tool_scheduler().stats()
+    max_concurrent = sum(pool.max_concurrent for pool in pools)
+    current = sum(pool.active for pool in pools)
 
     return ConnectionHealth(
         healthy=True,  # Connection is healthy if we can check
         concurrent_operations=current,
-        max_concurrent=MCP_MAX_CONCURRENT_TOOLS,
-        semaphore_available=available,
+        max_concurrent=max_concurrent,
+        semaphore_available=max(0, max_concurrent - current),
         utilization_percent=(
-            (current / MCP_MAX_CONCURRENT_TOOLS) * 100
-            if MCP_MAX_CONCURRENT_TOOLS > 0
-            else 0.0
+            min(100.0, (current / max_concurrent) * 100) if max_concurrent > 0 else 0.0
         ),
+        queued_operations=sum(pool.queued for pool in pools),
+        pools=pools,
+        single_flight=get_single_flight().stats(),
+        manager_pool=registry.stats(include_projects),
     )
@@ -1,7 +1,8 @@
 """Metadata index management with JSON storage and corruption recovery."""
 
 import json
-from collections.abc import Mapping, Sequence
+from collections.abc import AsyncGenerator, Mapping, Sequence
+from contextlib import asynccontextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import cast
@@ -82,6 +83,26 @@ class MetadataIndex:
         self.index_path: Path = self.cortex_dir / "index.json"
         self.memory_bank_dir: Path = self.cortex_dir / "memory-bank"
         self._data: dict[str, object] | None = None
+        self._batch_depth: int = 0
+        self._batch_dirty: bool = False
+
+    @asynccontextmanager
+    async def batch_updates(self) -> AsyncGenerator[None]:
+        """
+        Defer totals recalculation and saves to a single flush on exit.
+
+        Yields:
+            None; index updates inside the block are saved once afterwards
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._batch_dirty:
+                self._batch_dirty = False
+                await self.recalculate_totals()
+                await self.save()
 
     async def load(self) -> dict[str, object]:
         """
@@ -148,6 +169,9 @@ class MetadataIndex:
         """
         if self._data is None:
             return
+        if self._batch_depth > 0:
+            self._batch_dirty = True
+            return
 
         # Update last_updated timestamp
         self._data["last_updated"] = datetime.now().isoformat()
@@ -598,6 +622,9 @@ class MetadataIndex:
         """Recalculate total statistics."""
         if self._data is None:
             return
+        if self._batch_depth > 0:
+            self._batch_dirty = True
+            return
 
         files = self._data.get("files", {})
         if not isinstance(files, dict):
@@ -261,6 +261,64 @@ class ReferenceGraph(DictLikeModel):
     edges: list[ReferenceEdge] = Field(description="Graph edges")
 
 
+class GraphQuery(BaseModel):
+    """Filters and paging for a dependency graph query."""
+
+    model_config = ConfigDict(extra="forbid", validate_assignment=True)
+
+    root: str | None = Field(
+        default=None, description="Restrict to the neighborhood of this file"
+    )
+    depth: int | None = Field(
+        default=None, ge=0, description="Maximum hops from root (None = unbounded)"
+    )
+    direction: Literal["out", "in", "both"] = Field(
+        default="both",
+        description="Follow links from root (out), to root (in), or both",
+    )
+    link_types: list[str] | None = Field(
+        default=None,
+        description="Edge types to keep (reference, transclusion, links, informs)",
+    )
+    categories: list[str] | None = Field(
+        default=None, description="File categories to keep"
+    )
+    offset: int = Field(default=0, ge=0, description="Index of first edge to return")
+    limit: int | None = Field(
+        default=None, ge=1, description="Maximum edges to return (None = all)"
+    )
+
+
+class CompactGraph(BaseModel):
+    """Edge-list encoding of a graph query result.
+
+    Edges are ``[source, target, type]`` triples of indexes into ``nodes``
+    and ``edge_types``. The source file links to (depends on) the target.
+    The first page also lists matching files that have no matching edge.
+    """
+
+    model_config = ConfigDict(extra="forbid", validate_assignment=True)
+
+    nodes: list[str] = Field(
+        default_factory=list,
+        description="Files referenced by this page (first page: plus unlinked files)",
+    )
+    edge_types: list[str] = Field(default_factory=list, description="Edge type legend")
+    edges: list[tuple[int, int, int]] = Field(
+        default_factory=lambda: list[tuple[int, int, int]](),
+        description="Edges as (source index, target index, type index)",
+    )
+    total_nodes: int = Field(default=0, ge=0, description="Files matching the query")
+    total_edges: int = Field(default=0, ge=0, description="Edges matching the query")
+    edges_by_type: dict[str, int] = Field(
+        default_factory=dict, description="Matching edge count per type"
+    )
+    offset: int = Field(default=0, ge=0, description="Index of first edge returned")
+    next_offset: int | None = Field(
+        default=None, description="Offset of the next page, or None if complete"
+    )
+
+
 class FileDependencyDetail(BaseModel):
     """Detailed file dependency information."""
 
@@ -1073,6 +1131,74 @@ class ParsedMarkdownSection(BaseModel):
 # ============================================================================
 
 
+class ConcurrencyPoolStats(DictLikeModel):
+    """Load and queueing metrics of one tool concurrency pool."""
+
+    model_config = ConfigDict(extra="forbid", validate_assignment=True)
+
+    cost_class: str = Field(description="Cost class served by the pool")
+    max_concurrent: int = Field(ge=1, description="Concurrent executions allowed")
+    active: int = Field(ge=0, description="Executions currently running")
+    queued: int = Field(ge=0, description="Executions waiting for a slot")
+    max_queue_depth: int = Field(ge=0, description="Deepest queue observed")
+    completed_waits: int = Field(ge=0, description="Executions granted a slot")
+    avg_wait_ms: float = Field(ge=0.0, description="Mean time spent queued")
+    max_wait_ms: float = Field(ge=0.0, description="Longest time spent queued")
+
+
+class SingleFlightStats(DictLikeModel):
+    """Counters of single-flight deduplication of tool calls."""
+
+    model_config = ConfigDict(extra="forbid", validate_assignment=True)
+
+    executions: int = Field(default=0, ge=0, description="Calls actually executed")
+    duplicates_saved: int = Field(
+        default=0, ge=0, description="Calls that joined an identical in-flight call"
+    )
+    in_flight: int = Field(default=0, ge=0, description="Calls currently running")
+
+
+class PooledProjectStats(DictLikeModel):
+    """Memory and usage of one project in the manager pool."""
+
+    model_config = ConfigDict(extra="forbid", validate_assignment=True)
+
+    project_root: str = Field(description="Project root directory")
+    estimated_bytes: int = Field(
+        ge=0, description="Estimated memory retained by the project's managers"
+    )
+    idle_seconds: float = Field(ge=0.0, description="Time since the last use")
+    initialized_managers: int = Field(
+        ge=0, description="Managers created so far (lazy ones on first use)"
+    )
+
+
+class ManagerPoolStats(DictLikeModel):
+    """Size, memory and evictions of the per-project manager pool."""
+
+    model_config = ConfigDict(extra="forbid", validate_assignment=True)
+
+    projects: int = Field(default=0, ge=0, description="Projects in the pool")
+    max_projects: int = Field(default=1, ge=1, description="Projects kept at most")
+    idle_timeout_seconds: float | None = Field(
+        default=None, description="Idle time before a project is evicted"
+    )
+    estimated_bytes: int = Field(
+        default=0, ge=0, description="Estimated memory of all pooled projects"
+    )
+    memory_limit_bytes: int | None = Field(
+        default=None, description="Memory ceiling enforced by eviction"
+    )
+    evictions: dict[str, int] = Field(
+        default_factory=lambda: dict[str, int](),
+        description="Evicted projects by reason (capacity, idle, memory)",
+    )
+    pooled: list[PooledProjectStats] = Field(
+        default_factory=lambda: list[PooledProjectStats](),
+        description="Pooled projects, least recently used first (on request)",
+    )
+
+
 class ConnectionHealth(DictLikeModel):
     """MCP connection health metrics."""
 
@@ -1089,6 +1215,68 @@ class ConnectionHealth(DictLikeModel):
     utilization_percent: float = Field(
         ge=0.0, le=100.0, description="Resource utilization percentage"
     )
+    queued_operations: int = Field(
+        default=0, ge=0, description="Operations waiting for a slot"
+    )
+    pools: list[ConcurrencyPoolStats] = Field(
+        default_factory=lambda: list[ConcurrencyPoolStats](),
+        description="Per cost class pool metrics",
+    )
+    single_flight: SingleFlightStats = Field(
+        default_factory=SingleFlightStats,
+        description="Deduplication of concurrent identical calls",
+    )
+    manager_pool: ManagerPoolStats = Field(
+        default_factory=ManagerPoolStats,
+        description="Per-project manager pool size, memory and evictions",
+    )
+
+
+class TraceSpan(DictLikeModel):
+    """Timed section of a traced tool call."""
+
+    model_config = ConfigDict(extra="forbid", validate_assignment=True)
+
+    span_id: int = Field(ge=1, description="Span identifier within the trace")
+    parent_id: int | None = Field(
+        default=None, description="Enclosing span (None for the call itself)"
+    )
+    name: str = Field(description="Span name")
+    start_ms: float = Field(description="Start, relative to the call start")
+    duration_ms: float = Field(ge=0.0, description="Span duration")
+    error: str | None = Field(default=None, description="Exception type, if raised")
+
+
+class ToolTrace(DictLikeModel):
+    """Trace of one MCP tool call."""
+
+    model_config = ConfigDict(extra="forbid", validate_assignment=True)
+
+    tool: str = Field(description="Tool name")
+    started_at: str = Field(description="Call start (ISO 8601, UTC)")
+    duration_ms: float = Field(ge=0.0, description="Call duration")
+    error: str | None = Field(default=None, description="Exception type, if raised")
+    spans: list[TraceSpan] = Field(
+        default_factory=lambda: list[TraceSpan](), description="Spans by start time"
+    )
+    dropped_spans: int = Field(
+        default=0, ge=0, description="Spans beyond the per-trace limit"
+    )
+    profile: str | None = Field(
+        default=None, description="cProfile report, if the call was profiled"
+    )
+
+
+class LatencyStats(DictLikeModel):
+    """Latency percentiles of a tool or span."""
+
+    model_config = ConfigDict(extra="forbid", validate_assignment=True)
+
+    name: str = Field(description="Tool or span name")
+    count: int = Field(ge=1, description="Samples the percentiles are based on")
+    p50_ms: float = Field(ge=0.0, description="Median latency")
+    p95_ms: float = Field(ge=0.0, description="95th percentile latency")
+    max_ms: float = Field(ge=0.0, description="Highest sampled latency")
 
 
 # ============================================================================
@@ -2,19 +2,34 @@
 
 This module provides logging functionality to track load_context calls
 and their results for later analysis and optimization.
+
+Each session appends its calls to a JSON Lines file, one entry per line.
+Lines are written by a background thread, so logging a call never does
+file I/O on the event loop; readers call flush_session_logs() first to see
+every call logged so far. Session logs written as a single JSON document by
+earlier versions are still read.
 """
 
+import atexit
 import json
 import os
+import queue
+import threading
 import uuid
 from datetime import datetime
 from pathlib import Path
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from cortex.core.logging_config import logger
 from cortex.core.models import DictLikeModel
 from cortex.core.path_resolver import CortexResourceType, get_cortex_path
 
+SESSION_LOG_PREFIX = "context-session-"
+SESSION_LOG_SUFFIX = ".jsonl"
+# Session logs written before the JSON Lines format
+LEGACY_SESSION_LOG_SUFFIX = ".json"
+
 
 class LoadContextLogEntry(BaseModel):
     """Structure for a single load_context log entry."""
@@ -75,64 +90,105 @@ def _get_session_id() -> str:
     return session_id
 
 
-def _get_session_log_path(project_root: Path) -> Path:
+def _get_session_log_path(project_root: Path, suffix: str = SESSION_LOG_SUFFIX) -> Path:
     """Get the path for the current session's log file.
 
     Args:
         project_root: Project root directory
+        suffix: Log file suffix
 
     Returns:
-        Path to the session log JSON file
+        Path to the session log JSONL file
     """
     session_dir = get_cortex_path(project_root, CortexResourceType.SESSION)
     session_id = _get_session_id()
-    return session_dir / f"context-session-{session_id}.json"
-
+    return session_dir / f"{SESSION_LOG_PREFIX}{session_id}{suffix}"
 
-def _ensure_session_dir(project_root: Path) -> Path:
-    """Ensure the session directory exists.
 
-    Args:
-        project_root: Project root directory
-
-    Returns:
-        Path to the session directory
+class SessionLogWriter:
     """
-    session_dir = get_cortex_path(project_root, CortexResourceType.SESSION)
-    session_dir.mkdir(parents=True, exist_ok=True)
-    return session_dir
-
-
-def _load_session_log(log_path: Path) -> SessionLog:
-    """Load existing session log or create new one.
-
-    Args:
-        log_path: Path to the session log file
-
-    Returns:
-        Session log dictionary
+    Background writer appending lines to session log files.
+
+    Features:
+    - append() only enqueues, so callers never wait for the disk
+    - A daemon thread drains the queue, writing each file's pending lines
+      with a single open and write
+    - flush() blocks until every enqueued line is written; pending lines
+      are also flushed at interpreter exit
+    - Write errors are logged and never reach the caller
     """
-    if log_path.exists():
-        with open(log_path, encoding="utf-8") as f:
-            data = json.load(f)
-            return SessionLog.model_validate(data)
-
-    return SessionLog(
-        session_id=_get_session_id(),
-        session_start=datetime.now().isoformat(timespec="minutes"),
-        load_context_calls=[],
-    )
 
-
-def _save_session_log(log_path: Path, session_log: SessionLog) -> None:
-    """Save session log to file.
-
-    Args:
-        log_path: Path to the session log file
-        session_log: Session log model to save
-    """
-    with open(log_path, "w", encoding="utf-8") as f:
-        json.dump(session_log.model_dump(), f, indent=2)
+    def __init__(self) -> None:
+        """Initialize the writer; its thread starts on the first append."""
+        self._queue: queue.Queue[tuple[Path, str]] = queue.Queue()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def append(self, log_path: Path, line: str) -> None:
+        """
+        Enqueue a line for appending to a log file.
+
+        Args:
+            log_path: Log file, created with its directory if missing
+            line: Line to append, without the trailing newline
+        """
+        self._ensure_started()
+        self._queue.put((log_path, line))
+
+    def flush(self) -> None:
+        """Wait until every enqueued line is written."""
+        if self._thread is not None:
+            self._queue.join()
+
+    def _ensure_started(self) -> None:
+        """Start the writer thread once."""
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                thread = threading.Thread(
+                    target=self._run, name="cortex-session-log", daemon=True
+                )
+                thread.start()
+                self._thread = thread
+                _ = atexit.register(self.flush)
+
+    def _run(self) -> None:
+        """Drain the queue forever, batching lines per file."""
+        while True:
+            batch = [self._queue.get()]
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._write(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _write(self, batch: list[tuple[Path, str]]) -> None:
+        """Append a batch of lines, in order, grouped by file."""
+        lines_by_path: dict[Path, list[str]] = {}
+        for log_path, line in batch:
+            lines_by_path.setdefault(log_path, []).append(line)
+        for log_path, lines in lines_by_path.items():
+            try:
+                log_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(log_path, "a", encoding="utf-8") as f:
+                    _ = f.write("".join(f"{line}\n" for line in lines))
+            except OSError as e:
+                logger.warning(f"Failed to write session log {log_path}: {e}")
+
+
+# Global writer (one thread per process, shared by all projects)
+_writer = SessionLogWriter()
+
+
+def flush_session_logs() -> None:
+    """Wait until every logged load_context call is written to disk."""
+    _writer.flush()
 
 
 def log_load_context_call(
@@ -149,6 +205,8 @@ def log_load_context_call(
 ) -> None:
     """Log a load_context call for later analysis.
 
+    The entry is appended to the session's JSONL log in the background.
+
     Args:
         project_root: Project root directory
         task_description: Task description used
@@ -161,11 +219,6 @@ def log_load_context_call(
         excluded_files: Files that were excluded
         relevance_scores: Relevance scores for all files
     """
-    _ = _ensure_session_dir(project_root)
-    log_path = _get_session_log_path(project_root)
-
-    session_log = _load_session_log(log_path)
-
     entry = LoadContextLogEntry(
         timestamp=datetime.now().isoformat(timespec="minutes"),
         task_description=task_description,
@@ -178,9 +231,7 @@ def log_load_context_call(
         excluded_files=excluded_files,
         relevance_scores=relevance_scores,
     )
-
-    session_log.load_context_calls.append(entry)
-    _save_session_log(log_path, session_log)
+    _writer.append(_get_session_log_path(project_root), entry.model_dump_json())
 
 
 def get_session_id() -> str:
@@ -199,11 +250,27 @@ def get_session_log_path(project_root: Path) -> Path:
         project_root: Project root directory
 
     Returns:
-        Path to the session log JSON file
+        Path to the session log JSONL file
     """
     return _get_session_log_path(project_root)
 
 
+def get_session_log_paths(project_root: Path) -> list[Path]:
+    """Get the existing log files of the current session.
+
+    Args:
+        project_root: Project root directory
+
+    Returns:
+        Legacy JSON log first (if any), then the JSONL log (if any)
+    """
+    paths = [
+        _get_session_log_path(project_root, LEGACY_SESSION_LOG_SUFFIX),
+        _get_session_log_path(project_root),
+    ]
+    return [path for path in paths if path.exists()]
+
+
 def list_session_logs(project_root: Path) -> list[Path]:
     """List all session log files in the project.
 
@@ -211,20 +278,70 @@ def list_session_logs(project_root: Path) -> list[Path]:
         project_root: Project root directory
 
     Returns:
-        List of paths to session log files
+        List of paths to session log files (JSONL and legacy JSON)
     """
     session_dir = get_cortex_path(project_root, CortexResourceType.SESSION)
     if not session_dir.exists():
         return []
 
-    return sorted(session_dir.glob("context-session-*.json"))
+    return sorted(
+        path
+        for suffix in (SESSION_LOG_SUFFIX, LEGACY_SESSION_LOG_SUFFIX)
+        for path in session_dir.glob(f"{SESSION_LOG_PREFIX}*{suffix}")
+    )
+
+
+def session_id_from_log_path(log_path: Path) -> str:
+    """Get the session ID encoded in a session log file name.
+
+    Args:
+        log_path: Path to the session log file
+
+    Returns:
+        Session ID
+    """
+    return log_path.stem.removeprefix(SESSION_LOG_PREFIX)
+
+
+def read_session_log_entries(
+    log_path: Path, offset: int = 0
+) -> tuple[list[LoadContextLogEntry], int]:
+    """Read the entries appended to a JSONL session log after an offset.
+
+    Only complete lines are read, so a line still being written is picked
+    up by the next read. Lines that fail to parse are skipped.
+
+    Args:
+        log_path: Path to the JSONL session log
+        offset: Byte offset to start reading at
+
+    Returns:
+        Tuple of (entries, byte offset after the last complete line)
+    """
+    if not log_path.exists():
+        return [], offset
+
+    with open(log_path, "rb") as f:
+        _ = f.seek(offset)
+        data = f.read()
+    complete = data[: data.rfind(b"\n") + 1]
+
+    entries: list[LoadContextLogEntry] = []
+    for line in complete.splitlines():
+        if not line.strip():
+            continue
+        try:
+            entries.append(LoadContextLogEntry.model_validate_json(line))
+        except ValueError as e:
+            logger.warning(f"Skipping malformed session log line in {log_path}: {e}")
+    return entries, offset + len(complete)
 
 
 def read_session_log(log_path: Path) -> SessionLog | None:
     """Read a session log file.
 
     Args:
-        log_path: Path to the session log file
+        log_path: Path to a JSONL or legacy JSON session log file
 
     Returns:
         Session log dictionary or None if file doesn't exist
@@ -232,6 +349,14 @@ def read_session_log(log_path: Path) -> SessionLog | None:
     if not log_path.exists():
         return None
 
-    with open(log_path, encoding="utf-8") as f:
-        data = json.load(f)
-        return SessionLog.model_validate(data)
+    if log_path.suffix == LEGACY_SESSION_LOG_SUFFIX:
+        with open(log_path, encoding="utf-8") as f:
+            data = json.load(f)
+            return SessionLog.model_validate(data)
+
+    entries, _ = read_session_log_entries(log_path)
+    return SessionLog(
+        session_id=session_id_from_log_path(log_path),
+        session_start=entries[0].timestamp if entries else "",
+        load_context_calls=entries,
+    )
@@ -0,0 +1,133 @@
+"""Single-flight deduplication of concurrent identical tool calls.
+
+Several agents working on the same project often issue the same expensive,
+read-only call at the same time (validate all files, memory bank statistics).
+Instead of computing the result once per caller, the first call runs and every
+identical call that arrives while it is still in flight awaits the same result.
+Calls are identical when the tool, its normalized arguments, the project root
+and the memory bank version match, so a call made after a file changed never
+receives a result computed before.
+"""
+
+import asyncio
+import hashlib
+import json
+from collections.abc import Awaitable, Callable, Hashable
+from pathlib import Path
+from typing import cast
+
+from cortex.core.models import JsonValue, SingleFlightStats
+from cortex.core.path_resolver import CortexResourceType, get_cortex_path
+
+
+def memory_bank_version(project_root: Path) -> str:
+    """
+    Fingerprint the memory bank of a project.
+
+    Args:
+        project_root: Project root directory
+
+    Returns:
+        Hex digest over every markdown file's path, size and modification time
+    """
+    memory_bank = get_cortex_path(project_root, CortexResourceType.MEMORY_BANK)
+    digest = hashlib.sha256()
+    if memory_bank.is_dir():
+        for file_path in sorted(memory_bank.rglob("*.md")):
+            stat = file_path.stat()
+            digest.update(f"{file_path}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode())
+    return digest.hexdigest()[:16]
+
+
+def call_key(
+    tool: str,
+    args: tuple[JsonValue, ...],
+    kwargs: dict[str, JsonValue],
+    project_root: Path,
+    version: str,
+) -> tuple[str, str, str, str]:
+    """
+    Build the deduplication key of a tool call.
+
+    Args:
+        tool: Fully qualified tool function name
+        args: Positional arguments
+        kwargs: Keyword arguments; None values count as omitted
+        project_root: Resolved project root
+        version: Memory bank version
+
+    Returns:
+        Hashable key that is equal for identical calls
+    """
+    normalized = {k: v for k, v in kwargs.items() if v is not None}
+    arguments = json.dumps(
+        {"args": list(args), "kwargs": normalized}, sort_keys=True, default=str
+    )
+    return tool, arguments, str(project_root.resolve()), version
+
+
+class SingleFlight:
+    """
+    Share one in-flight execution among concurrent identical calls.
+
+    Features:
+    - The first call for a key executes; later identical calls await its result
+    - Exceptions are shared the same way as results
+    - The shared execution is cancelled only when every caller has cancelled
+    - Counts executions and the duplicate executions saved
+    """
+
+    def __init__(self) -> None:
+        """Initialize with no calls in flight."""
+        self._flights: dict[Hashable, tuple[asyncio.Task[object], list[int]]] = {}
+        self._executions: int = 0
+        self._shared: int = 0
+
+    async def run[T](self, key: Hashable, call: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run a call, or join the identical call already in flight.
+
+        Args:
+            key: Deduplication key (see call_key)
+            call: Coroutine function performing the call
+
+        Returns:
+            Result of the shared execution
+        """
+        flight = self._flights.get(key)
+        if flight is not None and flight[0].get_loop() is asyncio.get_running_loop():
+            task, waiters = flight
+            self._shared += 1
+        else:
+            task = asyncio.ensure_future(cast(Awaitable[object], call()))
+            waiters = [0]
+            self._flights[key] = (task, waiters)
+            self._executions += 1
+            task.add_done_callback(lambda done: self._forget(key, done))
+
+        waiters[0] += 1
+        try:
+            return cast(T, await asyncio.shield(task))
+        except asyncio.CancelledError:
+            if waiters[0] == 1 and not task.done():
+                _ = task.cancel()
+            raise
+        finally:
+            waiters[0] -= 1
+
+    def stats(self) -> SingleFlightStats:
+        """Get execution and deduplication counters."""
+        return SingleFlightStats(
+            executions=self._executions,
+            duplicates_saved=self._shared,
+            in_flight=len(self._flights),
+        )
+
+    def _forget(self, key: Hashable, task: asyncio.Task[object]) -> None:
+        """Drop a finished flight so later calls execute again."""
+        flight = self._flights.get(key)
+        if flight is not None and flight[0] is task:
+            del self._flights[key]
+        if not task.cancelled():
+            # Mark the exception retrieved; callers re-raise it from the shield
+            _ = task.exception()
@@ -0,0 +1,435 @@
+"""
+State Archive - Monthly segment files for aged-out state records.
+
+History tables (executions, rollbacks, approvals) only ever grow. Records
+older than a retention window are moved out of the live SQLite table into
+one gzip-compressed JSON Lines segment per kind and month, so the live
+tables, their indexes and everything that scans them stay proportional to
+recent activity rather than to the age of the project.
+
+Each archived record keeps a row in a small ``<kind>_archive`` index table
+(key, created_at, month), which is how point lookups and date range queries
+find the one segment they need. Segments are only read when a query reaches
+them and a few recently read segments are kept parsed.
+"""
+
+import gzip
+import json
+import os
+import re
+from collections import OrderedDict, defaultdict
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from pydantic import BaseModel
+
+from cortex.core.state_store import StateRow, StateStore, StateTable
+
+ARCHIVE_DIR_NAME = "archive"
+SEGMENT_SUFFIX = ".jsonl.gz"
+MAX_LOADED_SEGMENTS = 4
+
+_MONTH_PATTERN = re.compile(r"^\d{4}-\d{2}")
+
+
+@dataclass(frozen=True)
+class CompactionStats:
+    """Outcome of one compaction pass over a record kind."""
+
+    archived: int = 0
+    expired: int = 0
+    segments_removed: int = 0
+
+
+class StateArchive:
+    """
+    Time-partitioned cold storage for state store records.
+
+    Features:
+    - One compressed segment per record kind and month
+    - Indexed point lookups and date range reads into single segments
+    - Bounded cache of parsed segments
+    - Expiry of whole months past the archive retention
+    """
+
+    def __init__(self, store: StateStore, root: Path):
+        """
+        Bind an archive directory to the store holding its index.
+
+        Args:
+            store: State store holding live records and the archive index
+            root: Directory holding one sub-directory of segments per kind
+        """
+        self.store: StateStore = store
+        self.root: Path = Path(root)
+        self._segments: OrderedDict[Path, dict[str, StateRow]] = OrderedDict()
+
+    @classmethod
+    def in_directory(cls, store: StateStore, cortex_dir: Path) -> "StateArchive":
+        """Open the archive that lives in a .cortex directory."""
+        return cls(store, Path(cortex_dir) / ARCHIVE_DIR_NAME)
+
+    def archive_before(self, kind: str, created_before: str) -> list[str]:
+        """
+        Move live records created before a timestamp into monthly segments.
+
+        Segments are rewritten before the live rows are deleted, so an
+        interrupted pass leaves the records live and the next pass retries.
+
+        Args:
+            kind: Record kind
+            created_before: Exclusive upper bound on created_at
+
+        Returns:
+            Keys of the archived records
+        """
+        by_month: defaultdict[str, list[StateRow]] = defaultdict(list)
+        for row in self.store.range_rows(kind, until=created_before):
+            if _MONTH_PATTERN.match(row[1]):
+                by_month[row[1][:7]].append(row)
+        if not by_month:
+            return []
+
+        for month, rows in by_month.items():
+            # Rewriting a month also drops copies that were revived or deleted
+            path = self._segment_path(kind, month)
+            indexed = self.store.range_keys(
+                _index_kind(kind), since=month, until=_next_month(month)
+            )
+            segment = self._load_segment(path)
+            merged = {key: segment[key] for key in indexed if key in segment}
+            merged.update((row[0], row) for row in rows)
+            _write_segment(path, merged.values())
+            _ = self._segments.pop(path, None)
+
+        keys = [row[0] for rows in by_month.values() for row in rows]
+        with self.store.transaction():
+            _ = self.store.upsert_many(
+                _index_kind(kind),
+                [
+                    (key, created_at, month)
+                    for month, rows in by_month.items()
+                    for key, created_at, _ in rows
+                ],
+            )
+            _ = self.store.delete(kind, keys)
+        return keys
+
+    def expire_before(self, kind: str, created_before: str) -> tuple[int, int]:
+        """
+        Drop archived months that end before a timestamp.
+
+        Expiry works on whole segments: a month is removed only once every
+        record in it is older than ``created_before``.
+
+        Args:
+            kind: Record kind
+            created_before: Records created before this are no longer needed
+
+        Returns:
+            (expired records, removed segments)
+        """
+        if not _MONTH_PATTERN.match(created_before):
+            return 0, 0
+        first_kept = created_before[:7]
+        removed = 0
+        for month in self.months(kind):
+            if month >= first_kept:
+                break
+            path = self._segment_path(kind, month)
+            path.unlink(missing_ok=True)
+            _ = self._segments.pop(path, None)
+            removed += 1
+        expired = self.store.delete_before(_index_kind(kind), first_kept)
+        return expired, removed
+
+    def months(self, kind: str) -> list[str]:
+        """Get the months (YYYY-MM) that have a segment, oldest first."""
+        directory = self.root / kind
+        if not directory.is_dir():
+            return []
+        return sorted(
+            path.name.removesuffix(SEGMENT_SUFFIX)
+            for path in directory.glob(f"*{SEGMENT_SUFFIX}")
+        )
+
+    def count(self, kind: str) -> int:
+        """Count the archived records of a kind."""
+        return self.store.count(_index_kind(kind))
+
+    def contains(self, kind: str, key: str) -> bool:
+        """Check whether a record is archived, without reading segments."""
+        return self.store.get(_index_kind(kind), key) is not None
+
+    def get(self, kind: str, key: str) -> str | None:
+        """
+        Get the data of one archived record.
+
+        Args:
+            kind: Record kind
+            key: Record key
+
+        Returns:
+            Record JSON, or None if the record is not archived
+        """
+        month = self.store.get(_index_kind(kind), key)
+        if month is None:
+            return None
+        row = self._load_segment(self._segment_path(kind, month)).get(key)
+        return None if row is None else row[2]
+
+    def range_rows(
+        self, kind: str, since: str | None = None, until: str | None = None
+    ) -> list[StateRow]:
+        """
+        Get archived rows created in ``[since, until)``.
+
+        Only the segments of months holding matching index entries are read.
+
+        Args:
+            kind: Record kind
+            since: Inclusive lower bound on created_at, or None
+            until: Exclusive upper bound on created_at, or None
+
+        Returns:
+            Matching (key, created_at, data) rows ordered by created_at
+        """
+        rows: list[StateRow] = []
+        for key, _, month in self.store.range_rows(_index_kind(kind), since, until):
+            row = self._load_segment(self._segment_path(kind, month)).get(key)
+            if row is not None:
+                rows.append(row)
+        return rows
+
+    def forget(self, kind: str, keys: Iterable[str]) -> int:
+        """
+        Remove records from the archive index.
+
+        Used when a record is written live again or deleted; its stale copy
+        stays in the segment until the month is rewritten or expires.
+
+        Args:
+            kind: Record kind
+            keys: Record keys
+
+        Returns:
+            Number of index entries removed
+        """
+        keys = list(keys)
+        if not keys:
+            return 0
+        return self.store.delete(_index_kind(kind), keys)
+
+    def _segment_path(self, kind: str, month: str) -> Path:
+        return self.root / kind / f"{month}{SEGMENT_SUFFIX}"
+
+    def _load_segment(self, path: Path) -> dict[str, StateRow]:
+        """Parse a segment, keeping the last few parsed segments in memory."""
+        cached = self._segments.get(path)
+        if cached is not None:
+            self._segments.move_to_end(path)
+            return cached
+        rows: dict[str, StateRow] = {}
+        if path.exists():
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                for line in f:
+                    key, created_at, data = json.loads(line)
+                    rows[str(key)] = (str(key), str(created_at), str(data))
+        self._segments[path] = rows
+        while len(self._segments) > MAX_LOADED_SEGMENTS:
+            _ = self._segments.popitem(last=False)
+        return rows
+
+
+class ArchivedStateTable[ModelT: BaseModel](StateTable[ModelT]):
+    """
+    State table whose old records age out into a state archive.
+
+    Lookups, iteration, ``len`` and ``created_since`` cover live and
+    archived records alike, so callers see one history regardless of where
+    each record currently lives. Only reading an archived record's data
+    touches its segment; keys and counts come from the archive index.
+    """
+
+    def __init__(
+        self,
+        store: StateStore,
+        kind: str,
+        model_type: type[ModelT],
+        created_at: Callable[[ModelT], str],
+        archive: StateArchive,
+    ):
+        """
+        Bind a record kind to a model type and an archive.
+
+        Args:
+            store: State store holding the live records
+            kind: Record kind (table name)
+            model_type: Pydantic model of one record
+            created_at: Function returning the indexed timestamp of a record
+            archive: Archive receiving records past the retention window
+        """
+        super().__init__(store, kind, model_type, created_at)
+        self.archive: StateArchive = archive
+        # Archived records loaded into the cache, with their archived JSON
+        self._archived: dict[str, str] = {}
+
+    def __getitem__(self, key: str) -> ModelT:
+        try:
+            return super().__getitem__(key)
+        except KeyError:
+            data = self.archive.get(self.kind, key)
+            if data is None:
+                raise
+        model = self._model_type.model_validate_json(data)
+        self._cache[key] = model
+        self._written[key] = data
+        self._archived[key] = data
+        return model
+
+    def __setitem__(self, key: str, value: ModelT) -> None:
+        super().__setitem__(key, value)
+        _ = self._archived.pop(key, None)
+        _ = self.archive.forget(self.kind, [key])
+
+    def __delitem__(self, key: str) -> None:
+        _ = self._archived.pop(key, None)
+        if self.archive.forget(self.kind, [key]):
+            try:
+                super().__delitem__(key)
+            except KeyError:
+                pass
+            return
+        super().__delitem__(key)
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self.store.keys(_index_kind(self.kind))
+        yield from super().__iter__()
+
+    def __len__(self) -> int:
+        return self.archive.count(self.kind) + super().__len__()
+
+    def __contains__(self, key: object) -> bool:
+        if super().__contains__(key):
+            return True
+        return isinstance(key, str) and self.archive.contains(self.kind, key)
+
+    def flush(self, keys: Iterable[str] | None = None) -> int:
+        """
+        Write changed cached records; archived records that changed go live.
+
+        Args:
+            keys: Keys to check, or None for every cached record
+
+        Returns:
+            Number of rows written
+        """
+        written = super().flush(keys)
+        revived = [
+            key
+            for key, data in self._archived.items()
+            if self._written.get(key) != data
+        ]
+        for key in revived:
+            del self._archived[key]
+        _ = self.archive.forget(self.kind, revived)
+        return written
+
+    def clear_cache(self) -> None:
+        """Forget parsed records so they are re-read from the store."""
+        super().clear_cache()
+        self._archived.clear()
+
+    def live_items(self) -> list[tuple[str, ModelT]]:
+        """Get the records of the live table, without reading the archive."""
+        return [(key, super().__getitem__(key)) for key in self.store.keys(self.kind)]
+
+    def created_since(self, since: str) -> list[ModelT]:
+        """Get live and archived records created at or after ``since``."""
+        archived = [
+            self[key] for key, _, _ in self.archive.range_rows(self.kind, since=since)
+        ]
+        return archived + super().created_since(since)
+
+    def compact(
+        self,
+        active_days: int,
+        archive_days: int | None = None,
+        now: datetime | None = None,
+    ) -> CompactionStats:
+        """
+        Archive records past the active window and expire old archive months.
+
+        Args:
+            active_days: Days a record stays in the live table
+            archive_days: Days a record is kept at all, or None to keep forever
+            now: Reference time, defaults to the current time
+
+        Returns:
+            Counts of archived and expired records
+        """
+        now = now or datetime.now()
+        _ = self.flush()
+        archived = self.archive.archive_before(
+            self.kind, (now - timedelta(days=active_days)).isoformat()
+        )
+        for key in archived:
+            _ = self._cache.pop(key, None)
+            _ = self._written.pop(key, None)
+            _ = self._archived.pop(key, None)
+        expired, removed = 0, 0
+        if archive_days is not None:
+            expired, removed = self.archive.expire_before(
+                self.kind, (now - timedelta(days=archive_days)).isoformat()
+            )
+        return CompactionStats(
+            archived=len(archived), expired=expired, segments_removed=removed
+        )
+
+    def compact_if_due(
+        self,
+        active_days: int,
+        archive_days: int | None = None,
+        now: datetime | None = None,
+    ) -> CompactionStats | None:
+        """
+        Compact at most once per day.
+
+        Args:
+            active_days: Days a record stays in the live table
+            archive_days: Days a record is kept at all, or None to keep forever
+            now: Reference time, defaults to the current time
+
+        Returns:
+            Compaction counts, or None if the table was compacted today
+        """
+        now = now or datetime.now()
+        marker = f"compacted:{self.kind}"
+        today = now.date().isoformat()
+        if self.store.get_meta(marker) == today:
+            return None
+        stats = self.compact(active_days, archive_days, now)
+        self.store.set_meta(marker, today)
+        return stats
+
+
+def _index_kind(kind: str) -> str:
+    return f"{kind}_archive"
+
+
+def _next_month(month: str) -> str:
+    """The YYYY-MM month after ``month``."""
+    year, number = int(month[:4]), int(month[5:7])
+    return f"{year + number // 12:04d}-{number % 12 + 1:02d}"
+
+
+def _write_segment(path: Path, rows: Iterable[StateRow]) -> None:
+    """Atomically replace a segment with the given rows."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(f".{path.name}.tmp")
+    with gzip.open(temp_path, "wt", encoding="utf-8") as f:
+        for row in sorted(rows, key=lambda row: (row[1], row[0])):
+            _ = f.write(json.dumps(list(row)) + "\n")
+    os.replace(temp_path, path)
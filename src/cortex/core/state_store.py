@@ -0,0 +1,466 @@
+"""
+State Store - Embedded SQLite storage for .cortex state records.
+
+Rollbacks, refactoring executions, approvals and access records used to live
+in JSON files that were loaded whole at startup and rewritten whole on every
+change. The state store keeps each record type in its own indexed table of a
+single WAL-mode SQLite database, so a change is a row-level upsert and date
+filtered history is an index range scan. All managers of a project share one
+store, which is closed when the project's managers are released.
+
+Each legacy JSON file is imported once, when a store first meets it; from
+then on the file is only an export target, and every manager can still
+export its records as JSON for humans.
+"""
+
+import asyncio
+import re
+import sqlite3
+import threading
+from collections.abc import (
+    Callable,
+    Generator,
+    Iterable,
+    Iterator,
+    Mapping,
+    MutableMapping,
+)
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+from pydantic import BaseModel
+
+STATE_DB_NAME = "state.db"
+
+# (key, created_at, data) - data is the JSON document of one record
+type StateRow = tuple[str, str, str]
+
+_KIND_PATTERN = re.compile(r"^[a-z][a-z0-9_]*$")
+
+
+class StateStore:
+    """
+    Embedded transactional store with one indexed table per record kind.
+
+    Features:
+    - WAL journal with NORMAL synchronous mode for cheap small writes
+    - Row-level upserts and deletes in short transactions
+    - created_at index for date range scans
+    - One-shot import of legacy JSON files
+    - Worker-thread execution of blocking work for async callers
+    """
+
+    def __init__(self, db_path: Path):
+        """
+        Bind the store to its database; the connection opens on first use.
+
+        Args:
+            db_path: Path to the SQLite database file (created if needed)
+        """
+        self.db_path: Path = Path(db_path)
+        self._lock: threading.RLock = threading.RLock()
+        self._tables: set[str] = set()
+        self._db: sqlite3.Connection | None = None
+
+    @classmethod
+    def in_directory(cls, cortex_dir: Path) -> "StateStore":
+        """Open the state database that lives in a .cortex directory."""
+        return cls(Path(cortex_dir) / STATE_DB_NAME)
+
+    @property
+    def _connection(self) -> sqlite3.Connection:
+        """Get the database connection, opening it on first use or after close()."""
+        with self._lock:
+            if self._db is None:
+                self.db_path.parent.mkdir(parents=True, exist_ok=True)
+                db = sqlite3.connect(
+                    self.db_path, check_same_thread=False, isolation_level=None
+                )
+                _ = db.execute("PRAGMA journal_mode=WAL")
+                _ = db.execute("PRAGMA synchronous=NORMAL")
+                _ = db.execute(
+                    "CREATE TABLE IF NOT EXISTS state_meta "
+                    + "(name TEXT PRIMARY KEY, value TEXT)"
+                )
+                self._db = db
+            return self._db
+
+    @property
+    def closed(self) -> bool:
+        """Whether the database connection is currently closed."""
+        return self._db is None
+
+    def close(self) -> None:
+        """
+        Close the database connection.
+
+        Owners call this when they release the store (e.g. when a project's
+        managers are evicted). A call that still holds the store afterwards
+        transparently reopens the connection on its next query.
+        """
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    async def run[**P, T](
+        self, work: Callable[P, T], *args: P.args, **kwargs: P.kwargs
+    ) -> T:
+        """
+        Run blocking store work in a worker thread, off the event loop.
+
+        The work holds the store lock for its whole duration, so table
+        caches and archive segments touched by it never see another
+        thread's half-finished update.
+
+        Args:
+            work: Function performing queries (table or store methods)
+            *args: Positional arguments for work
+            **kwargs: Keyword arguments for work
+
+        Returns:
+            Result of work
+        """
+
+        def locked() -> T:
+            with self._lock:
+                return work(*args, **kwargs)
+
+        return await asyncio.to_thread(locked)
+
+    @contextmanager
+    def transaction(self) -> Generator[None]:
+        """Group several writes into one atomic transaction."""
+        with self._lock:
+            if self._connection.in_transaction:
+                yield
+                return
+            known_tables = set(self._tables)
+            _ = self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield
+            except BaseException:
+                _ = self._connection.execute("ROLLBACK")
+                # Tables created inside the transaction were rolled back too
+                self._tables = known_tables
+                raise
+            _ = self._connection.execute("COMMIT")
+
+    def upsert(self, kind: str, key: str, data: str, created_at: str = "") -> None:
+        """Insert or replace a single record."""
+        _ = self.upsert_many(kind, [(key, created_at, data)])
+
+    def upsert_many(self, kind: str, rows: Iterable[StateRow]) -> int:
+        """
+        Insert or replace several records in one transaction.
+
+        Args:
+            kind: Record kind (table name)
+            rows: (key, created_at, data) rows
+
+        Returns:
+            Number of rows written
+        """
+        table = self._table(kind)
+        rows = list(rows)
+        if not rows:
+            return 0
+        with self.transaction():
+            _ = self._connection.executemany(
+                f"INSERT INTO {table} (key, created_at, data) VALUES (?, ?, ?) "
+                + "ON CONFLICT(key) DO UPDATE SET "
+                + "created_at = excluded.created_at, data = excluded.data",
+                rows,
+            )
+        return len(rows)
+
+    def get(self, kind: str, key: str) -> str | None:
+        """Get the data of one record, or None if it does not exist."""
+        table = self._table(kind)
+        with self._lock:
+            row = self._connection.execute(
+                f"SELECT data FROM {table} WHERE key = ?", (key,)
+            ).fetchone()
+        return None if row is None else str(row[0])
+
+    def delete(self, kind: str, keys: Iterable[str]) -> int:
+        """Delete records by key and return how many were removed."""
+        table = self._table(kind)
+        with self.transaction():
+            cursor = self._connection.executemany(
+                f"DELETE FROM {table} WHERE key = ?", [(key,) for key in keys]
+            )
+        return max(cursor.rowcount, 0)
+
+    def delete_before(self, kind: str, created_before: str) -> int:
+        """Delete records created before a timestamp using the date index."""
+        table = self._table(kind)
+        with self.transaction():
+            cursor = self._connection.execute(
+                f"DELETE FROM {table} WHERE created_at < ?", (created_before,)
+            )
+        return max(cursor.rowcount, 0)
+
+    def keys(self, kind: str) -> list[str]:
+        """Get all record keys of a kind, oldest first."""
+        return self.range_keys(kind)
+
+    def count(self, kind: str) -> int:
+        """Count the records of a kind."""
+        table = self._table(kind)
+        with self._lock:
+            row = self._connection.execute(f"SELECT COUNT(*) FROM {table}").fetchone()
+        return int(row[0]) if row is not None else 0
+
+    def rows(self, kind: str) -> list[StateRow]:
+        """Get all (key, created_at, data) rows of a kind, oldest first."""
+        return self.range_rows(kind)
+
+    def range_keys(
+        self, kind: str, since: str | None = None, until: str | None = None
+    ) -> list[str]:
+        """
+        Get keys of records created in ``[since, until)`` via the date index.
+
+        Args:
+            kind: Record kind
+            since: Inclusive lower bound on created_at, or None
+            until: Exclusive upper bound on created_at, or None
+
+        Returns:
+            Matching keys ordered by created_at
+        """
+        return [str(row[0]) for row in self._range(kind, "key", since, until)]
+
+    def range_rows(
+        self, kind: str, since: str | None = None, until: str | None = None
+    ) -> list[StateRow]:
+        """
+        Get rows of records created in ``[since, until)`` via the date index.
+
+        Args:
+            kind: Record kind
+            since: Inclusive lower bound on created_at, or None
+            until: Exclusive upper bound on created_at, or None
+
+        Returns:
+            Matching (key, created_at, data) rows ordered by created_at
+        """
+        return [
+            (str(k), str(c), str(d))
+            for k, c, d in self._range(kind, "key, created_at, data", since, until)
+        ]
+
+    def _range(
+        self, kind: str, columns: str, since: str | None, until: str | None
+    ) -> list[tuple[object, ...]]:
+        table = self._table(kind)
+        clauses: list[str] = []
+        params: list[str] = []
+        if since is not None:
+            clauses.append("created_at >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("created_at < ?")
+            params.append(until)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._lock:
+            cursor = self._connection.execute(
+                f"SELECT {columns} FROM {table}{where} ORDER BY created_at, key",
+                params,
+            )
+            return [tuple(row) for row in cursor.fetchall()]
+
+    def import_legacy(
+        self, source: Path, load: Callable[[Path], Mapping[str, list[StateRow]]]
+    ) -> bool:
+        """
+        Import a legacy JSON file the first time the store meets it.
+
+        The import is recorded as done whatever its outcome: a missing file
+        had nothing to migrate and a corrupted one is reported once rather
+        than on every startup. The file is never read again, so exports to
+        the same path and records later deleted from the store cannot
+        re-enter it.
+
+        Args:
+            source: Legacy JSON file
+            load: Function parsing the file into rows per record kind
+
+        Returns:
+            True if the file was imported
+        """
+        key = _legacy_key(source)
+        if self.get_meta(key) is not None:
+            return False
+        try:
+            if not source.exists():
+                return False
+            tables = load(source)
+            with self.transaction():
+                for kind, rows in tables.items():
+                    _ = self.upsert_many(kind, rows)
+        finally:
+            self.set_meta(key, datetime.now().isoformat())
+        return True
+
+    def _table(self, kind: str) -> str:
+        """Get the table for a record kind, creating it on first use."""
+        if not _KIND_PATTERN.match(kind):
+            raise ValueError(f"Invalid state record kind: {kind!r}")
+        table = f"state_{kind}"
+        if table not in self._tables:
+            with self._lock:
+                _ = self._connection.execute(
+                    f"CREATE TABLE IF NOT EXISTS {table} (key TEXT PRIMARY KEY, "
+                    + "created_at TEXT NOT NULL DEFAULT '', data TEXT NOT NULL)"
+                )
+                _ = self._connection.execute(
+                    f"CREATE INDEX IF NOT EXISTS {table}_created_at ON {table} (created_at)"
+                )
+                self._tables.add(table)
+        return table
+
+    def get_meta(self, name: str) -> str | None:
+        """Get a store metadata value, or None if it is not set."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value FROM state_meta WHERE name = ?", (name,)
+            ).fetchone()
+        return None if row is None else str(row[0])
+
+    def set_meta(self, name: str, value: str) -> None:
+        """Set a store metadata value."""
+        with self._lock:
+            _ = self._connection.execute(
+                "INSERT INTO state_meta (name, value) VALUES (?, ?) "
+                + "ON CONFLICT(name) DO UPDATE SET value = excluded.value",
+                (name, value),
+            )
+
+
+class StateTable[ModelT: BaseModel](MutableMapping[str, ModelT]):
+    """
+    Dictionary view of one record kind, backed by a state store table.
+
+    Records are parsed on first access and cached. Assigning or deleting a
+    key writes through immediately; records mutated in place are written by
+    ``flush``, which only rewrites rows whose JSON actually changed.
+    """
+
+    def __init__(
+        self,
+        store: StateStore,
+        kind: str,
+        model_type: type[ModelT],
+        created_at: Callable[[ModelT], str],
+    ):
+        """
+        Bind a record kind to a model type.
+
+        Args:
+            store: State store holding the records
+            kind: Record kind (table name)
+            model_type: Pydantic model of one record
+            created_at: Function returning the indexed timestamp of a record
+        """
+        self.store: StateStore = store
+        self.kind: str = kind
+        self._model_type: type[ModelT] = model_type
+        self._created_at: Callable[[ModelT], str] = created_at
+        self._cache: dict[str, ModelT] = {}
+        self._written: dict[str, str] = {}
+
+    def __getitem__(self, key: str) -> ModelT:
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+        data = self.store.get(self.kind, key)
+        if data is None:
+            raise KeyError(key)
+        model = self._model_type.model_validate_json(data)
+        self._cache[key] = model
+        self._written[key] = data
+        return model
+
+    def __setitem__(self, key: str, value: ModelT) -> None:
+        data = value.model_dump_json()
+        self.store.upsert(self.kind, key, data, self._created_at(value))
+        self._cache[key] = value
+        self._written[key] = data
+
+    def __delitem__(self, key: str) -> None:
+        if self.store.delete(self.kind, [key]) == 0 and key not in self._cache:
+            raise KeyError(key)
+        _ = self._cache.pop(key, None)
+        _ = self._written.pop(key, None)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.store.keys(self.kind))
+
+    def __len__(self) -> int:
+        return self.store.count(self.kind)
+
+    def __contains__(self, key: object) -> bool:
+        if key in self._cache:
+            return True
+        return isinstance(key, str) and self.store.get(self.kind, key) is not None
+
+    def flush(self, keys: Iterable[str] | None = None) -> int:
+        """
+        Write cached records whose contents changed since they were written.
+
+        Args:
+            keys: Keys to check, or None for every cached record
+
+        Returns:
+            Number of rows written
+        """
+        candidates = self._cache.keys() if keys is None else keys
+        rows: list[StateRow] = []
+        for key in list(candidates):
+            model = self._cache.get(key)
+            if model is None:
+                continue
+            data = model.model_dump_json()
+            if self._written.get(key) != data:
+                rows.append((key, self._created_at(model), data))
+        written = self.store.upsert_many(self.kind, rows)
+        for key, _, data in rows:
+            self._written[key] = data
+        return written
+
+    def replace(self, records: Mapping[str, ModelT]) -> None:
+        """Make the table hold exactly ``records``, writing only differences."""
+        with self.store.transaction():
+            stale = [key for key in self if key not in records]
+            _ = self.store.delete(self.kind, stale)
+            for key in stale:
+                _ = self._cache.pop(key, None)
+                _ = self._written.pop(key, None)
+            self._cache.update(records)
+            _ = self.flush(records.keys())
+
+    def created_since(self, since: str) -> list[ModelT]:
+        """Get records created at or after ``since`` via the date index."""
+        return [self[key] for key in self.store.range_keys(self.kind, since=since)]
+
+    def clear_cache(self) -> None:
+        """Forget parsed records so they are re-read from the store."""
+        self._cache.clear()
+        self._written.clear()
+
+
+def model_rows[ModelT: BaseModel](
+    records: Mapping[str, ModelT], created_at: Callable[[ModelT], str]
+) -> list[StateRow]:
+    """Serialize models into state rows for bulk import."""
+    return [
+        (key, created_at(model), model.model_dump_json())
+        for key, model in records.items()
+    ]
+
+
+def _legacy_key(path: Path) -> str:
+    return f"legacy:{path.name}"
@@ -14,6 +14,7 @@ from cortex.core.models import (
     TokenCountSectionsResult,
 )
 from cortex.core.tiktoken_cache import setup_tiktoken_cache
+from cortex.core.tracing import traced
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +27,16 @@ class _TiktokenModule(Protocol):
     def get_encoding(self, name: str) -> _Encoding: ...
 
 
+# Loaded encodings by model, shared by every TokenCounter in the process (one
+# per project when serving many): encodings are read-only and take megabytes
+_shared_encodings: dict[str, _Encoding] = {}
+
+
+def loaded_encodings() -> list[object]:
+    """Get the encodings shared by every TokenCounter in the process."""
+    return list(_shared_encodings.values())
+
+
 class TokenCounter:
     """
     Accurate token counting using tiktoken library with graceful degradation.
@@ -77,7 +88,12 @@ class TokenCounter:
             return None
 
         if self.encoding_impl is None:
-            self.encoding_impl = self._load_tiktoken_with_timeout()
+            encoding = _shared_encodings.get(self.model)
+            if encoding is None:
+                encoding = self._load_tiktoken_with_timeout()
+                if encoding is not None:
+                    _shared_encodings[self.model] = encoding
+            self.encoding_impl = encoding
         return self.encoding_impl
 
     def _is_network_error(self, error: Exception) -> bool:
@@ -338,6 +354,7 @@ class TokenCounter:
         # Rough approximation: 1 token ≈ 4 characters
         return len(text) // 4
 
+    @traced("tokens.count_tokens")
     def count_tokens(self, text: str | None) -> int:
         """
         Count tokens in text with graceful degradation.
@@ -0,0 +1,221 @@
+"""Concurrency scheduling of MCP tool executions by cost class.
+
+With a single global semaphore a couple of long-running tools (pre-commit
+checks, full analyses) can occupy every slot while cheap reads queue behind
+them. The scheduler keeps a separate pool per cost class, matching the timeout
+tiers in constants.py, so a class can only starve itself. Within a pool, a
+queued call's priority rises the longer it waits, and projects with fewer
+running calls go first.
+"""
+
+import asyncio
+import time
+from collections.abc import AsyncGenerator, Mapping
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from enum import StrEnum
+
+from cortex.core.constants import (
+    MCP_CONCURRENCY_COMPLEX,
+    MCP_CONCURRENCY_EXTERNAL,
+    MCP_CONCURRENCY_FAST,
+    MCP_CONCURRENCY_MEDIUM,
+    MCP_QUEUE_AGING_SECONDS,
+    MCP_TOOL_TIMEOUT_FAST,
+    MCP_TOOL_TIMEOUT_MEDIUM,
+)
+from cortex.core.models import ConcurrencyPoolStats
+from cortex.core.tracing import span
+
+
+class CostClass(StrEnum):
+    """Cost class of a tool, selecting its concurrency pool."""
+
+    FAST = "fast"
+    MEDIUM = "medium"
+    COMPLEX = "complex"
+    EXTERNAL = "external"
+
+
+DEFAULT_POOL_LIMITS: dict[CostClass, int] = {
+    CostClass.FAST: MCP_CONCURRENCY_FAST,
+    CostClass.MEDIUM: MCP_CONCURRENCY_MEDIUM,
+    CostClass.COMPLEX: MCP_CONCURRENCY_COMPLEX,
+    CostClass.EXTERNAL: MCP_CONCURRENCY_EXTERNAL,
+}
+
+
+def cost_class_for_timeout(timeout: float) -> CostClass:
+    """
+    Derive a cost class from a tool's timeout tier.
+
+    Args:
+        timeout: Tool timeout in seconds
+
+    Returns:
+        FAST or MEDIUM for timeouts within those tiers, otherwise COMPLEX
+        (EXTERNAL shares the MEDIUM timeout and must be chosen explicitly)
+    """
+    if timeout <= MCP_TOOL_TIMEOUT_FAST:
+        return CostClass.FAST
+    if timeout <= MCP_TOOL_TIMEOUT_MEDIUM:
+        return CostClass.MEDIUM
+    return CostClass.COMPLEX
+
+
+@dataclass
+class _Waiter:
+    """A queued request for a pool slot."""
+
+    project: str
+    priority: int
+    enqueued_at: float
+    future: asyncio.Future[None]
+
+
+@dataclass
+class _Pool:
+    """Slots, queue and wait metrics of one cost class."""
+
+    cost_class: CostClass
+    limit: int
+    active: int = 0
+    active_by_project: dict[str, int] = field(default_factory=lambda: dict[str, int]())
+    waiters: list[_Waiter] = field(default_factory=lambda: list[_Waiter]())
+    max_queue_depth: int = 0
+    completed_waits: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+
+class ToolScheduler:
+    """
+    Per-cost-class concurrency pools for MCP tool executions.
+
+    Features:
+    - Independent slot limits per cost class (fast/medium/complex/external)
+    - Priority aging: every MCP_QUEUE_AGING_SECONDS queued adds one level
+    - Per-project fairness: projects with fewer running calls are preferred
+    - Queue depth and wait time metrics per pool
+    """
+
+    def __init__(
+        self,
+        limits: Mapping[CostClass, int] | None = None,
+        aging_seconds: float = MCP_QUEUE_AGING_SECONDS,
+    ) -> None:
+        """
+        Initialize the scheduler.
+
+        Args:
+            limits: Concurrent executions per cost class (default: constants)
+            aging_seconds: Queue wait that earns one priority level
+        """
+        merged = {**DEFAULT_POOL_LIMITS, **(limits or {})}
+        self._pools = {
+            cost_class: _Pool(cost_class, max(1, limit))
+            for cost_class, limit in merged.items()
+        }
+        self._aging_seconds = aging_seconds
+
+    @asynccontextmanager
+    async def slot(
+        self, cost_class: CostClass, project: str = "", priority: int = 0
+    ) -> AsyncGenerator[None]:
+        """
+        Hold a slot of a cost class pool for the duration of the block.
+
+        Args:
+            cost_class: Pool to take the slot from
+            project: Project the call works on, for fairness between projects
+            priority: Base priority; higher runs first
+        """
+        pool = self._pools[cost_class]
+        with span("scheduler.queue_wait"):
+            await self._acquire(pool, project, priority)
+        try:
+            yield
+        finally:
+            self._release(pool, project)
+
+    def stats(self) -> list[ConcurrencyPoolStats]:
+        """Get load and queueing metrics of every pool."""
+        return [
+            ConcurrencyPoolStats(
+                cost_class=pool.cost_class.value,
+                max_concurrent=pool.limit,
+                active=pool.active,
+                queued=len(pool.waiters),
+                max_queue_depth=pool.max_queue_depth,
+                completed_waits=pool.completed_waits,
+                avg_wait_ms=(
+                    pool.total_wait / pool.completed_waits * 1000
+                    if pool.completed_waits
+                    else 0.0
+                ),
+                max_wait_ms=pool.max_wait * 1000,
+            )
+            for pool in self._pools.values()
+        ]
+
+    async def _acquire(self, pool: _Pool, project: str, priority: int) -> None:
+        """Take a slot, queueing while the pool is full."""
+        if pool.active < pool.limit and not pool.waiters:
+            self._grant(pool, project, 0.0)
+            return
+
+        waiter = _Waiter(
+            project=project,
+            priority=priority,
+            enqueued_at=time.monotonic(),
+            future=asyncio.get_running_loop().create_future(),
+        )
+        pool.waiters.append(waiter)
+        pool.max_queue_depth = max(pool.max_queue_depth, len(pool.waiters))
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter in pool.waiters:
+                pool.waiters.remove(waiter)
+            elif waiter.future.done() and not waiter.future.cancelled():
+                # Granted just before the cancellation arrived: hand it on
+                self._release(pool, project)
+            raise
+
+    def _release(self, pool: _Pool, project: str) -> None:
+        """Return a slot and grant it to the best queued call."""
+        pool.active -= 1
+        remaining = pool.active_by_project.get(project, 1) - 1
+        if remaining > 0:
+            pool.active_by_project[project] = remaining
+        else:
+            _ = pool.active_by_project.pop(project, None)
+        self._dispatch(pool)
+
+    def _dispatch(self, pool: _Pool) -> None:
+        """Grant free slots to queued calls in score order."""
+        now = time.monotonic()
+        while pool.active < pool.limit and pool.waiters:
+            waiter = max(pool.waiters, key=lambda w: self._score(pool, w, now))
+            pool.waiters.remove(waiter)
+            if waiter.future.done():
+                continue
+            waiter.future.set_result(None)
+            self._grant(pool, waiter.project, now - waiter.enqueued_at)
+
+    def _score(self, pool: _Pool, waiter: _Waiter, now: float) -> tuple[float, float]:
+        """Rank a queued call; the oldest call wins ties."""
+        waited = now - waiter.enqueued_at
+        aged = waiter.priority + (
+            waited / self._aging_seconds if self._aging_seconds > 0 else 0.0
+        )
+        running = pool.active_by_project.get(waiter.project, 0)
+        return aged - running, waited
+
+    def _grant(self, pool: _Pool, project: str, waited: float) -> None:
+        """Record a slot handed to a call."""
+        pool.active += 1
+        pool.active_by_project[project] = pool.active_by_project.get(project, 0) + 1
+        pool.completed_waits += 1
+        pool.total_wait += waited
+        pool.max_wait = max(pool.max_wait, waited)
@@ -0,0 +1,368 @@
+"""Span tracing and hot-path profiling of MCP tool calls.
+
+Every tool call runs inside a trace whose root is the call itself. Code on
+the call's path marks the work worth seeing (rate limiter waits, file reads,
+token counting, relevance scoring, scheduler queueing) with span() or
+@traced; spans nest through awaits and child tasks because the current span
+lives in a context variable. Outside a trace both are a single context
+variable lookup, so managers can be instrumented unconditionally.
+
+Finished traces are kept in a ring buffer, and the durations of tool calls
+and of spans feed bounded latency samples for p50/p95 reporting. A call can
+additionally be captured with cProfile.
+"""
+
+import cProfile
+import functools
+import inspect
+import io
+import os
+import pstats
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable, Generator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import cast
+
+from cortex.core.constants import (
+    MCP_PROFILE_TOP_FUNCTIONS,
+    MCP_TRACE_BUFFER_SIZE,
+    MCP_TRACE_LATENCY_SAMPLES,
+    MCP_TRACE_MAX_SPANS,
+)
+from cortex.core.models import LatencyStats, ToolTrace, TraceSpan
+
+# Set to 0 to disable tracing of tool calls
+TRACING_ENV = "CORTEX_TRACING"
+
+
+@dataclass
+class _SpanRecord:
+    """A finished span, before conversion to its model."""
+
+    span_id: int
+    parent_id: int | None
+    name: str
+    start: float
+    end: float
+    error: str | None
+
+
+@dataclass
+class _ActiveTrace:
+    """State of a tool call trace while the call runs."""
+
+    tracer: "Tracer"
+    tool: str
+    start: float
+    started_at: str
+    spans: list[_SpanRecord] = field(default_factory=lambda: list[_SpanRecord]())
+    dropped_spans: int = 0
+    next_span_id: int = 1
+
+
+@dataclass(frozen=True)
+class _Position:
+    """The trace and span that new spans become children of."""
+
+    trace: _ActiveTrace
+    span_id: int | None
+
+
+_position: ContextVar[_Position | None] = ContextVar("cortex_trace", default=None)
+
+
+@contextmanager
+def span(name: str) -> Generator[None]:
+    """
+    Time a block as a span of the current trace (no-op outside a trace).
+
+    Args:
+        name: Span name, e.g. "fs.read_file"
+    """
+    position = _position.get()
+    if position is None:
+        yield
+        return
+
+    trace = position.trace
+    span_id = trace.next_span_id
+    trace.next_span_id += 1
+    token = _position.set(_Position(trace, span_id))
+    start = time.perf_counter()
+    error: str | None = None
+    try:
+        yield
+    except BaseException as e:
+        error = type(e).__name__
+        raise
+    finally:
+        end = time.perf_counter()
+        _position.reset(token)
+        trace.tracer.record_span(
+            trace, _SpanRecord(span_id, position.span_id, name, start, end, error)
+        )
+
+
+def traced[**P, R](name: str) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """
+    Decorator recording each call of a function or coroutine function as a span.
+
+    Args:
+        name: Span name
+
+    Returns:
+        Decorator function
+    """
+
+    def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        if inspect.iscoroutinefunction(func):
+            coroutine_function = cast(Callable[P, Awaitable[object]], func)
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: P.args, **kwargs: P.kwargs) -> object:
+                if _position.get() is None:
+                    return await coroutine_function(*args, **kwargs)
+                with span(name):
+                    return await coroutine_function(*args, **kwargs)
+
+            return cast(Callable[P, R], async_wrapper)
+
+        @functools.wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            if _position.get() is None:
+                return func(*args, **kwargs)
+            with span(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def _percentile(sorted_values: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of ascending values."""
+    index = min(len(sorted_values) - 1, int(len(sorted_values) * fraction))
+    return sorted_values[index]
+
+
+def _latency_stats(name: str, samples: deque[float]) -> LatencyStats:
+    """Summarize latency samples in seconds as milliseconds."""
+    ordered = sorted(samples)
+    return LatencyStats(
+        name=name,
+        count=len(ordered),
+        p50_ms=_percentile(ordered, 0.5) * 1000,
+        p95_ms=_percentile(ordered, 0.95) * 1000,
+        max_ms=ordered[-1] * 1000,
+    )
+
+
+class Tracer:
+    """
+    Recorder of tool call traces and latency samples.
+
+    Features:
+    - Ring buffer of the most recent traces
+    - Spans beyond the per-trace limit are counted instead of stored
+    - Bounded latency samples per tool and per span name for p50/p95
+    - Optional cProfile capture of a call, requested per call or armed for
+      the next call of a tool; one capture runs at a time and, as cProfile
+      is per thread, includes other calls running concurrently
+    """
+
+    def __init__(
+        self,
+        buffer_size: int = MCP_TRACE_BUFFER_SIZE,
+        max_spans: int = MCP_TRACE_MAX_SPANS,
+        latency_samples: int = MCP_TRACE_LATENCY_SAMPLES,
+        enabled: bool = True,
+    ) -> None:
+        """
+        Initialize the tracer.
+
+        Args:
+            buffer_size: Recent traces to keep
+            max_spans: Spans stored per trace
+            latency_samples: Latency samples kept per tool and per span name
+            enabled: Record traces at all
+        """
+        self.enabled = enabled
+        self._traces: deque[ToolTrace] = deque(maxlen=buffer_size)
+        self._max_spans = max_spans
+        self._latency_samples = latency_samples
+        self._tool_latency: dict[str, deque[float]] = {}
+        self._span_latency: dict[str, deque[float]] = {}
+        self._profile_requests: set[str] = set()
+        self._profiling = False
+
+    @contextmanager
+    def trace_tool(self, tool: str, profile: bool = False) -> Generator[None]:
+        """
+        Trace a tool call for the duration of the block.
+
+        Inside a running trace (a tool calling another tool) the block is
+        recorded as a span of that trace instead.
+
+        Args:
+            tool: Tool name
+            profile: Capture the call with cProfile
+        """
+        if not self.enabled:
+            yield
+            return
+        if _position.get() is not None:
+            with span(f"tool.{tool}"):
+                yield
+            return
+
+        trace = _ActiveTrace(
+            tracer=self,
+            tool=tool,
+            start=time.perf_counter(),
+            started_at=datetime.now(UTC).isoformat(),
+        )
+        token = _position.set(_Position(trace, None))
+        profiler = self._start_profile(tool, profile)
+        error: str | None = None
+        try:
+            yield
+        except BaseException as e:
+            error = type(e).__name__
+            raise
+        finally:
+            end = time.perf_counter()
+            _position.reset(token)
+            report = self._stop_profile(profiler)
+            self._finish(trace, end, error, report)
+
+    def request_profile(self, tool: str) -> None:
+        """Capture the next call of a tool with cProfile."""
+        self._profile_requests.add(tool)
+
+    def record_span(self, trace: _ActiveTrace, record: _SpanRecord) -> None:
+        """Store a finished span in its trace and its latency sample."""
+        if len(trace.spans) < self._max_spans:
+            trace.spans.append(record)
+        else:
+            trace.dropped_spans += 1
+        self._sample(self._span_latency, record.name, record.end - record.start)
+
+    def tool_latency(self, tool: str | None = None) -> list[LatencyStats]:
+        """
+        Get latency percentiles per tool, slowest p95 first.
+
+        Args:
+            tool: Only this tool (default: all tools)
+        """
+        stats = [
+            _latency_stats(name, samples)
+            for name, samples in self._tool_latency.items()
+            if tool is None or name == tool
+        ]
+        return sorted(stats, key=lambda s: s.p95_ms, reverse=True)
+
+    def span_latency(self) -> list[LatencyStats]:
+        """Get latency percentiles per span name, slowest p95 first."""
+        stats = [
+            _latency_stats(name, samples)
+            for name, samples in self._span_latency.items()
+        ]
+        return sorted(stats, key=lambda s: s.p95_ms, reverse=True)
+
+    def recent_traces(
+        self, tool: str | None = None, limit: int = 10
+    ) -> list[ToolTrace]:
+        """
+        Get the most recent traces, newest first.
+
+        Args:
+            tool: Only traces of this tool (default: all tools)
+            limit: Maximum traces to return
+        """
+        traces = [t for t in reversed(self._traces) if tool is None or t.tool == tool]
+        return traces[: max(0, limit)]
+
+    def clear(self) -> None:
+        """Drop all traces and latency samples."""
+        self._traces.clear()
+        self._tool_latency.clear()
+        self._span_latency.clear()
+
+    def _sample(
+        self, samples: dict[str, deque[float]], name: str, value: float
+    ) -> None:
+        """Add a latency sample, keeping the most recent ones."""
+        if name not in samples:
+            samples[name] = deque(maxlen=self._latency_samples)
+        samples[name].append(value)
+
+    def _start_profile(self, tool: str, requested: bool) -> cProfile.Profile | None:
+        """Start a cProfile capture if requested and none is running."""
+        armed = tool in self._profile_requests
+        if not (requested or armed) or self._profiling:
+            return None
+        self._profile_requests.discard(tool)
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            # Another profiler (e.g. a debugger or coverage tool) is active
+            return None
+        self._profiling = True
+        return profiler
+
+    def _stop_profile(self, profiler: cProfile.Profile | None) -> str | None:
+        """Stop a capture and render its hottest functions."""
+        if profiler is None:
+            return None
+        profiler.disable()
+        self._profiling = False
+        output = io.StringIO()
+        stats = pstats.Stats(profiler, stream=output)
+        _ = stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(
+            MCP_PROFILE_TOP_FUNCTIONS
+        )
+        return output.getvalue()
+
+    def _finish(
+        self, trace: _ActiveTrace, end: float, error: str | None, profile: str | None
+    ) -> None:
+        """Convert a finished trace to its model and record it."""
+        self._sample(self._tool_latency, trace.tool, end - trace.start)
+        self._traces.append(
+            ToolTrace(
+                tool=trace.tool,
+                started_at=trace.started_at,
+                duration_ms=(end - trace.start) * 1000,
+                error=error,
+                spans=[
+                    TraceSpan(
+                        span_id=record.span_id,
+                        parent_id=record.parent_id,
+                        name=record.name,
+                        start_ms=(record.start - trace.start) * 1000,
+                        duration_ms=(record.end - record.start) * 1000,
+                        error=record.error,
+                    )
+                    for record in sorted(trace.spans, key=lambda r: r.start)
+                ],
+                dropped_spans=trace.dropped_spans,
+                profile=profile,
+            )
+        )
+
+
+# Global tracer (one per server process, like the tool scheduler)
+_tracer: Tracer | None = None
+
+
+def get_tracer() -> Tracer:
+    """Get or create the global tracer."""
+    global _tracer
+    if _tracer is None:
+        _tracer = Tracer(enabled=os.environ.get(TRACING_ENV, "1") != "0")
+    return _tracer
@@ -4,24 +4,115 @@ MCP Memory Bank - Main Entry Point
 
 This is the main entry point for the Memory Bank MCP server.
 All tool implementations are in the tools/ package.
+
+By default the server speaks stdio to a single client. With CORTEX_TRANSPORT
+set to streamable-http or sse it runs as one long-running HTTP server that
+many clients share; each tool call names its project_root, and the managers
+of recently used projects stay warm in a pool between sessions, bounded by
+project count, idle time and estimated memory.
 """
 
+import asyncio
+import importlib
 import logging
+import os
 import sys
 from builtins import BaseExceptionGroup  # Python 3.11+
-from typing import cast
+from pathlib import Path
+from typing import Literal, cast
 
 import anyio
 
-# Import tools package to register all @mcp.tool() decorators
-import cortex.tools  # noqa: F401
 from cortex.server import mcp
+from cortex.tools import register_tools
 
-# Explicitly reference cortex.tools to satisfy type checker (imported for side effects)
-_ = cortex.tools
+# Register all tools; by default they are listed from the tool manifest and
+# each tool module is imported on first use (CORTEX_EAGER_TOOLS=1 disables)
+_ = register_tools()
 
 logger = logging.getLogger(__name__)
 
+# Set to 0 to skip initializing managers in the background after connecting
+WARMUP_ENV = "CORTEX_WARMUP"
+
+# Transport: stdio (default), or streamable-http / sse to serve many clients
+TRANSPORT_ENV = "CORTEX_TRANSPORT"
+# HTTP transports: address to listen on (default 127.0.0.1:8000)
+HOST_ENV = "CORTEX_HOST"
+PORT_ENV = "CORTEX_PORT"
+# HTTP transports: projects kept warm, and idle seconds before one is dropped
+MAX_PROJECTS_ENV = "CORTEX_MAX_PROJECTS"
+PROJECT_IDLE_SECONDS_ENV = "CORTEX_PROJECT_IDLE_SECONDS"
+# HTTP transports: estimated memory in MB of all projects kept warm
+POOL_MEMORY_MB_ENV = "CORTEX_POOL_MEMORY_MB"
+
+type Transport = Literal["stdio", "sse", "streamable-http"]
+TRANSPORTS: tuple[Transport, ...] = ("stdio", "sse", "streamable-http")
+
+
+def _get_transport() -> Transport:
+    """Get the transport selected by the environment.
+
+    Raises:
+        ValueError: If the transport is unknown
+    """
+    value = os.environ.get(TRANSPORT_ENV, "stdio")
+    for transport in TRANSPORTS:
+        if value == transport:
+            return transport
+    raise ValueError(
+        f"Unknown {TRANSPORT_ENV} {value!r}; expected one of {', '.join(TRANSPORTS)}"
+    )
+
+
+def _configure_http_server() -> None:
+    """Apply the HTTP address and manager pool settings from the environment."""
+    from cortex.core.constants import (
+        MANAGER_POOL_IDLE_SECONDS,
+        MANAGER_POOL_MAX_PROJECTS,
+        MANAGER_POOL_MEMORY_LIMIT_MB,
+    )
+    from cortex.core.manager_registry import get_default_registry
+
+    host = os.environ.get(HOST_ENV)
+    if host is not None:
+        mcp.settings.host = host
+        # FastMCP only guards loopback hosts against DNS rebinding
+        if host not in ("127.0.0.1", "localhost", "::1"):
+            mcp.settings.transport_security = None
+    mcp.settings.port = int(os.environ.get(PORT_ENV, mcp.settings.port))
+    get_default_registry().configure(
+        max_projects=int(os.environ.get(MAX_PROJECTS_ENV, MANAGER_POOL_MAX_PROJECTS)),
+        idle_timeout=float(
+            os.environ.get(PROJECT_IDLE_SECONDS_ENV, MANAGER_POOL_IDLE_SECONDS)
+        ),
+        memory_limit_bytes=int(
+            float(os.environ.get(POOL_MEMORY_MB_ENV, MANAGER_POOL_MEMORY_LIMIT_MB))
+            * 1024
+            * 1024
+        ),
+    )
+
+
+async def _warm_up_managers() -> None:
+    """Start the background manager warm-up once a client has connected."""
+    if os.environ.get(WARMUP_ENV, "1") == "0":
+        return
+    # An HTTP server's working directory is not the project of its clients
+    if os.environ.get(TRANSPORT_ENV, "stdio") != "stdio":
+        return
+    # Initializing managers creates .cortex/; leave other directories alone
+    if not (Path.cwd() / ".cortex").is_dir():
+        return
+    # Importing the managers takes a few hundred ms; keep it off the event loop
+    _ = await asyncio.to_thread(importlib.import_module, "cortex.managers.warmup")
+    from cortex.managers.warmup import start_warmup
+
+    _ = start_warmup()
+
+
+mcp.on_initialized(_warm_up_managers)
+
 
 def _is_connection_error(exc: BaseException) -> bool:
     """Check if exception is a connection-related error."""
@@ -89,10 +180,19 @@ def main() -> None:
 
     Handles MCP stdio connection with improved error handling and stability.
     Provides comprehensive error handling for connection issues and ensures
-    graceful shutdown on errors.
+    graceful shutdown on errors. CORTEX_TRANSPORT selects an HTTP transport
+    instead.
     """
     try:
-        mcp.run(transport="stdio")
+        transport = _get_transport()
+        if transport != "stdio":
+            _configure_http_server()
+    except ValueError as e:
+        logger.error(f"Invalid server configuration: {e}")
+        sys.exit(2)
+
+    try:
+        mcp.run(transport=transport)
     except KeyboardInterrupt:
         logger.info("MCP server interrupted by user")
         sys.exit(0)
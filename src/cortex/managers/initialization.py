@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Manager initialization and lifecycle management for MCP Memory Bank."""
 
+import asyncio
 import collections.abc
 from pathlib import Path
 from typing import cast
@@ -19,6 +20,7 @@ from cortex.core.metadata_index import MetadataIndex
 from cortex.core.migration import MigrationManager
 from cortex.core.models import ModelDict
 from cortex.core.path_resolver import CortexResourceType, get_cortex_path
+from cortex.core.state_store import StateStore
 from cortex.core.token_counter import TokenCounter
 from cortex.core.version_manager import VersionManager
 from cortex.guides.benefits import GUIDE as BENEFITS_GUIDE
@@ -53,6 +55,7 @@ from cortex.refactoring.refactoring_executor import RefactoringExecutor
 from cortex.refactoring.reorganization_planner import ReorganizationPlanner
 from cortex.refactoring.rollback_manager import RollbackManager
 from cortex.refactoring.split_recommender import SplitRecommender
+from cortex.refactoring.suggestion_pipeline import SuggestionPipeline
 
 # Import Synapse manager
 from cortex.rules.synapse_manager import SynapseManager
@@ -161,10 +164,9 @@ async def get_managers(project_root: Path) -> ManagersDict:
     Returns:
         ManagersDict model with manager instances (or LazyManager wrappers)
     """
-    from cortex.core.manager_registry import ManagerRegistry
+    from cortex.core.manager_registry import get_default_registry
 
-    registry = ManagerRegistry()
-    managers_dict = await registry.get_managers(project_root)
+    managers_dict = await get_default_registry().get_managers(project_root)
     return ManagersDict.model_validate(managers_dict)
 
 
@@ -186,6 +188,7 @@ async def initialize_managers(project_root: Path) -> ManagersDict:
         versions=core_managers.versions,
         migration=core_managers.migration,
         watcher=core_managers.watcher,
+        state=core_managers.state,
     )
 
     _add_linking_managers(managers, core_managers)
@@ -315,7 +318,8 @@ def _add_analysis_managers(
         core_managers: Core managers dictionary
     """
     managers.pattern_analyzer = LazyManager(
-        lambda: _create_pattern_analyzer(project_root), name="pattern_analyzer"
+        lambda: _create_pattern_analyzer(project_root, core_managers),
+        name="pattern_analyzer",
     )
     managers.structure_analyzer = LazyManager(
         lambda: _create_structure_analyzer(project_root, core_managers),
@@ -342,12 +346,17 @@ def _add_refactoring_managers(managers: ManagersDict, project_root: Path) -> Non
         name="consolidation_detector",
     )
     managers.split_recommender = LazyManager(
-        lambda: _create_split_recommender(project_root), name="split_recommender"
+        lambda: _create_split_recommender(project_root, managers),
+        name="split_recommender",
     )
     managers.reorganization_planner = LazyManager(
         lambda: _create_reorganization_planner(project_root),
         name="reorganization_planner",
     )
+    managers.suggestion_pipeline = LazyManager(
+        lambda: _create_suggestion_pipeline(project_root, managers),
+        name="suggestion_pipeline",
+    )
 
 
 def _add_execution_managers(
@@ -367,7 +376,7 @@ def _add_execution_managers(
         name="refactoring_executor",
     )
     managers.approval_manager = LazyManager(
-        lambda: _create_approval_manager(project_root),
+        lambda: _create_approval_manager(project_root, core_managers),
         name="approval_manager",
     )
     managers.rollback_manager = LazyManager(
@@ -398,6 +407,9 @@ async def _init_core_managers(project_root: Path) -> CoreManagersDict:
     versions = VersionManager(project_root)
     migration = MigrationManager(project_root)
     watcher = FileWatcherManager()
+    state = StateStore.in_directory(
+        get_cortex_path(project_root, CortexResourceType.CORTEX_DIR)
+    )
 
     from cortex.managers.types import CoreManagersDict
 
@@ -409,6 +421,7 @@ async def _init_core_managers(project_root: Path) -> CoreManagersDict:
         versions=versions,
         migration=migration,
         watcher=watcher,
+        state=state,
     )
 
 
@@ -562,9 +575,13 @@ async def _create_synapse_manager(
     )
 
 
-async def _create_pattern_analyzer(project_root: Path) -> PatternAnalyzer:
-    """Create PatternAnalyzer instance."""
-    return PatternAnalyzer(project_root)
+async def _create_pattern_analyzer(
+    project_root: Path, core_managers: CoreManagersDict
+) -> PatternAnalyzer:
+    """Create PatternAnalyzer instance, loading its access data off the loop."""
+    return await asyncio.to_thread(
+        PatternAnalyzer, project_root, state_store=core_managers.state
+    )
 
 
 async def _create_structure_analyzer(
@@ -636,7 +653,9 @@ async def _create_consolidation_detector(
     )
 
 
-async def _create_split_recommender(project_root: Path) -> SplitRecommender:
+async def _create_split_recommender(
+    project_root: Path, managers: ManagersDict
+) -> SplitRecommender:
     """Create SplitRecommender instance."""
     memory_bank_path = get_cortex_path(project_root, CortexResourceType.MEMORY_BANK)
     return SplitRecommender(
@@ -644,6 +663,7 @@ async def _create_split_recommender(project_root: Path) -> SplitRecommender:
         max_file_size=5000,
         max_sections=10,
         min_section_independence=0.6,
+        token_counter=managers.tokens,
     )
 
 
@@ -659,6 +679,27 @@ async def _create_reorganization_planner(
     )
 
 
+async def _create_suggestion_pipeline(
+    project_root: Path, managers: ManagersDict
+) -> SuggestionPipeline:
+    """Create SuggestionPipeline over the refactoring suggestion managers."""
+    from cortex.managers.manager_utils import get_manager
+
+    memory_bank_path = get_cortex_path(project_root, CortexResourceType.MEMORY_BANK)
+    return SuggestionPipeline(
+        memory_bank_path=memory_bank_path,
+        consolidation_detector=await get_manager(
+            managers, "consolidation_detector", ConsolidationDetector
+        ),
+        split_recommender=await get_manager(
+            managers, "split_recommender", SplitRecommender
+        ),
+        reorganization_planner=await get_manager(
+            managers, "reorganization_planner", ReorganizationPlanner
+        ),
+    )
+
+
 async def _create_refactoring_executor(
     project_root: Path, core_managers: CoreManagersDict, managers: ManagersDict
 ) -> RefactoringExecutor:
@@ -671,23 +712,30 @@ async def _create_refactoring_executor(
     link_validator = await get_manager(managers, "link_validator", LinkValidator)
     memory_bank_path = get_cortex_path(project_root, CortexResourceType.MEMORY_BANK)
 
-    return RefactoringExecutor(
+    return await asyncio.to_thread(
+        RefactoringExecutor,
         memory_bank_dir=memory_bank_path,
         fs_manager=fs_manager,
         version_manager=version_manager,
         link_validator=link_validator,
         metadata_index=metadata_index,
         config=None,
+        state_store=core_managers.state,
     )
 
 
 async def _create_approval_manager(
-    project_root: Path,
+    project_root: Path, core_managers: CoreManagersDict
 ) -> ApprovalManager:
     """Create ApprovalManager instance."""
     memory_bank_path = get_cortex_path(project_root, CortexResourceType.MEMORY_BANK)
 
-    return ApprovalManager(memory_bank_dir=memory_bank_path, config=None)
+    return await asyncio.to_thread(
+        ApprovalManager,
+        memory_bank_dir=memory_bank_path,
+        config=None,
+        state_store=core_managers.state,
+    )
 
 
 async def _create_rollback_manager(
@@ -699,12 +747,14 @@ async def _create_rollback_manager(
     metadata_index = core_managers.index
     memory_bank_path = get_cortex_path(project_root, CortexResourceType.MEMORY_BANK)
 
-    return RollbackManager(
+    return await asyncio.to_thread(
+        RollbackManager,
         memory_bank_dir=memory_bank_path,
         fs_manager=fs_manager,
         version_manager=version_manager,
         metadata_index=metadata_index,
         config=None,
+        state_store=core_managers.state,
     )
 
 
@@ -719,9 +769,11 @@ async def _create_learning_engine(
     )
     memory_bank_path = get_cortex_path(project_root, CortexResourceType.MEMORY_BANK)
 
-    return LearningEngine(
+    return await asyncio.to_thread(
+        LearningEngine,
         memory_bank_dir=memory_bank_path,
         config=cast(ModelDict, optimization_config.get("self_evolution.learning", {})),
+        state_store=managers.state,
     )
 
 
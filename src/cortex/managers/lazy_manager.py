@@ -51,6 +51,11 @@ class LazyManager[T]:
         """Check if manager has been initialized."""
         return self._instance is not None
 
+    @property
+    def instance(self) -> T | None:
+        """Get the manager instance if initialized, without initializing it."""
+        return self._instance
+
     @property
     def name(self) -> str:
         """Get manager name."""
@@ -61,6 +61,7 @@ MANAGER_GROUPS = [
             "consolidation_detector",
             "split_recommender",
             "reorganization_planner",
+            "suggestion_pipeline",
         ],
         priority=3,
     ),
@@ -5,7 +5,7 @@ This module contains Pydantic models for manager operations,
 migrated from dataclass definitions for better validation.
 """
 
-from typing import override
+from typing import Literal, override
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -34,3 +34,25 @@ class ManagerGroupModel(BaseModel):
     def __str__(self) -> str:
         """Return string representation."""
         return f"{self.name} ({len(self.managers)} managers, priority {self.priority})"
+
+
+class WarmupProgress(BaseModel):
+    """Progress of a background manager warm-up."""
+
+    model_config = ConfigDict(extra="forbid", validate_assignment=True)
+
+    project_root: str = Field(..., description="Project being warmed up")
+    state: Literal["pending", "running", "completed", "cancelled", "failed"] = Field(
+        default="pending", description="Warm-up state"
+    )
+    steps_total: int = Field(default=0, ge=0, description="Number of warm-up steps")
+    steps_completed: int = Field(
+        default=0, ge=0, description="Number of finished warm-up steps"
+    )
+    current_step: str | None = Field(default=None, description="Step currently running")
+    failed_steps: dict[str, str] = Field(
+        default_factory=dict, description="Error message per failed step"
+    )
+    elapsed_seconds: float = Field(
+        default=0.0, ge=0.0, description="Time since the warm-up started"
+    )
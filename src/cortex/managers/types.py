@@ -20,6 +20,7 @@ from cortex.core.file_system import FileSystemManager
 from cortex.core.file_watcher import FileWatcherManager
 from cortex.core.metadata_index import MetadataIndex
 from cortex.core.migration import MigrationManager
+from cortex.core.state_store import StateStore
 from cortex.core.token_counter import TokenCounter
 from cortex.core.version_manager import VersionManager
 from cortex.linking.link_parser import LinkParser
@@ -43,6 +44,7 @@ from cortex.refactoring.refactoring_executor import RefactoringExecutor
 from cortex.refactoring.reorganization_planner import ReorganizationPlanner
 from cortex.refactoring.rollback_manager import RollbackManager
 from cortex.refactoring.split_recommender import SplitRecommender
+from cortex.refactoring.suggestion_pipeline import SuggestionPipeline
 from cortex.rules.synapse_manager import SynapseManager
 from cortex.validation.duplication_detector import DuplicationDetector
 from cortex.validation.quality_metrics import QualityMetrics
@@ -70,6 +72,7 @@ class CoreManagersDict(BaseModel):
     versions: VersionManager = Field(description="Version manager")
     migration: MigrationManager = Field(description="Migration manager")
     watcher: FileWatcherManager = Field(description="File watcher manager")
+    state: StateStore = Field(description="State store shared by all managers")
 
 
 class ManagersDict(BaseModel):
@@ -95,6 +98,9 @@ class ManagersDict(BaseModel):
     versions: VersionManager = Field(description="Version manager")
     migration: MigrationManager = Field(description="Migration manager")
     watcher: FileWatcherManager = Field(description="File watcher manager")
+    state: StateStore | None = Field(
+        default=None, description="State store shared by all managers"
+    )
 
     # Phase 2: DRY Linking managers (lazy)
     link_parser: LazyManager[LinkParser] | LinkParser | None = Field(
@@ -168,6 +174,9 @@ class ManagersDict(BaseModel):
     reorganization_planner: (
         LazyManager[ReorganizationPlanner] | ReorganizationPlanner | None
     ) = Field(default=None, description="Reorganization planner")
+    suggestion_pipeline: LazyManager[SuggestionPipeline] | SuggestionPipeline | None = (
+        Field(default=None, description="Shared refactoring suggestion pipeline")
+    )
 
     # Phase 5.3-5.4: Execution managers (lazy)
     refactoring_executor: (
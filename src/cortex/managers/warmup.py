@@ -0,0 +1,163 @@
+"""Background manager warm-up after the MCP initialize handshake.
+
+Without a warm-up the first tool call pays for initializing the core managers,
+loading index.json and loading the tiktoken encoding. The warm-up does this
+work while the client is still idle, through the process-wide ManagerRegistry,
+so tool calls reuse its results and a tool call that arrives mid-way simply
+waits for the step it needs. Lazy managers are left to the tools that use them.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+from cortex.core.manager_registry import ManagerRegistry, get_default_registry
+from cortex.managers.initialization import get_project_root
+from cortex.managers.models import WarmupProgress
+from cortex.managers.types import ManagersDict
+
+logger = logging.getLogger(__name__)
+
+WarmupStep = tuple[str, Callable[[], Awaitable[object]]]
+
+
+class ManagerWarmup:
+    """
+    Background initialization of one project's core managers.
+
+    Features:
+    - Core managers (including the index load), then the tiktoken encoding,
+      then the dependency graph index; lazy managers are not initialized
+    - Blocking tiktoken loading runs in a worker thread
+    - Shares initialization with concurrent tool calls instead of repeating it
+    - A failing step is recorded and skipped; cancel() stops the warm-up
+    """
+
+    def __init__(
+        self, project_root: Path, registry: ManagerRegistry | None = None
+    ) -> None:
+        """
+        Prepare a warm-up without starting it.
+
+        Args:
+            project_root: Project root directory
+            registry: Registry to initialize managers in (default: shared one)
+        """
+        self.project_root = project_root
+        self._registry = registry or get_default_registry()
+        self._progress = WarmupProgress(project_root=str(project_root))
+        self._started_at: float | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> asyncio.Task[None]:
+        """Run the warm-up as a background task (idempotent)."""
+        if self._task is None:
+            self._task = asyncio.create_task(
+                self.run(), name=f"cortex-warmup:{self.project_root}"
+            )
+        return self._task
+
+    async def cancel(self) -> None:
+        """Cancel a running warm-up and wait until it has stopped."""
+        task = self._task
+        if task is None or task.done():
+            return
+        _ = task.cancel()
+        _ = await asyncio.wait([task])
+
+    def progress(self) -> WarmupProgress:
+        """Get a snapshot of the warm-up progress."""
+        elapsed = (
+            time.monotonic() - self._started_at if self._started_at is not None else 0
+        )
+        return self._progress.model_copy(update={"elapsed_seconds": elapsed})
+
+    async def run(self) -> None:
+        """Run every warm-up step in order."""
+        self._started_at = time.monotonic()
+        self._progress.state = "running"
+        self._progress.steps_total = 1
+        try:
+            managers = await self._run_step(
+                "core_managers", lambda: self._registry.get_managers(self.project_root)
+            )
+            if not isinstance(managers, ManagersDict):
+                self._progress.state = "failed"
+                return
+            steps = self._plan_steps(managers)
+            self._progress.steps_total += len(steps)
+            for name, step in steps:
+                _ = await self._run_step(name, step)
+                # Let queued tool calls run between steps
+                await asyncio.sleep(0)
+            self._progress.state = "completed"
+        except asyncio.CancelledError:
+            self._progress.state = "cancelled"
+            raise
+        finally:
+            self._progress.current_step = None
+
+    def _plan_steps(self, managers: ManagersDict) -> list[WarmupStep]:
+        """List the steps that follow core manager initialization."""
+
+        async def load_encoding() -> object:
+            return await asyncio.to_thread(lambda: managers.tokens.encoding)
+
+        async def index_dependency_graph() -> object:
+            return managers.graph.compute_loading_order()
+
+        return [
+            ("token_encoding", load_encoding),
+            ("dependency_graph", index_dependency_graph),
+        ]
+
+    async def _run_step(
+        self, name: str, step: Callable[[], Awaitable[object]]
+    ) -> object | None:
+        """Run one step, recording progress and failures."""
+        self._progress.current_step = name
+        try:
+            return await step()
+        except Exception as e:
+            logger.debug(f"Warm-up step {name} failed: {e}")
+            self._progress.failed_steps[name] = str(e)
+            return None
+        finally:
+            self._progress.steps_completed += 1
+
+
+# Warm-up of the server's project (one per process, like the server instance)
+_current_warmup: ManagerWarmup | None = None
+
+
+def start_warmup(project_root: Path | None = None) -> ManagerWarmup:
+    """
+    Start warming up a project's managers in the background.
+
+    A warm-up that is already running for the same project is reused.
+
+    Args:
+        project_root: Project root (default: detected like the tools do)
+
+    Returns:
+        The running warm-up
+    """
+    global _current_warmup
+    root = project_root or get_project_root()
+    if _current_warmup is None or _current_warmup.project_root != root:
+        _current_warmup = ManagerWarmup(root)
+    _ = _current_warmup.start()
+    return _current_warmup
+
+
+def get_warmup_progress() -> WarmupProgress | None:
+    """Get the progress of the current warm-up, or None if none was started."""
+    return _current_warmup.progress() if _current_warmup is not None else None
+
+
+async def cancel_warmup() -> None:
+    """Cancel the current warm-up, if any."""
+    if _current_warmup is not None:
+        await _current_warmup.cancel()
@@ -12,6 +12,7 @@ from datetime import datetime
 
 from cortex.core.dependency_graph import DependencyGraph
 from cortex.core.metadata_index import MetadataIndex
+from cortex.core.tracing import traced
 from cortex.optimization.models import FileMetadataForScoring, SectionScoreModel
 
 
@@ -48,6 +49,7 @@ class RelevanceScorer:
         # Cache for dependency score computation
         self._dependency_score_cache: dict[str, dict[str, float]] = {}
 
+    @traced("relevance.score_files")
     async def score_files(
         self,
         task_description: str,
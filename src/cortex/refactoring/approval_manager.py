@@ -5,10 +5,13 @@ Manage user approvals and preferences for refactoring suggestions.
 """
 
 import json
+from collections.abc import Iterable
 from datetime import datetime
 from pathlib import Path
 
 from cortex.core.async_file_utils import open_async_text_file
+from cortex.core.state_archive import ArchivedStateTable, CompactionStats, StateArchive
+from cortex.core.state_store import StateRow, StateStore, StateTable, model_rows
 from cortex.refactoring.models import (
     ApprovalConditions,
     ApprovalFileData,
@@ -46,6 +49,7 @@ class ApprovalManager:
         self,
         memory_bank_dir: Path,
         config: ApprovalManagerConfig | None = None,
+        state_store: StateStore | None = None,
     ) -> None:
         self.memory_bank_dir: Path = Path(memory_bank_dir)
         if config is None:
@@ -53,74 +57,133 @@ class ApprovalManager:
         else:
             self.config = config
 
-        # Approval data file
+        # Approvals and preferences live in the state store; approvals.json is
+        # a legacy import source and the target of export_approvals()
         self.approval_file: Path = self.memory_bank_dir.parent / "approvals.json"
-
-        # In-memory storage
-        self.approvals: dict[str, ApprovalModel] = {}
+        self.state_store: StateStore = state_store or StateStore.in_directory(
+            self.memory_bank_dir.parent
+        )
+        self.archive: StateArchive = StateArchive.in_directory(
+            self.state_store, self.memory_bank_dir.parent
+        )
+        self.approvals: ArchivedStateTable[ApprovalModel] = ArchivedStateTable(
+            self.state_store, "approvals", ApprovalModel, _created_at, self.archive
+        )
+        self._preference_table: StateTable[ApprovalPreferenceModel] = StateTable(
+            self.state_store,
+            "approval_preferences",
+            ApprovalPreferenceModel,
+            _created_at,
+        )
         self.preferences: list[ApprovalPreferenceModel] = []
+        self._compaction_checked: bool = False
 
         # Load existing data
         self._load_approvals()
 
     def _load_approvals(self) -> None:
         """
-        Load approvals and preferences from disk.
+        Import the legacy approval file once, then load preferences.
 
         Note:
             This method uses synchronous I/O during initialization for simplicity.
             For performance-critical paths, consider using async alternatives.
         """
-        if not self.approval_file.exists():
-            return
-
         try:
-            with open(self.approval_file) as f:
-                data = json.load(f)
-
-            approval_file_data = ApprovalFileData.model_validate(data)
-            self._load_approvals_from_data(approval_file_data)
-            self._load_preferences_from_data(approval_file_data)
-
+            _ = self.state_store.import_legacy(
+                self.approval_file, self._read_legacy_rows
+            )
         except Exception as e:
             from cortex.core.logging_config import logger
 
             logger.warning(f"Approval file corrupted, starting fresh: {e}")
 
-    def _load_approvals_from_data(self, data: ApprovalFileData) -> None:
-        """Load approvals from ApprovalFileData.
+        self.preferences = list(self._preference_table.values())
 
-        Args:
-            data: ApprovalFileData model
-        """
-        for approval_id, approval_model in data.approvals.items():
-            self.approvals[str(approval_id)] = approval_model
+    def _read_legacy_rows(self, source: Path) -> dict[str, list[StateRow]]:
+        """Parse the legacy approval file into state store rows."""
+        with open(source) as f:
+            data = json.load(f)
 
-    def _load_preferences_from_data(self, data: ApprovalFileData) -> None:
-        """Load preferences from ApprovalFileData.
+        approval_file_data = ApprovalFileData.model_validate(data)
+        preferences = {
+            preference.pattern_type: preference
+            for preference in approval_file_data.preferences
+        }
+        return {
+            "approvals": model_rows(approval_file_data.approvals, _created_at),
+            "approval_preferences": model_rows(preferences, _created_at),
+        }
 
-        Args:
-            data: ApprovalFileData model
+    async def _save_approvals(self, approval_ids: Iterable[str] | None = None) -> None:
         """
-        self.preferences = list(data.preferences)
+        Write changed approval records to the state store.
 
-    async def _save_approvals(self) -> None:
-        """Save approvals and preferences to disk."""
+        Args:
+            approval_ids: Approvals to write, or None for every loaded record
+        """
         try:
-            approvals_dict: dict[str, ApprovalModel] = dict(self.approvals)
-            preferences_list: list[ApprovalPreferenceModel] = list(self.preferences)
+            await self._compact_if_due()
+            _ = await self.state_store.run(self.approvals.flush, approval_ids)
+        except Exception as exc:
+            raise Exception(f"Failed to save approvals: {exc}") from exc
 
-            data = ApprovalFileData(
-                last_updated=datetime.now().isoformat(),
-                approvals=approvals_dict,
-                preferences=preferences_list,
+    async def _save_preferences(self) -> None:
+        """Write the current preference list to the state store."""
+        try:
+            await self.state_store.run(
+                self._preference_table.replace,
+                {
+                    preference.pattern_type: preference
+                    for preference in self.preferences
+                },
             )
+        except Exception as exc:
+            raise Exception(f"Failed to save preferences: {exc}") from exc
 
-            async with open_async_text_file(self.approval_file, "w", "utf-8") as f:
-                _ = await f.write(data.model_dump_json(indent=2))
+    async def _compact_if_due(self) -> None:
+        """Compact the approval history once a day, on the first write."""
+        retention = self.config.retention
+        if self._compaction_checked or not retention.auto_compact:
+            return
+        self._compaction_checked = True
+        _ = await self.state_store.run(
+            self.approvals.compact_if_due,
+            retention.active_days,
+            retention.archive_days,
+        )
 
-        except Exception as exc:
-            raise Exception(f"Failed to save approvals: {exc}") from exc
+    async def compact_history(self) -> CompactionStats:
+        """
+        Archive approvals past the active window and expire old archives.
+
+        Returns:
+            Counts of archived and expired approvals
+        """
+        retention = self.config.retention
+        return await self.state_store.run(
+            self.approvals.compact, retention.active_days, retention.archive_days
+        )
+
+    async def export_approvals(self, export_path: Path | None = None) -> Path:
+        """
+        Export approvals and preferences as JSON.
+
+        Args:
+            export_path: Target file, defaults to the legacy approvals.json
+
+        Returns:
+            Path of the written file
+        """
+        target = export_path or self.approval_file
+        data = ApprovalFileData(
+            last_updated=datetime.now().isoformat(),
+            approvals=await self.state_store.run(dict, self.approvals),
+            preferences=list(self.preferences),
+        )
+        async with open_async_text_file(target, "w", "utf-8") as f:
+            _ = await f.write(data.model_dump_json(indent=2))
+        return target
 
     async def request_approval(
         self,
@@ -154,8 +217,8 @@ class ApprovalManager:
             auto_approve,
         )
 
-        self.approvals[approval_id] = approval
-        await self._save_approvals()
+        await self._compact_if_due()
+        await self.state_store.run(self.approvals.update, {approval_id: approval})
 
         return self._build_approval_response(
             approval_id, status, auto_approve, auto_apply
@@ -223,19 +286,21 @@ class ApprovalManager:
         Returns:
             Updated approval record
         """
-        approval, approval_id = self._find_pending_approval(suggestion_id)
+        approval, approval_id = await self.state_store.run(
+            self._find_pending_approval, suggestion_id
+        )
 
         if not approval:
             approval, approval_id = await self._create_missing_approval(
                 suggestion_id, auto_apply
             )
 
-        self._update_approval_status(approval, user_comment, auto_apply)
-        await self._save_approvals()
-
         if approval_id is None:
             raise ValueError("Approval ID is required but was None")
 
+        self._update_approval_status(approval, user_comment, auto_apply)
+        await self._save_approvals([approval_id])
+
         return self._build_approval_success_response(
             approval_id, suggestion_id, auto_apply
         )
@@ -243,8 +308,8 @@ class ApprovalManager:
     def _find_pending_approval(
         self, suggestion_id: str
     ) -> tuple[ApprovalModel | None, str | None]:
-        """Find pending approval for suggestion."""
-        for aid, apr in self.approvals.items():
+        """Find pending approval for suggestion among live approvals."""
+        for aid, apr in self.approvals.live_items():
             if (
                 apr.suggestion_id == suggestion_id
                 and apr.status == ApprovalStatusEnum.PENDING
@@ -252,6 +317,15 @@ class ApprovalManager:
                 return apr, aid
         return None, None
 
+    def _find_approval(
+        self, suggestion_id: str
+    ) -> tuple[ApprovalModel | None, str | None]:
+        """Find the first live approval of a suggestion, whatever its status."""
+        for aid, apr in self.approvals.live_items():
+            if apr.suggestion_id == suggestion_id:
+                return apr, aid
+        return None, None
+
     async def _create_missing_approval(
         self, suggestion_id: str, auto_apply: bool
     ) -> tuple[ApprovalModel, str]:
@@ -296,15 +370,9 @@ class ApprovalManager:
         Returns:
             Updated approval record
         """
-        # Find approval for this suggestion
-        approval = None
-        approval_id = None
-
-        for aid, apr in self.approvals.items():
-            if apr.suggestion_id == suggestion_id:
-                approval = apr
-                approval_id = aid
-                break
+        approval, approval_id = await self.state_store.run(
+            self._find_approval, suggestion_id
+        )
 
         if not approval:
             return RejectResult(
@@ -317,7 +385,7 @@ class ApprovalManager:
         approval.status = ApprovalStatusEnum.REJECTED
         approval.user_comment = user_comment
 
-        await self._save_approvals()
+        await self._save_approvals([approval_id] if approval_id else None)
 
         return RejectResult(
             status="rejected",
@@ -341,7 +409,7 @@ class ApprovalManager:
         Returns:
             Updated approval record
         """
-        approval = self.approvals.get(approval_id)
+        approval = await self.state_store.run(self.approvals.get, approval_id)
 
         if not approval:
             return MarkAppliedResult(
@@ -354,7 +422,7 @@ class ApprovalManager:
         approval.applied_at = datetime.now().isoformat()
         approval.execution_id = execution_id
 
-        await self._save_approvals()
+        await self._save_approvals([approval_id])
 
         return MarkAppliedResult(
             status="applied",
@@ -403,7 +471,7 @@ class ApprovalManager:
         ]
 
         self.preferences.append(preference)
-        await self._save_approvals()
+        await self._save_preferences()
 
         return PreferenceResult(
             status="success",
@@ -433,7 +501,7 @@ class ApprovalManager:
         removed = original_count - len(self.preferences)
 
         if removed > 0:
-            await self._save_approvals()
+            await self._save_preferences()
             return PreferenceResult(
                 status="success",
                 pattern_type=pattern_type,
@@ -460,24 +528,25 @@ class ApprovalManager:
 
     async def get_approval(self, approval_id: str) -> ApprovalModel | None:
         """Get a specific approval by ID."""
-        approval = self.approvals.get(approval_id)
-        return approval
+        return await self.state_store.run(self.approvals.get, approval_id)
 
     async def get_approvals_for_suggestion(
         self, suggestion_id: str
     ) -> list[ApprovalModel]:
         """Get all approvals for a specific suggestion."""
+        approvals = await self.state_store.run(list, self.approvals.values())
         return [
             approval
-            for approval in self.approvals.values()
+            for approval in approvals
             if approval.suggestion_id == suggestion_id
         ]
 
     async def get_pending_approvals(self) -> PendingApprovalsResult:
         """Get all pending approvals."""
+        approvals = await self.state_store.run(self.approvals.live_items)
         pending: list[ApprovalModel] = [
             approval
-            for approval in self.approvals.values()
+            for _, approval in approvals
             if approval.status == ApprovalStatusEnum.PENDING
         ]
 
@@ -506,7 +575,10 @@ class ApprovalManager:
         cutoff_date = datetime.now() - timedelta(days=time_range_days)
 
         filtered_approvals: list[ApprovalModel] = []
-        for approval in self.approvals.values():
+        recent = await self.state_store.run(
+            self.approvals.created_since, cutoff_date.isoformat()
+        )
+        for approval in recent:
             approval_date = datetime.fromisoformat(approval.created_at)
             if approval_date >= cutoff_date:
                 if not status_filter or approval.status == status_filter:
@@ -565,17 +637,19 @@ class ApprovalManager:
         from datetime import timedelta
 
         cutoff_date = datetime.now() - timedelta(days=expiry_days)
-        expired_count = 0
+        expired_ids: list[str] = []
 
-        for approval in self.approvals.values():
+        approvals = await self.state_store.run(list, self.approvals.items())
+        for approval_id, approval in approvals:
             if approval.status == ApprovalStatusEnum.PENDING:
                 approval_date = datetime.fromisoformat(approval.created_at)
                 if approval_date < cutoff_date:
                     approval.status = ApprovalStatusEnum.EXPIRED
-                    expired_count += 1
+                    expired_ids.append(approval_id)
 
+        expired_count = len(expired_ids)
         if expired_count > 0:
-            await self._save_approvals()
+            await self._save_approvals(expired_ids)
 
         return CleanupExpiredApprovalsResult(
             status="success",
@@ -583,3 +657,8 @@ class ApprovalManager:
             expiry_days=expiry_days,
             message=f"Expired {expired_count} old pending approvals",
         )
+
+
+def _created_at(record: ApprovalModel | ApprovalPreferenceModel) -> str:
+    """Indexed timestamp of an approval or preference record."""
+    return record.created_at
@@ -138,7 +138,28 @@ class ConsolidationDetector:
             files = await self.get_all_markdown_files()
 
         file_contents = await self._read_files_for_detection(files)
-        opportunities = await self._detect_all_opportunity_types(file_contents)
+        return await self.detect_in_contents(file_contents)
+
+    async def detect_in_contents(
+        self,
+        file_contents: dict[str, str],
+        file_sections: dict[str, list[tuple[str, str]]] | None = None,
+    ) -> list[ConsolidationOpportunity]:
+        """
+        Detect consolidation opportunities in already loaded files.
+
+        Args:
+            file_contents: File paths mapped to their content
+            file_sections: Pre-parsed sections per file (parsed if None)
+
+        Returns:
+            List of consolidation opportunities, largest savings first
+        """
+        if file_sections is None:
+            file_sections = self._parse_files_into_sections(file_contents)
+        opportunities = await self._detect_all_opportunity_types(
+            file_contents, file_sections
+        )
         opportunities.sort(key=lambda o: o.token_savings, reverse=True)
 
         return opportunities
@@ -159,18 +180,24 @@ class ConsolidationDetector:
         return file_contents
 
     async def _detect_all_opportunity_types(
-        self, file_contents: dict[str, str]
+        self,
+        file_contents: dict[str, str],
+        file_sections: dict[str, list[tuple[str, str]]],
     ) -> list[ConsolidationOpportunity]:
         """Detect all types of consolidation opportunities."""
         opportunities: list[ConsolidationOpportunity] = []
 
-        exact_dupes = await self.detect_exact_duplicates(file_contents)
+        exact_dupes = await self.detect_exact_duplicates(file_contents, file_sections)
         opportunities.extend(exact_dupes)
 
-        similar_sections = await self.detect_similar_sections(file_contents)
+        similar_sections = await self.detect_similar_sections(
+            file_contents, file_sections
+        )
         opportunities.extend(similar_sections)
 
-        shared_patterns = await self.detect_shared_patterns(file_contents)
+        shared_patterns = await self.detect_shared_patterns(
+            file_contents, file_sections
+        )
         opportunities.extend(shared_patterns)
 
         return opportunities
@@ -201,10 +228,13 @@ class ConsolidationDetector:
             return ""
 
     async def detect_exact_duplicates(
-        self, file_contents: dict[str, str]
+        self,
+        file_contents: dict[str, str],
+        file_sections: dict[str, list[tuple[str, str]]] | None = None,
     ) -> list[ConsolidationOpportunity]:
         """Detect exact duplicate sections across files"""
-        file_sections = self._parse_all_files_into_sections(file_contents)
+        if file_sections is None:
+            file_sections = self._parse_all_files_into_sections(file_contents)
         section_hashes = self._build_section_hashes(file_sections)
         return self._create_opportunities_from_hashes(section_hashes)
 
@@ -412,11 +442,14 @@ class ConsolidationDetector:
         return similarity
 
     async def detect_similar_sections(
-        self, file_contents: dict[str, str]
+        self,
+        file_contents: dict[str, str],
+        file_sections: dict[str, list[tuple[str, str]]] | None = None,
     ) -> list[ConsolidationOpportunity]:
         """Detect similar (not exact) sections across files"""
         opportunities: list[ConsolidationOpportunity] = []
-        file_sections = self._parse_files_into_sections(file_contents)
+        if file_sections is None:
+            file_sections = self._parse_files_into_sections(file_contents)
         compared_pairs: set[tuple[str, str]] = set()
 
         for file1, sections1 in file_sections.items():
@@ -437,20 +470,24 @@ class ConsolidationDetector:
         return opportunities
 
     def _collect_heading_occurrences(
-        self, file_contents: dict[str, str]
+        self,
+        file_contents: dict[str, str],
+        file_sections: dict[str, list[tuple[str, str]]] | None = None,
     ) -> dict[str, list[tuple[str, str]]]:
         """Collect all heading occurrences across files.
 
         Args:
             file_contents: Dictionary of file paths to content
+            file_sections: Pre-parsed sections per file (parsed if None)
 
         Returns:
             Dictionary mapping normalized headings to (file, content) tuples
         """
         heading_occurrences: dict[str, list[tuple[str, str]]] = {}
+        if file_sections is None:
+            file_sections = self._parse_files_into_sections(file_contents)
 
-        for file_path, content in file_contents.items():
-            sections: list[tuple[str, str]] = self.parse_sections(content)
+        for file_path, sections in file_sections.items():
             for heading, section_content in sections:
                 normalized_heading = heading.lower().strip()
                 if normalized_heading not in heading_occurrences:
@@ -575,11 +612,15 @@ class ConsolidationDetector:
         ]
 
     async def detect_shared_patterns(
-        self, file_contents: dict[str, str]
+        self,
+        file_contents: dict[str, str],
+        file_sections: dict[str, list[tuple[str, str]]] | None = None,
     ) -> list[ConsolidationOpportunity]:
         """Detect shared patterns or repeated content structures"""
         opportunities: list[ConsolidationOpportunity] = []
-        heading_occurrences = self._collect_heading_occurrences(file_contents)
+        heading_occurrences = self._collect_heading_occurrences(
+            file_contents, file_sections
+        )
 
         for heading, occurrences in heading_occurrences.items():
             if len(occurrences) < 2:
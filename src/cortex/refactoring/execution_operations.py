@@ -11,6 +11,7 @@ from cortex.core.file_system import FileSystemManager
 from cortex.core.models import SectionMetadata
 
 from .models import RefactoringOperationModel
+from .staged_workspace import DirectIO, OperationIO
 
 
 class ExecutionOperations:
@@ -20,6 +21,7 @@ class ExecutionOperations:
         self,
         memory_bank_dir: Path,
         fs_manager: FileSystemManager,
+        io: OperationIO | None = None,
     ) -> None:
         """
         Initialize execution operations.
@@ -27,9 +29,11 @@ class ExecutionOperations:
         Args:
             memory_bank_dir: Memory bank directory path
             fs_manager: File system manager instance
+            io: File access for operations, defaults to writing to disk directly
         """
         self.memory_bank_dir: Path = memory_bank_dir
         self.fs_manager: FileSystemManager = fs_manager
+        self.io: OperationIO = io or DirectIO(fs_manager)
 
         # Operation dispatch table for reduced complexity
         self._operation_handlers: dict[
@@ -44,6 +48,10 @@ class ExecutionOperations:
             "modify": self._execute_modify,
         }
 
+    def with_io(self, io: OperationIO) -> "ExecutionOperations":
+        """Create operations bound to different file access, e.g. a workspace."""
+        return ExecutionOperations(self.memory_bank_dir, self.fs_manager, io)
+
     async def execute_operation(self, operation: RefactoringOperationModel) -> None:
         """Execute a single refactoring operation.
 
@@ -111,7 +119,7 @@ class ExecutionOperations:
     ) -> None:
         """Write consolidated content to target file."""
         target_path = self.memory_bank_dir / extraction_target
-        _ = await self.fs_manager.write_file(target_path, content)
+        _ = await self.io.write_file(target_path, content)
 
     async def _update_source_files_with_transclusions(
         self,
@@ -122,13 +130,13 @@ class ExecutionOperations:
         """Update source files to use transclusion syntax."""
         for file_path in files:
             full_path = self.memory_bank_dir / file_path
-            if not full_path.exists():
+            if not self.io.exists(full_path):
                 continue
 
-            content_tuple = await self.fs_manager.read_file(full_path)
+            content_tuple = await self.io.read_file(full_path)
             content, _ = content_tuple
 
-            parsed_sections = self.fs_manager.parse_sections(content)
+            parsed_sections = self.io.parse_sections(content)
 
             for section_title in sections:
                 # For consolidation, sections are just section names
@@ -139,7 +147,7 @@ class ExecutionOperations:
                     content, parsed_sections, section_title, transclusion
                 )
 
-            _ = await self.fs_manager.write_file(full_path, content)
+            _ = await self.io.write_file(full_path, content)
 
     def _replace_section_with_transclusion(
         self,
@@ -189,19 +197,19 @@ class ExecutionOperations:
         content = operation.parameters.content or ""
 
         new_file_path = self.memory_bank_dir / new_file_name
-        _ = await self.fs_manager.write_file(new_file_path, content)
+        _ = await self.io.write_file(new_file_path, content)
 
-        if original_file.exists():
-            original_content_tuple = await self.fs_manager.read_file(original_file)
+        if self.io.exists(original_file):
+            original_content_tuple = await self.io.read_file(original_file)
             original_content_str = original_content_tuple[0]
 
-            parsed_sections = self.fs_manager.parse_sections(original_content_str)
+            parsed_sections = self.io.parse_sections(original_content_str)
 
             updated_content = self._remove_sections(
                 original_content_str, parsed_sections, sections
             )
 
-            _ = await self.fs_manager.write_file(original_file, updated_content)
+            _ = await self.io.write_file(original_file, updated_content)
 
     def _remove_sections(
         self,
@@ -251,9 +259,8 @@ class ExecutionOperations:
             raise ValidationError("destination_file parameter must be provided")
         destination: Path = self.memory_bank_dir / destination_file
 
-        if source.exists():
-            destination.parent.mkdir(parents=True, exist_ok=True)
-            _ = source.rename(destination)
+        if self.io.exists(source):
+            await self.io.rename(source, destination)
 
     async def _execute_rename(self, operation: RefactoringOperationModel) -> None:
         """Execute file rename."""
@@ -263,33 +270,28 @@ class ExecutionOperations:
             raise ValidationError("new_name parameter must be provided")
         new_path: Path = old_path.parent / new_name
 
-        if old_path.exists():
-            _ = old_path.rename(new_path)
+        if self.io.exists(old_path):
+            await self.io.rename(old_path, new_path)
 
     async def execute_create(self, operation: RefactoringOperationModel) -> None:
         """Execute file/directory creation."""
         target = self.memory_bank_dir / operation.target_file
 
         if operation.parameters.is_directory:
-            target.mkdir(parents=True, exist_ok=True)
+            await self.io.mkdir(target)
         else:
             content = operation.parameters.content or ""
-            _ = await self.fs_manager.write_file(target, content)
+            _ = await self.io.write_file(target, content)
 
     async def _execute_delete(self, operation: RefactoringOperationModel) -> None:
         """Execute file deletion."""
         target = self.memory_bank_dir / operation.target_file
 
-        if target.exists():
-            if target.is_file():
-                target.unlink()
-            else:
-                import shutil
-
-                shutil.rmtree(target)
+        if self.io.exists(target):
+            await self.io.delete(target)
 
     async def _execute_modify(self, operation: RefactoringOperationModel) -> None:
         """Execute file modification."""
         target = self.memory_bank_dir / operation.target_file
         content = operation.parameters.content or ""
-        _ = await self.fs_manager.write_file(target, content)
+        _ = await self.io.write_file(target, content)
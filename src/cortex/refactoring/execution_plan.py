@@ -0,0 +1,79 @@
+"""
+Execution Plan - Dependency ordering of refactoring operations.
+
+Two operations depend on each other when they touch the same file, or when
+one touches a directory that contains a file touched by the other. Each
+operation waits for every earlier operation it conflicts with, so the plan
+is a DAG in submission order. Operations are grouped into waves: every
+operation in a wave is independent of the others and can run concurrently.
+"""
+
+from pathlib import PurePosixPath
+
+from .models import RefactoringOperationModel
+
+
+def operation_paths(operation: RefactoringOperationModel) -> set[str]:
+    """
+    Collect the memory-bank-relative paths an operation reads or writes.
+
+    Args:
+        operation: Refactoring operation
+
+    Returns:
+        Set of relative paths
+    """
+    parameters = operation.parameters
+    paths = {operation.target_file}
+    if parameters.source_file:
+        paths.add(parameters.source_file)
+    if parameters.destination_file:
+        paths.add(parameters.destination_file)
+    if parameters.new_name:
+        parent = PurePosixPath(operation.target_file).parent
+        paths.add(str(parent / parameters.new_name))
+    return {str(PurePosixPath(path)) for path in paths if path}
+
+
+def _paths_conflict(first: set[str], second: set[str]) -> bool:
+    """Whether two path sets share a path or an ancestor relationship."""
+    if first & second:
+        return True
+    for path in first:
+        ancestors = {str(parent) for parent in PurePosixPath(path).parents}
+        if ancestors & second:
+            return True
+    for path in second:
+        ancestors = {str(parent) for parent in PurePosixPath(path).parents}
+        if ancestors & first:
+            return True
+    return False
+
+
+def plan_waves(operations: list[RefactoringOperationModel]) -> list[list[int]]:
+    """
+    Group operations into waves of mutually independent operations.
+
+    An operation is placed one wave after the latest earlier operation it
+    conflicts with, which preserves submission order between conflicting
+    operations.
+
+    Args:
+        operations: Operations in submission order
+
+    Returns:
+        Waves of operation indexes, each wave in submission order
+    """
+    path_sets = [operation_paths(operation) for operation in operations]
+    levels: list[int] = []
+    for position, paths in enumerate(path_sets):
+        level = 0
+        for earlier in range(position):
+            if levels[earlier] >= level and _paths_conflict(path_sets[earlier], paths):
+                level = levels[earlier] + 1
+        levels.append(level)
+
+    waves: list[list[int]] = [[] for _ in range(max(levels, default=-1) + 1)]
+    for position, level in enumerate(levels):
+        waves[level].append(position)
+    return waves
@@ -0,0 +1,353 @@
+"""
+Impact Simulator - Exact dry-run metrics for refactorings.
+
+A dry run applies the refactoring's operations to a ``StagedWorkspace``
+overlay in the same dependency waves the executor uses, and never commits
+it. The memory bank before and after the refactoring is then measured from
+memory: token totals, markdown links and transclusions with their
+resolution against the overlay, and the heading structure quality score.
+
+Per-file statistics of the unchanged memory bank are computed once per
+corpus version and shared by every simulation, so only the files an
+operation rewrites are re-parsed. Several candidate refactorings can be
+simulated concurrently, each in its own overlay.
+"""
+
+import asyncio
+import hashlib
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import cast
+
+from cortex.core.async_file_utils import open_async_text_file
+from cortex.core.file_system import FileSystemManager
+from cortex.core.models import JsonValue, ModelDict
+from cortex.core.token_counter import TokenCounter
+from cortex.linking.link_validator import LinkValidator
+from cortex.validation.quality_metrics import QualityMetrics
+from cortex.validation.schema_validator import SchemaValidator
+
+from .execution_operations import ExecutionOperations
+from .execution_plan import plan_waves
+from .models import RefactoringOperationModel, SimulatedImpact
+from .staged_workspace import StagedWorkspace
+
+MAX_CONCURRENT_READS = 16
+
+Reference = tuple[str, str | None]
+
+
+@dataclass(frozen=True)
+class FileStats:
+    """Measurements of one markdown file."""
+
+    tokens: int
+    links: tuple[Reference, ...]
+    transclusions: tuple[Reference, ...]
+    headings: frozenset[str]
+    structure_score: float
+
+
+@dataclass(frozen=True)
+class CorpusStats:
+    """The unchanged memory bank and its per-file measurements."""
+
+    version: str
+    contents: dict[Path, str]
+    files: dict[Path, FileStats]
+
+
+@dataclass(frozen=True)
+class _Totals:
+    """Memory bank wide totals for one side of a simulation."""
+
+    tokens: int
+    links: int
+    broken_links: int
+    transclusions: int
+    unresolved_transclusions: int
+    structure_score: float
+
+
+class ImpactSimulator:
+    """
+    Simulate refactorings on an in-memory overlay and measure their impact.
+
+    Features:
+    - Operations run in dependency waves against a staged overlay
+    - Disk is never written
+    - Base corpus statistics computed once per version and shared
+    - Concurrent simulation of candidate refactorings
+    """
+
+    def __init__(
+        self,
+        memory_bank_dir: Path,
+        fs_manager: FileSystemManager,
+        operations: ExecutionOperations,
+        link_validator: LinkValidator,
+        token_counter: TokenCounter | None = None,
+    ):
+        """
+        Initialize the simulator.
+
+        Args:
+            memory_bank_dir: Memory bank directory path
+            fs_manager: File system manager the overlay reads through
+            operations: Operation handlers, rebound to each overlay
+            link_validator: Link validator supplying parser and headings
+            token_counter: Token counter (a new one if None)
+        """
+        self.memory_bank_dir: Path = Path(memory_bank_dir)
+        self.fs_manager: FileSystemManager = fs_manager
+        self.operations: ExecutionOperations = operations
+        self.link_validator: LinkValidator = link_validator
+        self.token_counter: TokenCounter = token_counter or TokenCounter()
+        self.quality_metrics: QualityMetrics = QualityMetrics(SchemaValidator())
+
+        self._corpus: CorpusStats | None = None
+        self._lock: asyncio.Lock = asyncio.Lock()
+
+    def corpus_version(self) -> str:
+        """
+        Fingerprint the markdown files of the memory bank.
+
+        Returns:
+            Hex digest over every file's path, size and modification time
+        """
+        digest = hashlib.sha256()
+        for file_path in self._markdown_files():
+            stat = file_path.stat()
+            digest.update(f"{file_path}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode())
+        return digest.hexdigest()
+
+    async def load_corpus(self) -> CorpusStats:
+        """
+        Load and measure the memory bank, reusing the cache if unchanged.
+
+        Returns:
+            Statistics of the current corpus version
+        """
+        async with self._lock:
+            version = self.corpus_version()
+            if self._corpus is not None and self._corpus.version == version:
+                return self._corpus
+            contents = await self._read_corpus()
+            files = {
+                path: await self.measure_file(content)
+                for path, content in contents.items()
+            }
+            self._corpus = CorpusStats(version=version, contents=contents, files=files)
+            return self._corpus
+
+    async def measure_file(self, content: str) -> FileStats:
+        """
+        Measure one markdown file.
+
+        Args:
+            content: File content
+
+        Returns:
+            Token count, references, headings and structure score
+        """
+        parsed = await self.link_validator.parser.parse_file(content)
+        headings = self.link_validator.extract_headings(content)
+        return FileStats(
+            tokens=self.token_counter.count_tokens(content),
+            links=_references(parsed.get("markdown_links")),
+            transclusions=_references(parsed.get("transclusions")),
+            headings=frozenset(heading.lower() for heading in headings),
+            structure_score=self.quality_metrics.calculate_file_structure(content),
+        )
+
+    async def simulate(
+        self, operations: list[RefactoringOperationModel]
+    ) -> SimulatedImpact:
+        """
+        Apply operations to an overlay and measure before and after.
+
+        Operations are copied, so their statuses are left untouched.
+
+        Args:
+            operations: Refactoring operations in suggestion order
+
+        Returns:
+            Exact before/after metrics
+
+        Raises:
+            Exception: The first error raised by an operation
+        """
+        corpus = await self.load_corpus()
+        workspace = StagedWorkspace(self.fs_manager)
+        staged_operations = self.operations.with_io(workspace)
+        copies = [operation.model_copy(deep=True) for operation in operations]
+
+        for wave in plan_waves(copies):
+            results = await asyncio.gather(
+                *(staged_operations.execute_operation(copies[p]) for p in wave),
+                return_exceptions=True,
+            )
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+
+        return await self._measure_overlay(corpus, workspace)
+
+    async def simulate_many(
+        self, candidates: Mapping[str, list[RefactoringOperationModel]]
+    ) -> dict[str, SimulatedImpact | BaseException]:
+        """
+        Simulate several candidate refactorings concurrently.
+
+        Args:
+            candidates: Operations by candidate (suggestion) ID
+
+        Returns:
+            Metrics by candidate ID, or the error its simulation raised
+        """
+        _ = await self.load_corpus()
+        keys = list(candidates)
+        results = await asyncio.gather(
+            *(self.simulate(candidates[key]) for key in keys),
+            return_exceptions=True,
+        )
+        return dict(zip(keys, results, strict=True))
+
+    def invalidate(self) -> None:
+        """Drop the cached corpus statistics."""
+        self._corpus = None
+
+    async def _measure_overlay(
+        self, corpus: CorpusStats, workspace: StagedWorkspace
+    ) -> SimulatedImpact:
+        """Measure the overlay against the unchanged corpus."""
+        after = dict(corpus.files)
+        created: list[str] = []
+        modified: list[str] = []
+        deleted: list[str] = []
+
+        for path in sorted(workspace.deleted_files):
+            _ = after.pop(path, None)
+            deleted.append(self._display_path(path))
+        for path, content in sorted(workspace.written_files.items()):
+            original = corpus.contents.get(path)
+            if original == content:
+                continue
+            if original is None and not path.is_file():
+                created.append(self._display_path(path))
+            else:
+                modified.append(self._display_path(path))
+            if self._in_corpus(path):
+                after[path] = await self.measure_file(content)
+
+        before_totals = self._totals(corpus.files, lambda path: path.is_file())
+        after_totals = self._totals(after, workspace.is_file)
+        return SimulatedImpact(
+            tokens_before=before_totals.tokens,
+            tokens_after=after_totals.tokens,
+            files_created=created,
+            files_modified=modified,
+            files_deleted=deleted,
+            links_before=before_totals.links,
+            links_after=after_totals.links,
+            broken_links_before=before_totals.broken_links,
+            broken_links_after=after_totals.broken_links,
+            transclusions_before=before_totals.transclusions,
+            transclusions_after=after_totals.transclusions,
+            unresolved_transclusions_before=before_totals.unresolved_transclusions,
+            unresolved_transclusions_after=after_totals.unresolved_transclusions,
+            structure_score_before=before_totals.structure_score,
+            structure_score_after=after_totals.structure_score,
+        )
+
+    def _totals(
+        self, files: Mapping[Path, FileStats], is_file: Callable[[Path], bool]
+    ) -> _Totals:
+        """
+        Sum the statistics of a memory bank state.
+
+        Link targets resolve against the memory bank directory, like the
+        link validator. A link is broken when its target file is missing; a
+        transclusion is unresolved when its file or section is missing.
+        """
+
+        def target_stats(target: str) -> tuple[bool, FileStats | None]:
+            path = self.memory_bank_dir / target
+            stats = files.get(path)
+            return stats is not None or is_file(path), stats
+
+        broken_links = 0
+        unresolved = 0
+        for stats in files.values():
+            for target, _ in stats.links:
+                exists, _ = target_stats(target)
+                broken_links += not exists
+            for target, section in stats.transclusions:
+                exists, target_file = target_stats(target)
+                if not exists:
+                    unresolved += 1
+                elif section and target_file is not None:
+                    unresolved += section.lower() not in target_file.headings
+
+        scores = [stats.structure_score for stats in files.values()]
+        return _Totals(
+            tokens=sum(stats.tokens for stats in files.values()),
+            links=sum(len(stats.links) for stats in files.values()),
+            broken_links=broken_links,
+            transclusions=sum(len(stats.transclusions) for stats in files.values()),
+            unresolved_transclusions=unresolved,
+            structure_score=sum(scores) / len(scores) if scores else 0.0,
+        )
+
+    def _in_corpus(self, path: Path) -> bool:
+        """Whether a path is a markdown file of the memory bank."""
+        return path.suffix == ".md" and self.memory_bank_dir in path.parents
+
+    def _display_path(self, path: Path) -> str:
+        """Path relative to the memory bank where possible."""
+        if self.memory_bank_dir in path.parents:
+            return str(path.relative_to(self.memory_bank_dir))
+        return str(path)
+
+    def _markdown_files(self) -> list[Path]:
+        """Markdown files of the memory bank in a stable order."""
+        if not self.memory_bank_dir.exists():
+            return []
+        return sorted(
+            path for path in self.memory_bank_dir.rglob("*.md") if path.is_file()
+        )
+
+    async def _read_corpus(self) -> dict[Path, str]:
+        """Read every markdown file concurrently, skipping unreadable ones."""
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_READS)
+
+        async def read(file_path: Path) -> tuple[Path, str | None]:
+            async with semaphore:
+                try:
+                    async with open_async_text_file(file_path, "r", "utf-8") as f:
+                        return file_path, await f.read()
+                except (OSError, UnicodeDecodeError) as e:
+                    from cortex.core.logging_config import logger
+
+                    logger.warning(f"Failed to read file {file_path}: {e}")
+                    return file_path, None
+
+        results = await asyncio.gather(*(read(path) for path in self._markdown_files()))
+        return {path: content for path, content in results if content is not None}
+
+
+def _references(items: JsonValue | None) -> tuple[Reference, ...]:
+    """Targets and sections of parsed links or transclusions."""
+    if not isinstance(items, list):
+        return ()
+    references: list[Reference] = []
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        entry = cast(ModelDict, item)
+        target = entry.get("target")
+        section = entry.get("section")
+        if isinstance(target, str) and target:
+            references.append((target, section if isinstance(section, str) else None))
+    return tuple(references)
@@ -4,16 +4,65 @@ Learning Adjustments Module
 Handles confidence adjustments for suggestions based on learned patterns
 and preferences.
 Split from learning_engine.py in Phase 9.1 for improved modularity.
+
+Preference-derived decisions (confidence adjustment, hiding rejected types,
+minimum threshold) are compiled into a per-type policy table that is rebuilt
+only when learning data changes, so evaluating a suggestion is a dictionary
+lookup per candidate.
 """
 
+from dataclasses import dataclass
 from typing import cast
 
 from cortex.core.models import JsonValue, ModelDict
 
-from .learning_data_manager import FeedbackRecord, LearningDataManager
+from .learning_data_manager import LearningDataManager
 from .learning_patterns import PatternManager
 
 
+@dataclass(frozen=True)
+class TypePolicy:
+    """Learned decisions for one suggestion type."""
+
+    adjustment: float = 0.0
+    adjustment_reason: str | None = None
+    hide_reason: str | None = None
+
+
+_NEUTRAL_POLICY = TypePolicy()
+
+
+def _number(value: JsonValue | None, default: float) -> float:
+    """Numeric preference value, or a default for anything else."""
+    return float(value) if isinstance(value, (int, float)) else default
+
+
+def compile_type_policy(suggestion_type: str, pref: ModelDict) -> TypePolicy:
+    """
+    Compile the stored preference of a suggestion type into a policy.
+
+    Args:
+        suggestion_type: Suggestion type the preference belongs to
+        pref: Preference dict with preference_score and total
+
+    Returns:
+        Policy with the confidence adjustment and hide decision
+    """
+    score = _number(pref.get("preference_score"), 0.5)
+    total = int(_number(pref.get("total"), 0))
+
+    adjustment, reason = 0.0, None
+    if score > 0.7:
+        adjustment, reason = 0.1, "User prefers this suggestion type"
+    elif score < 0.3:
+        adjustment, reason = -0.1, "User dislikes this suggestion type"
+
+    hide_reason = None
+    if score < 0.2 and total >= 5:
+        hide_reason = f"User consistently rejects {suggestion_type} suggestions"
+    return TypePolicy(adjustment, reason, hide_reason)
+
+
 class ConfidenceAdjuster:
     """
     Adjust suggestion confidence based on learned patterns and preferences.
@@ -32,6 +81,36 @@ class ConfidenceAdjuster:
         """
         self.data_manager = data_manager
         self.pattern_extractor = pattern_extractor
+        self._policies: dict[str, TypePolicy] = {}
+        self._min_threshold: float = 0.5
+        self._policy_revision: int = -1
+
+    def type_policy(self, suggestion_type: str) -> TypePolicy:
+        """Get the compiled policy of a suggestion type."""
+        self._refresh_policies()
+        return self._policies.get(suggestion_type, _NEUTRAL_POLICY)
+
+    def min_confidence_threshold(self) -> float:
+        """Get the learned minimum confidence threshold."""
+        self._refresh_policies()
+        return self._min_threshold
+
+    def _refresh_policies(self) -> None:
+        """Recompile policies if learning data changed since the last build."""
+        if self._policy_revision == self.data_manager.revision:
+            return
+        policies: dict[str, TypePolicy] = {}
+        for key, pref_val in self.data_manager.user_preferences.items():
+            if key.startswith("suggestion_type_") and isinstance(pref_val, dict):
+                suggestion_type = key.removeprefix("suggestion_type_")
+                policies[suggestion_type] = compile_type_policy(
+                    suggestion_type, cast(ModelDict, pref_val)
+                )
+        self._policies = policies
+        self._min_threshold = _number(
+            self.data_manager.get_preference("min_confidence_threshold"), 0.5
+        )
+        self._policy_revision = self.data_manager.revision
 
     def extract_original_confidence(self, suggestion: ModelDict) -> float:
         """Extract original confidence from suggestion."""
@@ -74,20 +153,7 @@ class ConfidenceAdjuster:
         self, suggestion: ModelDict, suggestion_type: str
     ) -> str | None:
         """Extract pattern key from suggestion."""
-        return self.pattern_extractor.extract_pattern_key(
-            FeedbackRecord(
-                feedback_id="",
-                suggestion_id="",
-                suggestion_type=suggestion_type,
-                feedback_type="",
-                comment=None,
-                created_at="",
-                suggestion_confidence=0.0,
-                was_approved=False,
-                was_applied=False,
-            ),
-            suggestion,
-        )
+        return self.pattern_extractor.pattern_key_for(suggestion_type, suggestion)
 
     def apply_preference_adjustment(
         self,
@@ -95,41 +161,12 @@ class ConfidenceAdjuster:
         adjustments: list[ModelDict],
     ) -> float:
         """Apply preference-based confidence adjustment."""
-        pref = self._get_preference_for_type(suggestion_type)
-        if pref is None:
-            return 0.0
-
-        pref_score = self._extract_preference_score(pref)
-        return self._apply_preference_score_adjustment(pref_score, adjustments)
-
-    def _get_preference_for_type(self, suggestion_type: str) -> ModelDict | None:
-        """Get preference dict for suggestion type."""
-        pref_key = f"suggestion_type_{suggestion_type}"
-        pref_val = self.data_manager.get_preference(pref_key)
-        return cast(ModelDict, pref_val) if isinstance(pref_val, dict) else None
-
-    def _extract_preference_score(self, pref: ModelDict) -> float:
-        """Extract preference score from preference dict."""
-        pref_score_val = pref.get("preference_score", 0.5)
-        return (
-            float(pref_score_val) if isinstance(pref_score_val, (int, float)) else 0.5
-        )
-
-    def _apply_preference_score_adjustment(
-        self, pref_score: float, adjustments: list[ModelDict]
-    ) -> float:
-        """Apply adjustment based on preference score."""
-        if pref_score > 0.7:
-            adjustments.append(
-                {"reason": "User prefers this suggestion type", "adjustment": 0.1}
-            )
-            return 0.1
-        elif pref_score < 0.3:
+        policy = self.type_policy(suggestion_type)
+        if policy.adjustment_reason is not None:
             adjustments.append(
-                {"reason": "User dislikes this suggestion type", "adjustment": -0.1}
+                {"reason": policy.adjustment_reason, "adjustment": policy.adjustment}
             )
-            return -0.1
-        return 0.0
+        return policy.adjustment
 
     def apply_all_adjustments(
         self,
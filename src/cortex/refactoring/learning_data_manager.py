@@ -5,9 +5,17 @@ Manages persistence and storage of learning data including feedback records,
 learned patterns, and user preferences.
 
 Extracted from learning_engine.py to improve modularity and maintainability.
+
+Learning data lives in the project state store. Each feedback record is one
+row written once; patterns, preferences and running feedback aggregates are
+small and are persisted together as one compact model snapshot, so saving
+after a feedback event costs the same regardless of how much feedback has
+accumulated. learning.json is a legacy import source and the target of
+export_learning_data().
 """
 
 import json
+import sqlite3
 from dataclasses import asdict, dataclass
 from datetime import datetime
 from pathlib import Path
@@ -15,6 +23,14 @@ from typing import cast
 
 from cortex.core.async_file_utils import open_async_text_file
 from cortex.core.models import JsonValue, ModelDict
+from cortex.core.state_store import StateRow, StateStore
+
+_FEEDBACK_KIND = "learning_feedback"
+_MODEL_KIND = "learning_model"
+_MODEL_KEY = "current"
+
+# Weight kept by a pattern's decayed score on each new feedback event
+PATTERN_SCORE_DECAY = 0.8
 
 
 @dataclass
@@ -49,11 +65,51 @@ class LearnedPattern:
     rejected_count: int
     last_seen: str
     confidence_adjustment: float  # How much to adjust confidence for this pattern
+    decayed_score: float = 0.5  # Approval rate weighted toward recent feedback
 
     def to_dict(self) -> ModelDict:
         """Convert to JSON-serializable dict."""
         return cast(ModelDict, asdict(self))
 
+    def record_outcome(self, approved: bool) -> None:
+        """Fold one feedback outcome into the decayed score."""
+        outcome = 1.0 if approved else 0.0
+        self.decayed_score = (
+            PATTERN_SCORE_DECAY * self.decayed_score
+            + (1.0 - PATTERN_SCORE_DECAY) * outcome
+        )
+
+
+@dataclass
+class FeedbackAggregates:
+    """Running feedback counts, updated in O(1) per feedback record."""
+
+    total: int = 0
+    approved: int = 0
+
+    @property
+    def rejected(self) -> int:
+        """Number of feedback records that were not approved."""
+        return self.total - self.approved
+
+    def add(self, feedback: FeedbackRecord, sign: int = 1) -> None:
+        """Add (or with ``sign=-1`` remove) one feedback record."""
+        self.total += sign
+        if feedback.was_approved:
+            self.approved += sign
+
+    def to_dict(self) -> ModelDict:
+        """Convert to JSON-serializable dict."""
+        return {"total": self.total, "approved": self.approved}
+
+    @classmethod
+    def from_records(cls, records: dict[str, FeedbackRecord]) -> "FeedbackAggregates":
+        """Recompute aggregates from feedback records."""
+        aggregates = cls()
+        for feedback in records.values():
+            aggregates.add(feedback)
+        return aggregates
+
 
 class LearningDataManager:
     """
@@ -69,63 +125,84 @@ class LearningDataManager:
 
     learning_file: Path
 
-    def __init__(self, learning_file: Path):
+    def __init__(self, learning_file: Path, state_store: StateStore | None = None):
         """
         Initialize learning data manager.
 
         Args:
-            learning_file: Path to the learning data JSON file
+            learning_file: Path to the legacy learning data JSON file; the
+                state store lives in the same directory
+            state_store: Shared state store of the project (opened from the
+                learning file's directory if omitted)
         """
         self.learning_file = Path(learning_file)
+        self.state_store: StateStore = state_store or StateStore.in_directory(
+            self.learning_file.parent
+        )
 
         # In-memory storage
         self.feedback_records: dict[str, FeedbackRecord] = {}
         self.learned_patterns: dict[str, LearnedPattern] = {}
         self.user_preferences: dict[str, JsonValue] = {}
+        self.aggregates: FeedbackAggregates = FeedbackAggregates()
+
+        # Bumped on every change so callers can cache derived views
+        self.revision: int = 0
+        self._unsaved_feedback: set[str] = set()
 
         # Load existing data
         self._load_learning_data()
 
     def _load_learning_data(self) -> None:
         """
-        Load learning data from disk.
+        Load learning data from the state store, importing learning.json.
 
         Note:
             This method uses synchronous I/O during initialization for simplicity.
             For performance-critical paths, consider using async alternatives.
         """
-        if not self.learning_file.exists():
-            return
-
         try:
-            data = self._read_learning_file()
-            if data is None:
-                return
+            _ = self.state_store.import_legacy(
+                self.learning_file, _read_legacy_learning_rows
+            )
 
-            self._load_feedback_records(data)
-            self._load_learned_patterns(data)
-            self._load_user_preferences(data)
+            self._load_feedback_records(self.state_store.rows(_FEEDBACK_KIND))
+            model = self._read_model_snapshot()
+            self._load_learned_patterns(model)
+            self._load_user_preferences(model)
+            self._load_aggregates(model)
 
         except Exception as e:
             self._handle_load_error(e)
 
-    def _read_learning_file(self) -> ModelDict | None:
-        """Read and parse learning data file."""
-        with open(self.learning_file) as f:
-            data_raw = cast(JsonValue, json.load(f))
-            if not isinstance(data_raw, dict):
-                return None
-            return cast(ModelDict, data_raw)
-
-    def _load_feedback_records(self, data: ModelDict) -> None:
-        """Load feedback records from data dictionary."""
-        feedback_dict: JsonValue = data.get("feedback", {})
-        if not isinstance(feedback_dict, dict):
-            return
+    def _read_model_snapshot(self) -> ModelDict:
+        """Read the stored patterns/preferences/aggregates snapshot."""
+        data = self.state_store.get(_MODEL_KIND, _MODEL_KEY)
+        if data is None:
+            return {}
+        model_raw = cast(JsonValue, json.loads(data))
+        return cast(ModelDict, model_raw) if isinstance(model_raw, dict) else {}
+
+    def _load_aggregates(self, data: ModelDict) -> None:
+        """Load stored aggregates, recomputing them if absent or stale."""
+        aggregates_raw = data.get("aggregates")
+        if isinstance(aggregates_raw, dict):
+            aggregates_dict = cast(ModelDict, aggregates_raw)
+            total = aggregates_dict.get("total")
+            approved = aggregates_dict.get("approved")
+            if (
+                isinstance(total, int)
+                and isinstance(approved, int)
+                and total == len(self.feedback_records)
+            ):
+                self.aggregates = FeedbackAggregates(total=total, approved=approved)
+                return
+        self.aggregates = FeedbackAggregates.from_records(self.feedback_records)
 
-        typed_feedback_dict: ModelDict = cast(ModelDict, feedback_dict)
-        for key_obj, value_obj in typed_feedback_dict.items():
-            feedback_id: str = str(key_obj)
+    def _load_feedback_records(self, rows: list[StateRow]) -> None:
+        """Load feedback records from state store rows."""
+        for feedback_id, _, data in rows:
+            value_obj = cast(JsonValue, json.loads(data))
             if isinstance(value_obj, dict):
                 feedback = self._deserialize_feedback_record(
                     feedback_id, cast(ModelDict, value_obj)
@@ -181,6 +258,9 @@ class LearningDataManager:
             rejected_count=cast(int, data.get("rejected_count", 0)),
             last_seen=cast(str, data.get("last_seen", "")),
             confidence_adjustment=cast(float, data.get("confidence_adjustment", 0.0)),
+            decayed_score=cast(
+                float, data.get("decayed_score", data.get("success_rate", 0.5))
+            ),
         )
 
     def _load_user_preferences(self, data: ModelDict) -> None:
@@ -198,39 +278,85 @@ class LearningDataManager:
         self.feedback_records = {}
         self.learned_patterns = {}
         self.user_preferences = {}
+        self.aggregates = FeedbackAggregates()
 
     async def save_learning_data(self) -> None:
-        """Save learning data to disk."""
+        """Save new feedback records and the current model snapshot."""
+        feedback_rows = [
+            (feedback_id, feedback.created_at, json.dumps(feedback.to_dict()))
+            for feedback_id in sorted(self._unsaved_feedback)
+            if (feedback := self.feedback_records.get(feedback_id)) is not None
+        ]
+        snapshot = json.dumps(self._model_snapshot())
         try:
-            data: ModelDict = {
-                "last_updated": datetime.now().isoformat(),
-                "feedback": {
-                    feedback_id: feedback.to_dict()
-                    for feedback_id, feedback in self.feedback_records.items()
-                },
-                "patterns": {
-                    pattern_id: pattern.to_dict()
-                    for pattern_id, pattern in self.learned_patterns.items()
-                },
-                "preferences": self.user_preferences,
-            }
-
-            # Ensure directory exists
-            self.learning_file.parent.mkdir(parents=True, exist_ok=True)
-
-            async with open_async_text_file(self.learning_file, "w", "utf-8") as f:
-                _ = await f.write(json.dumps(data, indent=2))
-
-        except Exception as e:
+            await self.state_store.run(self._write_rows, feedback_rows, snapshot)
+        except sqlite3.Error as e:
             raise Exception(f"Failed to save learning data: {e}") from e
+        self._unsaved_feedback.clear()
+
+    def _write_rows(self, feedback_rows: list[StateRow], snapshot: str) -> None:
+        """Write feedback rows and the model snapshot in one transaction."""
+        with self.state_store.transaction():
+            _ = self.state_store.upsert_many(_FEEDBACK_KIND, feedback_rows)
+            self.state_store.upsert(_MODEL_KIND, _MODEL_KEY, snapshot)
+
+    def _model_snapshot(self) -> ModelDict:
+        """Compact snapshot of everything except individual feedback."""
+        return {
+            "last_updated": datetime.now().isoformat(),
+            "patterns": {
+                pattern_id: pattern.to_dict()
+                for pattern_id, pattern in self.learned_patterns.items()
+            },
+            "preferences": self.user_preferences,
+            "aggregates": self.aggregates.to_dict(),
+        }
+
+    async def export_learning_data(self, export_path: Path | None = None) -> Path:
+        """
+        Export all learning data in the legacy JSON format.
+
+        Args:
+            export_path: Target file, defaults to the legacy learning.json
+
+        Returns:
+            Path of the written file
+        """
+        target = export_path or self.learning_file
+        data: ModelDict = {
+            "last_updated": datetime.now().isoformat(),
+            "feedback": {
+                feedback_id: feedback.to_dict()
+                for feedback_id, feedback in self.feedback_records.items()
+            },
+            "patterns": {
+                pattern_id: pattern.to_dict()
+                for pattern_id, pattern in self.learned_patterns.items()
+            },
+            "preferences": self.user_preferences,
+        }
+        try:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            async with open_async_text_file(target, "w", "utf-8") as f:
+                _ = await f.write(json.dumps(data, indent=2))
+        except OSError as e:
+            raise Exception(f"Failed to export learning data: {e}") from e
+        return target
 
     def add_feedback(self, feedback: FeedbackRecord) -> None:
-        """Add a feedback record to storage."""
+        """Add a feedback record to storage and update the aggregates."""
+        previous = self.feedback_records.get(feedback.feedback_id)
+        if previous is not None:
+            self.aggregates.add(previous, sign=-1)
         self.feedback_records[feedback.feedback_id] = feedback
+        self.aggregates.add(feedback)
+        self._unsaved_feedback.add(feedback.feedback_id)
+        self.revision += 1
 
     def add_pattern(self, pattern: LearnedPattern) -> None:
         """Add or update a learned pattern."""
         self.learned_patterns[pattern.pattern_id] = pattern
+        self.revision += 1
 
     def get_pattern(self, pattern_id: str) -> LearnedPattern | None:
         """Get a learned pattern by ID."""
@@ -239,6 +365,7 @@ class LearningDataManager:
     def update_preference(self, key: str, value: JsonValue) -> None:
         """Update a user preference."""
         self.user_preferences[key] = value
+        self.revision += 1
 
     def get_preference(
         self, key: str, default: JsonValue | None = None
@@ -272,6 +399,12 @@ class LearningDataManager:
         if reset_feedback:
             counts["feedback_reset"] = len(self.feedback_records)
             self.feedback_records = {}
+            self.aggregates = FeedbackAggregates()
+            self._unsaved_feedback.clear()
+            try:
+                _ = await self.state_store.run(self._delete_feedback_rows)
+            except sqlite3.Error as e:
+                raise Exception(f"Failed to reset learning data: {e}") from e
 
         if reset_patterns:
             counts["patterns_reset"] = len(self.learned_patterns)
@@ -281,22 +414,23 @@ class LearningDataManager:
             counts["preferences_reset"] = len(self.user_preferences)
             self.user_preferences = {}
 
+        self.revision += 1
         await self.save_learning_data()
 
         return counts
 
-    def get_feedback_stats(self) -> dict[str, int]:
-        """Get statistics about feedback records."""
-        total = len(self.feedback_records)
-        approved = len([f for f in self.feedback_records.values() if f.was_approved])
-        rejected = len(
-            [f for f in self.feedback_records.values() if not f.was_approved]
+    def _delete_feedback_rows(self) -> int:
+        """Delete every stored feedback record."""
+        return self.state_store.delete(
+            _FEEDBACK_KIND, self.state_store.keys(_FEEDBACK_KIND)
         )
 
+    def get_feedback_stats(self) -> dict[str, int]:
+        """Get statistics about feedback records from the running aggregates."""
         return {
-            "total": total,
-            "approved": approved,
-            "rejected": rejected,
+            "total": self.aggregates.total,
+            "approved": self.aggregates.approved,
+            "rejected": self.aggregates.rejected,
         }
 
     def get_all_patterns(self) -> dict[str, LearnedPattern]:
@@ -306,3 +440,32 @@ class LearningDataManager:
     def get_all_preferences(self) -> ModelDict:
         """Get all user preferences."""
         return self.user_preferences.copy()
+
+
+def _read_legacy_learning_rows(source: Path) -> dict[str, list[StateRow]]:
+    """Parse a legacy learning.json file into state store rows."""
+    with open(source, encoding="utf-8") as f:
+        data_raw = cast(JsonValue, json.load(f))
+    if not isinstance(data_raw, dict):
+        return {}
+    data = cast(ModelDict, data_raw)
+
+    feedback_rows: list[StateRow] = []
+    feedback_raw = data.get("feedback", {})
+    if isinstance(feedback_raw, dict):
+        for feedback_id, record in cast(ModelDict, feedback_raw).items():
+            if isinstance(record, dict):
+                created_at = cast(ModelDict, record).get("created_at", "")
+                feedback_rows.append(
+                    (feedback_id, str(created_at or ""), json.dumps(record))
+                )
+
+    # No aggregates: they are recomputed from the imported feedback
+    model: ModelDict = {
+        "patterns": data.get("patterns", {}),
+        "preferences": data.get("preferences", {}),
+    }
+    return {
+        _FEEDBACK_KIND: feedback_rows,
+        _MODEL_KIND: [(_MODEL_KEY, "", json.dumps(model))],
+    }
@@ -11,9 +11,9 @@ patterns, adjustments).
 
 from datetime import datetime
 from pathlib import Path
-from typing import cast
 
 from cortex.core.models import ModelDict
+from cortex.core.state_store import StateStore
 from cortex.refactoring.models import (
     FeedbackRecordResult,
     LearningInsights,
@@ -27,50 +27,6 @@ from .learning_patterns import PatternManager
 from .learning_preferences import PreferenceManager
 
 
-def _check_confidence_threshold(
-    adjusted_confidence: float, data_manager: LearningDataManager
-) -> tuple[bool, str]:
-    """Check if confidence meets minimum threshold."""
-    min_threshold_val = data_manager.get_preference("min_confidence_threshold", 0.5)
-    min_threshold = (
-        float(min_threshold_val) if isinstance(min_threshold_val, (int, float)) else 0.5
-    )
-
-    if adjusted_confidence < min_threshold:
-        return (
-            False,
-            f"Confidence {adjusted_confidence:.2f} below threshold {min_threshold:.2f}",
-        )
-    return True, ""
-
-
-def _check_suggestion_type_preference(
-    suggestion: ModelDict, data_manager: LearningDataManager
-) -> tuple[bool, str]:
-    """Check if suggestion type preference allows showing."""
-    suggestion_type_val = suggestion.get("type")
-    suggestion_type = (
-        str(suggestion_type_val) if suggestion_type_val is not None else ""
-    )
-    pref_key = f"suggestion_type_{suggestion_type}"
-
-    pref_val = data_manager.get_preference(pref_key)
-    pref: ModelDict | None = (
-        cast(ModelDict, pref_val) if isinstance(pref_val, dict) else None
-    )
-    if pref is not None:
-        pref_score_val = pref.get("preference_score", 0.5)
-        pref_score = (
-            float(pref_score_val) if isinstance(pref_score_val, (int, float)) else 0.5
-        )
-        total_val = pref.get("total", 0)
-        total = int(total_val) if isinstance(total_val, (int, float)) else 0
-        if pref_score < 0.2 and total >= 5:
-            return False, f"User consistently rejects {suggestion_type} suggestions"
-
-    return True, ""
-
-
 class LearningEngine:
     """
     Learn from user feedback and improve suggestions.
@@ -90,6 +46,7 @@ class LearningEngine:
         self,
         memory_bank_dir: Path,
         config: ModelDict | None = None,
+        state_store: StateStore | None = None,
     ):
         self.memory_bank_dir: Path = Path(memory_bank_dir)
         self.config: ModelDict = config or {}
@@ -98,7 +55,7 @@ class LearningEngine:
         learning_file = self.memory_bank_dir.parent / "learning.json"
 
         # Initialize data manager for persistence
-        self.data_manager = LearningDataManager(learning_file)
+        self.data_manager = LearningDataManager(learning_file, state_store)
 
         # Initialize specialized managers
         self.preference_manager = PreferenceManager(self.data_manager)
@@ -238,20 +195,59 @@ class LearningEngine:
         """
         if not bool(self.config.get("enabled", True)):
             return True, "Learning disabled"
+        return self._evaluate_suggestion(suggestion)[:2]
+
+    async def filter_suggestions(
+        self, suggestions: list[ModelDict]
+    ) -> list[tuple[ModelDict, float]]:
+        """
+        Keep the suggestions that should be shown, with adjusted confidence.
 
-        adjusted_confidence, _ = await self.adjust_suggestion_confidence(suggestion)
+        Policies are compiled once for the whole batch, so each candidate
+        costs a few dictionary lookups.
 
-        threshold_check = _check_confidence_threshold(
-            adjusted_confidence, self.data_manager
+        Args:
+            suggestions: Candidate suggestions
+
+        Returns:
+            (suggestion, adjusted_confidence) pairs in input order
+        """
+        if not bool(self.config.get("enabled", True)):
+            adjuster = self.confidence_adjuster
+            return [(s, adjuster.extract_original_confidence(s)) for s in suggestions]
+
+        kept: list[tuple[ModelDict, float]] = []
+        for suggestion in suggestions:
+            show, _, adjusted_confidence = self._evaluate_suggestion(suggestion)
+            if show:
+                kept.append((suggestion, adjusted_confidence))
+        return kept
+
+    def _evaluate_suggestion(self, suggestion: ModelDict) -> tuple[bool, str, float]:
+        """Decide whether to show a suggestion from the compiled policies."""
+        adjuster = self.confidence_adjuster
+        suggestion_type = adjuster.extract_suggestion_type(suggestion)
+        adjusted_confidence = adjuster.apply_all_adjustments(
+            suggestion,
+            suggestion_type,
+            adjuster.extract_original_confidence(suggestion),
+            [],
         )
-        if not threshold_check[0]:
-            return threshold_check
 
-        type_check = _check_suggestion_type_preference(suggestion, self.data_manager)
-        if not type_check[0]:
-            return type_check
+        min_threshold = adjuster.min_confidence_threshold()
+        if adjusted_confidence < min_threshold:
+            reason = (
+                f"Confidence {adjusted_confidence:.2f} below threshold "
+                + f"{min_threshold:.2f}"
+            )
+            return False, reason, adjusted_confidence
+
+        hide_reason = adjuster.type_policy(suggestion_type).hide_reason
+        if hide_reason is not None:
+            return False, hide_reason, adjusted_confidence
 
-        return True, "Suggestion meets confidence and preference criteria"
+        reason = "Suggestion meets confidence and preference criteria"
+        return True, reason, adjusted_confidence
 
     async def get_learning_insights(self) -> LearningInsights:
         """
@@ -263,14 +259,7 @@ class LearningEngine:
         feedback_stats = self.data_manager.get_feedback_stats()
         pattern_stats = self.pattern_manager.calculate_pattern_statistics()
         preference_summary = self.preference_manager.calculate_preference_summary()
-        min_threshold_val = self.data_manager.get_preference(
-            "min_confidence_threshold", 0.5
-        )
-        min_threshold = (
-            float(min_threshold_val)
-            if isinstance(min_threshold_val, (int, float))
-            else 0.5
-        )
+        min_threshold = self.confidence_adjuster.min_confidence_threshold()
 
         total_feedback = feedback_stats["total"]
         approved = feedback_stats["approved"]
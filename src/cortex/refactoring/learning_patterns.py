@@ -34,8 +34,12 @@ class PatternManager:
         suggestion_details: ModelDict,
     ) -> str | None:
         """Extract a pattern key from suggestion details."""
-        suggestion_type = feedback.suggestion_type
+        return self.pattern_key_for(feedback.suggestion_type, suggestion_details)
 
+    def pattern_key_for(
+        self, suggestion_type: str, suggestion_details: ModelDict
+    ) -> str | None:
+        """Extract a pattern key from a suggestion type and its details."""
         if suggestion_type == "consolidation":
             # Pattern: consolidation with similarity threshold
             similarity_val = suggestion_details.get("similarity_threshold", 0.8)
@@ -115,6 +119,7 @@ class PatternManager:
             pattern.approved_count += 1
         else:
             pattern.rejected_count += 1
+        pattern.record_outcome(feedback.was_approved)
 
         # Recalculate success rate
         pattern.success_rate = pattern.approved_count / pattern.total_occurrences
@@ -144,6 +149,7 @@ class PatternManager:
             rejected_count=0 if feedback.was_approved else 1,
             last_seen=datetime.now().isoformat(),
             confidence_adjustment=0.0,
+            decayed_score=1.0 if feedback.was_approved else 0.0,
         )
 
     def calculate_pattern_statistics(self) -> ModelDict:
@@ -171,6 +177,9 @@ class PatternManager:
             pattern_stats[pattern_type] = {
                 "count": len(patterns),
                 "avg_success_rate": avg_success_rate,
+                "avg_recent_success_rate": (
+                    sum(p.decayed_score for p in patterns) / len(patterns)
+                ),
                 "best_pattern": best_pattern,
             }
         return pattern_stats
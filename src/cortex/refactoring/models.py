@@ -676,6 +676,30 @@ class RollbackRecordModel(RefactoringBaseModel):
     error: str | None = Field(default=None, description="Error message if failed")
 
 
+class SnapshotFileEntry(RefactoringBaseModel):
+    """One file captured by a pre-refactoring snapshot."""
+
+    file: str = Field(..., description="Memory-bank-relative file path")
+    version: int = Field(..., ge=1, description="Snapshot version number")
+    snapshot_path: str = Field(..., description="Snapshot blob path")
+    content_hash: str = Field(..., description="SHA-256 hash of the snapshot")
+    token_count: int = Field(default=0, ge=0, description="Token count")
+
+
+class SnapshotIndexRecord(RefactoringBaseModel):
+    """Reverse index entry mapping a snapshot ID to its files."""
+
+    snapshot_id: str = Field(..., description="Snapshot identifier")
+    execution_id: str | None = Field(
+        default=None, description="Execution that created the snapshot"
+    )
+    created_at: str = Field(..., description="ISO timestamp of creation")
+    files: list[SnapshotFileEntry] = Field(
+        default_factory=lambda: list[SnapshotFileEntry](),
+        description="Files captured by the snapshot",
+    )
+
+
 # ============================================================================
 # Reorganization Models (from reorganization_planner.py, reorganization/executor.py)
 # ============================================================================
@@ -802,6 +826,45 @@ class ReorganizationImpactModel(RefactoringBaseModel):
     )
 
 
+class CategoryGraphMetrics(RefactoringBaseModel):
+    """Metrics of the category-level (quotient) dependency graph."""
+
+    categories: int = Field(default=0, ge=0, description="Non-empty categories")
+    intra_category_dependencies: int = Field(
+        default=0, ge=0, description="Dependencies within one category"
+    )
+    cross_category_dependencies: int = Field(
+        default=0, ge=0, description="Dependencies between categories"
+    )
+    cohesion: float = Field(
+        default=1.0,
+        ge=0.0,
+        le=1.0,
+        description="Share of dependencies that stay within a category",
+    )
+    category_depth: int = Field(
+        default=0, ge=0, description="Longest dependency chain between categories"
+    )
+
+
+class CategoryMoveDelta(RefactoringBaseModel):
+    """Effect of moving one file to another category."""
+
+    file: str = Field(..., description="File being moved")
+    source_category: str = Field(..., description="Current category")
+    target_category: str = Field(..., description="Category after the move")
+    before: CategoryGraphMetrics = Field(..., description="Metrics before the move")
+    after: CategoryGraphMetrics = Field(..., description="Metrics after the move")
+
+    @property
+    def cross_dependency_change(self) -> int:
+        """Change in cross-category dependencies (negative is better)."""
+        return (
+            self.after.cross_category_dependencies
+            - self.before.cross_category_dependencies
+        )
+
+
 class ReorganizationPlanModel(RefactoringBaseModel):
     """Represents a complete reorganization plan."""
 
@@ -1252,6 +1315,63 @@ class ExtractedInsightData(RefactoringBaseModel):
     valid: bool = Field(default=False, description="Whether data is valid")
 
 
+class SimulatedImpact(RefactoringBaseModel):
+    """Exact before/after metrics of a refactoring simulated in memory."""
+
+    tokens_before: int = Field(default=0, ge=0, description="Memory bank tokens")
+    tokens_after: int = Field(default=0, ge=0, description="Tokens after refactoring")
+    files_created: list[str] = Field(
+        default_factory=list, description="Files the refactoring would create"
+    )
+    files_modified: list[str] = Field(
+        default_factory=list, description="Files the refactoring would change"
+    )
+    files_deleted: list[str] = Field(
+        default_factory=list, description="Files the refactoring would delete"
+    )
+    links_before: int = Field(default=0, ge=0, description="Markdown links before")
+    links_after: int = Field(default=0, ge=0, description="Markdown links after")
+    broken_links_before: int = Field(
+        default=0, ge=0, description="Unresolvable markdown links before"
+    )
+    broken_links_after: int = Field(
+        default=0, ge=0, description="Unresolvable markdown links after"
+    )
+    transclusions_before: int = Field(
+        default=0, ge=0, description="Transclusion directives before"
+    )
+    transclusions_after: int = Field(
+        default=0, ge=0, description="Transclusion directives after"
+    )
+    unresolved_transclusions_before: int = Field(
+        default=0, ge=0, description="Transclusions whose target is missing before"
+    )
+    unresolved_transclusions_after: int = Field(
+        default=0, ge=0, description="Transclusions whose target is missing after"
+    )
+    structure_score_before: float = Field(
+        default=0.0, ge=0.0, le=100.0, description="Mean heading structure score"
+    )
+    structure_score_after: float = Field(
+        default=0.0,
+        ge=0.0,
+        le=100.0,
+        description="Mean heading structure score after refactoring",
+    )
+
+    @property
+    def token_savings(self) -> int:
+        """Tokens saved (negative when the refactoring adds tokens)."""
+        return self.tokens_before - self.tokens_after
+
+    @property
+    def files_affected(self) -> int:
+        """Number of files created, modified or deleted."""
+        return (
+            len(self.files_created) + len(self.files_modified) + len(self.files_deleted)
+        )
+
+
 class ExecutionResult(RefactoringBaseModel):
     """Result of executing a refactoring."""
 
@@ -1278,6 +1398,9 @@ class ExecutionResult(RefactoringBaseModel):
     rollback_available: bool = Field(
         default=False, description="Whether rollback is available"
     )
+    simulation: SimulatedImpact | None = Field(
+        default=None, description="Before/after metrics of a dry run"
+    )
 
 
 class ExecutionHistoryResult(RefactoringBaseModel):
@@ -1311,6 +1434,25 @@ class ExecutionStatsResult(RefactoringBaseModel):
 # ============================================================================
 
 
+class HistoryRetentionConfig(RefactoringBaseModel):
+    """Retention of history records in the state store and its archive."""
+
+    active_days: int = Field(
+        default=365,
+        ge=1,
+        description="Days a record stays in the live table before it is archived",
+    )
+    archive_days: int | None = Field(
+        default=None,
+        ge=1,
+        description="Days a record is kept at all (None keeps archives forever)",
+    )
+    auto_compact: bool = Field(
+        default=True,
+        description="Whether to compact history once a day, on its first write",
+    )
+
+
 class ApprovalManagerConfig(RefactoringBaseModel):
     """Configuration for ApprovalManager."""
 
@@ -1323,6 +1465,10 @@ class ApprovalManagerConfig(RefactoringBaseModel):
     max_pending_approvals: int = Field(
         default=100, ge=1, description="Maximum pending approvals to keep"
     )
+    retention: HistoryRetentionConfig = Field(
+        default_factory=HistoryRetentionConfig,
+        description="History retention and archiving",
+    )
 
 
 class ApprovalFileData(RefactoringBaseModel):
@@ -1349,6 +1495,10 @@ class RollbackManagerConfig(RefactoringBaseModel):
     max_rollback_history: int = Field(
         default=50, ge=1, description="Maximum rollback history entries to keep"
     )
+    retention: HistoryRetentionConfig = Field(
+        default_factory=HistoryRetentionConfig,
+        description="History retention and archiving",
+    )
 
 
 class RollbackFileData(RefactoringBaseModel):
@@ -1388,6 +1538,10 @@ class RefactoringExecutorConfig(RefactoringBaseModel):
     create_snapshots: bool = Field(
         default=True, description="Whether to create snapshots before execution"
     )
+    retention: HistoryRetentionConfig = Field(
+        default_factory=HistoryRetentionConfig,
+        description="History retention and archiving",
+    )
 
 
 # ============================================================================
@@ -4,8 +4,12 @@ Refactoring Executor - Phase 5.3
 Safely execute approved refactoring suggestions with validation and rollback support.
 """
 
+import asyncio
 import hashlib
 import json
+import sqlite3
+import uuid
+from collections.abc import Iterable, Sequence
 from datetime import datetime
 from pathlib import Path
 from typing import cast
@@ -15,12 +19,16 @@ from cortex.core.exceptions import FileOperationError
 from cortex.core.file_system import FileSystemManager
 from cortex.core.metadata_index import MetadataIndex
 from cortex.core.models import JsonValue, ModelDict
+from cortex.core.state_archive import ArchivedStateTable, CompactionStats, StateArchive
+from cortex.core.state_store import StateRow, StateStore, StateTable, model_rows
 from cortex.core.token_counter import TokenCounter
 from cortex.core.version_manager import VersionManager
 from cortex.linking.link_validator import LinkValidator
 
 from .execution_operations import ExecutionOperations
+from .execution_plan import plan_waves
 from .execution_validator import ExecutionValidator
+from .impact_simulator import ImpactSimulator
 from .models import (
     ExecutionHistoryResult,
     ExecutionResult,
@@ -31,7 +39,19 @@ from .models import (
     RefactoringStatus,
     RefactoringSuggestionModel,
     RefactoringValidationResult,
+    SimulatedImpact,
+    SnapshotFileEntry,
+    SnapshotIndexRecord,
 )
+from .snapshot_index import (
+    EXECUTION_KIND,
+    execution_created_at,
+    open_execution_history,
+    open_snapshot_index,
+)
+from .staged_workspace import StagedWorkspace, recover_staged_commits
+
+MAX_CONCURRENT_SNAPSHOTS = 8
 
 
 class RefactoringExecutor:
@@ -55,6 +75,7 @@ class RefactoringExecutor:
         link_validator: LinkValidator,
         metadata_index: MetadataIndex,
         config: RefactoringExecutorConfig | ModelDict | None = None,
+        state_store: StateStore | None = None,
     ):
         self.memory_bank_dir: Path = Path(memory_bank_dir)
         self.fs_manager: FileSystemManager = fs_manager
@@ -67,12 +88,37 @@ class RefactoringExecutor:
             memory_bank_dir, fs_manager, metadata_index
         )
         self.operations = self._initialize_operations(memory_bank_dir, fs_manager)
+        self.simulator: ImpactSimulator = ImpactSimulator(
+            self.memory_bank_dir,
+            fs_manager,
+            self.operations,
+            link_validator,
+            self.token_counter,
+        )
+        # Execution history lives in the state store; refactoring-history.json
+        # is a legacy import source and the target of export_history()
         self.history_file: Path = (
             self.memory_bank_dir.parent / "refactoring-history.json"
         )
-        self.executions: dict[str, RefactoringExecutionModel] = {}
+        self.state_store: StateStore = state_store or StateStore.in_directory(
+            self.memory_bank_dir.parent
+        )
+        self.archive: StateArchive = StateArchive.in_directory(
+            self.state_store, self.memory_bank_dir.parent
+        )
+        self.executions: ArchivedStateTable[RefactoringExecutionModel] = (
+            open_execution_history(self.state_store, self.archive)
+        )
+        self.snapshots: StateTable[SnapshotIndexRecord] = open_snapshot_index(
+            self.state_store
+        )
+        self._compaction_checked: bool = False
         self._load_history()
 
+        # Staging areas for journaled commits; finish any interrupted commit
+        self.staging_root: Path = self.memory_bank_dir.parent / ".staging"
+        _ = recover_staged_commits(self.staging_root)
+
     def _initialize_config(
         self, config: RefactoringExecutorConfig | ModelDict | None
     ) -> RefactoringExecutorConfig:
@@ -106,13 +152,37 @@ class RefactoringExecutor:
         )
 
     def _load_history(self) -> None:
-        """Load execution history from disk."""
-        records = self._read_history_file()
-        if records is None:
-            self.executions = {}
+        """Import legacy execution history once."""
+        _ = self.state_store.import_legacy(self.history_file, self._read_legacy_rows)
+
+    async def _compact_if_due(self) -> None:
+        """Compact the execution history once a day, on the first write."""
+        retention = self.config.retention
+        if self._compaction_checked or not retention.auto_compact:
             return
+        self._compaction_checked = True
+        _ = await self.state_store.run(
+            self.executions.compact_if_due,
+            retention.active_days,
+            retention.archive_days,
+        )
+
+    async def compact_history(self) -> CompactionStats:
+        """
+        Archive executions past the active window and expire old archives.
+
+        Returns:
+            Counts of archived and expired executions
+        """
+        retention = self.config.retention
+        return await self.state_store.run(
+            self.executions.compact, retention.active_days, retention.archive_days
+        )
 
-        self.executions = records
+    def _read_legacy_rows(self, _source: Path) -> dict[str, list[StateRow]]:
+        """Parse the legacy history file into state store rows."""
+        records = self._read_history_file() or {}
+        return {EXECUTION_KIND: model_rows(records, execution_created_at)}
 
     def _read_history_file(self) -> dict[str, RefactoringExecutionModel] | None:
         """
@@ -153,20 +223,54 @@ class RefactoringExecutor:
             logger.warning(f"Refactoring history corrupted, starting fresh: {e}")
             return None
 
-    async def _save_history(self):
-        """Save execution history to disk."""
+    async def _save_history(self, execution_ids: Iterable[str] | None = None):
+        """
+        Write changed execution records to the state store.
+
+        Args:
+            execution_ids: Executions to write, or None for every loaded record
+        """
+        try:
+            await self._compact_if_due()
+            _ = await self.state_store.run(self.executions.flush, execution_ids)
+        except sqlite3.Error as e:
+            raise FileOperationError(f"Failed to save execution history: {e}") from e
+
+    async def _record_execution(self, execution: RefactoringExecutionModel) -> None:
+        """Write one execution record to the state store."""
+        try:
+            await self._compact_if_due()
+            await self.state_store.run(
+                self.executions.update, {execution.execution_id: execution}
+            )
+        except sqlite3.Error as e:
+            raise FileOperationError(f"Failed to save execution history: {e}") from e
+
+    async def export_history(self, export_path: Path | None = None) -> Path:
+        """
+        Export the execution history as JSON.
+
+        Args:
+            export_path: Target file, defaults to the legacy history file
+
+        Returns:
+            Path of the written file
+        """
+        target = export_path or self.history_file
         try:
+            executions = await self.state_store.run(list, self.executions.items())
             payload = {
                 "last_updated": datetime.now().isoformat(),
                 "executions": {
-                    exec_id: exec_model.model_dump()
-                    for exec_id, exec_model in self.executions.items()
+                    exec_id: exec_model.model_dump(mode="json")
+                    for exec_id, exec_model in executions
                 },
             }
-            async with open_async_text_file(self.history_file, "w", "utf-8") as f:
+            async with open_async_text_file(target, "w", "utf-8") as f:
                 _ = await f.write(json.dumps(payload, indent=2))
         except Exception as e:
-            raise FileOperationError(f"Failed to save execution history: {e}") from e
+            raise FileOperationError(f"Failed to export execution history: {e}") from e
+        return target
 
     async def validate_refactoring(
         self,
@@ -226,14 +330,23 @@ class RefactoringExecutor:
                     return error_result
 
             if not dry_run:
-                execution.snapshot_id = await self._create_snapshot(operations)
+                execution.snapshot_id = await self._create_snapshot(
+                    operations, execution.execution_id
+                )
 
             execution.status = RefactoringStatus.EXECUTING
-            if not dry_run:
+            simulation: SimulatedImpact | None = None
+            if dry_run:
+                simulation = await self.simulator.simulate(operations)
+            else:
                 await self._execute_operations_batch(execution, operations)
 
-            await self._finalize_execution(execution, operations, suggestion, dry_run)
-            return self._build_success_result(execution, operations, dry_run)
+            await self._finalize_execution(
+                execution, operations, suggestion, dry_run, simulation
+            )
+            return self._build_success_result(
+                execution, operations, dry_run, simulation
+            )
 
         except Exception as e:
             return await self._build_failure_result(execution, operations, e)
@@ -280,8 +393,7 @@ class RefactoringExecutor:
             execution.error = (
                 f"Validation failed: {', '.join(validation_results.issues)}"
             )
-            self.executions[execution.execution_id] = execution
-            await self._save_history()
+            await self._record_execution(execution)
             return ExecutionResult(
                 status="failed",
                 execution_id=execution.execution_id,
@@ -297,17 +409,68 @@ class RefactoringExecutor:
         execution: RefactoringExecutionModel,
         operations: list[RefactoringOperationModel],
     ) -> None:
-        """Execute all operations in the list."""
-        for operation in operations:
-            operation.status = RefactoringStatus.EXECUTING
-            try:
-                await self.execute_operation(operation)
-                operation.status = RefactoringStatus.COMPLETED
-                operation.completed_at = datetime.now().isoformat()
-            except Exception as e:
-                operation.status = RefactoringStatus.FAILED
-                operation.error = str(e)
-                raise
+        """
+        Execute all operations in a staged workspace and commit them at once.
+
+        Operations run in waves of independent operations. Nothing reaches
+        disk until every operation succeeded; the outputs are then committed
+        as one journaled batch followed by a single metadata index save.
+        """
+        workspace = StagedWorkspace(self.fs_manager)
+        staged_operations = self.operations.with_io(workspace)
+
+        for wave in plan_waves(operations):
+            results = await asyncio.gather(
+                *(
+                    self._run_operation(staged_operations, operations[position])
+                    for position in wave
+                ),
+                return_exceptions=True,
+            )
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+
+        if workspace.has_changes:
+            await workspace.commit(self.staging_root / execution.execution_id)
+            await self._flush_index(workspace)
+
+    async def _run_operation(
+        self, operations: ExecutionOperations, operation: RefactoringOperationModel
+    ) -> None:
+        """Run one operation and record its status."""
+        operation.status = RefactoringStatus.EXECUTING
+        try:
+            await operations.execute_operation(operation)
+            operation.status = RefactoringStatus.COMPLETED
+            operation.completed_at = datetime.now().isoformat()
+        except Exception as e:
+            operation.status = RefactoringStatus.FAILED
+            operation.error = str(e)
+            raise
+
+    async def _flush_index(self, workspace: StagedWorkspace) -> None:
+        """Update index entries of committed memory bank files in one save."""
+        async with self.metadata_index.batch_updates():
+            for path, content in workspace.written_files.items():
+                if path.parent != self.memory_bank_dir or path.suffix != ".md":
+                    continue
+                sections = [
+                    section.model_dump(mode="json")
+                    for section in self.fs_manager.parse_sections(content)
+                ]
+                await self.metadata_index.update_file_metadata(
+                    path.name,
+                    path=path,
+                    exists=True,
+                    size_bytes=len(content.encode("utf-8")),
+                    token_count=self.token_counter.count_tokens(content),
+                    content_hash=self.fs_manager.compute_hash(content),
+                    sections=sections,
+                )
+            for path in workspace.deleted_files:
+                if path.parent == self.memory_bank_dir:
+                    await self.metadata_index.remove_file(path.name)
 
     async def _finalize_execution(
         self,
@@ -315,24 +478,29 @@ class RefactoringExecutor:
         operations: list[RefactoringOperationModel],
         suggestion: RefactoringSuggestionModel | ModelDict,
         dry_run: bool,
+        simulation: SimulatedImpact | None = None,
     ) -> None:
         """Measure impact and mark execution as completed."""
         if not dry_run:
             actual_impact = await self.measure_impact(operations, suggestion)
             execution.actual_impact = actual_impact
+        elif simulation is not None:
+            execution.actual_impact = self._build_simulated_impact(
+                operations, simulation, self._extract_estimated_impact(suggestion)
+            )
         else:
             execution.actual_impact = self._extract_estimated_impact(suggestion)
 
         execution.status = RefactoringStatus.COMPLETED
         execution.completed_at = datetime.now().isoformat()
-        self.executions[execution.execution_id] = execution
-        await self._save_history()
+        await self._record_execution(execution)
 
     def _build_success_result(
         self,
         execution: RefactoringExecutionModel,
         operations: list[RefactoringOperationModel],
         dry_run: bool,
+        simulation: SimulatedImpact | None = None,
     ) -> ExecutionResult:
         """Build success response model."""
         actual_impact = (
@@ -353,6 +521,7 @@ class RefactoringExecutor:
             actual_impact=actual_impact,
             dry_run=dry_run,
             rollback_available=execution.snapshot_id is not None,
+            simulation=simulation,
         )
 
     async def _build_failure_result(
@@ -365,8 +534,7 @@ class RefactoringExecutor:
         execution.status = RefactoringStatus.FAILED
         execution.error = str(error)
         execution.completed_at = datetime.now().isoformat()
-        self.executions[execution.execution_id] = execution
-        await self._save_history()
+        await self._record_execution(execution)
 
         return ExecutionResult(
             status="failed",
@@ -381,12 +549,29 @@ class RefactoringExecutor:
         )
 
     async def _create_snapshot(
-        self, operations: list[RefactoringOperationModel]
+        self,
+        operations: list[RefactoringOperationModel],
+        execution_id: str | None = None,
     ) -> str:
-        """Create snapshot of all files that will be modified."""
-        snapshot_id = f"refactoring-{datetime.now().strftime('%Y%m%d%H%M%S')}"
+        """Create snapshot of all files that will be modified.
+
+        The snapshotted files are recorded in the snapshot index so rollback
+        can find them without scanning version histories.
+        """
+        timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
+        snapshot_id = f"refactoring-{timestamp}-{uuid.uuid4().hex[:8]}"
         affected_files = self._collect_affected_files(operations)
-        await self._create_snapshots_for_files(affected_files, snapshot_id)
+        entries = await self._create_snapshots_for_files(affected_files, snapshot_id)
+        record = SnapshotIndexRecord(
+            snapshot_id=snapshot_id,
+            execution_id=execution_id,
+            created_at=datetime.now().isoformat(),
+            files=entries,
+        )
+        try:
+            await self.state_store.run(self.snapshots.update, {snapshot_id: record})
+        except sqlite3.Error as e:
+            raise FileOperationError(f"Failed to record snapshot index: {e}") from e
         return snapshot_id
 
     def _collect_affected_files(
@@ -424,15 +609,27 @@ class RefactoringExecutor:
 
     async def _create_snapshots_for_files(
         self, affected_files: set[str], snapshot_id: str
-    ) -> None:
-        """Create snapshots for all affected files."""
-        for file_path in affected_files:
-            full_path = self.memory_bank_dir / file_path
-            if full_path.exists():
-                await self._create_file_snapshot(full_path, snapshot_id)
+    ) -> list[SnapshotFileEntry]:
+        """Create snapshots for all affected files concurrently."""
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_SNAPSHOTS)
+
+        async def snapshot(file_path: str) -> SnapshotFileEntry:
+            async with semaphore:
+                return await self._create_file_snapshot(
+                    self.memory_bank_dir / file_path, snapshot_id, file_path
+                )
 
-    async def _create_file_snapshot(self, full_path: Path, snapshot_id: str) -> None:
-        """Create a single file snapshot."""
+        existing = [
+            file_path
+            for file_path in sorted(affected_files)
+            if (self.memory_bank_dir / file_path).exists()
+        ]
+        return list(await asyncio.gather(*(snapshot(path) for path in existing)))
+
+    async def _create_file_snapshot(
+        self, full_path: Path, snapshot_id: str, file_path: str
+    ) -> SnapshotFileEntry:
+        """Create a single file snapshot and describe it for the index."""
         content, _ = await self.fs_manager.read_file(full_path)
         content_bytes = content.encode("utf-8")
         size_bytes = len(content_bytes)
@@ -451,6 +648,14 @@ class RefactoringExecutor:
             change_type="modified",
             change_description=f"Pre-refactoring snapshot: {snapshot_id}",
         )
+        snapshot_path = self.version_manager.get_snapshot_path(full_path.name, version)
+        return SnapshotFileEntry(
+            file=file_path,
+            version=version,
+            snapshot_path=str(snapshot_path),
+            content_hash=self.fs_manager.compute_hash(content),
+            token_count=token_count,
+        )
 
     async def execute_operation(self, operation: RefactoringOperationModel):
         """Execute a single refactoring operation."""
@@ -482,6 +687,26 @@ class RefactoringExecutor:
             operations, affected_files, total_tokens_after, estimated_impact
         )
 
+    async def simulate_suggestions(
+        self, suggestions: Sequence[RefactoringSuggestionModel]
+    ) -> dict[str, SimulatedImpact | BaseException]:
+        """
+        Simulate candidate suggestions concurrently without touching disk.
+
+        Args:
+            suggestions: Candidate refactoring suggestions
+
+        Returns:
+            Before/after metrics by suggestion ID, or the error a simulation
+            raised
+        """
+        return await self.simulator.simulate_many(
+            {
+                suggestion.suggestion_id: self.extract_operations(suggestion)
+                for suggestion in suggestions
+            }
+        )
+
     async def get_execution_history(
         self,
         time_range_days: int = 90,
@@ -500,8 +725,8 @@ class RefactoringExecutor:
         from datetime import timedelta
 
         cutoff_date = datetime.now() - timedelta(days=time_range_days)
-        filtered_executions = self._filter_executions_by_date(
-            cutoff_date, include_rollbacks
+        filtered_executions = await self.state_store.run(
+            self._filter_executions_by_date, cutoff_date, include_rollbacks
         )
         status_counts = self._count_execution_statuses(filtered_executions)
 
@@ -519,7 +744,7 @@ class RefactoringExecutor:
         """
         from cortex.refactoring.models import RefactoringStatus
 
-        execution = self.executions.get(execution_id)
+        execution = await self.state_store.run(self.executions.get, execution_id)
         if execution:
             operations = self._convert_operations_to_models(execution.operations)
             validation_results = self._convert_impact_metrics(
@@ -597,12 +822,28 @@ class RefactoringExecutor:
             risk_level=estimated_impact.risk_level,
         )
 
+    def _build_simulated_impact(
+        self,
+        operations: list[RefactoringOperationModel],
+        simulation: SimulatedImpact,
+        estimated_impact: RefactoringImpactMetrics,
+    ) -> RefactoringImpactMetrics:
+        """Build impact metrics from an exact dry-run simulation."""
+        return RefactoringImpactMetrics(
+            token_savings=simulation.token_savings,
+            files_affected=simulation.files_affected,
+            operations_completed=len(operations),
+            complexity_reduction=estimated_impact.complexity_reduction,
+            risk_level=estimated_impact.risk_level,
+        )
+
     def _filter_executions_by_date(
         self, cutoff_date: datetime, include_rollbacks: bool
     ) -> list[RefactoringExecutionModel]:
         """Filter executions by date and rollback status."""
         filtered_executions: list[RefactoringExecutionModel] = []
-        for execution in self.executions.values():
+        cutoff = cutoff_date.isoformat()
+        for execution in self.executions.created_since(cutoff):
             exec_date = datetime.fromisoformat(execution.created_at)
             if exec_date >= cutoff_date:
                 if (
@@ -40,7 +40,10 @@ class ReorganizationAnalyzer:
         self.enable_categories = enable_categories
 
     async def analyze_current_structure(
-        self, structure_data: ModelDict, dependency_graph: ModelDict
+        self,
+        structure_data: ModelDict,
+        dependency_graph: ModelDict,
+        files: list[str] | None = None,
     ) -> ModelDict:
         """
         Analyze current Memory Bank structure.
@@ -48,11 +51,13 @@ class ReorganizationAnalyzer:
         Args:
             structure_data: Structure analysis results
             dependency_graph: Dependency graph data
+            files: Markdown files, listed from disk if None
 
         Returns:
             Dictionary containing structure analysis
         """
-        files = await self.get_all_markdown_files()
+        if files is None:
+            files = await self.get_all_markdown_files()
         structure = self._build_base_structure(files)
         self._apply_structure_data(structure, structure_data)
         self._apply_dependency_data(structure, dependency_graph)
@@ -0,0 +1,272 @@
+"""
+Category Graph for MCP Memory Bank reorganization.
+
+This module builds the category-level quotient of the file dependency graph:
+every category is one node, and the edge between two categories counts the
+file dependencies that cross from one to the other. The graph is built once
+per plan; moving a file between categories only touches that file's own
+dependencies, so alternative structures can be evaluated in O(degree).
+"""
+
+from collections import Counter
+from collections.abc import Callable, Iterable, Mapping
+from pathlib import Path
+from typing import cast
+
+from cortex.core.models import JsonValue, ModelDict
+from cortex.refactoring.models import CategoryGraphMetrics, CategoryMoveDelta
+
+UNCATEGORIZED = "uncategorized"
+
+CategoryEdge = tuple[str, str]
+
+
+class CategoryGraph:
+    """
+    Quotient of the file dependency graph over file categories.
+
+    Features:
+    - File adjacency and category edge counts built once
+    - Metrics (cohesion, cross-category dependencies, category depth)
+    - Move-one-file deltas without rebuilding the graph
+    """
+
+    def __init__(
+        self,
+        categories: Mapping[str, Iterable[str]],
+        dependencies: Mapping[str, Iterable[str]],
+    ):
+        """
+        Build the graph.
+
+        Args:
+            categories: Files by category
+            dependencies: Files each file depends on; unknown files are ignored
+        """
+        self._category_of: dict[str, str] = {}
+        self._members: dict[str, set[str]] = {}
+        for category, files in categories.items():
+            for file in files:
+                self._category_of[file] = category
+                self._members.setdefault(category, set()).add(file)
+
+        self._depends_on: dict[str, list[str]] = {f: [] for f in self._category_of}
+        self._dependents: dict[str, list[str]] = {f: [] for f in self._category_of}
+        for file, targets in dependencies.items():
+            if file not in self._category_of:
+                continue
+            for target in dict.fromkeys(targets):
+                if target == file or target not in self._category_of:
+                    continue
+                self._depends_on[file].append(target)
+                self._dependents[target].append(file)
+
+        self._edges: Counter[CategoryEdge] = Counter(
+            (self._category_of[file], self._category_of[target])
+            for file, targets in self._depends_on.items()
+            for target in targets
+        )
+
+    @classmethod
+    def from_structure(
+        cls,
+        files: list[str],
+        categories: Mapping[str, list[str]],
+        dependency_graph: ModelDict,
+    ) -> "CategoryGraph":
+        """
+        Build the graph from structure data and a dependency graph dictionary.
+
+        Dependency entries may name files by path or by file name; files
+        missing from every category are placed in ``uncategorized``.
+
+        Args:
+            files: Files of the memory bank
+            categories: Files by category
+            dependency_graph: Dependency graph data
+
+        Returns:
+            Category graph over all files
+        """
+        assigned = {file for members in categories.values() for file in members}
+        all_categories = {name: list(members) for name, members in categories.items()}
+        missing = [file for file in files if file not in assigned]
+        if missing:
+            all_categories.setdefault(UNCATEGORIZED, []).extend(missing)
+
+        known = [file for members in all_categories.values() for file in members]
+        resolve = _name_resolver(known)
+        dependencies: dict[str, list[str]] = {}
+        for file, targets in _extract_depends_on(dependency_graph).items():
+            source = resolve(file)
+            if source is None:
+                continue
+            resolved = [resolve(target) for target in targets]
+            dependencies.setdefault(source, []).extend(
+                target for target in resolved if target is not None
+            )
+        return cls(all_categories, dependencies)
+
+    @property
+    def categories(self) -> dict[str, list[str]]:
+        """Non-empty categories and their files, sorted."""
+        return {
+            category: sorted(members)
+            for category, members in sorted(self._members.items())
+            if members
+        }
+
+    def category_of(self, file: str) -> str | None:
+        """Category of a file, or None if the file is unknown."""
+        return self._category_of.get(file)
+
+    def metrics(self) -> CategoryGraphMetrics:
+        """
+        Metrics of the current category assignment.
+
+        Returns:
+            Category graph metrics
+        """
+        return _metrics(self._edges, self._non_empty_categories())
+
+    def evaluate_move(self, file: str, target_category: str) -> CategoryMoveDelta:
+        """
+        Evaluate moving a file to another category without applying it.
+
+        Args:
+            file: File to move
+            target_category: Category to move it to
+
+        Returns:
+            Metrics before and after the move
+
+        Raises:
+            KeyError: If the file is not part of the graph
+        """
+        source = self._category_of[file]
+        edges = self._edges + Counter[CategoryEdge]()
+        edges.update(self._move_delta(file, target_category))
+        edges = +edges
+        categories = self._non_empty_categories()
+        if len(self._members[source]) == 1 and source != target_category:
+            categories.discard(source)
+        categories.add(target_category)
+        return CategoryMoveDelta(
+            file=file,
+            source_category=source,
+            target_category=target_category,
+            before=self.metrics(),
+            after=_metrics(edges, categories),
+        )
+
+    def move(self, file: str, target_category: str) -> CategoryMoveDelta:
+        """
+        Move a file to another category, updating the graph in place.
+
+        Args:
+            file: File to move
+            target_category: Category to move it to
+
+        Returns:
+            Metrics before and after the move
+
+        Raises:
+            KeyError: If the file is not part of the graph
+        """
+        delta = self.evaluate_move(file, target_category)
+        self._edges.update(self._move_delta(file, target_category))
+        self._edges = +self._edges
+        self._members[delta.source_category].discard(file)
+        self._members.setdefault(target_category, set()).add(file)
+        self._category_of[file] = target_category
+        return delta
+
+    def _non_empty_categories(self) -> set[str]:
+        return {category for category, members in self._members.items() if members}
+
+    def _move_delta(self, file: str, target: str) -> Counter[CategoryEdge]:
+        """Edge count changes of moving one file, from its own dependencies."""
+        source = self._category_of[file]
+        delta: Counter[CategoryEdge] = Counter()
+        for dependency in self._depends_on[file]:
+            category = self._category_of[dependency]
+            delta[(source, category)] -= 1
+            delta[(target, category)] += 1
+        for dependent in self._dependents[file]:
+            category = self._category_of[dependent]
+            delta[(category, source)] -= 1
+            delta[(category, target)] += 1
+        return delta
+
+
+def _metrics(
+    edges: Counter[CategoryEdge], categories: set[str]
+) -> CategoryGraphMetrics:
+    """Metrics of a category edge multiset."""
+    intra = sum(count for (source, target), count in edges.items() if source == target)
+    cross = sum(edges.values()) - intra
+    total = intra + cross
+    return CategoryGraphMetrics(
+        categories=len(categories),
+        intra_category_dependencies=intra,
+        cross_category_dependencies=cross,
+        cohesion=intra / total if total else 1.0,
+        category_depth=_longest_chain(edges),
+    )
+
+
+def _longest_chain(edges: Counter[CategoryEdge]) -> int:
+    """Longest chain of cross-category edges; back edges of cycles are skipped."""
+    successors: dict[str, list[str]] = {}
+    for (source, target), count in edges.items():
+        if source != target and count > 0:
+            successors.setdefault(source, []).append(target)
+
+    longest: dict[str, int] = {}
+    visiting: set[str] = set()
+
+    def depth(node: str) -> int:
+        if node in longest:
+            return longest[node]
+        visiting.add(node)
+        best = 0
+        for successor in successors.get(node, []):
+            if successor not in visiting:
+                best = max(best, depth(successor) + 1)
+        visiting.discard(node)
+        longest[node] = best
+        return best
+
+    return max((depth(node) for node in list(successors)), default=0)
+
+
+def _extract_depends_on(dependency_graph: ModelDict) -> dict[str, list[str]]:
+    """Files each file depends on, from a dependency graph dictionary."""
+    dependencies_raw = dependency_graph.get("dependencies", {})
+    if not isinstance(dependencies_raw, dict):
+        return {}
+    result: dict[str, list[str]] = {}
+    for file, info in cast(ModelDict, dependencies_raw).items():
+        depends_on: JsonValue = (
+            cast(ModelDict, info).get("depends_on", [])
+            if isinstance(info, dict)
+            else []
+        )
+        if isinstance(depends_on, list):
+            result[str(file)] = [str(target) for target in depends_on]
+    return result
+
+
+def _name_resolver(files: list[str]) -> Callable[[str], str | None]:
+    """Map a dependency entry (path or file name) to a known file."""
+    known = set(files)
+    by_name: dict[str, str] = {}
+    for file in files:
+        _ = by_name.setdefault(Path(file).name, file)
+
+    def resolve(name: str) -> str | None:
+        if name in known:
+            return name
+        return by_name.get(Path(name).name)
+
+    return resolve
@@ -7,6 +7,7 @@ This module contains different optimization strategies for Memory Bank reorganiz
 - Simplified structure
 """
 
+import heapq
 from pathlib import Path
 from typing import cast
 
@@ -279,7 +280,8 @@ def _topological_sort(
     """
     Perform topological sort using Kahn's algorithm.
 
-    Sorts files in dependency order with zero-dependency files first.
+    Sorts files in dependency order with zero-dependency files first. Ready
+    files are kept in a heap, so ties resolve alphabetically in O(log n).
 
     Args:
         graph: Adjacency list
@@ -290,16 +292,16 @@ def _topological_sort(
         Topologically sorted file list
     """
     queue: list[str] = [f for f in files if in_degree[f] == 0]
+    heapq.heapify(queue)
     order: list[str] = []
 
     while queue:
-        queue.sort()
-        node = queue.pop(0)
+        node = heapq.heappop(queue)
         order.append(node)
 
         for neighbor in graph[node]:
             in_degree[neighbor] -= 1
             if in_degree[neighbor] == 0:
-                queue.append(neighbor)
+                heapq.heappush(queue, neighbor)
 
     return order
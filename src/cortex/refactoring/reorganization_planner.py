@@ -3,8 +3,15 @@ Reorganization Planner for MCP Memory Bank
 
 This module plans structural reorganization of Memory Bank files to improve
 dependency structure, reduce complexity, and optimize file organization.
+
+Plans are cached by plan id together with a category-level quotient of the
+dependency graph. Requesting the same goal for unchanged inputs returns the
+cached plan, and alternative structures are explored by moving one file at a
+time against the cached graph instead of re-planning.
 """
 
+import hashlib
+import json
 from pathlib import Path
 from typing import cast
 
@@ -16,6 +23,8 @@ from cortex.core.models import (
     StructureComparison,
 )
 from cortex.refactoring.models import (
+    CategoryGraphMetrics,
+    CategoryMoveDelta,
     DependencyGraphInput,
     MemoryBankStructureData,
     ReorganizationActionModel,
@@ -23,6 +32,7 @@ from cortex.refactoring.models import (
     ReorganizationPlanModel,
 )
 from cortex.refactoring.reorganization.analyzer import ReorganizationAnalyzer
+from cortex.refactoring.reorganization.category_graph import CategoryGraph
 from cortex.refactoring.reorganization.executor import (
     ReorganizationAction,
     ReorganizationExecutor,
@@ -36,6 +46,8 @@ __all__ = [
     "ReorganizationPlanModel",
 ]
 
+MAX_CACHED_PLANS = 32
+
 
 class ReorganizationPlanner:
     """
@@ -68,6 +80,14 @@ class ReorganizationPlanner:
 
         self.plan_counter: int = 0
 
+        # Plans and their category graphs by plan id, oldest first
+        self._plans: dict[str, ReorganizationPlanModel] = {}
+        self._category_graphs: dict[str, CategoryGraph] = {}
+        # (inputs fingerprint, goal) -> plan id, or None if no plan was needed;
+        # oldest first and bounded like the plans
+        self._plan_index: dict[tuple[str, str], str | None] = {}
+        self._analysis: tuple[str, ModelDict] | None = None
+
         # Initialize components
         self.analyzer = ReorganizationAnalyzer(
             self.memory_bank_path, max_dependency_depth, enable_categories
@@ -109,19 +129,200 @@ class ReorganizationPlanner:
         )
         structure_dict = cast(ModelDict, structure_model.model_dump(mode="json"))
         graph_dict = cast(ModelDict, graph_model.model_dump(mode="json"))
-        current_structure = await self.analyzer.analyze_current_structure(
-            structure_dict, graph_dict
+        files = await self.get_all_markdown_files()
+        inputs_key = _fingerprint(files, structure_dict, graph_dict)
+        cache_key = (inputs_key, optimize_for)
+        if cache_key in self._plan_index:
+            plan_id = self._plan_index[cache_key]
+            if plan_id is None:
+                return None
+            if plan_id in self._plans:
+                return self._plans[plan_id]
+
+        current_structure = await self._analyze_once(
+            inputs_key, files, structure_dict, graph_dict
         )
         if not self._needs_reorganization(current_structure, optimize_for):
+            self._index_plan(cache_key, None)
             return None
         proposed_structure = await self.strategies.generate_proposed_structure(
             current_structure, optimize_for, graph_dict
         )
         current_model = MemoryBankStructureData.model_validate(current_structure)
         proposed_model = MemoryBankStructureData.model_validate(proposed_structure)
-        return await self._build_reorganization_plan(
+        plan = await self._build_reorganization_plan(
             current_model, proposed_model, optimize_for, graph_dict
         )
+        self._index_plan(cache_key, plan.plan_id if plan else None)
+        if plan is not None:
+            self._remember_plan(plan, graph_dict)
+        return plan
+
+    async def _analyze_once(
+        self,
+        inputs_key: str,
+        files: list[str],
+        structure_dict: ModelDict,
+        graph_dict: ModelDict,
+    ) -> ModelDict:
+        """Analyze the current structure, reusing the analysis of the same inputs."""
+        if self._analysis is not None and self._analysis[0] == inputs_key:
+            return self._analysis[1]
+        current_structure = await self.analyzer.analyze_current_structure(
+            structure_dict, graph_dict, files
+        )
+        self._analysis = (inputs_key, current_structure)
+        return current_structure
+
+    def _index_plan(self, cache_key: tuple[str, str], plan_id: str | None) -> None:
+        """Record the plan of a set of inputs, forgetting the oldest entries."""
+        self._plan_index[cache_key] = plan_id
+        while len(self._plan_index) > MAX_CACHED_PLANS:
+            del self._plan_index[next(iter(self._plan_index))]
+
+    def _remember_plan(
+        self, plan: ReorganizationPlanModel, dependency_graph: ModelDict
+    ) -> None:
+        """Cache a plan and build its category graph."""
+        structure = plan.proposed_structure
+        if not structure.categories:
+            structure = plan.current_structure
+        self._plans[plan.plan_id] = plan
+        self._category_graphs[plan.plan_id] = CategoryGraph.from_structure(
+            plan.current_structure.files, structure.categories, dependency_graph
+        )
+        while len(self._plans) > MAX_CACHED_PLANS:
+            oldest = next(iter(self._plans))
+            del self._plans[oldest]
+            del self._category_graphs[oldest]
+
+    def get_plan(self, plan_id: str) -> ReorganizationPlanModel | None:
+        """
+        Look up a cached plan.
+
+        Args:
+            plan_id: Plan identifier
+
+        Returns:
+            The plan, or None if unknown or evicted
+        """
+        return self._plans.get(plan_id)
+
+    async def preview_plan(
+        self, plan_id: str, show_details: bool = True
+    ) -> ReorganizationPreview | None:
+        """
+        Preview a cached plan without re-planning.
+
+        Args:
+            plan_id: Plan identifier
+            show_details: Whether to include detailed action breakdown
+
+        Returns:
+            Preview, or None if the plan is unknown or evicted
+        """
+        plan = self._plans.get(plan_id)
+        if plan is None:
+            return None
+        return await self.preview_reorganization(plan, show_details)
+
+    def category_metrics(self, plan_id: str) -> CategoryGraphMetrics | None:
+        """
+        Metrics of a cached plan's category graph.
+
+        Args:
+            plan_id: Plan identifier
+
+        Returns:
+            Category graph metrics, or None if the plan is unknown
+        """
+        graph = self._category_graphs.get(plan_id)
+        return graph.metrics() if graph is not None else None
+
+    def evaluate_move(
+        self, plan_id: str, file: str, category: str
+    ) -> CategoryMoveDelta | None:
+        """
+        Evaluate moving one file to another category of a cached plan.
+
+        Args:
+            plan_id: Plan identifier
+            file: File to move, as listed in the plan
+            category: Target category
+
+        Returns:
+            Category graph metrics before and after, or None if the plan is
+            unknown
+
+        Raises:
+            KeyError: If the file is not part of the plan
+        """
+        graph = self._category_graphs.get(plan_id)
+        if graph is None:
+            return None
+        return graph.evaluate_move(file, category)
+
+    async def move_file(
+        self, plan_id: str, file: str, category: str
+    ) -> CategoryMoveDelta | None:
+        """
+        Move one file to another category of a cached plan.
+
+        The plan's proposed categories, actions, impact, risks and benefits
+        are regenerated from the updated category graph; the memory bank is
+        not re-analyzed. The edited plan replaces the cached one under the
+        same id; plans handed out earlier are left unchanged, and planning
+        the same inputs again produces a fresh plan.
+
+        Args:
+            plan_id: Plan identifier
+            file: File to move, as listed in the plan
+            category: Target category
+
+        Returns:
+            Category graph metrics before and after, or None if the plan is
+            unknown
+
+        Raises:
+            KeyError: If the file is not part of the plan
+            ValueError: If the plan does not assign files to categories
+        """
+        plan = self._plans.get(plan_id)
+        graph = self._category_graphs.get(plan_id)
+        if plan is None or graph is None:
+            return None
+        if not plan.proposed_structure.categories:
+            raise ValueError(f"Plan {plan_id} does not assign files to categories")
+
+        delta = graph.move(file, category)
+        proposed = plan.proposed_structure.model_copy(
+            update={"categories": graph.categories}
+        )
+        current_dict = cast(ModelDict, plan.current_structure.model_dump(mode="json"))
+        proposed_dict = cast(ModelDict, proposed.model_dump(mode="json"))
+        actions = await self.executor.generate_actions(
+            current_dict, proposed_dict, plan.optimization_goal
+        )
+        self._plans[plan_id] = plan.model_copy(
+            update={
+                "proposed_structure": proposed,
+                "actions": self._convert_actions_to_models(actions),
+                "estimated_impact": self.executor.calculate_impact(
+                    current_dict, proposed_dict, actions
+                ),
+                "risks": self.executor.identify_risks(actions, current_dict),
+                "benefits": self.executor.identify_benefits(
+                    proposed_dict, current_dict
+                ),
+            }
+        )
+        # The plan no longer is what its inputs produce
+        self._plan_index = {
+            key: indexed
+            for key, indexed in self._plan_index.items()
+            if indexed != plan_id
+        }
+        return delta
 
     def _normalize_inputs(
         self,
@@ -455,3 +656,13 @@ class ReorganizationPlanner:
             )
             for a in actions
         ]
+
+
+def _fingerprint(
+    files: list[str], structure_data: ModelDict, dependency_graph: ModelDict
+) -> str:
+    """Fingerprint of the planning inputs."""
+    payload = json.dumps(
+        [sorted(files), structure_data, dependency_graph], sort_keys=True
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
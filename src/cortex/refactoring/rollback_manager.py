@@ -5,7 +5,9 @@ Rollback Manager - Phase 5.3
 Handle rollback of refactoring executions with conflict detection.
 """
 
+import asyncio
 import json
+import sqlite3
 from collections.abc import Iterable
 from datetime import datetime
 from pathlib import Path
@@ -16,18 +18,30 @@ from cortex.core.exceptions import FileOperationError
 from cortex.core.file_system import FileSystemManager
 from cortex.core.metadata_index import MetadataIndex
 from cortex.core.models import JsonValue, ModelDict, VersionMetadata
+from cortex.core.state_archive import ArchivedStateTable, CompactionStats, StateArchive
+from cortex.core.state_store import StateRow, StateStore, StateTable, model_rows
 from cortex.core.version_manager import VersionManager
 
 from .models import (
+    RefactoringExecutionModel,
     RefactoringStatus,
     RollbackFileData,
     RollbackHistoryResult,
     RollbackManagerConfig,
     RollbackRecordModel,
     RollbackRefactoringResult,
+    SnapshotFileEntry,
+    SnapshotIndexRecord,
 )
 from .rollback_analysis import FileRollbackAnalysis
+from .snapshot_index import (
+    open_execution_history,
+    open_snapshot_index,
+    snapshot_for_execution,
+)
 
+MAX_CONCURRENT_RESTORES = 8
+SNAPSHOT_DESCRIPTION_PREFIX = "Pre-refactoring snapshot: "
 
 # RollbackRecord is now replaced by RollbackRecordModel from models.py
 # This alias is kept for backward compatibility during migration
@@ -53,6 +67,7 @@ class RollbackManager:
         version_manager: VersionManager,
         metadata_index: MetadataIndex,
         config: RollbackManagerConfig | None = None,
+        state_store: StateStore | None = None,
     ):
         self.memory_bank_dir: Path = Path(memory_bank_dir)
         self.fs_manager: FileSystemManager = fs_manager
@@ -63,30 +78,57 @@ class RollbackManager:
         else:
             self.config = config
 
-        # Rollback history file
+        # Rollback history lives in the state store; rollbacks.json is a
+        # legacy import source and the target of export_rollbacks()
         self.rollback_file: Path = self.memory_bank_dir.parent / "rollbacks.json"
-        self.rollbacks: dict[str, RollbackRecord] = {}
+        self.state_store: StateStore = state_store or StateStore.in_directory(
+            self.memory_bank_dir.parent
+        )
+        self.archive: StateArchive = StateArchive.in_directory(
+            self.state_store, self.memory_bank_dir.parent
+        )
+        self.rollbacks: ArchivedStateTable[RollbackRecordModel] = ArchivedStateTable(
+            self.state_store,
+            "rollbacks",
+            RollbackRecordModel,
+            _rollback_created_at,
+            self.archive,
+        )
+
+        # Execution history and reverse index of pre-refactoring snapshots,
+        # both written by the executor
+        self.executions: ArchivedStateTable[RefactoringExecutionModel] = (
+            open_execution_history(self.state_store, self.archive)
+        )
+        self.snapshots: StateTable[SnapshotIndexRecord] = open_snapshot_index(
+            self.state_store
+        )
+
+        self._compaction_checked: bool = False
 
-        # Load existing rollback history
+        # Import legacy rollback history
         self._load_rollbacks()
 
     def _load_rollbacks(self) -> None:
         """
-        Load rollback history from disk.
+        Import rollback history from the legacy JSON file once.
 
         Note:
             This method uses synchronous I/O during initialization for simplicity.
             For performance-critical paths, consider using async alternatives.
         """
-        if not self.rollback_file.exists():
-            return
-
         try:
-            rollback_file_data = self._read_rollback_file()
-            self.rollbacks = self._parse_rollbacks_dict(rollback_file_data)
+            _ = self.state_store.import_legacy(
+                self.rollback_file, self._read_legacy_rows
+            )
         except Exception as e:
             self._handle_corrupted_history(e)
 
+    def _read_legacy_rows(self, _source: Path) -> dict[str, list[StateRow]]:
+        """Parse the legacy rollback file into state store rows."""
+        rollbacks = self._parse_rollbacks_dict(self._read_rollback_file())
+        return {"rollbacks": model_rows(rollbacks, _rollback_created_at)}
+
     def _read_rollback_file(self) -> RollbackFileData:
         """Read and parse rollback file.
 
@@ -127,7 +169,7 @@ class RollbackManager:
         return rollback_file_data.rollbacks
 
     def _handle_corrupted_history(self, error: Exception) -> None:
-        """Handle corrupted rollback history by starting fresh.
+        """Handle a corrupted legacy rollback file by skipping its import.
 
         Args:
             error: The exception that occurred during loading
@@ -135,19 +177,75 @@ class RollbackManager:
         from cortex.core.logging_config import logger
 
         logger.warning(f"Rollback history corrupted, starting fresh: {error}")
-        self.rollbacks = {}
 
-    async def save_rollbacks(self):
-        """Save rollback history to disk."""
+    async def save_rollbacks(self, rollback_ids: Iterable[str] | None = None):
+        """
+        Write changed rollback records to the state store.
+
+        Args:
+            rollback_ids: Rollbacks to write, or None for every loaded record
+        """
+        try:
+            await self._compact_if_due()
+            _ = await self.state_store.run(self.rollbacks.flush, rollback_ids)
+        except sqlite3.Error as e:
+            raise FileOperationError(f"Failed to save rollback history: {e}") from e
+
+    async def _record_rollback(
+        self, rollback_id: str, rollback_record: RollbackRecordModel
+    ) -> None:
+        """Write one rollback record to the state store."""
+        try:
+            await self._compact_if_due()
+            await self.state_store.run(
+                self.rollbacks.update, {rollback_id: rollback_record}
+            )
+        except sqlite3.Error as e:
+            raise FileOperationError(f"Failed to save rollback history: {e}") from e
+
+    async def _compact_if_due(self) -> None:
+        """Compact the rollback history once a day, on the first write."""
+        retention = self.config.retention
+        if self._compaction_checked or not retention.auto_compact:
+            return
+        self._compaction_checked = True
+        _ = await self.state_store.run(
+            self.rollbacks.compact_if_due, retention.active_days, retention.archive_days
+        )
+
+    async def compact_history(self) -> CompactionStats:
+        """
+        Archive rollbacks past the active window and expire old archives.
+
+        Returns:
+            Counts of archived and expired rollback records
+        """
+        retention = self.config.retention
+        return await self.state_store.run(
+            self.rollbacks.compact, retention.active_days, retention.archive_days
+        )
+
+    async def export_rollbacks(self, export_path: Path | None = None) -> Path:
+        """
+        Export the rollback history as JSON.
+
+        Args:
+            export_path: Target file, defaults to the legacy rollbacks.json
+
+        Returns:
+            Path of the written file
+        """
+        target = export_path or self.rollback_file
         try:
             data = RollbackFileData(
                 last_updated=datetime.now().isoformat(),
-                rollbacks=self.rollbacks,
+                rollbacks=await self.state_store.run(dict, self.rollbacks),
             )
-            async with open_async_text_file(self.rollback_file, "w", "utf-8") as f:
+            async with open_async_text_file(target, "w", "utf-8") as f:
                 _ = await f.write(data.model_dump_json(indent=2))
         except Exception as e:
-            raise FileOperationError(f"Failed to save rollback history: {e}") from e
+            raise FileOperationError(f"Failed to export rollback history: {e}") from e
+        return target
 
     async def rollback_refactoring(
         self,
@@ -294,13 +392,14 @@ class RollbackManager:
         Returns:
             Snapshot ID or None if validation fails
         """
-        snapshot_id = self.find_snapshot_for_execution(execution_id)
+        snapshot_id = await self.state_store.run(
+            self.find_snapshot_for_execution, execution_id
+        )
 
         if not snapshot_id and restore_snapshot:
             rollback_record.status = RefactoringStatus.FAILED
             rollback_record.error = f"No snapshot found for execution {execution_id}"
-            self.rollbacks[rollback_id] = rollback_record
-            await self.save_rollbacks()
+            await self._record_rollback(rollback_id, rollback_record)
             return None
 
         if snapshot_id is None:
@@ -400,8 +499,7 @@ class RollbackManager:
         rollback_record.status = RefactoringStatus.COMPLETED
         rollback_record.completed_at = datetime.now().isoformat()
 
-        self.rollbacks[rollback_id] = rollback_record
-        await self.save_rollbacks()
+        await self._record_rollback(rollback_id, rollback_record)
 
         return RollbackRefactoringResult(
             status="success",
@@ -430,8 +528,7 @@ class RollbackManager:
         rollback_record.error = str(error)
         rollback_record.completed_at = datetime.now().isoformat()
 
-        self.rollbacks[rollback_id] = rollback_record
-        await self.save_rollbacks()
+        await self._record_rollback(rollback_id, rollback_record)
 
         return RollbackRefactoringResult(
             status="failed",
@@ -442,9 +539,11 @@ class RollbackManager:
 
     def find_snapshot_for_execution(self, execution_id: str) -> str | None:
         """Find snapshot ID for an execution."""
-        # This would typically come from the execution record
-        # For now, we'll construct it from the execution_id
-        # In practice, the RefactoringExecutor would store this
+        snapshot_id = snapshot_for_execution(self.executions, execution_id)
+        if snapshot_id is not None:
+            return snapshot_id
+
+        # Executions recorded before the state store: derive the ID
         if "exec-" in execution_id:
             # Extract timestamp from execution_id
             # Format: exec-{suggestion_id}-{timestamp}
@@ -459,10 +558,18 @@ class RollbackManager:
         execution_id: str,  # noqa: ARG002
         snapshot_id: str,
     ) -> list[str]:
-        """Get list of files affected by an execution."""
+        """Get list of files affected by an execution.
+
+        Snapshots in the snapshot index list their files directly; older
+        snapshots are found by scanning the memory bank's version histories.
+        """
         if not snapshot_id:
             return []
 
+        record = await self.state_store.run(self.snapshots.get, snapshot_id)
+        if record is not None:
+            return [entry.file for entry in record.files]
+
         affected_files: list[str] = []
         for file_path in self.memory_bank_dir.glob("**/*.md"):
             if file_path.is_file():
@@ -480,19 +587,12 @@ class RollbackManager:
         if version_history is None:
             return False
 
-        for version_entry in version_history:
-            change_description = version_entry.change_description or ""
-            if change_description.startswith(
-                f"Pre-refactoring snapshot: {snapshot_id}"
-            ):
-                return True
-
-        return False
+        return snapshot_id in snapshot_version_map(version_history)
 
     async def detect_conflicts(
         self,
         affected_files: list[str],
-        snapshot_id: str,
+        snapshot_id: str,  # noqa: ARG002
     ) -> list[str]:
         """
         Detect conflicts between current state and snapshot.
@@ -500,28 +600,36 @@ class RollbackManager:
         A conflict occurs when:
         - File has been manually edited since snapshot
         - File structure has changed
+
+        Stored hashes come from one index snapshot and files are hashed
+        concurrently.
         """
-        conflicts: list[str] = []
+        index = await self._index_snapshot(affected_files)
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_RESTORES)
 
-        for file_path in affected_files:
-            full_path = self.memory_bank_dir / file_path
+        async def check(file_path: str) -> str | None:
+            async with semaphore:
+                return await self._detect_file_conflict(file_path, index.get(file_path))
 
-            if not full_path.exists():
-                conflicts.append(f"{file_path} - File was deleted after refactoring")
-                continue
+        results = await asyncio.gather(*(check(path) for path in affected_files))
+        return [conflict for conflict in results if conflict is not None]
 
-            # Get current content hash
-            content, _ = await self.fs_manager.read_file(full_path)
-            current_hash = self.fs_manager.compute_hash(content)
+    async def _detect_file_conflict(
+        self, file_path: str, metadata: dict[str, object] | None
+    ) -> str | None:
+        """Describe the conflict of a single file, if any."""
+        full_path = self.memory_bank_dir / file_path
+        if not full_path.exists():
+            return f"{file_path} - File was deleted after refactoring"
 
-            # Get metadata to check for external modifications
-            metadata = await self.metadata_index.get_file_metadata(file_path)
-            if metadata:
-                stored_hash = _extract_content_hash(cast(JsonValue, metadata))
-                if stored_hash and stored_hash != current_hash:
-                    conflicts.append(f"{file_path} - File has been manually edited")
+        content, _ = await self.fs_manager.read_file(full_path)
+        current_hash = self.fs_manager.compute_hash(content)
 
-        return conflicts
+        # Compare against the hash recorded by the last tracked write
+        stored_hash = _extract_content_hash(cast(JsonValue, metadata))
+        if stored_hash and stored_hash != current_hash:
+            return f"{file_path} - File has been manually edited"
+        return None
 
     async def restore_files(
         self,
@@ -533,6 +641,9 @@ class RollbackManager:
         """
         Restore files from snapshot.
 
+        Snapshot versions are resolved from one index snapshot, files are
+        restored concurrently and the index is saved once afterwards.
+
         Args:
             affected_files: List of files to restore
             snapshot_id: Snapshot to restore from
@@ -542,21 +653,44 @@ class RollbackManager:
         Returns:
             List of successfully restored files
         """
-        restored_files: list[str] = []
-
-        for file_path in affected_files:
-            # Skip files with conflicts if preserving manual changes
-            if await self._should_skip_conflicted_file(
-                file_path, preserve_manual_changes, conflicts
-            ):
-                continue
-
-            # Restore from snapshot
-            restored = await self._restore_single_file(file_path, snapshot_id)
-            if restored:
-                restored_files.append(file_path)
+        record = await self.state_store.run(self.snapshots.get, snapshot_id)
+        entries = {} if record is None else {e.file: e for e in record.files}
+        unindexed = [path for path in affected_files if path not in entries]
+        index = await self._index_snapshot(unindexed) if unindexed else {}
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_RESTORES)
+
+        async def restore(file_path: str) -> bool:
+            async with semaphore:
+                # Skip files with conflicts if preserving manual changes
+                if await self._should_skip_conflicted_file(
+                    file_path, preserve_manual_changes, conflicts
+                ):
+                    return False
+                entry = entries.get(file_path)
+                if entry is not None:
+                    return await self._restore_indexed_file(file_path, entry)
+                return await self._restore_single_file(
+                    file_path, snapshot_id, index.get(file_path)
+                )
+
+        async with self.metadata_index.batch_updates():
+            restored = await asyncio.gather(*(restore(p) for p in affected_files))
+        return [
+            file_path
+            for file_path, ok in zip(affected_files, restored, strict=True)
+            if ok
+        ]
 
-        return restored_files
+    async def _index_snapshot(
+        self, affected_files: list[str]
+    ) -> dict[str, dict[str, object]]:
+        """Metadata of the affected files, read from the index once."""
+        all_metadata = await self.metadata_index.get_all_files_metadata()
+        return {
+            file_path: all_metadata[file_path]
+            for file_path in affected_files
+            if file_path in all_metadata
+        }
 
     async def _should_skip_conflicted_file(
         self, file_path: str, preserve_manual_changes: bool, conflicts: list[str]
@@ -583,29 +717,63 @@ class RollbackManager:
 
         return False
 
-    async def _restore_single_file(self, file_path: str, snapshot_id: str) -> bool:
+    async def _restore_indexed_file(
+        self, file_path: str, entry: SnapshotFileEntry
+    ) -> bool:
+        """
+        Restore a single file from its snapshot index entry.
+
+        Args:
+            file_path: Path to file
+            entry: Snapshot index entry of the file
+
+        Returns:
+            True if file was successfully restored
+        """
+        from cortex.core.logging_config import logger
+
+        try:
+            content = await self.version_manager.get_snapshot_content(
+                Path(entry.snapshot_path)
+            )
+        except (FileNotFoundError, OSError) as e:
+            logger.warning(f"Failed to restore file {file_path} during rollback: {e}")
+            return False
+
+        if self.fs_manager.compute_hash(content) != entry.content_hash:
+            # The blob was overwritten by a later snapshot of the same file
+            logger.warning(
+                f"Snapshot {entry.snapshot_path} of {file_path} no longer "
+                + "matches the recorded hash; skipping restore"
+            )
+            return False
+
+        await self._write_restored_content(file_path, content, entry.token_count)
+        return True
+
+    async def _restore_single_file(
+        self, file_path: str, snapshot_id: str, file_meta: dict[str, object] | None
+    ) -> bool:
         """
         Restore a single file from snapshot.
 
         Args:
             file_path: Path to file
             snapshot_id: Snapshot to restore from
+            file_meta: Index metadata of the file
 
         Returns:
             True if file was successfully restored
         """
         try:
-            # Get version history from metadata
-            version_history = await self._get_version_history(file_path)
+            version_history = _extract_version_history(cast(JsonValue, file_meta))
             if version_history is None:
                 return False
 
-            # Find snapshot version
-            snapshot_version = self._find_snapshot_version(version_history, snapshot_id)
+            snapshot_version = snapshot_version_map(version_history).get(snapshot_id)
             if snapshot_version is None:
                 return False
 
-            # Rollback to this version
             return await self._rollback_file_to_version(
                 file_path, version_history, snapshot_version
             )
@@ -617,45 +785,6 @@ class RollbackManager:
             logger.warning(f"Failed to restore file {file_path} during rollback: {e}")
             return False
 
-    async def _get_version_history(
-        self, file_path: str
-    ) -> list[VersionMetadata] | None:
-        """
-        Get version history for a file.
-
-        Args:
-            file_path: Path to file
-
-        Returns:
-            Version history list (Pydantic models) or None if not found
-        """
-        file_meta = await self.metadata_index.get_file_metadata(file_path)
-        return _extract_version_history(cast(JsonValue, file_meta))
-
-    def _find_snapshot_version(
-        self, version_history: list[VersionMetadata], snapshot_id: str
-    ) -> int | None:
-        """
-        Find version number for a snapshot.
-
-        Args:
-            version_history: Version history list (Pydantic models)
-            snapshot_id: Snapshot to find
-
-        Returns:
-            Version number or None if not found
-        """
-        for version_entry in version_history:
-            change_description = version_entry.change_description or ""
-            if not change_description.startswith(
-                f"Pre-refactoring snapshot: {snapshot_id}"
-            ):
-                continue
-
-            return version_entry.version
-
-        return None
-
     async def _rollback_file_to_version(
         self,
         file_path: str,
@@ -676,7 +805,40 @@ class RollbackManager:
         result = await self.version_manager.rollback_to_version(
             file_path, version_history, version
         )
-        return result is not None
+        if result is None:
+            return False
+
+        content = result.get("content")
+        if isinstance(content, str):
+            metadata = result.get("metadata")
+            token_count = 0
+            if isinstance(metadata, dict):
+                token_count_raw = metadata.get("token_count")
+                if isinstance(token_count_raw, int):
+                    token_count = token_count_raw
+            await self._write_restored_content(file_path, content, token_count)
+        return True
+
+    async def _write_restored_content(
+        self, file_path: str, content: str, token_count: int
+    ) -> None:
+        """Write restored content back and refresh its index entry."""
+        full_path = self.memory_bank_dir / file_path
+        content_hash = await self.fs_manager.write_file(full_path, content)
+
+        sections = [
+            section.model_dump(mode="json")
+            for section in self.fs_manager.parse_sections(content)
+        ]
+        await self.metadata_index.update_file_metadata(
+            file_path,
+            path=full_path,
+            exists=True,
+            size_bytes=len(content.encode("utf-8")),
+            token_count=token_count,
+            content_hash=content_hash,
+            sections=sections,
+        )
 
     async def backup_current_version(self, file_path: str):
         """Backup current version before rollback."""
@@ -728,9 +890,10 @@ class RollbackManager:
         from datetime import timedelta
 
         cutoff_date = datetime.now() - timedelta(days=time_range_days)
-        filtered_rollbacks = _filter_rollbacks_by_date(
-            self.rollbacks.values(), cutoff_date
+        recent = await self.state_store.run(
+            self.rollbacks.created_since, cutoff_date.isoformat()
         )
+        filtered_rollbacks = _filter_rollbacks_by_date(recent, cutoff_date)
         stats = _calculate_rollback_statistics(filtered_rollbacks)
         return _build_rollback_history_result(
             time_range_days, filtered_rollbacks, stats
@@ -742,7 +905,7 @@ class RollbackManager:
         Returns:
             RollbackRecordModel or None if not found
         """
-        return self.rollbacks.get(rollback_id)
+        return await self.state_store.run(self.rollbacks.get, rollback_id)
 
     async def analyze_rollback_impact(
         self,
@@ -757,7 +920,9 @@ class RollbackManager:
         Returns:
             RollbackImpactResult with impact analysis
         """
-        snapshot_id = self.find_snapshot_for_execution(execution_id)
+        snapshot_id = await self.state_store.run(
+            self.find_snapshot_for_execution, execution_id
+        )
         if not snapshot_id:
             return {
                 "status": "error",
@@ -803,6 +968,25 @@ class RollbackManager:
         }
 
 
+def snapshot_version_map(version_history: list[VersionMetadata]) -> dict[str, int]:
+    """
+    Map pre-refactoring snapshot ids to the versions that recorded them.
+
+    Args:
+        version_history: Version history of one file
+
+    Returns:
+        Version number per snapshot id (earliest version wins)
+    """
+    versions: dict[str, int] = {}
+    for version_entry in version_history:
+        description = version_entry.change_description or ""
+        if description.startswith(SNAPSHOT_DESCRIPTION_PREFIX):
+            snapshot_id = description.removeprefix(SNAPSHOT_DESCRIPTION_PREFIX)
+            _ = versions.setdefault(snapshot_id.strip(), version_entry.version)
+    return versions
+
+
 def _extract_version_history(file_meta: JsonValue) -> list[VersionMetadata] | None:
     if file_meta is None:
         return None
@@ -878,6 +1062,11 @@ def _extract_hash_from_object(file_meta: JsonValue) -> str | None:
         )
 
 
+def _rollback_created_at(rollback: RollbackRecordModel) -> str:
+    """Indexed timestamp of a rollback record."""
+    return rollback.created_at
+
+
 def _filter_rollbacks_by_date(
     rollbacks: Iterable[RollbackRecordModel], cutoff_date: datetime
 ) -> list[RollbackRecordModel]:
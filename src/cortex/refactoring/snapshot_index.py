@@ -0,0 +1,80 @@
+"""
+Snapshot Index - Reverse index from snapshot IDs to snapshotted files.
+
+The refactoring executor records every pre-refactoring snapshot it takes
+(file, version, blob path) under the snapshot ID. Rollback looks snapshots
+up here instead of scanning every file's version history, so finding what
+to restore costs O(affected files).
+"""
+
+from collections.abc import Mapping
+
+from cortex.core.state_archive import ArchivedStateTable, StateArchive
+from cortex.core.state_store import StateStore, StateTable
+
+from .models import RefactoringExecutionModel, SnapshotIndexRecord
+
+SNAPSHOT_KIND = "snapshots"
+EXECUTION_KIND = "executions"
+
+
+def open_snapshot_index(store: StateStore) -> StateTable[SnapshotIndexRecord]:
+    """
+    Open the snapshot reverse index in a state store.
+
+    Args:
+        store: State store of the project
+
+    Returns:
+        Table of snapshot records keyed by snapshot ID
+    """
+    return StateTable(store, SNAPSHOT_KIND, SnapshotIndexRecord, _snapshot_created_at)
+
+
+def open_execution_history(
+    store: StateStore, archive: StateArchive
+) -> ArchivedStateTable[RefactoringExecutionModel]:
+    """
+    Open the refactoring execution history in a state store.
+
+    Args:
+        store: State store of the project
+        archive: Archive holding executions past the retention window
+
+    Returns:
+        Table of execution records keyed by execution ID
+    """
+    return ArchivedStateTable(
+        store,
+        EXECUTION_KIND,
+        RefactoringExecutionModel,
+        execution_created_at,
+        archive,
+    )
+
+
+def snapshot_for_execution(
+    executions: Mapping[str, RefactoringExecutionModel], execution_id: str
+) -> str | None:
+    """
+    Look up the snapshot ID recorded on an execution.
+
+    Args:
+        executions: Execution history, live and archived
+        execution_id: Execution identifier
+
+    Returns:
+        Snapshot ID, or None when the execution is unknown or has none
+    """
+    execution = executions.get(execution_id)
+    return execution.snapshot_id if execution is not None else None
+
+
+def execution_created_at(execution: RefactoringExecutionModel) -> str:
+    """Indexed timestamp of an execution record."""
+    return execution.created_at
+
+
+def _snapshot_created_at(record: SnapshotIndexRecord) -> str:
+    """Indexed timestamp of a snapshot record."""
+    return record.created_at
@@ -10,6 +10,8 @@ from typing import cast
 
 from cortex.core.models import ModelDict
 
+from .split_planner import section_features
+
 
 class SplitAnalyzer:
     """
@@ -220,30 +222,7 @@ class SplitAnalyzer:
         Returns:
             Independence score (0.0 - 1.0)
         """
-        independence_score = 0.5  # Base score
-
-        content = cast(str, section["content"])
-
-        # Check for internal references (links to other sections)
-        internal_refs = len(re.findall(r"\[.*?\]\(#.*?\)", content))
-        if internal_refs == 0:
-            independence_score += 0.2
-        elif internal_refs <= 2:
-            independence_score += 0.1
-
-        # Check for self-contained content (definitions, explanations)
-        has_code_blocks = "```" in content
-        has_lists = bool(re.search(r"^\s*[-*+]\s", content, re.MULTILINE))
-        has_headings = bool(re.search(r"^#{2,6}\s", content, re.MULTILINE))
-
-        if has_code_blocks:
-            independence_score += 0.1
-        if has_lists:
-            independence_score += 0.1
-        if has_headings:
-            independence_score += 0.1
-
-        return min(independence_score, 1.0)
+        return section_features(section).independence
 
     def calculate_group_independence(
         self,
@@ -0,0 +1,250 @@
+"""
+Split Planner - Token-weighted partitioning of a file's sections.
+
+Each section's features (token count, anchor, outgoing ``#anchor`` links,
+code/list/subheading flags) are computed once. The section sequence is then
+partitioned into contiguous chunks by dynamic programming: a chunk costs the
+squared deviation of its token count from the target size, and every chunk
+boundary costs the number of internal links that cross it plus a penalty
+for separating a subsection from the section before it.
+
+Chunks are capped at a maximum token count, so each position only looks back
+over the sections that fit in one chunk. The DP runs in O(n * k) for n
+sections and at most k sections per chunk, which is linear in the file for
+bounded section sizes.
+"""
+
+import re
+from collections.abc import Callable
+from dataclasses import dataclass
+from math import ceil
+from typing import cast
+
+from cortex.core.models import ModelDict
+
+TokenCountFn = Callable[[str], int]
+
+CHARS_PER_TOKEN = 4
+NESTED_CUT_COST = 0.5
+BALANCE_WEIGHT = 1.0
+
+_INTERNAL_LINK = re.compile(r"\[[^\n]*?\]\(#([^\n]*?)\)")
+_LIST_ITEM = re.compile(r"^\s*[-*+]\s", re.MULTILINE)
+_SUBHEADING = re.compile(r"^#{2,6}\s", re.MULTILINE)
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate tokens as one per four characters."""
+    return len(text) // CHARS_PER_TOKEN
+
+
+def heading_anchor(heading: str) -> str:
+    """
+    Build the markdown anchor of a heading.
+
+    Args:
+        heading: Heading text
+
+    Returns:
+        Lowercase, hyphenated anchor without punctuation
+    """
+    slug = re.sub(r"[^\w\s-]", "", heading.strip().lower())
+    return re.sub(r"\s+", "-", slug)
+
+
+@dataclass(frozen=True)
+class SectionFeatures:
+    """Per-section facts used for independence scoring and partitioning."""
+
+    heading: str
+    level: int
+    start_line: int
+    end_line: int
+    tokens: int
+    anchor: str
+    link_anchors: tuple[str, ...]
+    has_code_blocks: bool
+    has_lists: bool
+    has_subheadings: bool
+
+    @property
+    def independence(self) -> float:
+        """How self-contained the section is (0.0 - 1.0)."""
+        score = 0.5
+        if not self.link_anchors:
+            score += 0.2
+        elif len(self.link_anchors) <= 2:
+            score += 0.1
+        if self.has_code_blocks:
+            score += 0.1
+        if self.has_lists:
+            score += 0.1
+        if self.has_subheadings:
+            score += 0.1
+        return min(score, 1.0)
+
+
+def section_features(
+    section: ModelDict, count_tokens: TokenCountFn = estimate_tokens
+) -> SectionFeatures:
+    """
+    Compute the features of one parsed section.
+
+    Args:
+        section: Section dictionary from ``SplitAnalyzer.parse_file_structure``
+        count_tokens: Token counting function
+
+    Returns:
+        Section features
+    """
+    heading = str(section.get("heading") or "")
+    content = section.get("content")
+    text = content if isinstance(content, str) else ""
+    return SectionFeatures(
+        heading=heading,
+        level=_int_field(section, "level"),
+        start_line=_int_field(section, "start_line"),
+        end_line=_int_field(section, "end_line"),
+        tokens=count_tokens(text),
+        anchor=heading_anchor(heading),
+        link_anchors=tuple(
+            anchor.strip().lower() for anchor in _INTERNAL_LINK.findall(text)
+        ),
+        has_code_blocks="```" in text,
+        has_lists=_LIST_ITEM.search(text) is not None,
+        has_subheadings=_SUBHEADING.search(text) is not None,
+    )
+
+
+def extract_features(
+    sections: list[ModelDict], count_tokens: TokenCountFn = estimate_tokens
+) -> list[SectionFeatures]:
+    """
+    Compute features for every section of a file.
+
+    Args:
+        sections: Parsed sections in file order
+        count_tokens: Token counting function
+
+    Returns:
+        Features in file order
+    """
+    return [section_features(section, count_tokens) for section in sections]
+
+
+def boundary_costs(features: list[SectionFeatures]) -> list[float]:
+    """
+    Cost of starting a new chunk before each section.
+
+    A boundary before section ``i`` costs one per internal link spanning it
+    (from a section before ``i`` to one at or after ``i``, or back) plus
+    ``NESTED_CUT_COST`` per heading level the section sits below the file's
+    top level. Link spans are accumulated with a difference array.
+
+    Args:
+        features: Section features in file order
+
+    Returns:
+        Cost per boundary; index 0 (the file start) is always 0.0
+    """
+    count = len(features)
+    if count == 0:
+        return []
+
+    positions: dict[str, int] = {}
+    for index, feature in enumerate(features):
+        _ = positions.setdefault(feature.anchor, index)
+
+    spans = [0] * (count + 1)
+    for source, feature in enumerate(features):
+        for anchor in feature.link_anchors:
+            target = positions.get(anchor)
+            if target is None or target == source:
+                continue
+            low, high = min(source, target), max(source, target)
+            spans[low + 1] += 1
+            spans[high + 1] -= 1
+
+    top_level = min(feature.level for feature in features)
+    costs = [0.0] * count
+    crossing = 0
+    for index in range(1, count):
+        crossing += spans[index]
+        nesting = features[index].level - top_level
+        costs[index] = crossing + NESTED_CUT_COST * nesting
+    return costs
+
+
+def partition_sections(
+    features: list[SectionFeatures],
+    target_tokens: int,
+    max_tokens: int | None = None,
+) -> list[tuple[int, int]]:
+    """
+    Partition sections into contiguous, balanced, loosely coupled chunks.
+
+    Args:
+        features: Section features in file order
+        target_tokens: Desired tokens per chunk
+        max_tokens: Hard cap per chunk (a single larger section still forms
+            its own chunk); defaults to twice the target
+
+    Returns:
+        Chunks as ``(start, end)`` section index ranges, end exclusive
+    """
+    count = len(features)
+    if count == 0:
+        return []
+    target = max(target_tokens, 1)
+    cap = max_tokens if max_tokens is not None else 2 * target
+
+    prefix = [0] * (count + 1)
+    for index, feature in enumerate(features):
+        prefix[index + 1] = prefix[index] + feature.tokens
+    costs = boundary_costs(features)
+
+    best = [0.0] + [float("inf")] * count
+    previous = [0] * (count + 1)
+    for end in range(1, count + 1):
+        for start in range(end - 1, -1, -1):
+            tokens = prefix[end] - prefix[start]
+            if tokens > cap and start < end - 1:
+                break
+            deviation = (tokens - target) / target
+            cost = best[start] + BALANCE_WEIGHT * deviation * deviation
+            if start > 0:
+                cost += costs[start]
+            if cost < best[end]:
+                best[end] = cost
+                previous[end] = start
+
+    chunks: list[tuple[int, int]] = []
+    end = count
+    while end > 0:
+        start = previous[end]
+        chunks.append((start, end))
+        end = start
+    chunks.reverse()
+    return chunks
+
+
+def balanced_target(total_tokens: int, chunk_count: int) -> int:
+    """
+    Target tokens per chunk for splitting a total into a number of chunks.
+
+    Args:
+        total_tokens: Tokens in the whole file
+        chunk_count: Desired number of chunks
+
+    Returns:
+        Target chunk size, at least 1
+    """
+    return max(ceil(total_tokens / max(chunk_count, 1)), 1)
+
+
+def _int_field(section: ModelDict, key: str) -> int:
+    """Integer field of a section dictionary (0 if missing)."""
+    value = section.get(key)
+    if isinstance(value, (int, float)):
+        return int(cast(int | float, value))
+    return 0
@@ -8,11 +8,13 @@ Delegates analysis operations to SplitAnalyzer.
 
 import re
 from dataclasses import dataclass
+from math import ceil
 from pathlib import Path
 from typing import cast
 
 from cortex.core.async_file_utils import open_async_text_file
-from cortex.core.models import JsonValue, ModelDict
+from cortex.core.models import ModelDict
+from cortex.core.token_counter import TokenCounter
 from cortex.refactoring.models import (
     NewSplitStructure,
     SplitFileInfo,
@@ -21,6 +23,13 @@ from cortex.refactoring.models import (
 )
 
 from .split_analyzer import SplitAnalyzer
+from .split_planner import (
+    SectionFeatures,
+    balanced_target,
+    estimate_tokens,
+    extract_features,
+    partition_sections,
+)
 
 
 @dataclass
@@ -85,6 +94,7 @@ class SplitRecommender:
         max_file_size: int = 5000,  # tokens
         max_sections: int = 10,
         min_section_independence: float = 0.6,
+        token_counter: TokenCounter | None = None,
     ):
         """
         Initialize the split recommender.
@@ -94,11 +104,14 @@ class SplitRecommender:
             max_file_size: Maximum recommended file size in tokens
             max_sections: Maximum recommended number of sections per file
             min_section_independence: Minimum independence score for split (0-1)
+            token_counter: Token counter for section weights (estimated from
+                character counts if None)
         """
         self.memory_bank_path: Path = Path(memory_bank_path)
         self.max_file_size: int = max_file_size
         self.max_sections: int = max_sections
         self.min_section_independence: float = min_section_independence
+        self.token_counter: TokenCounter | None = token_counter
 
         # Create analyzer for file analysis
         self.analyzer: SplitAnalyzer = SplitAnalyzer(
@@ -123,13 +136,23 @@ class SplitRecommender:
         """
         return self.analyzer.parse_file_structure(content)
 
+    def count_tokens(self, text: str) -> int:
+        """Count tokens with the token counter, or estimate without one."""
+        if self.token_counter is None:
+            return estimate_tokens(text)
+        return self.token_counter.count_tokens(text)
+
     def generate_recommendation_id(self) -> str:
         """Generate unique recommendation ID"""
         self.recommendation_counter += 1
         return f"SPLIT-{self.recommendation_counter:04d}"
 
     async def analyze_file(
-        self, file_path: str, content: str | None = None, token_count: int | None = None
+        self,
+        file_path: str,
+        content: str | None = None,
+        token_count: int | None = None,
+        sections: list[ModelDict] | None = None,
     ) -> SplitRecommendation | None:
         """
         Analyze a file and recommend splitting if needed.
@@ -138,6 +161,7 @@ class SplitRecommender:
             file_path: Path to the file to analyze
             content: File content (will read if not provided)
             token_count: Token count (will calculate if not provided)
+            sections: Parsed file structure (will parse if not provided)
 
         Returns:
             Split recommendation or None if file is fine
@@ -147,9 +171,10 @@ class SplitRecommender:
             return None
 
         if token_count is None:
-            token_count = len(content) // 4
+            token_count = self.count_tokens(content)
 
-        sections = self.analyzer.parse_file_structure(content)
+        if sections is None:
+            sections = self.analyzer.parse_file_structure(content)
         should_split, reasons = await self.analyzer.should_split_file(
             file_path, content, token_count, sections
         )
@@ -172,27 +197,42 @@ class SplitRecommender:
         )
 
     async def suggest_file_splits(
-        self, files: list[str] | None = None
+        self,
+        files: list[str] | None = None,
+        file_contents: dict[str, str] | None = None,
+        token_counts: dict[str, int] | None = None,
+        file_structures: dict[str, list[ModelDict]] | None = None,
     ) -> list[SplitRecommendation]:
         """
         Suggest splits for multiple files.
 
         Args:
             files: List of files to analyze (all if None)
+            file_contents: Already loaded content per file (read if missing)
+            token_counts: Token count per file (estimated if missing)
+            file_structures: Parsed structure per file (parsed if missing)
 
         Returns:
             List of split recommendations
         """
         recommendations: list[SplitRecommendation] = []
+        file_contents = file_contents or {}
+        token_counts = token_counts or {}
+        file_structures = file_structures or {}
 
         # Get files to analyze
         if files is None:
-            files = await self.get_all_markdown_files()
+            files = list(file_contents) or await self.get_all_markdown_files()
 
         # Analyze each file
         for file_path in files:
             try:
-                recommendation = await self.analyze_file(file_path)
+                recommendation = await self.analyze_file(
+                    file_path,
+                    file_contents.get(file_path),
+                    token_counts.get(file_path),
+                    file_structures.get(file_path),
+                )
                 if recommendation:
                     recommendations.append(recommendation)
             except Exception as e:
@@ -260,176 +300,81 @@ class SplitRecommender:
             return "\n".join(str(item) for item in content if item is not None)
         return str(content) if content is not None else ""
 
-    async def _generate_split_by_topics(
-        self,
-        file_path: str,
-        content: str,
-        sections: list[ModelDict],
+    def _generate_split_by_topics(
+        self, file_path: str, features: list[SectionFeatures]
     ) -> list[SplitPoint]:
         """Generate split points by top-level topics."""
-        split_points: list[SplitPoint] = []
-        top_level_sections = [
-            s for s in sections if self.get_section_int(s, "level", 0) == 1
+        return [
+            self._split_point(file_path, [feature], feature.independence)
+            for feature in features
+            if feature.level == 1
+            and feature.independence >= self.min_section_independence
         ]
 
-        for section in top_level_sections:
-            independence = self.analyzer.calculate_section_independence(
-                section, sections, content
-            )
-
-            if independence >= self.min_section_independence:
-                section_heading = self.get_section_str(section, "heading", "")
-                start_line = self.get_section_int(section, "start_line", 0)
-                end_line = self.get_section_int(section, "end_line", 0)
-                section_content = self.get_section_content(section)
-
-                split_point = SplitPoint(
-                    section_heading=section_heading,
-                    start_line=start_line,
-                    end_line=end_line,
-                    token_count=len(section_content) // 4,
-                    independence_score=independence,
-                    suggested_filename=self.generate_split_filename(
-                        file_path, section_heading
-                    ),
-                )
-                split_points.append(split_point)
-
-        return split_points
-
-    async def _generate_split_by_sections(
-        self,
-        file_path: str,
-        content: str,
-        sections: list[ModelDict],
+    def _generate_split_by_sections(
+        self, file_path: str, features: list[SectionFeatures]
     ) -> list[SplitPoint]:
-        """Generate split points by grouping related sections."""
+        """Generate split points by partitioning sections into loose groups."""
+        total_tokens = sum(feature.tokens for feature in features)
+        chunk_count = max(
+            2,
+            ceil(len(features) / self.max_sections),
+            ceil(total_tokens / max(self.max_file_size, 1)),
+        )
+        target = balanced_target(total_tokens, chunk_count)
         split_points: list[SplitPoint] = []
-        section_groups_raw = self.analyzer.group_related_sections(sections)
-
-        for group_name, group_sections_raw in section_groups_raw.items():
-            group_sections = _normalize_group_sections(group_sections_raw)
-            if not group_sections:
-                continue
-
-            split_point = self._create_split_point_from_group(
-                file_path, content, sections, group_name, group_sections
-            )
-            if split_point:
-                split_points.append(split_point)
-
+        for start, end in partition_sections(features, target):
+            group = features[start:end]
+            independence = sum(f.independence for f in group) / len(group)
+            if independence >= self.min_section_independence:
+                split_points.append(self._split_point(file_path, group, independence))
         return split_points
 
-    def _create_split_point_from_group(
-        self,
-        file_path: str,
-        content: str,
-        sections: list[ModelDict],
-        group_name: str,
-        group_sections: list[ModelDict],
-    ) -> SplitPoint | None:
-        """Create split point from section group."""
-        combined_content = "\n".join(
-            self.get_section_content(s) for s in group_sections
-        )
-        start_line = self.get_section_int(group_sections[0], "start_line", 0)
-        end_line = self.get_section_int(group_sections[-1], "end_line", 0)
-
-        independence = self.analyzer.calculate_group_independence(
-            group_sections, sections, content
-        )
-
-        if independence < self.min_section_independence:
-            return None
-
-        group_name_str = str(group_name)
-        return SplitPoint(
-            section_heading=group_name_str,
-            start_line=start_line,
-            end_line=end_line,
-            token_count=len(combined_content) // 4,
-            independence_score=independence,
-            suggested_filename=self.generate_split_filename(file_path, group_name_str),
-        )
-
-    async def _generate_split_by_size(
-        self,
-        file_path: str,
-        sections: list[ModelDict],
+    def _generate_split_by_size(
+        self, file_path: str, features: list[SectionFeatures]
     ) -> list[SplitPoint]:
-        """Generate split points by size, creating roughly equal chunks."""
-        split_points: list[SplitPoint] = []
-        target_chunk_size = self.max_file_size
-        current_chunk_sections: list[ModelDict] = []
-        current_chunk_tokens = 0
-
-        for section in sections:
-            section_content = self.get_section_content(section)
-            section_tokens = len(section_content) // 4
-
-            if (
-                current_chunk_tokens + section_tokens > target_chunk_size
-                and current_chunk_sections
-            ):
-                split_point = self._create_chunk_split_point(
-                    file_path, current_chunk_sections, current_chunk_tokens
-                )
-                split_points.append(split_point)
-
-                # Start new chunk
-                current_chunk_sections = [section]
-                current_chunk_tokens = section_tokens
-            else:
-                current_chunk_sections.append(section)
-                current_chunk_tokens += section_tokens
-
-        # Add last chunk
-        if current_chunk_sections:
-            split_point = self._create_chunk_split_point(
-                file_path, current_chunk_sections, current_chunk_tokens
-            )
-            split_points.append(split_point)
-
-        return split_points
+        """Generate split points by size, creating balanced chunks."""
+        total_tokens = sum(feature.tokens for feature in features)
+        chunk_count = ceil(total_tokens / max(self.max_file_size, 1))
+        target = balanced_target(total_tokens, chunk_count)
+        return [
+            self._split_point(file_path, features[start:end], 0.7)
+            for start, end in partition_sections(features, target, self.max_file_size)
+        ]
 
-    def _create_chunk_split_point(
-        self,
-        file_path: str,
-        chunk_sections: list[ModelDict],
-        chunk_tokens: int,
+    def _split_point(
+        self, file_path: str, group: list[SectionFeatures], independence: float
     ) -> SplitPoint:
-        """Create a split point for a size-based chunk."""
-        chunk_heading = self.get_section_str(chunk_sections[0], "heading", "")
-        start_line = self.get_section_int(chunk_sections[0], "start_line", 0)
-        end_line = self.get_section_int(chunk_sections[-1], "end_line", 0)
-
+        """Create a split point covering a run of sections."""
+        heading = group[0].heading
         return SplitPoint(
-            section_heading=chunk_heading,
-            start_line=start_line,
-            end_line=end_line,
-            token_count=chunk_tokens,
-            independence_score=0.7,  # Moderate independence for size-based splits
-            suggested_filename=self.generate_split_filename(file_path, chunk_heading),
+            section_heading=heading,
+            start_line=group[0].start_line,
+            end_line=group[-1].end_line,
+            token_count=sum(feature.tokens for feature in group),
+            independence_score=independence,
+            suggested_filename=self.generate_split_filename(file_path, heading),
         )
 
     async def generate_split_points(
         self,
         file_path: str,
-        content: str,
+        content: str,  # noqa: ARG002
         sections: list[ModelDict],
         strategy: str,
     ) -> list[SplitPoint]:
         """
         Generate specific split points based on strategy.
 
-        Uses analyzer for independence calculations.
+        Section features are computed once and shared by every strategy.
         """
+        features = extract_features(sections, self.count_tokens)
         if strategy == "by_topics":
-            return await self._generate_split_by_topics(file_path, content, sections)
+            return self._generate_split_by_topics(file_path, features)
         elif strategy == "by_sections":
-            return await self._generate_split_by_sections(file_path, content, sections)
+            return self._generate_split_by_sections(file_path, features)
         elif strategy == "by_size":
-            return await self._generate_split_by_size(file_path, sections)
+            return self._generate_split_by_size(file_path, features)
         else:
             return []
 
@@ -566,24 +511,3 @@ def _build_recommendation(
         new_structure=new_structure,
         maintain_dependencies=True,
     )
-
-
-def _normalize_group_sections(
-    group_sections_raw: JsonValue | list[ModelDict],
-) -> list[ModelDict]:
-    """Normalize group sections to a list of dictionaries.
-
-    Args:
-        group_sections_raw: Raw group sections from analyzer
-
-    Returns:
-        Normalized list of section dictionaries
-    """
-    if isinstance(group_sections_raw, list):
-        return [cast(ModelDict, s) for s in group_sections_raw if isinstance(s, dict)]
-    else:
-        return (
-            [cast(ModelDict, group_sections_raw)]
-            if isinstance(group_sections_raw, dict)
-            else []
-        )
@@ -0,0 +1,351 @@
+"""
+Staged Workspace - Copy-on-write file view for refactoring execution.
+
+Refactoring operations read and write through an ``OperationIO``. The direct
+implementation touches disk immediately; ``StagedWorkspace`` keeps every
+write, rename and delete in memory so a failed operation leaves disk
+untouched. A staged workspace is committed as one journaled batch: outputs
+are written to temporary files next to the memory bank and made durable,
+a journal listing every rename and delete is made durable, and only then
+are the renames applied. An interrupted commit is rolled forward from its journal.
+"""
+
+import asyncio
+import json
+import os
+import shutil
+import sys
+from collections.abc import Awaitable
+from pathlib import Path
+from typing import Protocol, cast
+
+from cortex.core.async_file_utils import open_async_text_file
+from cortex.core.file_system import FileSystemManager
+from cortex.core.models import ModelDict, SectionMetadata
+
+JOURNAL_NAME = "journal.json"
+# Written once the journal's removals are done; renames may land after it
+REMOVALS_DONE_NAME = "removals.done"
+MAX_CONCURRENT_STAGE_WRITES = 16
+
+
+class OperationIO(Protocol):
+    """File access used by refactoring operations."""
+
+    async def read_file(self, file_path: Path) -> tuple[str, str]: ...
+
+    async def write_file(self, file_path: Path, content: str) -> str: ...
+
+    def parse_sections(self, content: str) -> list[SectionMetadata]: ...
+
+    def exists(self, path: Path) -> bool: ...
+
+    def is_file(self, path: Path) -> bool: ...
+
+    async def rename(self, source: Path, destination: Path) -> None: ...
+
+    async def delete(self, path: Path) -> None: ...
+
+    async def mkdir(self, path: Path) -> None: ...
+
+
+class DirectIO:
+    """Operation IO that applies every change to disk immediately."""
+
+    def __init__(self, fs_manager: FileSystemManager) -> None:
+        self.fs_manager: FileSystemManager = fs_manager
+
+    async def read_file(self, file_path: Path) -> tuple[str, str]:
+        return await self.fs_manager.read_file(file_path)
+
+    async def write_file(self, file_path: Path, content: str) -> str:
+        return await self.fs_manager.write_file(file_path, content)
+
+    def parse_sections(self, content: str) -> list[SectionMetadata]:
+        return self.fs_manager.parse_sections(content)
+
+    def exists(self, path: Path) -> bool:
+        return path.exists()
+
+    def is_file(self, path: Path) -> bool:
+        return path.is_file()
+
+    async def rename(self, source: Path, destination: Path) -> None:
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        _ = source.rename(destination)
+
+    async def delete(self, path: Path) -> None:
+        if path.is_file():
+            path.unlink()
+        else:
+            shutil.rmtree(path)
+
+    async def mkdir(self, path: Path) -> None:
+        path.mkdir(parents=True, exist_ok=True)
+
+
+class StagedWorkspace:
+    """
+    Copy-on-write view of the project for one refactoring execution.
+
+    Features:
+    - Reads fall through to disk until a path is staged
+    - Writes, renames and deletes are held in memory; writes get the same
+      path and content checks as FileSystemManager.write_file
+    - Directory moves and deletes are expanded to the files beneath them
+    - Journaled commit that never leaves a partial state behind
+    """
+
+    def __init__(self, fs_manager: FileSystemManager) -> None:
+        """
+        Create an empty workspace over the file system manager's project.
+
+        Args:
+            fs_manager: File system manager used for reads and path checks
+        """
+        self.fs_manager: FileSystemManager = fs_manager
+        self._files: dict[Path, str | None] = {}
+        self._created_dirs: set[Path] = set()
+        self._removed_dirs: set[Path] = set()
+
+    @property
+    def written_files(self) -> dict[Path, str]:
+        """Staged file contents by path."""
+        return {path: c for path, c in self._files.items() if c is not None}
+
+    @property
+    def deleted_files(self) -> list[Path]:
+        """Paths staged for deletion."""
+        return [path for path, content in self._files.items() if content is None]
+
+    @property
+    def has_changes(self) -> bool:
+        """Whether anything has been staged."""
+        return bool(self._files or self._created_dirs or self._removed_dirs)
+
+    async def read_file(self, file_path: Path) -> tuple[str, str]:
+        if file_path in self._files:
+            content = self._files[file_path]
+            if content is None:
+                raise FileNotFoundError(file_path)
+            return content, self.fs_manager.compute_hash(content)
+        if self._under_removed_dir(file_path):
+            raise FileNotFoundError(file_path)
+        return await self.fs_manager.read_file(file_path)
+
+    async def write_file(self, file_path: Path, content: str) -> str:
+        self.fs_manager.validate_write(file_path, content)
+        return self._stage(file_path, content)
+
+    def _stage(self, file_path: Path, content: str) -> str:
+        """Stage existing content at a path, checking only the path."""
+        if not self.fs_manager.validate_path(file_path):
+            raise PermissionError(
+                f"Failed to stage '{file_path.name}': path is outside project root"
+            )
+        self._files[file_path] = content
+        return self.fs_manager.compute_hash(content)
+
+    def parse_sections(self, content: str) -> list[SectionMetadata]:
+        return self.fs_manager.parse_sections(content)
+
+    def exists(self, path: Path) -> bool:
+        if path in self._files:
+            return self._files[path] is not None
+        if path in self._created_dirs:
+            return True
+        if any(
+            path in staged.parents
+            for staged, content in self._files.items()
+            if content is not None
+        ):
+            return True
+        return not self._under_removed_dir(path) and path.exists()
+
+    def is_file(self, path: Path) -> bool:
+        if path in self._files:
+            return self._files[path] is not None
+        return not self._under_removed_dir(path) and path.is_file()
+
+    async def rename(self, source: Path, destination: Path) -> None:
+        if self.is_file(source):
+            content, _ = await self.read_file(source)
+            _ = self._stage(destination, content)
+            self._files[source] = None
+            return
+
+        for file_path in self._files_under(source):
+            content, _ = await self.read_file(file_path)
+            relative = file_path.relative_to(source)
+            _ = self._stage(destination / relative, content)
+            self._files[file_path] = None
+        self._created_dirs.add(destination)
+        self._removed_dirs.add(source)
+
+    async def delete(self, path: Path) -> None:
+        if self.is_file(path):
+            self._files[path] = None
+            return
+        for file_path in self._files_under(path):
+            self._files[file_path] = None
+        self._removed_dirs.add(path)
+
+    async def mkdir(self, path: Path) -> None:
+        self._created_dirs.add(path)
+        self._removed_dirs.discard(path)
+
+    async def commit(self, staging_dir: Path) -> None:
+        """
+        Apply all staged changes as one journaled batch.
+
+        The file locks of every written or deleted file are held while the
+        journal is written and applied, as FileSystemManager.write_file
+        holds them for a single write.
+
+        Args:
+            staging_dir: Empty directory on the same file system as the
+                project, used for temporary outputs and the journal
+        """
+        staging_dir.mkdir(parents=True, exist_ok=True)
+        writes = list(self.written_files.items())
+        renames = [
+            (staging_dir / f"{position}.tmp", target)
+            for position, (target, _) in enumerate(writes)
+        ]
+
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_STAGE_WRITES)
+
+        async def stage(temp_path: Path, content: str) -> None:
+            async with semaphore:
+                async with open_async_text_file(temp_path, "w", "utf-8") as f:
+                    _ = await f.write(content)
+                await asyncio.to_thread(_fsync_file, temp_path)
+
+        staged: list[Awaitable[None]] = [
+            stage(temp_path, content)
+            for (temp_path, _), (_, content) in zip(renames, writes, strict=True)
+        ]
+        _ = await asyncio.gather(*staged)
+        # The journal must never point at outputs a power loss could truncate
+        _fsync_directory(staging_dir)
+
+        journal: ModelDict = {
+            "mkdirs": [str(path) for path in sorted(self._created_dirs)],
+            "renames": [[str(temp), str(target)] for temp, target in renames],
+            "deletes": [str(path) for path in self.deleted_files],
+            "remove_dirs": [str(path) for path in sorted(self._removed_dirs)],
+        }
+        acquired: list[Path] = []
+        try:
+            for lock_path in sorted(map(self.fs_manager.lock_path_for, self._files)):
+                await self.fs_manager.acquire_lock(lock_path)
+                acquired.append(lock_path)
+            _write_journal(staging_dir / JOURNAL_NAME, journal)
+            apply_journal(staging_dir)
+        finally:
+            for lock_path in acquired:
+                await self.fs_manager.release_lock(lock_path)
+
+    def _under_removed_dir(self, path: Path) -> bool:
+        return any(removed in path.parents for removed in self._removed_dirs)
+
+    def _files_under(self, directory: Path) -> list[Path]:
+        """Files beneath a directory, on disk or staged."""
+        found: set[Path] = set()
+        if directory.is_dir() and not self._under_removed_dir(directory):
+            found.update(
+                path
+                for path in directory.rglob("*")
+                if path.is_file() and not self._under_removed_dir(path)
+            )
+        found.update(path for path in self._files if directory in path.parents)
+        return sorted(path for path in found if self.is_file(path))
+
+
+def _fsync_file(path: Path) -> None:
+    """Flush a written file's data to disk."""
+    with open(path, "rb") as f:
+        os.fsync(f.fileno())
+
+
+def _fsync_directory(directory: Path) -> None:
+    """Flush a directory's entries to disk (not supported on Windows)."""
+    if sys.platform == "win32":
+        return
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _write_durably(path: Path, content: str) -> None:
+    """Write a file atomically and make it durable."""
+    temp_path = path.with_suffix(".tmp")
+    with open(temp_path, "w", encoding="utf-8") as f:
+        _ = f.write(content)
+        f.flush()
+        os.fsync(f.fileno())
+    _ = temp_path.replace(path)
+    _fsync_directory(path.parent)
+
+
+def _write_journal(journal_path: Path, journal: ModelDict) -> None:
+    """Write the commit journal durably and atomically."""
+    _write_durably(journal_path, json.dumps(journal))
+
+
+def apply_journal(staging_dir: Path) -> None:
+    """
+    Apply (or finish applying) the commit journal in a staging directory.
+
+    An interrupted commit can be replayed. Removals run first, since staged
+    outputs may land inside a removed directory, and are marked done in the
+    staging directory before any rename; a replay past that mark skips them
+    so it never deletes outputs an earlier attempt already installed.
+
+    Args:
+        staging_dir: Staging directory containing the journal
+    """
+    journal_path = staging_dir / JOURNAL_NAME
+    with open(journal_path, encoding="utf-8") as f:
+        journal = cast(dict[str, list[str] | list[list[str]]], json.load(f))
+
+    removals_done = staging_dir / REMOVALS_DONE_NAME
+    if not removals_done.exists():
+        for directory in cast(list[str], journal.get("remove_dirs", [])):
+            shutil.rmtree(directory, ignore_errors=True)
+        for path in cast(list[str], journal.get("deletes", [])):
+            Path(path).unlink(missing_ok=True)
+        _write_durably(removals_done, "")
+    for directory in cast(list[str], journal.get("mkdirs", [])):
+        Path(directory).mkdir(parents=True, exist_ok=True)
+    for temp, target in cast(list[list[str]], journal.get("renames", [])):
+        temp_path, target_path = Path(temp), Path(target)
+        if temp_path.exists():
+            target_path.parent.mkdir(parents=True, exist_ok=True)
+            _ = temp_path.replace(target_path)
+
+    shutil.rmtree(staging_dir, ignore_errors=True)
+
+
+def recover_staged_commits(staging_root: Path) -> int:
+    """
+    Roll forward interrupted commits and discard abandoned staging areas.
+
+    Args:
+        staging_root: Directory holding one staging directory per execution
+
+    Returns:
+        Number of commits rolled forward
+    """
+    if not staging_root.is_dir():
+        return 0
+    recovered = 0
+    for staging_dir in sorted(staging_root.iterdir()):
+        if (staging_dir / JOURNAL_NAME).exists():
+            apply_journal(staging_dir)
+            recovered += 1
+        else:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+    return recovered
@@ -0,0 +1,260 @@
+"""
+Suggestion Pipeline - One shared analysis pass for all refactoring suggestions.
+
+The consolidation detector, split recommender and reorganization planner
+used to each read every markdown file and parse it themselves. The pipeline
+loads the corpus once, parses sections and counts tokens once, loads
+the structure data and dependency graph once, and then runs the three
+generators concurrently over the shared analysis.
+
+Both the corpus analysis and the generated suggestions are cached per corpus
+version. The version is a fingerprint of every markdown file's path, size and
+modification time, so an unchanged memory bank is never re-read.
+"""
+
+import asyncio
+import hashlib
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+from cortex.core.async_file_utils import open_async_text_file
+from cortex.core.models import ModelDict
+
+from .consolidation_detector import ConsolidationDetector, ConsolidationOpportunity
+from .models import (
+    DependencyGraphInput,
+    MemoryBankStructureData,
+    ReorganizationPlanModel,
+)
+from .reorganization_planner import ReorganizationPlanner
+from .split_recommender import SplitRecommendation, SplitRecommender
+
+MAX_CONCURRENT_READS = 16
+
+StructureInputs = tuple[MemoryBankStructureData, DependencyGraphInput]
+StructureLoader = Callable[[], Awaitable[StructureInputs]]
+
+
+@dataclass(frozen=True)
+class SuggestionCorpus:
+    """Memory bank files and the analysis shared by all generators."""
+
+    version: str
+    contents: dict[str, str]
+    sections: dict[str, list[tuple[str, str]]]
+    structures: dict[str, list[ModelDict]]
+    token_counts: dict[str, int]
+
+
+@dataclass(frozen=True)
+class SuggestionParameters:
+    """Generator settings that make up the result cache key."""
+
+    min_similarity: float = 0.80
+    max_file_size: int = 2500
+    goal: str = "dependency_depth"
+
+
+@dataclass
+class SuggestionBatch:
+    """Suggestions of every type generated from one corpus version."""
+
+    corpus_version: str
+    consolidation: list[ConsolidationOpportunity]
+    splits: list[SplitRecommendation]
+    reorganization: ReorganizationPlanModel | None
+
+
+class SuggestionPipeline:
+    """
+    Generate consolidation, split and reorganization suggestions in one pass.
+
+    Features:
+    - Single concurrent read of the corpus per version
+    - Sections, file structures and token counts computed once
+    - Structure data and dependency graph loaded once per version
+    - Generators fanned out concurrently
+    - Results cached per corpus version and parameters
+    """
+
+    def __init__(
+        self,
+        memory_bank_path: Path,
+        consolidation_detector: ConsolidationDetector,
+        split_recommender: SplitRecommender,
+        reorganization_planner: ReorganizationPlanner,
+    ):
+        """
+        Initialize the pipeline.
+
+        Args:
+            memory_bank_path: Path to Memory Bank directory
+            consolidation_detector: Detector for consolidation opportunities
+            split_recommender: Recommender for file splits
+            reorganization_planner: Planner for reorganizations
+        """
+        self.memory_bank_path: Path = Path(memory_bank_path)
+        self.consolidation_detector: ConsolidationDetector = consolidation_detector
+        self.split_recommender: SplitRecommender = split_recommender
+        self.reorganization_planner: ReorganizationPlanner = reorganization_planner
+
+        self._corpus: SuggestionCorpus | None = None
+        self._structure: StructureInputs | None = None
+        self._results: dict[tuple[SuggestionParameters, bool], SuggestionBatch] = {}
+        self._lock: asyncio.Lock = asyncio.Lock()
+
+    def corpus_version(self) -> str:
+        """
+        Fingerprint the markdown files of the memory bank.
+
+        Returns:
+            Hex digest over every file's path, size and modification time
+        """
+        digest = hashlib.sha256()
+        for file_path in self._markdown_files():
+            stat = file_path.stat()
+            digest.update(f"{file_path}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode())
+        return digest.hexdigest()
+
+    async def load_corpus(self) -> SuggestionCorpus:
+        """
+        Load and analyze the corpus, reusing the cached analysis if unchanged.
+
+        Returns:
+            Corpus analysis for the current version
+        """
+        version = self.corpus_version()
+        if self._corpus is not None and self._corpus.version == version:
+            return self._corpus
+
+        contents = await self._read_corpus()
+        analyzer = self.split_recommender.analyzer
+        detector = self.consolidation_detector
+        self._corpus = SuggestionCorpus(
+            version=version,
+            contents=contents,
+            sections={
+                path: detector.parse_sections(content)
+                for path, content in contents.items()
+            },
+            structures={
+                path: analyzer.parse_file_structure(content)
+                for path, content in contents.items()
+            },
+            token_counts={
+                path: self.split_recommender.count_tokens(content)
+                for path, content in contents.items()
+            },
+        )
+        self._structure = None
+        self._results.clear()
+        return self._corpus
+
+    async def generate(
+        self,
+        parameters: SuggestionParameters | None = None,
+        load_structure: StructureLoader | None = None,
+    ) -> SuggestionBatch:
+        """
+        Generate suggestions of every type for the current corpus.
+
+        Args:
+            parameters: Generator settings (defaults if None)
+            load_structure: Loader for structure data and dependency graph;
+                reorganization is skipped when None
+
+        Returns:
+            Suggestions of every type, cached per corpus version
+        """
+        parameters = parameters or SuggestionParameters()
+        async with self._lock:
+            corpus = await self.load_corpus()
+            key = (parameters, load_structure is not None)
+            cached = self._results.get(key)
+            if cached is not None:
+                return cached
+
+            consolidation, splits, reorganization = await asyncio.gather(
+                self._detect_consolidation(corpus, parameters),
+                self._recommend_splits(corpus, parameters),
+                self._plan_reorganization(parameters, load_structure),
+            )
+            batch = SuggestionBatch(
+                corpus_version=corpus.version,
+                consolidation=consolidation,
+                splits=splits,
+                reorganization=reorganization,
+            )
+            self._results[key] = batch
+            return batch
+
+    def invalidate(self) -> None:
+        """Drop the cached corpus analysis and results."""
+        self._corpus = None
+        self._structure = None
+        self._results.clear()
+
+    async def _detect_consolidation(
+        self, corpus: SuggestionCorpus, parameters: SuggestionParameters
+    ) -> list[ConsolidationOpportunity]:
+        """Run the consolidation detector over the shared sections."""
+        self.consolidation_detector.min_similarity = parameters.min_similarity
+        return await self.consolidation_detector.detect_in_contents(
+            corpus.contents, corpus.sections
+        )
+
+    async def _recommend_splits(
+        self, corpus: SuggestionCorpus, parameters: SuggestionParameters
+    ) -> list[SplitRecommendation]:
+        """Run the split recommender over the shared structures."""
+        self.split_recommender.max_file_size = parameters.max_file_size
+        return await self.split_recommender.suggest_file_splits(
+            list(corpus.contents),
+            corpus.contents,
+            corpus.token_counts,
+            corpus.structures,
+        )
+
+    async def _plan_reorganization(
+        self,
+        parameters: SuggestionParameters,
+        load_structure: StructureLoader | None,
+    ) -> ReorganizationPlanModel | None:
+        """Run the reorganization planner over the shared structure graph."""
+        if load_structure is None:
+            return None
+        if self._structure is None:
+            self._structure = await load_structure()
+        structure_data, dependency_graph = self._structure
+        return await self.reorganization_planner.create_reorganization_plan(
+            optimize_for=parameters.goal,
+            structure_data=structure_data,
+            dependency_graph=dependency_graph,
+        )
+
+    def _markdown_files(self) -> list[Path]:
+        """Markdown files of the memory bank in a stable order."""
+        if not self.memory_bank_path.exists():
+            return []
+        return sorted(
+            path for path in self.memory_bank_path.rglob("*.md") if path.is_file()
+        )
+
+    async def _read_corpus(self) -> dict[str, str]:
+        """Read every markdown file concurrently, skipping unreadable ones."""
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_READS)
+
+        async def read(file_path: Path) -> tuple[str, str | None]:
+            async with semaphore:
+                try:
+                    async with open_async_text_file(file_path, "r", "utf-8") as f:
+                        return str(file_path), await f.read()
+                except (OSError, UnicodeDecodeError) as e:
+                    from cortex.core.logging_config import logger
+
+                    logger.warning(f"Failed to read file {file_path}: {e}")
+                    return str(file_path), None
+
+        results = await asyncio.gather(*(read(path) for path in self._markdown_files()))
+        return {path: content for path, content in results if content is not None}
@@ -9,10 +9,280 @@ global state, it's an acceptable exception as:
 
 For proper dependency injection in your own code, use ManagerRegistry instead
 of relying on global state.
+
+Tools can be registered lazily from a manifest of their schemas: the server
+lists them straight away and imports a tool's module on its first call.
+Prompt modules can likewise be deferred until a client first asks for prompts,
+and background work can be started once a client completes the handshake.
+Every tool call is traced (see cortex.core.tracing).
 """
 
+import asyncio
+import importlib
+import logging
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any, cast
+
 from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp.exceptions import ToolError
+from mcp.server.fastmcp.server import Context
+from mcp.server.fastmcp.tools import Tool
+from mcp.server.fastmcp.tools.tool_manager import ToolManager
+from mcp.server.fastmcp.utilities.func_metadata import ArgModelBase, FuncMetadata
+from mcp.types import (
+    ContentBlock,
+    GetPromptResult,
+    InitializedNotification,
+    ToolAnnotations,
+)
+from mcp.types import Prompt as MCPPrompt
+from pydantic import Field
+
+logger = logging.getLogger(__name__)
+
+# Request _meta key asking for a cProfile capture of a tool call
+PROFILE_META_KEY = "cortex/profile"
+
+
+class LazyTool(Tool):
+    """Tool listed from its manifest schema and imported on first call."""
+
+    module: str = Field(description="Module defining the tool function")
+    function: str = Field(description="Name of the tool function in its module")
+    loader: Callable[[str], Tool] = Field(exclude=True)
+
+    async def run(
+        self,
+        arguments: dict[str, Any],
+        context: Context[Any, Any, Any] | None = None,
+        convert_result: bool = False,
+    ) -> Any:
+        """Import the tool module, then run the real tool."""
+        tool = self.loader(self.name)
+        return await tool.run(arguments, context=context, convert_result=convert_result)
+
+
+class CortexMCP(FastMCP[Any]):
+    """
+    FastMCP server with deferred tool and prompt imports.
+
+    Features:
+    - Lazy tools listed from manifest schemas
+    - Tool modules imported on first invocation, one module at a time
+    - Prompt modules imported on the first prompt request
+    - Background hooks started after the initialize handshake
+    - Every tool call traced, and profiled when the request's _meta asks
+    """
+
+    def __init__(self, name: str):
+        """
+        Create the server.
+
+        Args:
+            name: Server name
+        """
+        # Importing a lazily listed module re-registers its tools by design
+        super().__init__(name, warn_on_duplicate_tools=False)
+        self._deferred_prompt_modules: list[str] = []
+        self._initialized_hooks: list[Callable[[], Awaitable[None]]] = []
+        self._background_tasks: set[asyncio.Task[None]] = set()
+        self._mcp_server.notification_handlers[InitializedNotification] = (
+            self._on_initialized
+        )
+
+    def add_lazy_tool(
+        self,
+        name: str,
+        module: str,
+        function: str,
+        description: str,
+        parameters: dict[str, Any],
+        output_schema: dict[str, Any] | None = None,
+        title: str | None = None,
+        annotations: ToolAnnotations | None = None,
+    ) -> None:
+        """
+        List a tool whose module is imported on its first call.
+
+        Args:
+            name: Tool name
+            module: Module defining the tool function
+            function: Name of the tool function in its module
+            description: Tool description
+            parameters: JSON schema of the tool arguments
+            output_schema: JSON schema of the structured output, if any
+            title: Human-readable title
+            annotations: Tool annotations
+        """
+        tool = LazyTool(
+            fn=_not_loaded,
+            name=name,
+            title=title,
+            description=description,
+            parameters=parameters,
+            fn_metadata=FuncMetadata(
+                arg_model=ArgModelBase, output_schema=output_schema
+            ),
+            is_async=True,
+            context_kwarg=None,
+            annotations=annotations,
+            module=module,
+            function=function,
+            loader=self.load_tool,
+        )
+        tools = [t for t in self._tool_manager.list_tools() if t.name != name]
+        self._replace_tools([*tools, tool])
+
+    def load_tool(self, name: str) -> Tool:
+        """
+        Import a lazily listed tool's module and return the real tool.
+
+        Every lazy tool of the same module is replaced in the same step. If
+        the import fails, the lazy tools stay listed so a later call retries.
+
+        Args:
+            name: Tool name
+
+        Returns:
+            The registered tool
+
+        Raises:
+            ToolError: If the tool is unknown or its module cannot provide it
+        """
+        lazy = self._tool_manager.get_tool(name)
+        if lazy is None:
+            raise ToolError(f"Unknown tool: {name}")
+        if not isinstance(lazy, LazyTool):
+            return lazy
+
+        previous = self._tool_manager.list_tools()
+        siblings = [
+            t for t in previous if isinstance(t, LazyTool) and t.module == lazy.module
+        ]
+        self._replace_tools([t for t in previous if not any(t is s for s in siblings)])
+        try:
+            module = importlib.import_module(lazy.module)
+            for sibling in siblings:
+                if self._tool_manager.get_tool(sibling.name) is not None:
+                    continue
+                # The module was imported earlier, while its tools were lazy
+                fn = cast(Callable[..., Any], getattr(module, sibling.function))
+                _ = self._tool_manager.add_tool(
+                    fn,
+                    name=sibling.name,
+                    title=sibling.title,
+                    description=sibling.description,
+                    annotations=sibling.annotations,
+                )
+        except Exception as e:
+            self._replace_tools(previous)
+            raise ToolError(f"Failed to load tool {name}: {e}") from e
+
+        tool = self._tool_manager.get_tool(name)
+        if tool is None:
+            raise ToolError(f"Tool {name} is not defined in {lazy.module}")
+        return tool
+
+    def is_loaded(self, name: str) -> bool:
+        """Check whether a tool is registered and its module imported."""
+        tool = self._tool_manager.get_tool(name)
+        return tool is not None and not isinstance(tool, LazyTool)
+
+    def registered_tools(self) -> Sequence[Tool]:
+        """Get the registered tools, lazy placeholders included."""
+        return self._tool_manager.list_tools()
+
+    def defer_prompts(self, modules: Sequence[str]) -> None:
+        """
+        Import prompt modules on the first prompt request instead of now.
+
+        Args:
+            modules: Modules registering prompts as an import side effect
+        """
+        self._deferred_prompt_modules.extend(modules)
+
+    async def list_prompts(self) -> list[MCPPrompt]:
+        """List all available prompts, importing deferred prompt modules."""
+        self._load_deferred_prompts()
+        return await super().list_prompts()
+
+    async def get_prompt(
+        self, name: str, arguments: dict[str, Any] | None = None
+    ) -> GetPromptResult:
+        """Get a prompt by name, importing deferred prompt modules."""
+        self._load_deferred_prompts()
+        return await super().get_prompt(name, arguments)
+
+    async def call_tool(
+        self, name: str, arguments: dict[str, Any]
+    ) -> Sequence[ContentBlock] | dict[str, Any]:
+        """
+        Call a tool by name with arguments, recording a trace of the call.
+
+        Args:
+            name: Tool name
+            arguments: Tool arguments
+
+        Returns:
+            Converted tool result
+        """
+        # Imported here so that importing the server stays free of cortex.core
+        from cortex.core.tracing import get_tracer
+
+        with get_tracer().trace_tool(name, profile=self._profile_requested()):
+            return await super().call_tool(name, arguments)
+
+    def on_initialized(self, hook: Callable[[], Awaitable[None]]) -> None:
+        """
+        Run a coroutine in the background after each initialize handshake.
+
+        The hook runs as a task so it never delays the client's first request;
+        failures are logged and otherwise ignored.
+
+        Args:
+            hook: Coroutine function to run
+        """
+        self._initialized_hooks.append(hook)
+
+    async def _on_initialized(self, _notification: InitializedNotification) -> None:
+        for hook in self._initialized_hooks:
+            task = asyncio.create_task(self._run_hook(hook))
+            # Keep a reference so the task is not garbage collected mid-run
+            self._background_tasks.add(task)
+            task.add_done_callback(self._background_tasks.discard)
+
+    async def _run_hook(self, hook: Callable[[], Awaitable[None]]) -> None:
+        try:
+            await hook()
+        except Exception:
+            logger.exception("Initialized hook failed")
+
+    def _profile_requested(self) -> bool:
+        """Check whether the current request's _meta asks for a profile."""
+        try:
+            meta = self._mcp_server.request_context.meta
+        except LookupError:
+            return False
+        extra = meta.model_extra if meta is not None else None
+        return bool(extra and extra.get(PROFILE_META_KEY))
+
+    def _load_deferred_prompts(self) -> None:
+        modules, self._deferred_prompt_modules = self._deferred_prompt_modules, []
+        for module in modules:
+            _ = importlib.import_module(module)
+
+    def _replace_tools(self, tools: list[Tool]) -> None:
+        self._tool_manager = ToolManager(
+            tools=tools,
+            warn_on_duplicate_tools=self.settings.warn_on_duplicate_tools,
+        )
+
+
+def _not_loaded(**_kwargs: Any) -> None:
+    """Placeholder function of lazy tools; LazyTool.run never calls it."""
+    raise ToolError("Tool module is not loaded")
+
 
 # FastMCP server instance (framework requirement)
 # This is an acceptable exception to the no-global-state rule
-mcp = FastMCP("cortex")
+mcp = CortexMCP("cortex")
@@ -24,39 +24,112 @@ Modules:
 - prompts: MCP prompt templates for one-time operations (7 prompts)
 
 Total: 54 tools + 7 prompts
+
+Importing this package does not import the tool modules; call
+``register_tools()`` to register them (lazily from manifest.py by default).
 """
 
-# Import all tool modules to register their decorators
-from . import (
-    analysis_operations,  # noqa: F401
-    configuration_operations,  # noqa: F401
-    connection_health,  # noqa: F401
-    file_operations,  # noqa: F401
-    markdown_operations,  # noqa: F401
-    phase1_foundation_dependency,  # noqa: F401
-    phase1_foundation_rollback,  # noqa: F401
-    phase1_foundation_stats,  # noqa: F401
-    phase1_foundation_version,  # noqa: F401
-    phase2_linking,  # noqa: F401
-    phase3_validation,  # noqa: F401
-    phase4_optimization,  # noqa: F401
-    phase5_analysis,  # noqa: F401
-    phase5_execution,  # noqa: F401
-    phase5_refactoring,  # noqa: F401
-    phase8_structure,  # noqa: F401
-    pre_commit_tools,  # noqa: F401
-    prompts,  # noqa: F401
-    refactoring_operations,  # noqa: F401
-    roadmap_corruption,  # noqa: F401
-    rules_operations,  # noqa: F401
-    synapse_prompts,  # noqa: F401  # Dynamic Synapse prompts registration
-    synapse_tools,  # noqa: F401
-    validation_operations,  # noqa: F401
+import importlib
+import os
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from . import (
+        analysis_operations,
+        configuration_operations,
+        connection_health,
+        file_operations,
+        markdown_operations,
+        phase1_foundation_dependency,
+        phase1_foundation_rollback,
+        phase1_foundation_stats,
+        phase1_foundation_version,
+        phase2_linking,
+        phase3_validation,
+        phase4_optimization,
+        phase5_analysis,
+        phase5_execution,
+        phase5_refactoring,
+        phase8_structure,
+        pre_commit_tools,
+        prompts,
+        refactoring_operations,
+        roadmap_corruption,
+        rules_operations,
+        synapse_prompts,
+        synapse_tools,
+        validation_operations,
+    )
+
+# Modules registering @mcp.tool() functions when imported
+TOOL_MODULES: tuple[str, ...] = (
+    "analysis_operations",
+    "configuration_operations",
+    "connection_health",
+    "file_operations",
+    "markdown_operations",
+    "phase1_foundation_dependency",
+    "phase1_foundation_rollback",
+    "phase1_foundation_stats",
+    "phase1_foundation_version",
+    "phase2_linking",
+    "phase3_validation",
+    "phase4_optimization",
+    "phase5_analysis",
+    "phase5_execution",
+    "phase5_refactoring",
+    "phase8_structure",
+    "pre_commit_tools",
+    "refactoring_operations",
+    "roadmap_corruption",
+    "rules_operations",
+    "synapse_tools",
+    "validation_operations",
 )
 
-# Explicitly reference synapse_prompts to satisfy type checker
-# (imported for side effects)
-_ = synapse_prompts
+# Modules registering prompts when imported (synapse_prompts scans the disk)
+PROMPT_MODULES: tuple[str, ...] = ("prompts", "synapse_prompts")
+
+# Set to 1 to import every tool module at startup instead of using the manifest
+EAGER_TOOLS_ENV = "CORTEX_EAGER_TOOLS"
+
+
+def register_tools(lazy: bool | None = None) -> bool:
+    """
+    Register all MCP tools and prompts with the server.
+
+    In lazy mode tools are listed from the tool manifest and their modules
+    are imported on first call, and prompt modules are imported on the first
+    prompt request. Eager mode imports everything now, which is also the
+    fallback when the manifest is missing, invalid or stale.
+
+    Args:
+        lazy: Use lazy registration; None reads CORTEX_EAGER_TOOLS
+
+    Returns:
+        True if tools were registered lazily
+    """
+    from cortex.server import mcp
+
+    if lazy is None:
+        lazy = os.environ.get(EAGER_TOOLS_ENV, "").lower() not in ("1", "true", "yes")
+    if lazy:
+        from cortex.tools.manifest import register_from_manifest
+
+        if register_from_manifest(mcp):
+            mcp.defer_prompts([f"{__name__}.{name}" for name in PROMPT_MODULES])
+            return True
+    for name in (*TOOL_MODULES, *PROMPT_MODULES):
+        _ = importlib.import_module(f"{__name__}.{name}")
+    return False
+
+
+def __getattr__(name: str) -> object:
+    # Keep ``cortex.tools.<module>`` attribute access working without imports
+    if name in TOOL_MODULES or name in PROMPT_MODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "analysis_operations",
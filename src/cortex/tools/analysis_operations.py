@@ -73,9 +73,10 @@ async def analyze_usage_patterns(
 
 async def analyze_structure(structure_analyzer: StructureAnalyzer) -> str:
     """Analyze structure and return JSON response."""
-    organization = await structure_analyzer.analyze_file_organization()
-    anti_patterns = await structure_analyzer.detect_anti_patterns()
-    complexity = await structure_analyzer.measure_complexity_metrics()
+    async with structure_analyzer.analysis_session():
+        organization = await structure_analyzer.analyze_file_organization()
+        anti_patterns = await structure_analyzer.detect_anti_patterns()
+        complexity = await structure_analyzer.measure_complexity_metrics()
 
     analysis = {
         "organization": organization.model_dump(mode="json"),
@@ -1,16 +1,19 @@
-"""MCP Connection Health Monitoring Tool.
+"""MCP Connection Health Monitoring Tools.
 
-This module provides tools for monitoring MCP connection health and stability.
+This module provides tools for monitoring MCP connection health and stability,
+and for inspecting where tool calls spend their time.
 """
 
 import json
 
 from cortex.core.mcp_stability import check_connection_health
+from cortex.core.tracing import get_tracer
+from cortex.managers.warmup import get_warmup_progress
 from cortex.server import mcp
 
 
 @mcp.tool()
-async def check_mcp_connection_health() -> str:
+async def check_mcp_connection_health(include_projects: bool = False) -> str:
     """Check MCP connection health and resource utilization.
 
     Returns connection health metrics including:
@@ -19,17 +22,73 @@ async def check_mcp_connection_health() -> str:
     - Maximum allowed concurrent operations
     - Resource utilization percentage
     - Available semaphore slots
+    - Per cost class concurrency pools with queue depth and wait times
+    - Single-flight counters: executions and duplicate calls that shared them
+    - Manager pool: number and estimated memory of the projects whose
+      managers are kept in memory, the pool bounds and evictions by reason;
+      with include_projects, each project's root, memory and idle time
+    - Progress of the background manager warm-up started after the
+      initialize handshake (null if no warm-up was started)
+
+    Args:
+        include_projects: List each pooled project with its root path. Off
+            by default: a server shared over HTTP pools other clients'
+            projects, whose paths should not be disclosed to every caller.
 
     Returns:
-        JSON string with health metrics:
+        JSON string with health metrics (manager_pool.pooled is empty
+        unless include_projects is set):
         {
           "status": "success",
           "health": {
             "healthy": true,
             "concurrent_operations": 2,
-            "max_concurrent": 5,
-            "semaphore_available": 3,
-            "utilization_percent": 40.0
+            "max_concurrent": 11,
+            "semaphore_available": 9,
+            "utilization_percent": 18.2,
+            "queued_operations": 0,
+            "pools": [
+              {
+                "cost_class": "fast",
+                "max_concurrent": 4,
+                "active": 1,
+                "queued": 0,
+                "max_queue_depth": 2,
+                "completed_waits": 57,
+                "avg_wait_ms": 0.8,
+                "max_wait_ms": 41.2
+              }
+            ],
+            "single_flight": {
+              "executions": 14,
+              "duplicates_saved": 5,
+              "in_flight": 0
+            },
+            "manager_pool": {
+              "projects": 1,
+              "max_projects": 16,
+              "idle_timeout_seconds": 1800.0,
+              "estimated_bytes": 1046575,
+              "memory_limit_bytes": 1073741824,
+              "evictions": {"idle": 2},
+              "pooled": [
+                {
+                  "project_root": "/path/to/project",
+                  "estimated_bytes": 1046575,
+                  "idle_seconds": 12.5,
+                  "initialized_managers": 9
+                }
+              ]
+            }
+          },
+          "warmup": {
+            "project_root": "/path/to/project",
+            "state": "running",
+            "steps_total": 31,
+            "steps_completed": 12,
+            "current_step": "context_optimizer",
+            "failed_steps": {},
+            "elapsed_seconds": 0.42
           }
         }
 
@@ -40,18 +99,110 @@ async def check_mcp_connection_health() -> str:
           "health": {
             "healthy": true,
             "concurrent_operations": 1,
-            "max_concurrent": 5,
-            "semaphore_available": 4,
-            "utilization_percent": 20.0
-          }
+            "max_concurrent": 11,
+            "semaphore_available": 10,
+            "utilization_percent": 9.1,
+            "queued_operations": 0,
+            "pools": [...],
+            "single_flight": {...},
+            "manager_pool": {...}
+          },
+          "warmup": null
         }
     """
     try:
-        health = await check_connection_health()
+        health = await check_connection_health(include_projects)
+        warmup = get_warmup_progress()
         return json.dumps(
             {
                 "status": "success",
                 "health": health.model_dump(),
+                "warmup": warmup.model_dump() if warmup is not None else None,
+            },
+            indent=2,
+        )
+    except Exception as e:
+        return json.dumps(
+            {
+                "status": "error",
+                "error": str(e),
+                "error_type": type(e).__name__,
+            },
+            indent=2,
+        )
+
+
+@mcp.tool()
+async def get_tool_performance(
+    tool_name: str | None = None,
+    recent_traces: int = 3,
+    profile_next_call: str | None = None,
+) -> str:
+    """Report tool call latency percentiles and recent call traces.
+
+    Every tool call is traced. Spans time the work inside a call: scheduler
+    queueing, rate limiter waits, file reads and writes, token counting and
+    relevance scoring. Latencies are percentiles over the most recent calls.
+
+    Args:
+        tool_name: Only report this tool's latency and traces (default: all)
+        recent_traces: Number of most recent traces to include, with spans
+        profile_next_call: Capture the next call of this tool with cProfile;
+            its trace then includes the hottest functions
+
+    Returns:
+        JSON string with latency statistics:
+        {
+          "status": "success",
+          "tools": [
+            {"name": "load_context", "count": 12, "p50_ms": 84.1,
+             "p95_ms": 210.5, "max_ms": 231.0}
+          ],
+          "spans": [
+            {"name": "fs.read_file", "count": 96, "p50_ms": 1.2,
+             "p95_ms": 4.8, "max_ms": 9.3}
+          ],
+          "recent_traces": [
+            {
+              "tool": "load_context",
+              "started_at": "2026-01-01T12:00:00+00:00",
+              "duration_ms": 91.7,
+              "error": null,
+              "spans": [
+                {"span_id": 1, "parent_id": null, "name": "fs.read_file",
+                 "start_ms": 3.1, "duration_ms": 1.4, "error": null}
+              ],
+              "dropped_spans": 0,
+              "profile": null
+            }
+          ],
+          "profile_armed": null
+        }
+
+    Example:
+        >>> get_tool_performance(tool_name="validate", recent_traces=0)
+        {
+          "status": "success",
+          "tools": [{"name": "validate", "count": 4, ...}],
+          "spans": [...],
+          "recent_traces": [],
+          "profile_armed": null
+        }
+    """
+    try:
+        tracer = get_tracer()
+        if profile_next_call:
+            tracer.request_profile(profile_next_call)
+        return json.dumps(
+            {
+                "status": "success",
+                "tools": [s.model_dump() for s in tracer.tool_latency(tool_name)],
+                "spans": [s.model_dump() for s in tracer.span_latency()],
+                "recent_traces": [
+                    t.model_dump()
+                    for t in tracer.recent_traces(tool_name, limit=recent_traces)
+                ],
+                "profile_armed": profile_next_call,
             },
             indent=2,
         )
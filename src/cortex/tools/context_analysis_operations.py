@@ -3,6 +3,10 @@ Context Analysis Operations
 
 This module provides tools to analyze load_context effectiveness
 and store statistics for optimization.
+
+The statistics file keeps, per session log, a watermark of the bytes
+already analyzed, so each analysis only reads calls appended since the
+previous one instead of reprocessing every log.
 """
 
 import json
@@ -13,11 +17,15 @@ from typing import cast
 from cortex.core.models import JsonDict, JsonValue, ModelDict
 from cortex.core.path_resolver import CortexResourceType, get_cortex_path
 from cortex.core.session_logger import (
+    LEGACY_SESSION_LOG_SUFFIX,
     LoadContextLogEntry,
+    flush_session_logs,
     get_session_id,
-    get_session_log_path,
+    get_session_log_paths,
     list_session_logs,
     read_session_log,
+    read_session_log_entries,
+    session_id_from_log_path,
 )
 from cortex.tools.models import (
     ContextInsights,
@@ -430,23 +438,67 @@ def _calculate_session_stats(
     )
 
 
-def _update_global_stats(
-    project_root: Path, session_id: str, entries: list[ContextUsageEntry]
-) -> tuple[ContextUsageStatistics, int]:
-    """Update global statistics with new session entries. Returns
-    (stats, new_entries_count)."""
+def _read_unanalyzed_calls(
+    log_path: Path, stats: ContextUsageStatistics, known_sessions: set[str]
+) -> tuple[str, list[LoadContextLogEntry]]:
+    """Read the calls of a session log not yet in the statistics.
+
+    Advances the log's watermark past the calls returned. Legacy JSON logs
+    are read whole, once.
+
+    Returns:
+        Tuple of (session ID, unanalyzed calls)
+    """
+    name = log_path.name
+    if log_path.suffix == LEGACY_SESSION_LOG_SUFFIX:
+        session_log = read_session_log(log_path)
+        stats.log_watermarks[name] = log_path.stat().st_size
+        if session_log is None or session_log.session_id in known_sessions:
+            return session_id_from_log_path(log_path), []
+        return session_log.session_id, session_log.load_context_calls
+
+    session_id = session_id_from_log_path(log_path)
+    watermark = stats.log_watermarks.get(name, 0)
+    if log_path.stat().st_size <= watermark:
+        return session_id, []
+    calls, stats.log_watermarks[name] = read_session_log_entries(log_path, watermark)
+    return session_id, calls
+
+
+def _update_statistics(
+    project_root: Path, log_files: list[Path]
+) -> tuple[ContextUsageStatistics, list[ContextUsageEntry], int]:
+    """Add the unanalyzed calls of session logs to the global statistics.
+
+    Logs whose watermark is at their end are not read.
+
+    Returns:
+        Tuple of (stats, new entries, new sessions)
+    """
     stats_path = _get_statistics_path(project_root)
     stats = _load_statistics(stats_path)
-    existing_sessions = {e.session_id for e in stats.entries}
-    new_entries_added = 0
-    if session_id not in existing_sessions:
-        stats.entries.extend(entries)
-        stats.total_sessions_analyzed += 1
+    watermarks = dict(stats.log_watermarks)
+    known_sessions = {e.session_id for e in stats.entries}
+    new_entries: list[ContextUsageEntry] = []
+    new_sessions: set[str] = set()
+    for log_file in log_files:
+        if log_file.suffix == LEGACY_SESSION_LOG_SUFFIX and (
+            log_file.name in stats.log_watermarks
+        ):
+            continue
+        session_id, calls = _read_unanalyzed_calls(log_file, stats, known_sessions)
+        if calls and session_id not in known_sessions:
+            new_sessions.add(session_id)
+        new_entries.extend(_analyze_log_entry(session_id, call) for call in calls)
+
+    if new_entries:
+        stats.entries.extend(new_entries)
+        stats.total_sessions_analyzed += len(new_sessions)
         stats.last_updated = datetime.now().isoformat(timespec="minutes")
         _update_aggregates(stats)
+    if new_entries or stats.log_watermarks != watermarks:
         _save_statistics(stats_path, stats)
-        new_entries_added = len(entries)
-    return stats, new_entries_added
+    return stats, new_entries, len(new_sessions)
 
 
 def _build_current_session_result(
@@ -481,10 +533,16 @@ def _build_current_session_result(
 
 def analyze_current_session(project_root: Path) -> CurrentSessionAnalysisResult:
     """Analyze the current session's load_context calls and update statistics."""
+    flush_session_logs()
     session_id = get_session_id()
-    log_path = get_session_log_path(project_root)
-    session_log = read_session_log(log_path)
-    if session_log is None or not session_log.load_context_calls:
+    log_paths = get_session_log_paths(project_root)
+    calls = [
+        call
+        for log_path in log_paths
+        if (session_log := read_session_log(log_path)) is not None
+        for call in session_log.load_context_calls
+    ]
+    if not calls:
         return CurrentSessionAnalysisResult(
             status="no_data",
             session_id=session_id,
@@ -497,35 +555,14 @@ def analyze_current_session(project_root: Path) -> CurrentSessionAnalysisResult:
             message="No load_context calls in current session.",
         )
 
-    current_entries = [
-        _analyze_log_entry(session_id, entry)
-        for entry in session_log.load_context_calls
-    ]
+    current_entries = [_analyze_log_entry(session_id, call) for call in calls]
     session_stats = _calculate_session_stats(current_entries)
-    stats, new_entries_added = _update_global_stats(
-        project_root, session_id, current_entries
-    )
+    stats, new_entries, _ = _update_statistics(project_root, log_paths)
     return _build_current_session_result(
-        session_id, current_entries, session_stats, stats, new_entries_added
+        session_id, current_entries, session_stats, stats, len(new_entries)
     )
 
 
-def _process_log_files(
-    log_files: list[Path], existing_sessions: set[str]
-) -> tuple[list[ContextUsageEntry], int]:
-    """Process log files and return (new_entries, sessions_analyzed)."""
-    new_entries: list[ContextUsageEntry] = []
-    sessions_analyzed = 0
-    for log_file in log_files:
-        session_log = read_session_log(log_file)
-        if session_log is None or session_log.session_id in existing_sessions:
-            continue
-        sessions_analyzed += 1
-        for entry in session_log.load_context_calls:
-            new_entries.append(_analyze_log_entry(session_log.session_id, entry))
-    return new_entries, sessions_analyzed
-
-
 def _build_session_logs_result(
     sessions_analyzed: int,
     new_entries: list[ContextUsageEntry],
@@ -558,7 +595,8 @@ def _build_session_logs_result(
 
 
 def analyze_session_logs(project_root: Path) -> SessionLogsAnalysisResult:
-    """Analyze all session logs and update statistics."""
+    """Analyze session log calls not analyzed yet and update statistics."""
+    flush_session_logs()
     log_files = list_session_logs(project_root)
     if not log_files:
         return SessionLogsAnalysisResult(
@@ -572,18 +610,7 @@ def analyze_session_logs(project_root: Path) -> SessionLogsAnalysisResult:
             message="No session logs found. Use load_context to generate data.",
         )
 
-    stats_path = _get_statistics_path(project_root)
-    stats = _load_statistics(stats_path)
-    existing_sessions = {e.session_id for e in stats.entries}
-    new_entries, sessions_analyzed = _process_log_files(log_files, existing_sessions)
-
-    if new_entries:
-        stats.entries.extend(new_entries)
-        stats.total_sessions_analyzed += sessions_analyzed
-        stats.last_updated = datetime.now().isoformat(timespec="minutes")
-        _update_aggregates(stats)
-        _save_statistics(stats_path, stats)
-
+    stats, new_entries, sessions_analyzed = _update_statistics(project_root, log_files)
     return _build_session_logs_result(sessions_analyzed, new_entries, stats)
 
 
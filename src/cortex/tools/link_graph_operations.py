@@ -5,10 +5,12 @@ for building dependency graphs of Memory Bank file links.
 """
 
 import json
-from typing import cast
+from collections import Counter
+from typing import Literal, cast
 
 from cortex.core.dependency_graph import DependencyGraph
-from cortex.core.models import ModelDict
+from cortex.core.graph_query import iter_compact_mermaid
+from cortex.core.models import GraphQuery, ModelDict
 from cortex.core.path_resolver import CortexResourceType, get_cortex_path
 from cortex.linking.link_parser import LinkParser
 from cortex.managers.initialization import get_managers, get_project_root
@@ -21,6 +23,13 @@ async def get_link_graph(
     project_root: str | None = None,
     include_transclusions: bool = True,
     format: str = "json",
+    root: str | None = None,
+    depth: int | None = None,
+    direction: Literal["out", "in", "both"] = "both",
+    link_types: list[str] | None = None,
+    categories: list[str] | None = None,
+    offset: int = 0,
+    limit: int | None = None,
 ) -> str:
     """Build and return a dependency graph showing how Memory Bank files
     reference each other through links.
@@ -43,8 +52,19 @@ async def get_link_graph(
         include_transclusions: Whether to include transclusion links in
             the graph (default: True); if False, only markdown reference
             links are included
-        format: Output format - "json" for structured data or "mermaid"
-            for diagram syntax (default: "json")
+        format: Output format - "json" for structured data, "compact"
+            for an indexed edge list, or "mermaid" for diagram syntax
+            (default: "json")
+        root: Optional file to center the graph on; only files within
+            `depth` hops of it are returned
+        depth: Maximum hops from `root` (default: unbounded)
+        direction: Follow links from root ("out"), to root ("in") or
+            both (default: "both")
+        link_types: Optional edge types to keep ("reference",
+            "transclusion", "links", "informs")
+        categories: Optional file categories to keep
+        offset: Index of the first edge to return (default: 0)
+        limit: Maximum number of edges to return (default: all)
 
     Returns:
         JSON string containing link graph in requested format:
@@ -56,6 +76,10 @@ async def get_link_graph(
         - cycles: List of detected circular dependency paths
         - summary: Statistics about graph structure (only in JSON format)
         - diagram: Mermaid diagram syntax string (only in Mermaid format)
+        - graph: Compact edge list (when format is "compact" or any of
+          root/depth/link_types/categories/offset/limit is given); edges
+          are [source, target, type] indexes into graph.nodes and
+          graph.edge_types, and graph.next_offset pages through the rest
         - error: Error message (only if status is "error")
         - error_type: Type of error that occurred (only if status is "error")
 
@@ -201,10 +225,28 @@ async def get_link_graph(
         - Setting include_transclusions=False is useful for analyzing
           reference structure only
         - The summary includes has_cycles and cycle_count for quick cycle detection
+        - On large memory banks prefer a root/depth neighborhood or a
+          limit; the compact edge list lists each file name only once
     """
     try:
         link_graph, cycles = await _build_link_graph_data(project_root)
 
+        if format == "compact" or _is_graph_query(
+            root, depth, link_types, categories, offset, limit
+        ):
+            if link_types is None and not include_transclusions:
+                link_types = ["reference", "links", "informs"]
+            query = GraphQuery(
+                root=root,
+                depth=depth,
+                direction=direction,
+                link_types=link_types,
+                categories=categories,
+                offset=offset,
+                limit=limit,
+            )
+            return _generate_query_response(link_graph, cycles, query, format)
+
         if format == "mermaid":
             return _generate_mermaid_response(link_graph, cycles)
 
@@ -241,6 +283,67 @@ async def _build_link_graph_data(
     return link_graph, cycles
 
 
+def _is_graph_query(
+    root: str | None,
+    depth: int | None,
+    link_types: list[str] | None,
+    categories: list[str] | None,
+    offset: int,
+    limit: int | None,
+) -> bool:
+    """Check whether any query filter or paging parameter was given."""
+    return (
+        any(value is not None for value in (root, depth, link_types, categories))
+        or offset > 0
+        or limit is not None
+    )
+
+
+def _generate_query_response(
+    link_graph: DependencyGraph,
+    cycles: list[list[str]],
+    query: GraphQuery,
+    format: str,
+) -> str:
+    """Generate response for a filtered, paginated graph query.
+
+    Args:
+        link_graph: Dependency graph instance
+        cycles: Detected cycles
+        query: Graph query filters and paging
+        format: "mermaid" for a diagram, anything else for the edge list
+
+    Returns:
+        JSON string with the compact graph or its diagram
+    """
+    compact = link_graph.query(query)
+    nodes = set(compact.nodes)
+    page_cycles = [cycle for cycle in cycles if nodes.issuperset(cycle)]
+
+    if format == "mermaid":
+        diagram = "\n".join(iter_compact_mermaid(compact, link_graph.get_file_category))
+        return json.dumps(
+            {
+                "status": "success",
+                "format": "mermaid",
+                "diagram": diagram,
+                "cycles": page_cycles,
+                "total_edges": compact.total_edges,
+                "next_offset": compact.next_offset,
+            }
+        )
+
+    return json.dumps(
+        {
+            "status": "success",
+            "format": "compact",
+            "graph": compact.model_dump(mode="json"),
+            "cycles": page_cycles,
+        },
+        separators=(",", ":"),
+    )
+
+
 def _generate_mermaid_response(
     link_graph: DependencyGraph, cycles: list[list[str]]
 ) -> str:
@@ -278,10 +381,13 @@ def _calculate_link_summary(
     Returns:
         Summary dictionary
     """
-    reference_links, transclusion_links = _count_links_by_type(link_graph)
+    all_files = link_graph.get_all_files()
+    type_counts = _count_links_by_type(link_graph, set(all_files))
+    reference_links = type_counts["reference"]
+    transclusion_links = type_counts["transclusion"]
 
     return {
-        "total_files": len(link_graph.get_all_files()),
+        "total_files": len(all_files),
         "total_links": reference_links + transclusion_links,
         "reference_links": reference_links,
         "transclusion_links": transclusion_links,
@@ -290,50 +396,22 @@ def _calculate_link_summary(
     }
 
 
-def _count_links_by_type(link_graph: DependencyGraph) -> tuple[int, int]:
-    """Count reference and transclusion links in the graph.
+def _count_links_by_type(link_graph: DependencyGraph, files: set[str]) -> Counter[str]:
+    """Count links per type in a single pass over the link table.
 
     Args:
         link_graph: Dependency graph instance
+        files: Files whose outgoing links are counted
 
     Returns:
-        Tuple of (reference_count, transclusion_count)
-    """
-    reference_links = 0
-    transclusion_links = 0
-
-    for source_file in link_graph.get_all_files():
-        if source_file not in link_graph.link_types:
-            continue
-
-        ref_count, trans_count = _count_links_for_file(
-            link_graph.link_types[source_file]
-        )
-        reference_links += ref_count
-        transclusion_links += trans_count
-
-    return reference_links, transclusion_links
-
-
-def _count_links_for_file(link_types: dict[str, str]) -> tuple[int, int]:
-    """Count reference and transclusion links for a single file.
-
-    Args:
-        link_types: Dictionary mapping targets to link types
-
-    Returns:
-        Tuple of (reference_count, transclusion_count)
+        Counter mapping link type to number of links
     """
-    reference_links = 0
-    transclusion_links = 0
-
-    for link_type in link_types.values():
-        if link_type == "reference":
-            reference_links += 1
-        elif link_type == "transclusion":
-            transclusion_links += 1
-
-    return reference_links, transclusion_links
+    return Counter(
+        link_type
+        for source_file, targets in link_graph.link_types.items()
+        if source_file in files
+        for link_type in targets.values()
+    )
 
 
 def _generate_json_response(
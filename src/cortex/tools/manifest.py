@@ -0,0 +1,268 @@
+"""
+Tool Manifest - Tool schemas for lazy registration at server startup.
+
+Importing every tool module at startup pulls in every manager class, which
+dominates cold start time. The manifest records each tool's name, schemas,
+annotations and defining module, so the server can list all tools without
+importing them and import a tool's module on its first call.
+
+The manifest is generated from the eagerly registered tools and checked in:
+
+    python -m cortex.tools.manifest          # regenerate
+    python -m cortex.tools.manifest --check  # fail if out of date
+
+It also records the tool module list and a digest of every module that
+registers or defines a tool. A manifest whose module list or sources no
+longer match the installed code is stale and is not loaded, so the server
+falls back to importing the tool modules instead of omitting new tools.
+"""
+
+import argparse
+import hashlib
+import importlib
+import json
+import logging
+import sys
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, cast
+
+from mcp.types import ToolAnnotations
+
+from cortex.server import CortexMCP, mcp
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_PATH = Path(__file__).parent.parent / "resources" / "tool_manifest.json"
+MANIFEST_VERSION = 2
+
+# Source paths in the manifest are relative to the cortex package
+PACKAGE_ROOT = Path(__file__).parent.parent
+
+
+@dataclass(frozen=True)
+class ToolSpec:
+    """Schema and location of one MCP tool."""
+
+    name: str
+    module: str
+    function: str
+    description: str
+    parameters: dict[str, Any]
+    output_schema: dict[str, Any] | None = None
+    title: str | None = None
+    annotations: dict[str, Any] | None = None
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ToolSpec":
+        """Create a spec from its manifest entry."""
+        return cls(
+            name=str(data["name"]),
+            module=str(data["module"]),
+            function=str(data["function"]),
+            description=str(data.get("description", "")),
+            parameters=cast(dict[str, Any], data["parameters"]),
+            output_schema=cast(dict[str, Any] | None, data.get("output_schema")),
+            title=cast(str | None, data.get("title")),
+            annotations=cast(dict[str, Any] | None, data.get("annotations")),
+        )
+
+
+def collect_tool_specs(modules: list[str], server: CortexMCP = mcp) -> list[ToolSpec]:
+    """
+    Import tool modules and describe every tool they register.
+
+    A tool's module is the listed module whose import registered it, which
+    may re-export a tool defined in a helper module. Helper modules are not
+    always importable on their own (they can import their facade), while
+    the listed modules are.
+
+    Args:
+        modules: Fully qualified tool modules
+        server: Server the modules register their tools with
+
+    Returns:
+        Specs of all registered tools, sorted by name
+    """
+    registered_by: dict[str, str] = {}
+    for module in modules:
+        imported = importlib.import_module(module)
+        for tool in server.registered_tools():
+            if tool.name not in registered_by and hasattr(imported, tool.fn.__name__):
+                registered_by[tool.name] = module
+    specs: list[ToolSpec] = []
+    for tool in server.registered_tools():
+        _ = server.load_tool(tool.name)
+    for tool in server.registered_tools():
+        specs.append(
+            ToolSpec(
+                name=tool.name,
+                module=registered_by.get(tool.name, tool.fn.__module__),
+                function=tool.fn.__name__,
+                description=tool.description,
+                parameters=tool.parameters,
+                output_schema=tool.output_schema,
+                title=tool.title,
+                annotations=(
+                    tool.annotations.model_dump(exclude_none=True)
+                    if tool.annotations is not None
+                    else None
+                ),
+            )
+        )
+    return sorted(specs, key=lambda spec: spec.name)
+
+
+def tool_modules() -> list[str]:
+    """Get the fully qualified modules that register the server's tools."""
+    from cortex.tools import TOOL_MODULES
+
+    return [f"cortex.tools.{name}" for name in TOOL_MODULES]
+
+
+def _digest(path: Path) -> str:
+    """Hash a source file."""
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def source_digests(modules: Iterable[str]) -> dict[str, str]:
+    """
+    Hash the source files of imported modules.
+
+    Args:
+        modules: Imported modules inside the cortex package
+
+    Returns:
+        Digest of each module's file, keyed by its path relative to the package
+    """
+    digests: dict[str, str] = {}
+    for module in modules:
+        file = Path(str(sys.modules[module].__file__))
+        digests[file.relative_to(PACKAGE_ROOT).as_posix()] = _digest(file)
+    return dict(sorted(digests.items()))
+
+
+def _is_current(manifest: dict[str, Any], modules: list[str]) -> bool:
+    """Check that a manifest was generated from the installed tool sources."""
+    if manifest.get("modules") != modules:
+        return False
+    sources = cast(dict[str, str], manifest.get("sources", {}))
+    return all(
+        _digest(PACKAGE_ROOT / file) == digest for file, digest in sources.items()
+    )
+
+
+def render_manifest(
+    specs: list[ToolSpec], modules: list[str], sources: dict[str, str]
+) -> str:
+    """
+    Serialize tool specs as manifest JSON.
+
+    Args:
+        specs: Specs of all registered tools
+        modules: Tool modules the specs were collected from
+        sources: Digests of the modules registering or defining the tools
+
+    Returns:
+        Manifest JSON
+    """
+    data = {
+        "version": MANIFEST_VERSION,
+        "modules": modules,
+        "sources": sources,
+        "tools": [asdict(spec) for spec in specs],
+    }
+    return json.dumps(data, indent=2, sort_keys=True) + "\n"
+
+
+def load_manifest(
+    path: Path = MANIFEST_PATH, modules: list[str] | None = None
+) -> list[ToolSpec] | None:
+    """
+    Load tool specs from a manifest file.
+
+    Args:
+        path: Manifest file
+        modules: Tool modules the manifest must list (default: tool_modules())
+
+    Returns:
+        Tool specs, or None if the manifest is missing, unreadable, from
+        another manifest version or stale (generated from other tool
+        modules or other versions of their sources)
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if not isinstance(data, dict):
+            return None
+        manifest = cast(dict[str, Any], data)
+        if manifest.get("version") != MANIFEST_VERSION:
+            return None
+        if not _is_current(manifest, tool_modules() if modules is None else modules):
+            logger.warning(f"Tool manifest {path} is stale; importing tool modules")
+            return None
+        entries = cast(list[dict[str, Any]], manifest.get("tools", []))
+        return [ToolSpec.from_dict(entry) for entry in entries]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def register_from_manifest(server: CortexMCP = mcp, path: Path = MANIFEST_PATH) -> bool:
+    """
+    List every manifest tool on the server without importing its module.
+
+    Args:
+        server: Server to register the tools with
+        path: Manifest file
+
+    Returns:
+        True if the manifest was loaded, False if it was missing, invalid or
+        stale
+    """
+    specs = load_manifest(path)
+    if not specs:
+        return False
+    for spec in specs:
+        server.add_lazy_tool(
+            name=spec.name,
+            module=spec.module,
+            function=spec.function,
+            description=spec.description,
+            parameters=spec.parameters,
+            output_schema=spec.output_schema,
+            title=spec.title,
+            annotations=(
+                ToolAnnotations.model_validate(spec.annotations)
+                if spec.annotations is not None
+                else None
+            ),
+        )
+    return True
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Regenerate the manifest, or check that it is up to date."""
+    parser = argparse.ArgumentParser(description="Generate the MCP tool manifest")
+    _ = parser.add_argument(
+        "--check", action="store_true", help="fail if the manifest is out of date"
+    )
+    args = parser.parse_args(argv)
+
+    modules = tool_modules()
+    specs = collect_tool_specs(modules)
+    defining = {tool.fn.__module__ for tool in mcp.registered_tools()}
+    rendered = render_manifest(specs, modules, source_digests({*modules, *defining}))
+    if cast(bool, args.check):
+        current = MANIFEST_PATH.read_text() if MANIFEST_PATH.exists() else ""
+        if current != rendered:
+            print(f"{MANIFEST_PATH} is out of date", file=sys.stderr)
+            return 1
+        return 0
+    _ = MANIFEST_PATH.write_text(rendered)
+    print(f"Wrote {MANIFEST_PATH}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -22,6 +22,7 @@ from pydantic import BaseModel, ConfigDict, Field
 from cortex.core.constants import MCP_TOOL_TIMEOUT_SECONDS
 from cortex.core.mcp_stability import mcp_tool_wrapper
 from cortex.core.models import GitCommandResult
+from cortex.core.tool_scheduler import CostClass
 from cortex.managers.initialization import get_project_root
 from cortex.server import mcp
 from cortex.tools.roadmap_corruption import CorruptionMatch
@@ -762,7 +763,7 @@ async def _run_markdownlint_with_cache(
 
 
 @mcp.tool()
-@mcp_tool_wrapper(timeout=MCP_TOOL_TIMEOUT_SECONDS)
+@mcp_tool_wrapper(timeout=MCP_TOOL_TIMEOUT_SECONDS, cost_class=CostClass.EXTERNAL)
 async def fix_markdown_lint(
     project_root: str | None = None,
     include_untracked_markdown: bool = False,
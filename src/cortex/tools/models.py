@@ -2447,6 +2447,10 @@ class ContextUsageStatistics(StrictBaseModel):
         default_factory=lambda: list[ContextUsageEntry](),
         description="Individual context usage entries",
     )
+    log_watermarks: dict[str, int] = Field(
+        default_factory=dict,
+        description="Bytes of each session log file already analyzed",
+    )
 
 
 class SessionStats(StrictBaseModel):
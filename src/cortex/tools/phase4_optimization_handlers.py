@@ -15,6 +15,8 @@ import json
 
 # Import via facade to allow test patching
 import cortex.tools.phase4_optimization as phase4_opt
+from cortex.core.constants import MCP_TOOL_TIMEOUT_MEDIUM
+from cortex.core.mcp_stability import mcp_tool_wrapper
 from cortex.server import mcp
 from cortex.tools.phase4_context_operations import load_context_impl
 from cortex.tools.phase4_progressive_operations import (
@@ -25,6 +27,7 @@ from cortex.tools.phase4_summarization_operations import summarize_content_impl
 
 
 @mcp.tool()
+@mcp_tool_wrapper(timeout=MCP_TOOL_TIMEOUT_MEDIUM)
 async def load_context(
     task_description: str,
     token_budget: int | None = None,
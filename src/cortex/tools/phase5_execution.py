@@ -84,7 +84,10 @@ async def apply_refactoring(
             or rollback.
             Example: "Approved for Phase 2 consolidation"
         dry_run: If True, simulate the operation without making actual changes.
-            Useful for previewing impact. Default: False
+            For apply, the operations run on an in-memory overlay and the
+            result carries exact before/after metrics (tokens, links,
+            transclusions, structure score) under "simulation".
+            Default: False
         validate_first: If True, validate the refactoring before execution
             (apply action only).
             Checks file existence, syntax, and conflicts. Default: True
@@ -20,6 +20,7 @@ from pydantic import BaseModel, ConfigDict, Field
 from cortex.core.constants import MCP_TOOL_TIMEOUT_VERY_COMPLEX
 from cortex.core.mcp_stability import mcp_tool_wrapper
 from cortex.core.models import JsonValue, ModelDict
+from cortex.core.tool_scheduler import CostClass
 from cortex.managers.initialization import get_project_root
 from cortex.server import mcp
 from cortex.services.framework_adapters.base import CheckResult, TestResult
@@ -179,7 +180,7 @@ def _create_error_result(error: str, error_type: str = "ValueError") -> str:
 
 
 @mcp.tool()
-@mcp_tool_wrapper(timeout=MCP_TOOL_TIMEOUT_VERY_COMPLEX)
+@mcp_tool_wrapper(timeout=MCP_TOOL_TIMEOUT_VERY_COMPLEX, cost_class=CostClass.EXTERNAL)
 async def execute_pre_commit_checks(
     checks: Sequence[str] | None = None,
     language: str | None = None,
@@ -4,7 +4,8 @@ Refactoring Operations Tools
 This module contains refactoring suggestion tools for Memory Bank.
 
 Total: 1 tool
-- suggest_refactoring: Consolidation/split/reorganization suggestions
+- suggest_refactoring: Consolidation/split/reorganization suggestions, or all
+  three from one shared analysis pass
 """
 
 import json
@@ -24,19 +25,23 @@ from cortex.refactoring.consolidation_detector import (
 from cortex.refactoring.models import DependencyGraphInput, MemoryBankStructureData
 from cortex.refactoring.reorganization_planner import ReorganizationPlanner
 from cortex.refactoring.split_recommender import SplitRecommendation, SplitRecommender
+from cortex.refactoring.suggestion_pipeline import (
+    SuggestionParameters,
+    SuggestionPipeline,
+)
 from cortex.server import mcp
 
 
 def validate_refactoring_type(type: str) -> str | None:
     """Validate refactoring type parameter."""
-    valid_types = ["consolidation", "splits", "reorganization"]
+    valid_types = ["consolidation", "splits", "reorganization", "all"]
     if type not in valid_types:
         return json.dumps(
             {
                 "status": "error",
                 "error": (
                     f"Invalid type: {type}. Valid types: consolidation, "
-                    "splits, reorganization"
+                    "splits, reorganization, all"
                 ),
                 "valid_types": valid_types,
             },
@@ -73,6 +78,28 @@ def handle_preview_mode(preview_suggestion_id: str) -> str:
     )
 
 
+async def preview_cached_plan(
+    reorganization_planner: ReorganizationPlanner, preview_suggestion_id: str
+) -> str:
+    """Preview a cached reorganization plan, or explain that caching is needed."""
+    preview = await reorganization_planner.preview_plan(preview_suggestion_id)
+    if preview is None:
+        return handle_preview_mode(preview_suggestion_id)
+    metrics = reorganization_planner.category_metrics(preview_suggestion_id)
+    return json.dumps(
+        {
+            "status": "success",
+            "preview_mode": True,
+            "suggestion_id": preview_suggestion_id,
+            "preview": preview.model_dump(mode="json"),
+            "category_metrics": (
+                metrics.model_dump(mode="json") if metrics is not None else None
+            ),
+        },
+        indent=2,
+    )
+
+
 def convert_opportunities_to_dict(
     opportunities: Sequence[ConsolidationOpportunity],
 ) -> list[ModelDict]:
@@ -164,9 +191,10 @@ async def get_structure_data(
     structure_analyzer = await get_manager(
         mgrs, "structure_analyzer", StructureAnalyzer
     )
-    organization = await structure_analyzer.analyze_file_organization()
-    anti_patterns = await structure_analyzer.detect_anti_patterns()
-    complexity = await structure_analyzer.measure_complexity_metrics()
+    async with structure_analyzer.analysis_session():
+        organization = await structure_analyzer.analyze_file_organization()
+        anti_patterns = await structure_analyzer.detect_anti_patterns()
+        complexity = await structure_analyzer.measure_complexity_metrics()
 
     analysis: ModelDict = {
         "file_organization": organization.model_dump(mode="json"),
@@ -189,13 +217,10 @@ async def get_structure_data(
     }
 
 
-async def suggest_reorganization(
-    reorganization_planner: ReorganizationPlanner,
+async def load_reorganization_inputs(
     mgrs: ManagersDict,
-    goal: str | None,
-) -> str:
-    """Generate reorganization plan."""
-    reorg_goal = goal or "dependency_depth"
+) -> tuple[MemoryBankStructureData, DependencyGraphInput]:
+    """Load structure data and dependency graph for reorganization planning."""
     structure_data = await get_structure_data(mgrs)
     dependency_graph_instance = cast(DependencyGraphProtocol, mgrs.graph)
     graph_data = dependency_graph_instance.to_dict()
@@ -204,6 +229,17 @@ async def suggest_reorganization(
     graph_model = DependencyGraphInput.model_validate(
         graph_data.model_dump(mode="json")
     )
+    return structure_model, graph_model
+
+
+async def suggest_reorganization(
+    reorganization_planner: ReorganizationPlanner,
+    mgrs: ManagersDict,
+    goal: str | None,
+) -> str:
+    """Generate reorganization plan."""
+    reorg_goal = goal or "dependency_depth"
+    structure_model, graph_model = await load_reorganization_inputs(mgrs)
 
     plan = await reorganization_planner.create_reorganization_plan(
         optimize_for=reorg_goal,
@@ -222,6 +258,51 @@ async def suggest_reorganization(
     )
 
 
+async def suggest_all(
+    mgrs: ManagersDict,
+    min_similarity: float | None,
+    size_threshold: int | None,
+    goal: str | None,
+) -> str:
+    """Generate every suggestion type from one shared analysis pass."""
+    pipeline = await get_manager(mgrs, "suggestion_pipeline", SuggestionPipeline)
+    similarity = min_similarity or 0.80
+    threshold = size_threshold or 10000  # 10KB default
+    reorg_goal = goal or "dependency_depth"
+    parameters = SuggestionParameters(
+        min_similarity=similarity,
+        max_file_size=threshold // 4,  # 1 token ≈ 4 chars
+        goal=reorg_goal,
+    )
+
+    async def load_structure() -> tuple[MemoryBankStructureData, DependencyGraphInput]:
+        return await load_reorganization_inputs(mgrs)
+
+    batch = await pipeline.generate(parameters, load_structure)
+    plan = batch.reorganization
+
+    return json.dumps(
+        {
+            "status": "success",
+            "type": "all",
+            "corpus_version": batch.corpus_version,
+            "consolidation": {
+                "min_similarity": similarity,
+                "opportunities": convert_opportunities_to_dict(batch.consolidation),
+            },
+            "splits": {
+                "size_threshold": threshold,
+                "recommendations": convert_recommendations_to_dict(batch.splits),
+            },
+            "reorganization": {
+                "goal": reorg_goal,
+                "plan": plan.model_dump(mode="json") if plan else None,
+            },
+        },
+        indent=2,
+    )
+
+
 async def process_refactoring_request(
     type: str,
     project_root: str | None,
@@ -242,7 +323,7 @@ async def process_refactoring_request(
 
     # Handle preview mode
     if preview_suggestion_id:
-        return handle_preview_mode(preview_suggestion_id)
+        return await preview_cached_plan(reorganization_planner, preview_suggestion_id)
 
     # Generate suggestions based on type
     if type == "consolidation":
@@ -251,13 +332,15 @@ async def process_refactoring_request(
         return await suggest_splits(split_recommender, size_threshold)
     elif type == "reorganization":
         return await suggest_reorganization(reorganization_planner, mgrs, goal)
+    elif type == "all":
+        return await suggest_all(mgrs, min_similarity, size_threshold, goal)
 
     return json.dumps({"status": "error", "error": "Unknown error"}, indent=2)
 
 
 @mcp.tool()
 async def suggest_refactoring(
-    type: Literal["consolidation", "splits", "reorganization"],
+    type: Literal["consolidation", "splits", "reorganization", "all"],
     project_root: str | None = None,
     min_similarity: float | None = None,
     size_threshold: int | None = None,
@@ -270,7 +353,7 @@ async def suggest_refactoring(
     structure and efficiency.
 
     This consolidated tool provides three types of refactoring suggestions to
-    help optimize your Memory Bank:
+    help optimize your Memory Bank, or all three at once:
 
     1. **consolidation**: Identifies opportunities to consolidate duplicate or
        highly similar content across multiple files. Uses similarity analysis
@@ -291,6 +374,7 @@ async def suggest_refactoring(
             - "consolidation": Find duplicate content to consolidate
             - "splits": Find large files to split
             - "reorganization": Generate structure reorganization plan
+            - "all": All three from one shared analysis pass
 
         project_root: Absolute path to project root directory.
             Example: "/Users/username/projects/my-project"
@@ -302,23 +386,24 @@ async def suggest_refactoring(
             Default: 0.80 (80% similarity)
             Higher values = stricter matching, fewer suggestions.
             Lower values = more lenient matching, more suggestions.
-            Only applies to type="consolidation".
+            Only applies to type="consolidation" or "all".
 
         size_threshold: Maximum file size in bytes before suggesting split.
             Example: 8000 (suggest split for files over 8KB)
             Default: 10000 (10KB, approximately 2500 tokens)
-            Only applies to type="splits".
+            Only applies to type="splits" or "all".
 
         goal: Optimization goal for reorganization.
             - "dependency_depth": Minimize dependency chain depth (default)
             - "category": Group files by functionality/category
             - "complexity": Reduce overall structural complexity
-            Only applies to type="reorganization".
+            Only applies to type="reorganization" or "all".
 
         preview_suggestion_id: ID of a specific suggestion to preview.
             Example: "consolidation_001"
             If provided, returns detailed preview instead of generating suggestions.
-            Currently requires suggestion caching (future feature).
+            Reorganization plan IDs (e.g. "REORG-0001") from an earlier call
+            are previewed from the plan cache, with category graph metrics.
 
         show_diff: Whether to include file diff in preview.
             Default: True
@@ -438,6 +523,16 @@ async def suggest_refactoring(
             }
         }
 
+        For type="all":
+        {
+            "status": "success",
+            "type": "all",
+            "corpus_version": "3f2a...",
+            "consolidation": {"min_similarity": 0.80, "opportunities": [...]},
+            "splits": {"size_threshold": 10000, "recommendations": [...]},
+            "reorganization": {"goal": "dependency_depth", "plan": {...}}
+        }
+
         For preview_suggestion_id (future feature):
         {
             "status": "success",
@@ -661,6 +756,9 @@ async def suggest_refactoring(
         - Split recommendations consider both file size and logical content
           boundaries (sections, headings). Files just under the threshold may
           not get suggestions.
+        - type="all" reads and parses the Memory Bank once and runs the three
+          generators concurrently. Its results are cached until a markdown
+          file changes.
         - Reorganization plans preserve all file content and dependencies.
           The tool only suggests moves, it does not execute them automatically.
         - The min_similarity threshold significantly affects results:
@@ -7,6 +7,8 @@ Total: 1 tool
 - validate: Schema/duplications/quality checks
 """
 
+from cortex.core.constants import MCP_TOOL_TIMEOUT_COMPLEX
+from cortex.core.mcp_stability import mcp_tool_wrapper
 from cortex.server import mcp
 from cortex.tools.validation_dispatch import (
     CheckType,
@@ -17,6 +19,7 @@ from cortex.tools.validation_helpers import create_validation_error_response
 
 
 @mcp.tool()
+@mcp_tool_wrapper(timeout=MCP_TOOL_TIMEOUT_COMPLEX, single_flight=True)
 async def validate(
     check_type: CheckType,
     file_name: str | None = None,
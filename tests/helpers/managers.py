@@ -13,6 +13,7 @@ from cortex.core.file_system import FileSystemManager
 from cortex.core.file_watcher import FileWatcherManager
 from cortex.core.metadata_index import MetadataIndex
 from cortex.core.migration import MigrationManager
+from cortex.core.state_store import StateStore
 from cortex.core.token_counter import TokenCounter
 from cortex.core.version_manager import VersionManager
 from cortex.managers.types import ManagersDict
@@ -27,6 +28,7 @@ def make_test_managers(
     versions: VersionManager | MagicMock | None = None,
     migration: MigrationManager | MagicMock | None = None,
     watcher: FileWatcherManager | MagicMock | None = None,
+    state: StateStore | MagicMock | None = None,
     **kwargs: MagicMock | None,
 ) -> ManagersDict:
     """Create a valid `ManagersDict` with MagicMock defaults.
@@ -44,5 +46,6 @@ def make_test_managers(
         versions=versions or MagicMock(name="versions"),
         migration=migration or MagicMock(name="migration"),
         watcher=watcher or MagicMock(name="watcher"),
+        state=state,
         **kwargs,
     )
@@ -18,6 +18,7 @@ from cortex.core.models import DependencyGraphDict, FileOrganizationResult
 from cortex.refactoring.consolidation_detector import ConsolidationOpportunity
 from cortex.refactoring.models import ReorganizationImpactModel, ReorganizationPlanModel
 from cortex.refactoring.split_recommender import SplitRecommendation
+from cortex.refactoring.suggestion_pipeline import SuggestionBatch, SuggestionParameters
 from cortex.tools.analysis_operations import (
     analyze,
     analyze_insights,
@@ -33,6 +34,7 @@ from cortex.tools.refactoring_operations import (
     get_structure_data,
     handle_preview_mode,
     process_refactoring_request,
+    suggest_all,
     suggest_consolidation,
     suggest_refactoring,
     suggest_reorganization,
@@ -476,6 +478,14 @@ class TestValidateRefactoringType:
         # Assert
         assert result is None
 
+    def test_validate_valid_all(self) -> None:
+        """Test validating the combined type."""
+        # Act
+        result = validate_refactoring_type("all")
+
+        # Assert
+        assert result is None
+
     def test_validate_invalid_type(self) -> None:
         """Test validating invalid type."""
         # Act
@@ -928,6 +938,40 @@ class TestSuggestReorganization:
         assert result_data["plan"]["plan_id"] == "plan-2"
 
 
+class TestSuggestAll:
+    """Test suggest_all helper."""
+
+    @pytest.mark.asyncio
+    async def test_suggest_all_uses_pipeline(self) -> None:
+        """Test all suggestion types come from one pipeline batch."""
+        # Arrange
+        mock_pipeline = MagicMock()
+        mock_pipeline.generate = AsyncMock(
+            return_value=SuggestionBatch(
+                corpus_version="v1",
+                consolidation=[],
+                splits=[],
+                reorganization=None,
+            )
+        )
+        mgrs = make_test_managers(suggestion_pipeline=mock_pipeline)
+
+        # Act
+        result = await suggest_all(mgrs, 0.9, 8000, "category")
+
+        # Assert
+        result_data = json.loads(result)
+        assert result_data["type"] == "all"
+        assert result_data["corpus_version"] == "v1"
+        assert result_data["consolidation"]["min_similarity"] == 0.9
+        assert result_data["splits"]["size_threshold"] == 8000
+        assert result_data["reorganization"]["plan"] is None
+        parameters = mock_pipeline.generate.await_args.args[0]
+        assert parameters == SuggestionParameters(
+            min_similarity=0.9, max_file_size=2000, goal="category"
+        )
+
+
 class TestProcessRefactoringRequest:
     """Test _process_refactoring_request helper."""
 
@@ -2,16 +2,25 @@
 Unit tests for connection_health.py MCP tool.
 
 Tests the check_mcp_connection_health tool which monitors
-MCP connection health and resource utilization.
+MCP connection health, resource utilization and the manager pool,
+and the get_tool_performance tool which reports tool call latencies.
 """
 
 import json
-from unittest.mock import AsyncMock, patch
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from cortex.core.manager_registry import ManagerRegistry
 from cortex.core.models import ConnectionHealth
-from cortex.tools.connection_health import check_mcp_connection_health
+from cortex.core.tracing import Tracer, span
+from cortex.managers.models import WarmupProgress
+from cortex.tools.connection_health import (
+    check_mcp_connection_health,
+    get_tool_performance,
+)
+from tests.helpers.managers import make_test_managers
 
 
 class TestCheckMCPConnectionHealth:
@@ -90,3 +99,108 @@ class TestCheckMCPConnectionHealth:
             assert result["status"] == "error"
             assert result["error"] == error_message
             assert result["error_type"] == "ValueError"
+
+    @pytest.mark.asyncio
+    async def test_check_connection_health_reports_warmup(self) -> None:
+        """Test the background warm-up progress is included."""
+        # Arrange
+        progress = WarmupProgress(
+            project_root="/project",
+            state="running",
+            steps_total=10,
+            steps_completed=4,
+            current_step="context_optimizer",
+        )
+
+        with patch(
+            "cortex.tools.connection_health.get_warmup_progress",
+            return_value=progress,
+        ):
+            # Act
+            result = json.loads(await check_mcp_connection_health())
+
+            # Assert
+            assert result["warmup"]["state"] == "running"
+            assert result["warmup"]["steps_completed"] == 4
+            assert result["warmup"]["current_step"] == "context_optimizer"
+
+    @pytest.mark.asyncio
+    async def test_check_connection_health_reports_manager_pool(self) -> None:
+        """Test the per-project manager pool is included."""
+        # Arrange
+        registry = ManagerRegistry(max_projects=3, memory_limit_bytes=2048)
+
+        with patch(
+            "cortex.core.manager_registry.get_default_registry",
+            return_value=registry,
+        ):
+            # Act
+            result = json.loads(await check_mcp_connection_health())
+
+        # Assert
+        pool = result["health"]["manager_pool"]
+        assert pool["projects"] == 0
+        assert pool["max_projects"] == 3
+        assert pool["memory_limit_bytes"] == 2048
+        assert pool["evictions"] == {}
+
+    @pytest.mark.asyncio
+    async def test_check_connection_health_lists_projects_on_request(
+        self, tmp_path: Path
+    ) -> None:
+        """Test pooled project roots are only reported when requested."""
+        # Arrange
+        registry = ManagerRegistry(max_projects=3)
+        registry._managers[str(tmp_path)] = make_test_managers(fs=MagicMock())
+
+        with (
+            patch(
+                "cortex.core.manager_registry.get_default_registry",
+                return_value=registry,
+            ),
+            patch("cortex.core.manager_registry.estimate_size", return_value=512),
+        ):
+            # Act
+            default = json.loads(await check_mcp_connection_health())
+            detailed = json.loads(
+                await check_mcp_connection_health(include_projects=True)
+            )
+
+        # Assert
+        assert default["health"]["manager_pool"]["pooled"] == []
+        assert default["health"]["manager_pool"]["estimated_bytes"] == 512
+        pooled = detailed["health"]["manager_pool"]["pooled"]
+        assert [p["project_root"] for p in pooled] == [str(tmp_path)]
+
+
+class TestGetToolPerformance:
+    """Tests for get_tool_performance tool."""
+
+    @pytest.mark.asyncio
+    async def test_reports_latency_and_traces(self) -> None:
+        """Test per tool and per span latency and recent traces are reported."""
+        # Arrange
+        tracer = Tracer()
+        for tool in ("validate", "load_context"):
+            with tracer.trace_tool(tool):
+                with span("fs.read_file"):
+                    pass
+
+        with patch("cortex.tools.connection_health.get_tracer", return_value=tracer):
+            # Act
+            result = json.loads(
+                await get_tool_performance(
+                    tool_name="validate", profile_next_call="load_context"
+                )
+            )
+
+            # Assert
+            assert result["status"] == "success"
+            assert [t["name"] for t in result["tools"]] == ["validate"]
+            assert result["spans"][0]["name"] == "fs.read_file"
+            assert result["spans"][0]["count"] == 2
+            assert [t["tool"] for t in result["recent_traces"]] == ["validate"]
+            assert result["profile_armed"] == "load_context"
+            with tracer.trace_tool("load_context"):
+                pass
+            assert tracer.recent_traces(limit=1)[0].profile is not None
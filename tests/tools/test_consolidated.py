@@ -669,6 +669,7 @@ class TestAnalyze:
         """Test structure analysis."""
         # Setup
         mock_structure_analyzer = AsyncMock()
+        mock_structure_analyzer.analysis_session = MagicMock()
         organization = MagicMock()
         organization.model_dump = MagicMock(
             return_value={"total_files": 5, "total_size_bytes": 5000}
@@ -1003,6 +1004,7 @@ class TestSuggestRefactoring:
             return_value={"preview": "Reorganization preview"}
         )
         mock_structure_analyzer = AsyncMock()
+        mock_structure_analyzer.analysis_session = MagicMock()
         organization = MagicMock()
         organization.file_count = 0
         organization.model_dump = MagicMock(return_value={})
@@ -790,6 +790,57 @@ class TestGetLinkGraph:
             assert summary["reference_links"] == 1  # file1->file2
             assert summary["transclusion_links"] == 1  # file2->file3
 
+    async def test_get_link_graph_compact_query(self) -> None:
+        """Test root/limit parameters return a paginated compact edge list."""
+        # Arrange
+        from cortex.core.dependency_graph import DependencyGraph
+
+        graph = DependencyGraph()
+        graph.add_link_dependency("notes.md", "ideas.md", "reference")
+        graph.add_link_dependency("notes.md", "drafts.md", "transclusion")
+        graph.add_link_dependency("drafts.md", "notes.md", "reference")
+
+        with patch(
+            "cortex.tools.link_graph_operations._build_link_graph_data",
+            AsyncMock(return_value=(graph, graph.detect_cycles())),
+        ):
+            # Act
+            result_str = await get_link_graph(root="notes.md", depth=1, limit=2)
+            result = json.loads(result_str)
+
+            # Assert
+            assert result["status"] == "success"
+            assert result["format"] == "compact"
+            compact = result["graph"]
+            assert compact["nodes"][0] == "notes.md"
+            assert compact["total_edges"] == 3
+            assert len(compact["edges"]) == 2
+            assert compact["next_offset"] == 2
+
+    async def test_get_link_graph_query_mermaid_queries_once(self) -> None:
+        """Test a mermaid query renders the diagram from one query result."""
+        # Arrange
+        from cortex.core.dependency_graph import DependencyGraph
+
+        graph = DependencyGraph()
+        graph.add_link_dependency("notes.md", "ideas.md", "reference")
+
+        with (
+            patch(
+                "cortex.tools.link_graph_operations._build_link_graph_data",
+                AsyncMock(return_value=(graph, [])),
+            ),
+            patch.object(graph, "query", wraps=graph.query) as query,
+        ):
+            # Act
+            result_str = await get_link_graph(root="notes.md", format="mermaid")
+            result = json.loads(result_str)
+
+            # Assert
+            assert result["format"] == "mermaid"
+            assert '    n0["notes"]' in result["diagram"]
+            assert query.call_count == 1
+
     async def test_get_link_graph_exception(self, mock_project_root: Path) -> None:
         """Test exception handling in get_link_graph."""
         # Arrange
@@ -9,6 +9,7 @@ This test suite provides comprehensive coverage for:
 - All helper functions and error paths
 """
 
+import asyncio
 import json
 from pathlib import Path
 from typing import Any
@@ -252,6 +253,53 @@ class TestLoadContext:
             assert result["status"] == "success"
             assert result["strategy"] == "dependency_aware"
 
+    async def test_load_context_logs_every_concurrent_call(
+        self,
+        mock_project_root: Path,
+        mock_managers: ManagersDict,
+        mock_optimization_result: MagicMock,
+    ) -> None:
+        """Test identical concurrent calls each record a session log entry."""
+        # Arrange
+        release = asyncio.Event()
+
+        async def slow_optimize(**_kwargs: object) -> MagicMock:
+            _ = await release.wait()
+            return mock_optimization_result
+
+        mock_managers.context_optimizer.optimize_context = AsyncMock(
+            side_effect=slow_optimize
+        )
+        with (
+            patch(
+                "cortex.tools.phase4_optimization.get_project_root",
+                return_value=mock_project_root,
+            ),
+            patch(
+                "cortex.tools.phase4_optimization.get_managers",
+                return_value=mock_managers,
+            ),
+            patch(
+                "cortex.tools.phase4_context_operations.get_manager",
+                side_effect=_get_manager_helper,
+            ),
+            patch(
+                "cortex.tools.phase4_context_operations.log_load_context_call"
+            ) as log_call,
+        ):
+            tasks = [
+                asyncio.create_task(load_context(task_description="Test task"))
+                for _ in range(2)
+            ]
+            await asyncio.sleep(0.05)
+
+            # Act
+            release.set()
+            _ = await asyncio.gather(*tasks)
+
+            # Assert
+            assert log_call.call_count == 2
+
     async def test_load_context_exception_handling(
         self, mock_project_root: Path
     ) -> None:
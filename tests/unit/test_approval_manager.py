@@ -4,6 +4,7 @@ import json
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import cast
+from unittest.mock import patch
 
 import pytest
 
@@ -74,6 +75,31 @@ class TestApprovalManagerInitialization:
         assert "apr-1" in manager.approvals
         assert len(manager.preferences) == 1
 
+    @pytest.mark.asyncio
+    async def test_compaction_waits_for_first_write(self, memory_bank_dir: Path):
+        """Test daily compaction runs on the first write, not in the constructor."""
+        # Arrange
+        seeded = ApprovalManager(memory_bank_dir=memory_bank_dir)
+        seeded.approvals["old"] = ApprovalModel(
+            approval_id="old",
+            suggestion_id="sug-old",
+            suggestion_type="consolidation",
+            status=ApprovalStatusEnum.APPROVED,
+            created_at=(datetime.now() - timedelta(days=400)).isoformat(),
+        )
+
+        # Act
+        manager = ApprovalManager(memory_bank_dir=memory_bank_dir)
+        live_after_init = manager.state_store.get("approvals", "old")
+        _ = await manager.request_approval(
+            suggestion_id="sug-new", suggestion_type="split"
+        )
+
+        # Assert
+        assert live_after_init is not None
+        assert manager.state_store.get("approvals", "old") is None
+        assert "old" in manager.approvals
+
 
 class TestRequestApproval:
     """Test requesting approval for suggestions."""
@@ -138,10 +164,8 @@ class TestRequestApproval:
         )
 
         # Assert
-        approval_file = memory_bank_dir.parent / "approvals.json"
-        assert approval_file.exists()
-        data = json.loads(approval_file.read_text())
-        assert len(data["approvals"]) == 1
+        reloaded = ApprovalManager(memory_bank_dir=memory_bank_dir)
+        assert len(reloaded.approvals) == 1
 
 
 class TestApproveSuggestion:
@@ -444,6 +468,32 @@ class TestApprovalQueries:
         assert isinstance(suggestion_id, str)
         assert suggestion_id == "sug-2"
 
+    @pytest.mark.asyncio
+    async def test_pending_lookups_skip_archived_approvals(self, memory_bank_dir: Path):
+        """Test pending approval scans never read archive segments."""
+        # Arrange
+        manager = ApprovalManager(memory_bank_dir=memory_bank_dir)
+        _ = await manager.request_approval(
+            suggestion_id="sug-old", suggestion_type="consolidation"
+        )
+        _ = manager.approvals.compact(
+            active_days=30, now=datetime.now() + timedelta(days=60)
+        )
+        _ = await manager.request_approval(
+            suggestion_id="sug-new", suggestion_type="split"
+        )
+        manager.approvals.clear_cache()
+
+        # Act
+        with patch.object(manager.approvals.archive, "get", side_effect=AssertionError):
+            pending = await manager.get_pending_approvals()
+            approved = await manager.approve_suggestion("sug-new")
+
+        # Assert
+        assert pending["count"] == 1
+        assert approved["status"] == "approved"
+        assert len(manager.approvals) == 2
+
 
 class TestApprovalHistory:
     """Test approval history functionality."""
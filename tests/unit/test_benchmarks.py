@@ -3,25 +3,42 @@
 This module provides extensive test coverage for:
 - BenchmarkResult class and methods
 - Benchmark base class and lifecycle hooks
+- CPU, memory and allocation measurements and concurrent-load mode
 - BenchmarkSuite and benchmark collection
 - BenchmarkRunner execution and reporting
 - Core operation benchmarks (token counting, file I/O, dependency graph)
 - Analysis operation benchmarks (pattern analysis, structure analysis)
+- Startup import-time benchmarks and budget
+- Generated memory banks and end-to-end tool workflow benchmarks
+- Baseline comparison and the cortex-bench CLI
 """
 
+import asyncio
+import csv
 import json
+import sys
 import tempfile
+import tracemalloc
 from collections.abc import Generator
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 from cortex.benchmarks.analysis_benchmarks import (
     CoAccessPatternBenchmark,
+    DependencyChainBenchmark,
     PatternAnalysisBenchmark,
     StructureAnalysisBenchmark,
     create_analysis_benchmark_suite,
 )
+from cortex.benchmarks.baseline import (
+    compare_results,
+    load_baseline,
+    save_baseline,
+    threshold_for,
+)
+from cortex.benchmarks.cli import main as bench_main
 from cortex.benchmarks.core_benchmarks import (
     DependencyGraphBenchmark,
     DependencyGraphToDictBenchmark,
@@ -34,7 +51,26 @@ from cortex.benchmarks.framework import (
     BenchmarkResult,
     BenchmarkRunner,
     BenchmarkSuite,
+    percentile,
+)
+from cortex.benchmarks.memory_bank_generator import (
+    MemoryBankSpec,
+    generate_memory_bank,
+    memory_bank_file_names,
+    transclusion_levels,
+)
+from cortex.benchmarks.startup_benchmarks import (
+    CORTEX_IMPORT_BUDGET_MS,
+    create_startup_benchmark_suite,
+    measure_import_time,
+    parse_import_time,
+)
+from cortex.benchmarks.workflow_benchmarks import (
+    WORKFLOWS,
+    ToolWorkflowBenchmark,
+    create_workflow_benchmark_suite,
 )
+from cortex.core.metadata_index import MetadataIndex
 
 # ==============================================================================
 # Test Fixtures
@@ -192,6 +228,14 @@ class ConcreteBenchmark(Benchmark):
         self.run_iteration_called += 1
 
 
+class FailingBenchmark(ConcreteBenchmark):
+    """Benchmark whose iterations raise."""
+
+    async def run_iteration(self):
+        """Fail every iteration."""
+        raise RuntimeError("tool failed")
+
+
 class TestBenchmark:
     """Tests for Benchmark base class."""
 
@@ -267,6 +311,129 @@ class TestBenchmark:
         assert result.total_time > 0
 
 
+class SleepingBenchmark(Benchmark):
+    """Benchmark whose iterations wait without using the CPU."""
+
+    def __init__(self, concurrency: int = 1):
+        super().__init__(
+            name="Sleeping",
+            description="Test benchmark",
+            iterations=20,
+            warmup_iterations=0,
+            concurrency=concurrency,
+        )
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def run_iteration(self) -> None:
+        """Sleep while counting overlapping iterations."""
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+
+
+class AllocatingBenchmark(Benchmark):
+    """Benchmark whose iterations allocate and keep about 1 MB."""
+
+    def __init__(self):
+        super().__init__(
+            name="Allocating",
+            description="Test benchmark",
+            iterations=3,
+            warmup_iterations=0,
+            track_allocations=True,
+        )
+        self.kept: list[bytes] = []
+
+    async def run_iteration(self) -> None:
+        """Allocate a temporary and a kept buffer."""
+        temporary = bytes(2_000_000)
+        self.kept.append(bytes(1_000_000))
+        del temporary
+
+
+class TestBenchmarkMeasurements:
+    """Tests for CPU, memory, allocation and concurrency measurements."""
+
+    def test_percentile_interpolates(self) -> None:
+        """Test percentiles interpolate between closest ranks."""
+        # Act/Assert
+        assert percentile([1.0, 2.0, 3.0, 4.0], 0.5) == 2.5
+        assert percentile([1.0, 2.0, 3.0, 4.0], 1.0) == 4.0
+        assert percentile([5.0], 0.95) == 5.0
+
+    @pytest.mark.asyncio
+    async def test_waiting_iterations_have_low_cpu_ratio(self) -> None:
+        """Test CPU time is measured apart from wall time."""
+        # Act
+        result = await SleepingBenchmark().run()
+
+        # Assert
+        assert result.mean_time >= 0.01
+        assert result.mean_cpu_time < result.mean_time
+        assert result.cpu_ratio < 0.5
+        assert result.peak_alloc_bytes is None
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="needs resource module")
+    @pytest.mark.asyncio
+    async def test_peak_rss_is_recorded(self) -> None:
+        """Test the process's peak RSS is recorded."""
+        # Act
+        result = await SleepingBenchmark().run()
+
+        # Assert
+        assert result.peak_rss_bytes is not None
+        assert result.peak_rss_bytes > 1_000_000
+        assert result.rss_growth_bytes is not None
+        assert result.rss_growth_bytes >= 0
+
+    @pytest.mark.asyncio
+    async def test_allocations_are_tracked(self) -> None:
+        """Test allocation peaks and kept bytes per iteration."""
+        # Arrange
+        was_tracing = tracemalloc.is_tracing()
+
+        # Act
+        result = await AllocatingBenchmark().run()
+
+        # Assert
+        assert result.peak_alloc_bytes is not None
+        assert result.peak_alloc_bytes >= 3_000_000
+        assert result.mean_alloc_bytes is not None
+        assert 900_000 <= result.mean_alloc_bytes < 2_000_000
+        assert tracemalloc.is_tracing() == was_tracing
+
+    @pytest.mark.asyncio
+    async def test_concurrent_iterations_overlap(self) -> None:
+        """Test concurrent mode shares iterations between coroutines."""
+        # Arrange
+        benchmark = SleepingBenchmark(concurrency=10)
+
+        # Act
+        result = await benchmark.run()
+
+        # Assert
+        assert benchmark.max_in_flight == 10
+        assert result.iterations == 20
+        assert result.concurrency == 10
+        assert result.total_time < 0.15
+        assert result.ops_per_second > 100
+
+    def test_result_to_dict_includes_measurements(
+        self, sample_benchmark_result: BenchmarkResult
+    ) -> None:
+        """Test resource measurements are serialized, unmeasured as None."""
+        # Act
+        result_dict = sample_benchmark_result.to_dict()
+
+        # Assert
+        assert result_dict["concurrency"] == 1
+        assert result_dict["mean_cpu_time"] == 0.0
+        assert result_dict["peak_rss_bytes"] is None
+        assert result_dict["peak_alloc_bytes"] is None
+
+
 # ==============================================================================
 # Test BenchmarkSuite
 # ==============================================================================
@@ -322,6 +489,26 @@ class TestBenchmarkSuite:
         assert benchmark2.setup_called
         assert benchmark2.teardown_called
 
+    @pytest.mark.asyncio
+    async def test_suite_records_failed_benchmark(self):
+        """Test a raising benchmark is recorded and the suite continues."""
+        # Arrange
+        suite = BenchmarkSuite(name="Test Suite", description="Test description")
+        failing = FailingBenchmark()
+        passing = ConcreteBenchmark()
+        suite.add_benchmark(failing)
+        suite.add_benchmark(passing)
+
+        # Act
+        results = await suite.run_all()
+
+        # Assert
+        assert results[0].error == "RuntimeError: tool failed"
+        assert results[0].to_dict()["error"] == "RuntimeError: tool failed"
+        assert failing.teardown_called
+        assert results[1].error is None
+        assert passing.run_iteration_called == 12
+
 
 # ==============================================================================
 # Test BenchmarkRunner
@@ -414,6 +601,26 @@ class TestBenchmarkRunner:
         assert len(saved_data["Test Suite"]) == 1
         assert saved_data["Test Suite"][0]["name"] == "Test Benchmark"
 
+    def test_runner_export_csv_appends_runs(
+        self, temp_output_dir: Path, sample_benchmark_result: BenchmarkResult
+    ) -> None:
+        """Test CSV exports accumulate rows under a single header."""
+        # Arrange
+        runner = BenchmarkRunner(output_dir=temp_output_dir)
+        results = {"Test Suite": [sample_benchmark_result]}
+
+        # Act
+        runner.export_csv(results)
+        runner.export_csv(results)
+
+        # Assert
+        with open(temp_output_dir / "results.csv", newline="") as f:
+            rows = list(csv.DictReader(f))
+        assert len(rows) == 2
+        assert rows[0]["suite"] == "Test Suite"
+        assert rows[0]["median_time"] == "0.104"
+        assert rows[0]["peak_rss_bytes"] == ""
+
     def test_runner_generate_markdown_report(
         self, temp_output_dir: Path, sample_benchmark_result: BenchmarkResult
     ) -> None:
@@ -663,6 +870,28 @@ class TestStructureAnalysisBenchmark:
         assert not temp_path.exists()
 
 
+class TestDependencyChainBenchmark:
+    """Tests for DependencyChainBenchmark."""
+
+    @pytest.mark.asyncio
+    async def test_dependency_chain_benchmark_runs_on_random_graph(self):
+        """Test dependency chain benchmark completes on a random graph."""
+        # Arrange
+        benchmark = DependencyChainBenchmark(num_files=200)
+        await benchmark.setup()
+
+        # Act
+        await benchmark.run_iteration()
+
+        # Assert
+        assert benchmark.analyzer is not None
+        chains = await benchmark.analyzer.find_dependency_chains()
+        assert len(chains) <= 20
+
+        # Cleanup
+        await benchmark.teardown()
+
+
 class TestCoAccessPatternBenchmark:
     """Tests for CoAccessPatternBenchmark."""
 
@@ -709,8 +938,373 @@ class TestCreateAnalysisBenchmarkSuite:
         # Assert
         assert suite.name == "Analysis Operations"
         assert suite.description != ""
-        # 3 pattern + 3 structure + 3 co-access = 9 benchmarks
-        assert len(suite.benchmarks) == 9
+        # 3 pattern + 3 structure + 1 chain + 3 co-access = 10 benchmarks
+        assert len(suite.benchmarks) == 10
+
+
+# ==============================================================================
+# Test Startup Benchmarks
+# ==============================================================================
+
+
+class TestImportTime:
+    """Tests for import-time parsing and the startup budget."""
+
+    def test_parse_import_time(self) -> None:
+        """Test self time is summed per package and the total is cumulative."""
+        # Arrange
+        report = (
+            "import time: self [us] | cumulative | imported package\n"
+            "import time:       300 |        300 |     mcp.types\n"
+            "import time:       100 |        400 |   mcp\n"
+            "import time:        50 |         50 |   cortex.server\n"
+            "import time:        25 |        475 | cortex.main\n"
+        )
+
+        # Act
+        profile = parse_import_time(report, "cortex.main")
+
+        # Assert
+        assert profile.total_ms == 0.475
+        assert profile.package_ms("mcp") == 0.4
+        assert profile.package_ms("cortex") == 0.075
+        assert profile.imported_modules[-1] == "cortex.main"
+
+    def test_lazy_startup_within_budget(self) -> None:
+        """Test Cortex's own startup imports stay within the budget."""
+        # Act
+        profile = measure_import_time("cortex.main")
+
+        # Assert
+        assert profile.package_ms("cortex") <= CORTEX_IMPORT_BUDGET_MS
+        assert "cortex.managers.initialization" not in profile.imported_modules
+
+    def test_create_startup_benchmark_suite(self) -> None:
+        """Test the startup suite compares lazy and eager tool registration."""
+        # Act
+        suite = create_startup_benchmark_suite()
+
+        # Assert
+        assert [b.name for b in suite.benchmarks] == [
+            "Import Time (cortex.main, lazy tools)",
+            "Import Time (cortex.main, eager tools)",
+        ]
+
+
+# ==============================================================================
+# Test Generated Memory Banks and Workflow Benchmarks
+# ==============================================================================
+
+
+def _result(name: str, median_time: float) -> BenchmarkResult:
+    """Create a result whose timings all equal median_time."""
+    return BenchmarkResult(
+        name=name,
+        iterations=5,
+        total_time=median_time * 5,
+        min_time=median_time,
+        max_time=median_time,
+        mean_time=median_time,
+        median_time=median_time,
+        std_dev=0.0,
+        p95_time=median_time,
+        p99_time=median_time,
+    )
+
+
+class TestMemoryBankGenerator:
+    """Tests for generated memory banks."""
+
+    def test_file_names_start_with_core_files(self) -> None:
+        """Test core files come first and topic files fill the rest."""
+        # Act
+        names = memory_bank_file_names(10)
+
+        # Assert
+        assert names[0] == "projectBrief.md"
+        assert names[-1] == "topic-00002.md"
+        assert len(set(names)) == 10
+
+    def test_transclusion_levels_partition_files(self) -> None:
+        """Test every file belongs to exactly one transclusion level."""
+        # Arrange
+        names = memory_bank_file_names(25)
+
+        # Act
+        levels = transclusion_levels(names)
+
+        # Assert
+        assert sorted(n for level in levels for n in level) == sorted(names)
+
+    @pytest.mark.asyncio
+    async def test_generate_memory_bank(self, temp_output_dir: Path) -> None:
+        """Test files are written, linked, transcluded and indexed."""
+        # Arrange
+        spec = MemoryBankSpec(num_files=40, links_per_file=3, transclusions_per_file=1)
+
+        # Act
+        bank = await generate_memory_bank(temp_output_dir, spec)
+
+        # Assert
+        files = sorted((temp_output_dir / ".cortex" / "memory-bank").glob("*.md"))
+        assert len(files) == 40
+        assert bank.total_links == 120
+        assert bank.transcluding_files
+        content = files[0].read_text()
+        assert "## Related" in content
+        indexed = await MetadataIndex(temp_output_dir).get_all_files_metadata()
+        assert len(indexed) == 40
+
+    @pytest.mark.asyncio
+    async def test_generation_is_deterministic(self, temp_output_dir: Path) -> None:
+        """Test the same spec generates the same memory bank."""
+        # Arrange
+        spec = MemoryBankSpec(num_files=10)
+
+        # Act
+        first = await generate_memory_bank(temp_output_dir / "a", spec)
+        second = await generate_memory_bank(temp_output_dir / "b", spec)
+
+        # Assert
+        assert first.total_links == second.total_links
+        assert first.transcluding_files == second.transcluding_files
+
+
+class TestToolWorkflowBenchmark:
+    """Tests for end-to-end tool workflow benchmarks."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("workflow", sorted(WORKFLOWS))
+    async def test_workflow_runs_on_generated_bank(self, workflow: str) -> None:
+        """Test each workflow calls its tool without errors."""
+        # Arrange
+        benchmark = ToolWorkflowBenchmark(
+            WORKFLOWS[workflow],
+            MemoryBankSpec(num_files=10),
+            iterations=1,
+            warmup_iterations=0,
+        )
+
+        # Act
+        result = await benchmark.run()
+
+        # Assert
+        assert result.iterations == 1
+        assert result.metadata["workflow"] == workflow
+        assert result.metadata["num_files"] == 10
+        assert benchmark.temp_dir is None
+
+    def test_create_workflow_benchmark_suite(self) -> None:
+        """Test one benchmark is created per size and workflow."""
+        # Act
+        suite = create_workflow_benchmark_suite(
+            sizes=[10, 100], workflows=["load_context", "validate_all"]
+        )
+
+        # Assert
+        assert [b.name for b in suite.benchmarks] == [
+            "load_context (10 files)",
+            "validate_all (10 files)",
+            "load_context (100 files)",
+            "validate_all (100 files)",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_workflow_shares_managers(self) -> None:
+        """Test concurrent calls run against one generated project."""
+        # Arrange
+        suite = create_workflow_benchmark_suite(
+            sizes=[10],
+            workflows=["get_memory_bank_stats"],
+            iterations=4,
+            warmup_iterations=0,
+            concurrency=4,
+        )
+
+        # Act
+        results = await suite.run_all()
+
+        # Assert
+        assert results[0].name == "get_memory_bank_stats (10 files, 4 concurrent)"
+        assert results[0].concurrency == 4
+
+    @pytest.mark.asyncio
+    async def test_concurrent_writes_use_separate_files(self) -> None:
+        """Test concurrent write calls do not conflict on one file."""
+        # Arrange
+        suite = create_workflow_benchmark_suite(
+            sizes=[10],
+            workflows=["manage_file_write"],
+            iterations=6,
+            warmup_iterations=1,
+            concurrency=3,
+        )
+
+        # Act
+        results = await suite.run_all()
+
+        # Assert
+        assert results[0].error is None
+        assert results[0].iterations == 6
+
+    def test_unknown_workflow_raises(self) -> None:
+        """Test unknown workflow names are rejected."""
+        # Act/Assert
+        with pytest.raises(ValueError, match="Unknown workflows: nope"):
+            _ = create_workflow_benchmark_suite(workflows=["nope"])
+
+
+# ==============================================================================
+# Test Baselines and the cortex-bench CLI
+# ==============================================================================
+
+
+class TestBaselineComparison:
+    """Tests for baseline files and regression comparison."""
+
+    def test_baseline_round_trip(self, temp_output_dir: Path) -> None:
+        """Test saved baselines load by benchmark name."""
+        # Arrange
+        path = temp_output_dir / "baseline.json"
+
+        # Act
+        save_baseline([_result("a", 0.01)], path)
+        baseline = load_baseline(path)
+
+        # Assert
+        assert baseline["a"]["median_time"] == 0.01
+
+    def test_load_baseline_rejects_other_versions(self, temp_output_dir: Path) -> None:
+        """Test files of another format version are rejected."""
+        # Arrange
+        path = temp_output_dir / "baseline.json"
+        _ = path.write_text(json.dumps({"version": 99, "results": []}))
+
+        # Act/Assert
+        with pytest.raises(ValueError, match="Unsupported baseline version"):
+            _ = load_baseline(path)
+
+    def test_compare_results_classifies_changes(self) -> None:
+        """Test regressions, improvements, noise, new and missing benchmarks."""
+        # Arrange
+        baseline = {
+            "slower": {"median_time": 0.010},
+            "faster": {"median_time": 0.010},
+            "noise": {"median_time": 0.0010},
+            "gone": {"median_time": 0.010},
+        }
+        current = [
+            _result("slower", 0.020),
+            _result("faster", 0.005),
+            _result("noise", 0.0019),
+            _result("added", 0.010),
+        ]
+
+        # Act
+        report = compare_results(current, baseline)
+
+        # Assert
+        statuses = {c.name: c.status for c in report.comparisons}
+        assert statuses == {
+            "slower": "regression",
+            "faster": "improvement",
+            "noise": "unchanged",
+            "added": "new",
+            "gone": "missing",
+        }
+        assert not report.passed
+        assert "FAILED: 1 regression(s)" in report.to_markdown()
+
+    def test_failed_benchmarks_fail_the_report(self, temp_output_dir: Path) -> None:
+        """Test failed benchmarks are reported and kept out of baselines."""
+        # Arrange
+        failed = BenchmarkResult.failed("broken", 10, "RuntimeError: boom")
+        path = temp_output_dir / "baseline.json"
+
+        # Act
+        report = compare_results([failed], {"broken": {"median_time": 0.01}})
+        save_baseline([failed, _result("ok", 0.01)], path)
+
+        # Assert
+        assert [c.status for c in report.comparisons] == ["failed"]
+        assert not report.passed
+        assert "1 failed benchmark(s)" in report.to_markdown()
+        assert list(load_baseline(path)) == ["ok"]
+
+    def test_threshold_overrides(self) -> None:
+        """Test a matching override raises the allowed slowdown."""
+        # Arrange
+        baseline = {"validate_all (10 files)": {"median_time": 0.010}}
+        current = [_result("validate_all (10 files)", 0.014)]
+
+        # Act
+        report = compare_results(
+            current, baseline, threshold=0.2, overrides={"validate_all*": 0.5}
+        )
+
+        # Assert
+        assert report.passed
+        assert threshold_for("load_context (10 files)", 0.2, {"validate*": 0.5}) == 0.2
+
+
+class TestBenchCli:
+    """Tests for the cortex-bench entry point."""
+
+    def test_regression_fails_the_run(self, temp_output_dir: Path) -> None:
+        """Test a baseline run passes and a much faster baseline fails it."""
+        # Arrange
+        args = [
+            "--sizes",
+            "10",
+            "--workflows",
+            "get_memory_bank_stats",
+            "--iterations",
+            "2",
+            "--warmup-iterations",
+            "0",
+            "--output-dir",
+            str(temp_output_dir),
+        ]
+        baseline_path = temp_output_dir / "baseline.json"
+
+        # Act
+        saved = bench_main([*args, "--save-baseline", str(baseline_path)])
+        compared = bench_main(
+            [*args, "--baseline", str(baseline_path), "--threshold", "1000"]
+        )
+        save_baseline([_result("get_memory_bank_stats (10 files)", 0.0)], baseline_path)
+        regressed = bench_main(
+            [*args, "--baseline", str(baseline_path), "--min-delta-ms", "0"]
+        )
+
+        # Assert
+        assert saved == 0
+        assert compared == 0
+        assert regressed == 1
+        assert (temp_output_dir / "comparison.md").exists()
+        assert (temp_output_dir / "results.csv").read_text().count("\n") == 4
+
+    def test_unreadable_baseline_is_reported(
+        self, temp_output_dir: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test a missing or malformed baseline exits with 2 before benchmarking."""
+        # Arrange
+        malformed = temp_output_dir / "malformed.json"
+        _ = malformed.write_text("{not json", encoding="utf-8")
+        args = ["--sizes", "10", "--output-dir", str(temp_output_dir)]
+
+        # Act
+        with patch("cortex.benchmarks.cli.run_benchmarks") as mock_run:
+            missing_code = bench_main(
+                [*args, "--baseline", str(temp_output_dir / "missing.json")]
+            )
+            malformed_code = bench_main([*args, "--baseline", str(malformed)])
+
+        # Assert
+        assert missing_code == 2
+        assert malformed_code == 2
+        mock_run.assert_not_called()
+        assert "Cannot load baseline" in capsys.readouterr().err
 
 
 # ==============================================================================
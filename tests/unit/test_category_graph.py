@@ -0,0 +1,116 @@
+"""
+Tests for category_graph module.
+
+This test module covers:
+- Building the category quotient graph from structure data
+- Cohesion, cross-category dependency and depth metrics
+- Move-one-file evaluation and in-place moves
+"""
+
+import pytest
+
+from cortex.core.models import ModelDict
+from cortex.refactoring.reorganization.category_graph import CategoryGraph
+
+
+@pytest.fixture
+def graph() -> CategoryGraph:
+    """Two categories with one file on the wrong side."""
+    return CategoryGraph(
+        categories={
+            "core": ["brief.md", "context.md"],
+            "reference": ["api.md", "glossary.md"],
+        },
+        dependencies={
+            "context.md": ["brief.md"],
+            "glossary.md": ["brief.md", "context.md"],
+            "api.md": ["glossary.md", "missing.md"],
+        },
+    )
+
+
+class TestMetrics:
+    """Tests for CategoryGraph.metrics."""
+
+    def test_counts_quotient_edges(self, graph: CategoryGraph) -> None:
+        """Test dependencies are split into intra- and cross-category edges."""
+        # Act
+        metrics = graph.metrics()
+
+        # Assert
+        assert metrics.categories == 2
+        assert metrics.intra_category_dependencies == 2
+        assert metrics.cross_category_dependencies == 2
+        assert metrics.cohesion == 0.5
+        assert metrics.category_depth == 1
+
+    def test_from_structure_resolves_file_names(self) -> None:
+        """Test dependency entries by file name map onto full paths."""
+        # Arrange
+        files = ["/bank/brief.md", "/bank/context.md", "/bank/notes.md"]
+        dependency_graph: ModelDict = {
+            "dependencies": {"context.md": {"depends_on": ["brief.md"]}}
+        }
+
+        # Act
+        graph = CategoryGraph.from_structure(
+            files, {"core": ["/bank/brief.md"]}, dependency_graph
+        )
+
+        # Assert
+        assert graph.category_of("/bank/notes.md") == "uncategorized"
+        assert graph.metrics().cross_category_dependencies == 1
+
+
+class TestMoves:
+    """Tests for evaluating and applying moves."""
+
+    def test_evaluate_move_leaves_graph_unchanged(self, graph: CategoryGraph) -> None:
+        """Test evaluating a move reports the delta without applying it."""
+        # Act
+        delta = graph.evaluate_move("glossary.md", "core")
+
+        # Assert
+        assert delta.source_category == "reference"
+        assert delta.cross_dependency_change == -1
+        assert delta.after.cohesion == 0.75
+        assert graph.category_of("glossary.md") == "reference"
+
+    def test_move_matches_rebuilt_graph(self, graph: CategoryGraph) -> None:
+        """Test an in-place move equals building the moved structure anew."""
+        # Arrange
+        rebuilt = CategoryGraph(
+            categories={
+                "core": ["brief.md", "context.md", "glossary.md"],
+                "reference": ["api.md"],
+            },
+            dependencies={
+                "context.md": ["brief.md"],
+                "glossary.md": ["brief.md", "context.md"],
+                "api.md": ["glossary.md"],
+            },
+        )
+
+        # Act
+        delta = graph.move("glossary.md", "core")
+
+        # Assert
+        assert graph.metrics() == rebuilt.metrics() == delta.after
+        assert graph.categories == rebuilt.categories
+
+    def test_moving_last_file_drops_category(self, graph: CategoryGraph) -> None:
+        """Test emptying a category removes it from the metrics."""
+        # Act
+        _ = graph.move("api.md", "core")
+        delta = graph.evaluate_move("glossary.md", "core")
+
+        # Assert
+        assert delta.after.categories == 1
+        assert delta.after.cross_category_dependencies == 0
+        assert delta.after.category_depth == 0
+
+    def test_unknown_file_raises(self, graph: CategoryGraph) -> None:
+        """Test moving a file outside the graph raises KeyError."""
+        # Act / Assert
+        with pytest.raises(KeyError):
+            _ = graph.evaluate_move("missing.md", "core")
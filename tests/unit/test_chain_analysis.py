@@ -0,0 +1,159 @@
+"""
+Tests for chain_analysis module.
+
+This test module covers:
+- Dependency depth calculation on the condensed graph
+- Longest linear chain extraction
+- Circular chain reporting
+- Length caps and top-k limits
+"""
+
+import random
+
+from cortex.analysis.chain_analysis import (
+    calculate_dependency_depths,
+    find_dependency_chains,
+)
+
+
+def _graph(edges: dict[str, list[str]]) -> dict[str, dict[str, list[str]]]:
+    """Build an analysis graph dict from an adjacency mapping."""
+    nodes = set(edges) | {dep for deps in edges.values() for dep in deps}
+    return {
+        node: {
+            "dependencies": edges.get(node, []),
+            "dependents": [src for src, deps in edges.items() if node in deps],
+        }
+        for node in nodes
+    }
+
+
+class TestCalculateDependencyDepths:
+    """Tests for calculate_dependency_depths."""
+
+    def test_linear_chain_depths(self) -> None:
+        """Test depths along a simple chain."""
+        # Arrange
+        graph = _graph({"a": ["b"], "b": ["c"], "c": []})
+
+        # Act
+        depth_map, max_depth = calculate_dependency_depths(graph)
+
+        # Assert
+        assert depth_map == {"a": 2, "b": 1, "c": 0}
+        assert max_depth == 2
+
+    def test_cycle_counts_each_member_once(self) -> None:
+        """Test depths terminate on cycles and count the cycle once."""
+        # Arrange
+        graph = _graph({"x": ["a"], "a": ["b"], "b": ["a", "c"], "c": []})
+
+        # Act
+        depth_map, max_depth = calculate_dependency_depths(graph)
+
+        # Assert
+        assert depth_map["c"] == 0
+        assert depth_map["a"] == depth_map["b"] == 2
+        assert max_depth == 3
+
+    def test_empty_graph(self) -> None:
+        """Test empty graph has zero depth."""
+        # Act
+        depth_map, max_depth = calculate_dependency_depths({})
+
+        # Assert
+        assert depth_map == {}
+        assert max_depth == 0
+
+
+class TestFindDependencyChains:
+    """Tests for find_dependency_chains."""
+
+    def test_reports_only_maximal_linear_chain(self) -> None:
+        """Test suffixes of the longest chain are not reported separately."""
+        # Arrange
+        graph = _graph({"a": ["b"], "b": ["c"], "c": ["d"], "d": []})
+
+        # Act
+        chains = find_dependency_chains(graph)
+
+        # Assert
+        assert len(chains) == 1
+        assert chains[0].chain == ["a", "b", "c", "d"]
+        assert chains[0].length == 4
+        assert chains[0].is_linear
+
+    def test_picks_longest_branch(self) -> None:
+        """Test the chain follows the longest path through branches."""
+        # Arrange
+        graph = _graph({"a": ["b", "x"], "b": ["c"], "c": ["d"], "x": []})
+
+        # Act
+        chains = find_dependency_chains(graph)
+
+        # Assert
+        assert chains[0].chain == ["a", "b", "c", "d"]
+
+    def test_reports_shortest_cycle(self) -> None:
+        """Test circular chains are closed by repeating the first file."""
+        # Arrange
+        graph = _graph({"a": ["b"], "b": ["c"], "c": ["a"]})
+
+        # Act
+        chains = find_dependency_chains(graph)
+
+        # Assert
+        circular = [c for c in chains if not c.is_linear]
+        assert len(circular) == 1
+        assert circular[0].chain[0] == circular[0].chain[-1]
+        assert set(circular[0].chain) == {"a", "b", "c"}
+
+    def test_respects_max_chain_length(self) -> None:
+        """Test long chains are truncated and long cycles dropped."""
+        # Arrange
+        edges = {f"n{i}": [f"n{i + 1}"] for i in range(8)}
+        edges["c0"] = ["c1"]
+        edges["c1"] = ["c2"]
+        edges["c2"] = ["c3"]
+        edges["c3"] = ["c0"]
+        graph = _graph(edges)
+
+        # Act
+        chains = find_dependency_chains(graph, max_chain_length=3)
+
+        # Assert
+        assert chains
+        assert all(c.length <= 3 and len(c.chain) <= 3 for c in chains)
+        assert all(c.is_linear for c in chains)
+
+    def test_limit_bounds_results(self) -> None:
+        """Test the number of results is bounded by the limit."""
+        # Arrange
+        edges = {f"s{i}": [f"m{i}"] for i in range(30)}
+        edges.update({f"m{i}": [f"e{i}"] for i in range(30)})
+        graph = _graph(edges)
+
+        # Act
+        limited = find_dependency_chains(graph, limit=5)
+        unlimited = find_dependency_chains(graph, limit=None)
+
+        # Assert
+        assert len(limited) == 5
+        assert len(unlimited) == 30
+
+    def test_large_random_graph_is_fast_and_sorted(self) -> None:
+        """Test dense random graphs complete with sorted, bounded results."""
+        # Arrange
+        rng = random.Random(7)
+        edges = {
+            f"f{i}": [f"f{rng.randrange(1000)}" for _ in range(6)] for i in range(1000)
+        }
+        graph = _graph(edges)
+
+        # Act
+        chains = find_dependency_chains(graph, max_chain_length=30)
+
+        # Assert
+        assert len(chains) <= 20
+        lengths = [c.length for c in chains]
+        assert lengths == sorted(lengths, reverse=True)
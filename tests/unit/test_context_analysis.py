@@ -6,6 +6,7 @@ from pathlib import Path
 from typing import cast
 
 from cortex.core.path_resolver import CortexResourceType, get_cortex_path
+from cortex.core.session_logger import log_load_context_call
 from cortex.tools.context_analysis_operations import (
     analyze_current_session,
     analyze_session_logs,
@@ -152,6 +153,82 @@ class TestAnalyzeSessionLogs:
         assert "implement/add" in patterns
 
 
+class TestIncrementalAnalysis:
+    """Tests for watermark-based analysis of JSONL session logs."""
+
+    @staticmethod
+    def _log_call(project_root: Path, task_description: str) -> None:
+        log_load_context_call(
+            project_root=project_root,
+            task_description=task_description,
+            token_budget=5000,
+            strategy="dependency_aware",
+            selected_files=["file1.md"],
+            selected_sections={},
+            total_tokens=1000,
+            utilization=0.2,
+            excluded_files=[],
+            relevance_scores={"file1.md": 0.8},
+        )
+
+    def test_only_new_calls_are_analyzed(self, tmp_path: Path) -> None:
+        """Test calls appended after an analysis are added by the next one."""
+        # Arrange
+        env_key = "CORTEX_SESSION_ID"
+        original = os.environ.get(env_key)
+        os.environ[env_key] = "incremental_test"
+
+        try:
+            self._log_call(tmp_path, "Fix bug")
+            first = analyze_session_logs(tmp_path)
+            self._log_call(tmp_path, "Add feature")
+
+            # Act
+            second = analyze_session_logs(tmp_path)
+            third = analyze_session_logs(tmp_path)
+
+            # Assert
+            assert first.new_entries_added == 1
+            assert first.new_sessions_analyzed == 1
+            assert second.new_entries_added == 1
+            assert second.new_sessions_analyzed == 0
+            assert second.total_entries == 2
+            assert second.total_sessions == 1
+            assert third.new_entries_added == 0
+        finally:
+            if original:
+                os.environ[env_key] = original
+            else:
+                _ = os.environ.pop(env_key, None)
+
+    def test_watermarks_are_persisted(self, tmp_path: Path) -> None:
+        """Test the statistics file records how much of each log was read."""
+        # Arrange
+        env_key = "CORTEX_SESSION_ID"
+        original = os.environ.get(env_key)
+        os.environ[env_key] = "watermark_test"
+
+        try:
+            self._log_call(tmp_path, "Fix bug")
+
+            # Act
+            result = analyze_current_session(tmp_path)
+
+            # Assert
+            session_dir = get_cortex_path(tmp_path, CortexResourceType.SESSION)
+            log_path = session_dir / "context-session-watermark_test.jsonl"
+            stats = json.loads(
+                (session_dir / "context-usage-statistics.json").read_text()
+            )
+            assert result.new_entries_added == 1
+            assert stats["log_watermarks"] == {log_path.name: log_path.stat().st_size}
+        finally:
+            if original:
+                os.environ[env_key] = original
+            else:
+                _ = os.environ.pop(env_key, None)
+
+
 class TestAnalyzeCurrentSession:
     """Tests for current session analysis."""
 
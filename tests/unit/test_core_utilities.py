@@ -3,23 +3,27 @@ Unit tests for core utility modules.
 
 Tests for:
 - responses.py
-- manager_registry.py
+- manager_registry.py (including the project pool and its memory limit)
 - mcp_tool_validator.py
 - mcp_failure_handler.py
 """
 
 # pyright: reportPrivateUsage=false
 
+import asyncio
 import json
+import threading
 from pathlib import Path
 from typing import cast
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from pydantic import BaseModel
 
 from cortex.core.manager_registry import ManagerRegistry
 from cortex.core.models import ModelDict
 from cortex.core.responses import error_response, success_response
+from cortex.core.state_store import StateStore, StateTable
 from tests.helpers.managers import make_test_managers
 
 
@@ -157,6 +161,32 @@ class TestManagerRegistry:
             # Assert - only called once
             assert mock_init.call_count == 1
 
+    @pytest.mark.asyncio
+    async def test_get_managers_concurrent_calls_share_initialization(
+        self, tmp_path: Path
+    ) -> None:
+        """Test concurrent first calls initialize the managers only once."""
+        # Arrange
+        registry = ManagerRegistry()
+        mock_managers = make_test_managers(fs=MagicMock())
+
+        async def slow_initialize(_root: Path) -> object:
+            await asyncio.sleep(0.01)
+            return mock_managers
+
+        with patch(
+            "cortex.managers.initialization.initialize_managers",
+            side_effect=slow_initialize,
+        ) as mock_init:
+            # Act
+            first, second = await asyncio.gather(
+                registry.get_managers(tmp_path), registry.get_managers(tmp_path)
+            )
+
+            # Assert
+            assert mock_init.call_count == 1
+            assert first is second
+
     def test_clear_cache_all(self, tmp_path: Path) -> None:
         """Test clearing all cached managers."""
         # Arrange
@@ -193,6 +223,327 @@ class TestManagerRegistry:
         assert not registry.has_managers(tmp_path)
 
 
+class _Note(BaseModel):
+    text: str
+
+
+class TestManagerPool:
+    """Tests for LRU and idle eviction of pooled project managers."""
+
+    @staticmethod
+    def _initialize(_root: Path) -> object:
+        return make_test_managers(fs=MagicMock())
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_project_is_evicted(self, tmp_path: Path) -> None:
+        """Test the pool keeps the most recently used projects."""
+        # Arrange
+        registry = ManagerRegistry(max_projects=2)
+        roots = [tmp_path / name for name in ("a", "b", "c")]
+
+        with patch(
+            "cortex.managers.initialization.initialize_managers",
+            new_callable=AsyncMock,
+            side_effect=self._initialize,
+        ):
+            first = await registry.get_managers(roots[0])
+            _ = await registry.get_managers(roots[1])
+            _ = await registry.get_managers(roots[0])
+
+            # Act
+            _ = await registry.get_managers(roots[2])
+
+        # Assert
+        assert registry.projects() == [str(roots[0]), str(roots[2])]
+        assert await registry.get_managers(roots[0]) is first
+        cast(MagicMock, first.watcher).stop.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_evicted_managers_are_released(self, tmp_path: Path) -> None:
+        """Test eviction stops the evicted project's file watcher."""
+        # Arrange
+        registry = ManagerRegistry(max_projects=1)
+
+        with patch(
+            "cortex.managers.initialization.initialize_managers",
+            new_callable=AsyncMock,
+            side_effect=self._initialize,
+        ):
+            evicted = await registry.get_managers(tmp_path / "a")
+
+            # Act
+            _ = await registry.get_managers(tmp_path / "b")
+
+        # Assert
+        cast(MagicMock, evicted.watcher).stop.assert_called_once()
+        assert not registry.has_managers(tmp_path / "a")
+
+    @pytest.mark.asyncio
+    async def test_idle_projects_are_evicted(self, tmp_path: Path) -> None:
+        """Test projects unused past the idle timeout are evicted on access."""
+        # Arrange
+        now = [0.0]
+        registry = ManagerRegistry(idle_timeout=60.0, clock=lambda: now[0])
+
+        with patch(
+            "cortex.managers.initialization.initialize_managers",
+            new_callable=AsyncMock,
+            side_effect=self._initialize,
+        ):
+            _ = await registry.get_managers(tmp_path / "idle")
+            now[0] = 30.0
+            _ = await registry.get_managers(tmp_path / "busy")
+            now[0] = 75.0
+
+            # Act
+            _ = await registry.get_managers(tmp_path / "busy")
+
+        # Assert
+        assert registry.projects() == [str(tmp_path / "busy")]
+
+    def test_idle_eviction_disabled_by_default(self, tmp_path: Path) -> None:
+        """Test projects are only evicted by pool size without a timeout."""
+        # Arrange
+        registry = ManagerRegistry()
+        registry._managers[str(tmp_path)] = make_test_managers(fs=MagicMock())
+
+        # Act
+        evicted = registry.evict_idle()
+
+        # Assert
+        assert evicted == []
+        assert registry.has_managers(tmp_path)
+
+    def test_configure_shrinks_pool(self, tmp_path: Path) -> None:
+        """Test lowering max_projects evicts the least recently used."""
+        # Arrange
+        registry = ManagerRegistry()
+        for name in ("a", "b", "c"):
+            registry._managers[str(tmp_path / name)] = make_test_managers(
+                fs=MagicMock()
+            )
+
+        # Act
+        registry.configure(max_projects=1, idle_timeout=10.0)
+
+        # Assert
+        assert registry.projects() == [str(tmp_path / "c")]
+        assert registry.idle_timeout == 10.0
+
+    @pytest.mark.asyncio
+    async def test_memory_limit_evicts_least_recently_used(
+        self, tmp_path: Path
+    ) -> None:
+        """Test projects are evicted until the pool fits its memory limit."""
+        # Arrange
+        registry = ManagerRegistry(memory_limit_bytes=250)
+        roots = [tmp_path / name for name in ("a", "b", "c")]
+
+        with (
+            patch(
+                "cortex.managers.initialization.initialize_managers",
+                new_callable=AsyncMock,
+                side_effect=self._initialize,
+            ),
+            patch("cortex.core.manager_registry.estimate_size", return_value=100),
+        ):
+            _ = await registry.get_managers(roots[0])
+            _ = await registry.get_managers(roots[1])
+
+            # Act
+            _ = await registry.get_managers(roots[2])
+            _ = await registry.refresh_memory_usage()
+
+        # Assert
+        assert registry.projects() == [str(roots[1]), str(roots[2])]
+        assert registry.stats().evictions == {"memory": 1}
+
+    @pytest.mark.asyncio
+    async def test_requests_measure_memory_off_the_event_loop(
+        self, tmp_path: Path
+    ) -> None:
+        """Test requests read cached estimates and re-measure in a worker thread."""
+        # Arrange
+        registry = ManagerRegistry(memory_limit_bytes=1000)
+        threads: list[int] = []
+
+        def estimate(*_args: object) -> int:
+            threads.append(threading.get_ident())
+            return 100
+
+        with (
+            patch(
+                "cortex.managers.initialization.initialize_managers",
+                new_callable=AsyncMock,
+                side_effect=self._initialize,
+            ),
+            patch("cortex.core.manager_registry.estimate_size", side_effect=estimate),
+        ):
+            # Act
+            _ = await registry.get_managers(tmp_path / "a")
+            _ = await registry.get_managers(tmp_path / "a")
+            usage = await registry.refresh_memory_usage()
+
+        # Assert
+        assert usage == {str(tmp_path / "a"): 100}
+        assert threads
+        assert threading.get_ident() not in threads
+
+    @pytest.mark.asyncio
+    async def test_memory_limit_keeps_requested_project(self, tmp_path: Path) -> None:
+        """Test the project being requested survives an exceeded limit."""
+        # Arrange
+        registry = ManagerRegistry(memory_limit_bytes=10)
+
+        with (
+            patch(
+                "cortex.managers.initialization.initialize_managers",
+                new_callable=AsyncMock,
+                side_effect=self._initialize,
+            ),
+            patch("cortex.core.manager_registry.estimate_size", return_value=100),
+        ):
+            # Act
+            managers = await registry.get_managers(tmp_path)
+            _ = await registry.refresh_memory_usage()
+
+        # Assert
+        assert registry.has_managers(tmp_path)
+        cast(MagicMock, managers.watcher).stop.assert_not_called()
+
+    def test_memory_estimates_are_reused(self, tmp_path: Path) -> None:
+        """Test a project is re-measured only after measure_interval."""
+        # Arrange
+        now = [0.0]
+        registry = ManagerRegistry(measure_interval=60.0, clock=lambda: now[0])
+        registry._managers[str(tmp_path)] = make_test_managers(fs=MagicMock())
+
+        with patch(
+            "cortex.core.manager_registry.estimate_size", side_effect=[100, 200]
+        ) as mock_estimate:
+            # Act
+            first = registry.memory_usage()
+            now[0] = 30.0
+            cached = registry.memory_usage()
+            now[0] = 61.0
+            refreshed = registry.memory_usage()
+
+        # Assert
+        assert first == cached == {str(tmp_path): 100}
+        assert refreshed == {str(tmp_path): 200}
+        assert mock_estimate.call_count == 2
+
+    def test_eviction_flushes_state_records(self, tmp_path: Path) -> None:
+        """Test records changed in place are written when a project is evicted."""
+        # Arrange
+        store = StateStore(tmp_path / "state.db")
+        table = StateTable(store, "notes", _Note, lambda _: "")
+        table["n1"] = _Note(text="before")
+        table["n1"].text = "after"
+        holder = MagicMock()
+        holder.table = table
+        registry = ManagerRegistry(max_projects=1)
+        registry._managers[str(tmp_path)] = make_test_managers(
+            fs=MagicMock(), rollback_manager=holder
+        )
+
+        # Act
+        registry.configure(max_projects=1, memory_limit_bytes=0)
+
+        # Assert
+        assert not registry.has_managers(tmp_path)
+        table.clear_cache()
+        assert table["n1"].text == "after"
+        store.close()
+
+    def test_eviction_closes_state_store(self, tmp_path: Path) -> None:
+        """Test evicting a project closes its shared state store."""
+        # Arrange
+        store = StateStore(tmp_path / "state.db")
+        _ = store.count("notes")
+        registry = ManagerRegistry(max_projects=1)
+        registry._managers[str(tmp_path)] = make_test_managers(
+            fs=MagicMock(), state=store
+        )
+
+        # Act
+        registry.configure(max_projects=1, memory_limit_bytes=0)
+
+        # Assert
+        assert store.closed
+
+    @pytest.mark.asyncio
+    async def test_eviction_stops_rules_reindexing(self, tmp_path: Path) -> None:
+        """Test evicting a project stops its rules manager's auto re-index."""
+        # Arrange
+        from cortex.managers.lazy_manager import LazyManager
+        from cortex.optimization.rules_indexer import RulesIndexer
+
+        indexer = RulesIndexer(tmp_path, MagicMock())
+        await indexer.start_auto_reindex(str(tmp_path))
+        rules_manager = MagicMock()
+        rules_manager.indexer = indexer
+        lazy_rules = LazyManager(AsyncMock(return_value=rules_manager), "rules")
+        _ = await lazy_rules.get()
+        registry = ManagerRegistry(max_projects=1)
+        registry._managers[str(tmp_path)] = make_test_managers(
+            fs=MagicMock(), rules_manager=lazy_rules
+        )
+        reindex_task = indexer.reindex_task
+        assert reindex_task is not None
+
+        # Act
+        registry.configure(max_projects=1, memory_limit_bytes=0)
+        _ = await asyncio.wait_for(asyncio.gather(*registry._releases), timeout=1.0)
+
+        # Assert
+        assert reindex_task.done()
+        assert not registry._releases
+
+    def test_stats_describe_pooled_projects(self, tmp_path: Path) -> None:
+        """Test pool stats report each project's memory and idle time."""
+        # Arrange
+        now = [0.0]
+        registry = ManagerRegistry(
+            max_projects=4, memory_limit_bytes=1000, clock=lambda: now[0]
+        )
+        root_str = str(tmp_path)
+        registry._managers[root_str] = make_test_managers(fs=MagicMock())
+        registry._last_used[root_str] = 0.0
+        now[0] = 5.0
+
+        # Act
+        with patch("cortex.core.manager_registry.estimate_size", return_value=300):
+            _ = registry.memory_usage()
+            stats = registry.stats(include_projects=True)
+
+        # Assert
+        assert stats.projects == 1
+        assert stats.max_projects == 4
+        assert stats.estimated_bytes == 300
+        assert stats.memory_limit_bytes == 1000
+        assert stats.pooled[0].project_root == root_str
+        assert stats.pooled[0].idle_seconds == 5.0
+        assert stats.pooled[0].initialized_managers == 7
+
+    def test_stats_hide_project_roots_by_default(self, tmp_path: Path) -> None:
+        """Test pool stats only report totals unless projects are requested."""
+        # Arrange
+        registry = ManagerRegistry(max_projects=4)
+        registry._managers[str(tmp_path)] = make_test_managers(fs=MagicMock())
+
+        # Act
+        with patch(
+            "cortex.core.manager_registry.estimate_size", return_value=300
+        ) as mock_estimate:
+            stats = registry.stats()
+
+        # Assert
+        assert stats.projects == 1
+        assert stats.pooled == []
+        mock_estimate.assert_not_called()
+
+
 class TestMCPToolValidator:
     """Tests for mcp_tool_validator module."""
 
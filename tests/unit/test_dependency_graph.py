@@ -11,6 +11,7 @@ from cortex.core.dependency_graph import (
     DependencyGraph,
     FileDependencyInfo,
 )
+from cortex.core.models import GraphQuery
 
 
 class TestDependencyGraphInitialization:
@@ -572,6 +573,54 @@ class TestToMermaidExport:
         assert "classDef foundation fill:#fff9c4" in mermaid
 
 
+class TestGraphQuery:
+    """Tests for filtered, paginated graph queries."""
+
+    def test_iter_typed_edges_classifies_edges(self):
+        """Test edges carry link, dynamic or static types."""
+        # Arrange
+        graph = DependencyGraph()
+        graph.add_link_dependency("notes.md", "progress.md", "transclusion")
+        graph.add_dynamic_dependency("notes.md", "ideas.md")
+
+        # Act
+        edges = list(graph.iter_typed_edges())
+
+        # Assert
+        assert ("notes.md", "progress.md", "transclusion") in edges
+        assert ("notes.md", "ideas.md", "links") in edges
+        assert ("productContext.md", "projectBrief.md", "informs") in edges
+
+    def test_query_neighborhood_of_root(self):
+        """Test query returns only the neighborhood of the root."""
+        # Arrange
+        graph = DependencyGraph()
+        graph.add_link_dependency("notes.md", "ideas.md", "reference")
+        graph.add_link_dependency("ideas.md", "drafts.md", "reference")
+
+        # Act
+        result = graph.query(
+            GraphQuery(root="notes.md", depth=1, link_types=["reference"])
+        )
+
+        # Assert
+        assert result.nodes == ["notes.md", "ideas.md"]
+        assert result.total_edges == 1
+
+    def test_query_mermaid_streams_lines(self):
+        """Test query_mermaid yields a diagram for the page."""
+        # Arrange
+        graph = DependencyGraph()
+        graph.add_link_dependency("notes.md", "ideas.md", "transclusion")
+
+        # Act
+        lines = list(graph.query_mermaid(GraphQuery(root="notes.md")))
+
+        # Assert
+        assert lines[0] == "flowchart TD"
+        assert "    n0 -.->|transclusion| n1" in lines
+
+
 class TestLinkDependencyManagement:
     """Tests for link-based dependency methods."""
 
@@ -712,6 +761,92 @@ class TestDetectCycles:
         assert len(cycles) > 0
 
 
+class TestIncrementalIndex:
+    """Tests for index maintenance across graph mutations."""
+
+    def test_cycle_detected_after_incremental_insert(self):
+        """Test adding an edge after a query updates cycle state."""
+        # Arrange
+        graph = DependencyGraph()
+        graph.add_dynamic_dependency("file1.md", "file2.md")
+        assert not graph.has_circular_dependency()
+
+        # Act
+        graph.add_dynamic_dependency("file2.md", "file1.md")
+
+        # Assert
+        assert graph.has_circular_dependency()
+        assert graph.detect_cycles() == [["file1.md", "file2.md", "file1.md"]]
+
+    def test_cycle_cleared_after_removal(self):
+        """Test removing an edge splits the cycle again."""
+        # Arrange
+        graph = DependencyGraph()
+        graph.add_dynamic_dependency("file1.md", "file2.md")
+        graph.add_dynamic_dependency("file2.md", "file1.md")
+        assert graph.has_circular_dependency()
+
+        # Act
+        graph.remove_dynamic_dependency("file2.md", "file1.md")
+
+        # Assert
+        assert not graph.has_circular_dependency()
+        assert graph.detect_cycles() == []
+
+    def test_transitive_dependencies_follow_mutations(self):
+        """Test cached closures are invalidated when reachability changes."""
+        # Arrange
+        graph = DependencyGraph()
+        graph.add_dynamic_dependency("a.md", "b.md")
+        assert graph.get_transitive_dependencies("a.md") == {"b.md"}
+
+        # Act
+        graph.add_dynamic_dependency("b.md", "progress.md")
+
+        # Assert
+        assert "progress.md" in graph.get_transitive_dependencies("a.md")
+        assert "projectBrief.md" in graph.get_transitive_dependencies("a.md")
+
+    def test_removing_duplicate_of_static_edge_keeps_dependency(self):
+        """Test static edges survive removal of an identical dynamic edge."""
+        # Arrange
+        graph = DependencyGraph()
+        graph.add_dynamic_dependency("productContext.md", "projectBrief.md")
+        _ = graph.get_dependents("projectBrief.md")
+
+        # Act
+        graph.remove_dynamic_dependency("productContext.md", "projectBrief.md")
+
+        # Assert
+        assert "productContext.md" in graph.get_dependents("projectBrief.md")
+
+    def test_direct_dict_mutation_rebuilds_index(self):
+        """Test adding keys to dynamic_deps directly is noticed."""
+        # Arrange
+        graph = DependencyGraph()
+        assert not graph.has_circular_dependency()
+
+        # Act
+        graph.dynamic_deps["loop.md"] = ["loop.md"]
+
+        # Assert
+        assert graph.has_circular_dependency()
+
+    def test_loading_order_cached_until_mutation(self):
+        """Test loading order is reused and refreshed after changes."""
+        # Arrange
+        graph = DependencyGraph()
+        first = graph.compute_loading_order()
+        assert graph.compute_loading_order() == first
+
+        # Act
+        graph.add_dynamic_dependency("memorybankinstructions.md", "progress.md")
+        second = graph.compute_loading_order()
+
+        # Assert
+        assert second.index("progress.md") < second.index("memorybankinstructions.md")
+
+
 class TestGetAllFiles:
     """Tests for get_all_files method."""
 
@@ -0,0 +1,90 @@
+"""
+Tests for execution_plan module.
+
+This test module covers:
+- Path collection per operation
+- Wave planning for independent and conflicting operations
+"""
+
+from cortex.refactoring.execution_plan import operation_paths, plan_waves
+from cortex.refactoring.models import OperationParameters, RefactoringOperationModel
+
+
+def _operation(
+    operation_id: str, operation_type: str, target_file: str, **params: str
+) -> RefactoringOperationModel:
+    return RefactoringOperationModel(
+        operation_id=operation_id,
+        operation_type=operation_type,
+        target_file=target_file,
+        parameters=OperationParameters.model_validate(params),
+    )
+
+
+class TestOperationPaths:
+    """Tests for operation_paths."""
+
+    def test_includes_source_destination_and_rename(self) -> None:
+        """Test all referenced paths are collected."""
+        # Arrange
+        consolidate = _operation(
+            "op-1", "consolidate", "a.md", source_file="b.md", destination_file="c.md"
+        )
+        rename = _operation("op-2", "rename", "dir/a.md", new_name="z.md")
+
+        # Act / Assert
+        assert operation_paths(consolidate) == {"a.md", "b.md", "c.md"}
+        assert operation_paths(rename) == {"dir/a.md", "dir/z.md"}
+
+
+class TestPlanWaves:
+    """Tests for plan_waves."""
+
+    def test_independent_operations_share_a_wave(self) -> None:
+        """Test operations on disjoint files run together."""
+        # Arrange
+        operations = [
+            _operation(f"op-{i}", "create", f"file{i}.md", content="x")
+            for i in range(4)
+        ]
+
+        # Act
+        waves = plan_waves(operations)
+
+        # Assert
+        assert waves == [[0, 1, 2, 3]]
+
+    def test_conflicting_operations_keep_order(self) -> None:
+        """Test operations on the same file run in submission order."""
+        # Arrange
+        operations = [
+            _operation("op-1", "create", "a.md", content="x"),
+            _operation("op-2", "split", "a.md", destination_file="b.md"),
+            _operation("op-3", "create", "c.md", content="y"),
+            _operation("op-4", "modify", "b.md", content="z"),
+        ]
+
+        # Act
+        waves = plan_waves(operations)
+
+        # Assert
+        assert waves == [[0, 2], [1], [3]]
+
+    def test_directory_conflicts_with_files_beneath(self) -> None:
+        """Test a directory operation waits for files inside it."""
+        # Arrange
+        operations = [
+            _operation("op-1", "modify", "plans/a.md", content="x"),
+            _operation("op-2", "delete", "plans"),
+        ]
+
+        # Act
+        waves = plan_waves(operations)
+
+        # Assert
+        assert waves == [[0], [1]]
+
+    def test_empty_plan(self) -> None:
+        """Test no operations produce no waves."""
+        # Act / Assert
+        assert plan_waves([]) == []
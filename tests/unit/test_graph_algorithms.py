@@ -389,6 +389,48 @@ class TestGetTransitiveDependencies:
         assert "A" not in transitive
 
 
+class TestStronglyConnectedComponents:
+    """Tests for Tarjan strongly connected components."""
+
+    def test_strongly_connected_components_acyclic(self) -> None:
+        """Test every node is its own component in an acyclic graph."""
+        deps = {"A": ["B"], "B": ["C"], "C": []}
+
+        def get_deps(node: str) -> list[str]:
+            return deps.get(node, [])
+
+        components = GraphAlgorithms.strongly_connected_components(
+            ["A", "B", "C"], get_deps
+        )
+
+        assert components == [["C"], ["B"], ["A"]]
+
+    def test_strongly_connected_components_groups_cycle(self) -> None:
+        """Test nodes on a cycle share one component."""
+        deps = {"A": ["B"], "B": ["C"], "C": ["A", "D"], "D": []}
+
+        def get_deps(node: str) -> list[str]:
+            return deps.get(node, [])
+
+        components = GraphAlgorithms.strongly_connected_components(
+            ["A", "B", "C", "D"], get_deps
+        )
+
+        assert [sorted(c) for c in components] == [["D"], ["A", "B", "C"]]
+
+    def test_strongly_connected_components_deep_chain(self) -> None:
+        """Test long chains do not hit the recursion limit."""
+        deps = {f"n{i}": [f"n{i + 1}"] for i in range(5000)}
+
+        def get_deps(node: str) -> list[str]:
+            return deps.get(node, [])
+
+        components = GraphAlgorithms.strongly_connected_components(["n0"], get_deps)
+
+        assert len(components) == 5001
+        assert components[0] == ["n5000"]
+
+
 class TestComputePriorityOrder:
     """Tests for priority-based ordering."""
 
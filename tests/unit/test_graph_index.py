@@ -0,0 +1,158 @@
+"""
+Unit tests for graph_index.py
+
+Tests IncrementalGraphIndex maintenance of strongly connected components,
+topological order and cached transitive closures under edge insertion and
+removal.
+"""
+
+import random
+
+from cortex.core.graph_algorithms import GraphAlgorithms
+from cortex.core.graph_index import IncrementalGraphIndex
+
+
+def _brute_force_closure(edges: set[tuple[str, str]], node: str) -> set[str]:
+    """Compute transitive dependencies without the index."""
+    adjacency: dict[str, list[str]] = {}
+    for source, target in edges:
+        adjacency.setdefault(source, []).append(target)
+    return GraphAlgorithms.get_transitive_dependencies(
+        node, lambda n: adjacency.get(n, [])
+    )
+
+
+class TestBuild:
+    """Tests for bulk index construction."""
+
+    def test_build_groups_cycle_into_component(self) -> None:
+        """Test bulk build detects components and cycles."""
+        index = IncrementalGraphIndex.build(
+            ["d"], [("a", "b"), ("b", "c"), ("c", "a"), ("c", "d")]
+        )
+
+        assert index.component("a") == frozenset({"a", "b", "c"})
+        assert index.component("d") == frozenset({"d"})
+        assert index.has_cycles()
+        assert index.cycles() == [["a", "b", "c", "a"]]
+
+    def test_build_orders_dependencies_first(self) -> None:
+        """Test topological order puts dependencies before dependents."""
+        index = IncrementalGraphIndex.build([], [("a", "b"), ("b", "c")])
+
+        assert index.topological_order() == ["c", "b", "a"]
+
+    def test_build_counts_duplicate_edges(self) -> None:
+        """Test an edge added twice survives one removal."""
+        index = IncrementalGraphIndex.build([], [("a", "b"), ("a", "b")])
+
+        index.remove_edge("a", "b")
+
+        assert index.dependencies("a") == {"b"}
+
+
+class TestIncrementalUpdates:
+    """Tests for incremental insert and delete."""
+
+    def test_insert_reorders_without_cycle(self) -> None:
+        """Test inserting an edge against the order repairs it."""
+        index = IncrementalGraphIndex.build(["a", "b", "c"], [])
+        order_before = index.topological_order()
+        first, last = order_before[0], order_before[-1]
+
+        index.add_edge(first, last)
+
+        order = index.topological_order()
+        assert order.index(last) < order.index(first)
+        assert not index.has_cycles()
+
+    def test_insert_merges_cycle(self) -> None:
+        """Test closing a cycle merges components."""
+        index = IncrementalGraphIndex.build([], [("a", "b"), ("b", "c")])
+
+        index.add_edge("c", "a")
+
+        assert index.component("b") == frozenset({"a", "b", "c"})
+        assert index.is_cyclic("a")
+
+    def test_remove_splits_component(self) -> None:
+        """Test removing a cycle edge splits the component."""
+        index = IncrementalGraphIndex.build([], [("a", "b"), ("b", "c"), ("c", "a")])
+
+        index.remove_edge("c", "a")
+
+        assert index.component("a") == frozenset({"a"})
+        assert not index.has_cycles()
+        assert index.topological_order() == ["c", "b", "a"]
+
+    def test_self_loop_is_cycle(self) -> None:
+        """Test a self-referencing node counts as a cycle."""
+        index = IncrementalGraphIndex()
+
+        index.add_edge("a", "a")
+
+        assert index.cycles() == [["a", "a"]]
+        index.remove_edge("a", "a")
+        assert not index.has_cycles()
+
+    def test_closure_invalidated_for_dependents_only(self) -> None:
+        """Test cached closures refresh after an upstream change."""
+        index = IncrementalGraphIndex.build([], [("a", "b"), ("x", "y")])
+        assert index.transitive_dependencies("a") == {"b"}
+        assert index.transitive_dependencies("x") == {"y"}
+
+        index.add_edge("b", "c")
+
+        assert index.transitive_dependencies("a") == {"b", "c"}
+        assert index.transitive_dependencies("x") == {"y"}
+
+    def test_revision_changes_only_on_structural_change(self) -> None:
+        """Test duplicate insertions do not bump the revision."""
+        index = IncrementalGraphIndex()
+        index.add_edge("a", "b")
+        revision = index.revision
+
+        index.add_edge("a", "b")
+
+        assert index.revision == revision
+
+    def test_unknown_node_queries(self) -> None:
+        """Test queries on unknown nodes return empty results."""
+        index = IncrementalGraphIndex()
+
+        assert index.transitive_dependencies("missing") == set()
+        assert index.dependents("missing") == set()
+        assert not index.is_cyclic("missing")
+
+
+class TestRandomizedConsistency:
+    """Randomized comparison against full recomputation."""
+
+    def test_matches_brute_force_under_random_mutations(self) -> None:
+        """Test index stays consistent with from-scratch analysis."""
+        rng = random.Random(42)
+        nodes = [f"n{i}" for i in range(12)]
+
+        for _ in range(30):
+            index = IncrementalGraphIndex()
+            edges: set[tuple[str, str]] = set()
+            for _ in range(40):
+                if edges and rng.random() < 0.35:
+                    edge = rng.choice(sorted(edges))
+                    edges.discard(edge)
+                    index.remove_edge(*edge)
+                else:
+                    edge = (rng.choice(nodes), rng.choice(nodes))
+                    if edge not in edges:
+                        edges.add(edge)
+                        index.add_edge(*edge)
+
+                node = rng.choice(nodes)
+                assert index.transitive_dependencies(node) == (
+                    _brute_force_closure(edges, node) if index.has_node(node) else set()
+                )
+
+            position = {n: i for i, n in enumerate(index.topological_order())}
+            for source, target in edges:
+                if index.component(source) != index.component(target):
+                    assert position[target] < position[source]
@@ -0,0 +1,141 @@
+"""
+Tests for graph_query module.
+
+This test module covers:
+- Link type and category filtering
+- Root/depth/direction neighborhoods
+- Edge pagination and the compact encoding
+- Streamed Mermaid rendering
+"""
+
+from cortex.core.graph_query import iter_compact_mermaid, query_graph
+from cortex.core.models import GraphQuery
+
+FILES = ["a.md", "b.md", "c.md", "d.md", "e.md"]
+EDGES = [
+    ("a.md", "b.md", "reference"),
+    ("b.md", "c.md", "transclusion"),
+    ("c.md", "d.md", "reference"),
+    ("e.md", "a.md", "reference"),
+]
+CATEGORIES = {"a.md": "meta", "b.md": "meta", "c.md": "active"}
+
+
+def _category(file_name: str) -> str:
+    return CATEGORIES.get(file_name, "unknown")
+
+
+class TestQueryGraph:
+    """Tests for query_graph."""
+
+    def test_unfiltered_query_returns_all_edges(self) -> None:
+        """Test an empty query encodes the full graph."""
+        # Act
+        result = query_graph(FILES, EDGES, _category, GraphQuery())
+
+        # Assert
+        assert result.total_nodes == 5
+        assert result.total_edges == 4
+        assert result.edges_by_type == {"reference": 3, "transclusion": 1}
+        decoded = [
+            (result.nodes[s], result.nodes[t], result.edge_types[k])
+            for s, t, k in result.edges
+        ]
+        assert decoded == EDGES
+        assert result.next_offset is None
+
+    def test_filters_by_link_type(self) -> None:
+        """Test only requested edge types are kept."""
+        # Act
+        result = query_graph(
+            FILES, EDGES, _category, GraphQuery(link_types=["transclusion"])
+        )
+
+        # Assert
+        assert result.total_edges == 1
+        assert result.edge_types == ["transclusion"]
+
+    def test_filters_by_category(self) -> None:
+        """Test edges need both endpoints in an allowed category."""
+        # Act
+        result = query_graph(FILES, EDGES, _category, GraphQuery(categories=["meta"]))
+
+        # Assert
+        assert result.total_nodes == 2
+        assert result.total_edges == 1
+        assert result.nodes == ["a.md", "b.md"]
+
+    def test_root_neighborhood_respects_depth_and_direction(self) -> None:
+        """Test root queries only follow edges within depth hops."""
+        # Act
+        both = query_graph(FILES, EDGES, _category, GraphQuery(root="b.md", depth=1))
+        out = query_graph(
+            FILES,
+            EDGES,
+            _category,
+            GraphQuery(root="b.md", depth=2, direction="out"),
+        )
+
+        # Assert
+        assert both.nodes[0] == "b.md"
+        assert set(both.nodes) == {"a.md", "b.md", "c.md"}
+        assert both.total_edges == 2
+        assert set(out.nodes) == {"b.md", "c.md", "d.md"}
+
+    def test_unknown_root_returns_empty_graph(self) -> None:
+        """Test querying around a missing file returns nothing."""
+        # Act
+        result = query_graph(FILES, EDGES, _category, GraphQuery(root="zzz.md"))
+
+        # Assert
+        assert result.total_nodes == 0
+        assert result.edges == []
+
+    def test_paginates_edges(self) -> None:
+        """Test offset and limit page through matching edges."""
+        # Act
+        first = query_graph(FILES, EDGES, _category, GraphQuery(limit=3))
+        second = query_graph(FILES, EDGES, _category, GraphQuery(offset=3, limit=3))
+
+        # Assert
+        assert len(first.edges) == 3
+        assert first.next_offset == 3
+        assert len(second.edges) == 1
+        assert second.next_offset is None
+        assert second.nodes == ["e.md", "a.md"]
+
+    def test_first_page_lists_unlinked_nodes(self) -> None:
+        """Test counted nodes without matching edges are still named."""
+        # Act
+        isolated = query_graph([*FILES, "f.md"], EDGES, _category, GraphQuery())
+        lone_root = query_graph(
+            [*FILES, "f.md"], EDGES, _category, GraphQuery(root="f.md")
+        )
+        second = query_graph(
+            [*FILES, "f.md"], EDGES, _category, GraphQuery(offset=3, limit=3)
+        )
+
+        # Assert
+        assert isolated.total_nodes == len(isolated.nodes) == 6
+        assert isolated.nodes[-1] == "f.md"
+        assert lone_root.nodes == ["f.md"]
+        assert lone_root.total_nodes == 1
+        assert "f.md" not in second.nodes
+
+
+class TestIterCompactMermaid:
+    """Tests for iter_compact_mermaid."""
+
+    def test_renders_indexed_nodes_and_typed_arrows(self) -> None:
+        """Test diagram lines use table indexes and per-type arrows."""
+        # Arrange
+        graph = query_graph(FILES, EDGES[:2], _category, GraphQuery())
+
+        # Act
+        lines = list(iter_compact_mermaid(graph, _category))
+
+        # Assert
+        assert lines[0] == "flowchart TD"
+        assert '    n0["a"]:::meta' in lines
+        assert "    n0 -->|reference| n1" in lines
+        assert "    n1 -.->|transclusion| n2" in lines
@@ -0,0 +1,185 @@
+"""
+Tests for impact_simulator module.
+
+This test module covers:
+- Overlay simulation that never touches disk
+- Exact token, link and transclusion metrics before and after
+- Error propagation from failing operations
+- Concurrent simulation of candidate refactorings
+- Corpus statistics caching
+"""
+
+from pathlib import Path
+
+import pytest
+
+from cortex.core.exceptions import ValidationError
+from cortex.core.file_system import FileSystemManager
+from cortex.core.token_counter import TokenCounter
+from cortex.linking.link_parser import LinkParser
+from cortex.linking.link_validator import LinkValidator
+from cortex.refactoring.execution_operations import ExecutionOperations
+from cortex.refactoring.impact_simulator import ImpactSimulator
+from cortex.refactoring.models import (
+    OperationParameters,
+    RefactoringOperationModel,
+    SimulatedImpact,
+)
+
+GUIDE = "# Guide\n\n## Setup\n\nInstall everything.\n\n## Usage\n\nRun it.\n"
+INDEX = (
+    "# Index\n\nSee [the guide](guide.md).\n\n{{include: guide.md#Setup}}\n\n"
+    + "Filler text for the index. " * 40
+    + "\n"
+)
+
+
+def _operation(
+    operation_id: str, operation_type: str, target_file: str, **parameters: object
+) -> RefactoringOperationModel:
+    return RefactoringOperationModel(
+        operation_id=operation_id,
+        operation_type=operation_type,
+        target_file=target_file,
+        parameters=OperationParameters.model_validate(parameters),
+    )
+
+
+@pytest.fixture
+def simulator(
+    memory_bank_dir: Path,
+    mock_file_system: FileSystemManager,
+    mock_link_parser: LinkParser,
+) -> ImpactSimulator:
+    """Create a simulator over a memory bank with a guide and an index."""
+    _ = (memory_bank_dir / "guide.md").write_text(GUIDE)
+    _ = (memory_bank_dir / "index.md").write_text(INDEX)
+    return ImpactSimulator(
+        memory_bank_dir,
+        mock_file_system,
+        ExecutionOperations(memory_bank_dir, mock_file_system),
+        LinkValidator(mock_file_system, mock_link_parser),
+    )
+
+
+class TestSimulate:
+    """Tests for ImpactSimulator.simulate."""
+
+    @pytest.mark.asyncio
+    async def test_exact_tokens_without_touching_disk(
+        self, simulator: ImpactSimulator, memory_bank_dir: Path
+    ) -> None:
+        """Test a rewrite is measured exactly while disk stays unchanged."""
+        # Arrange
+        short_index = "# Index\n\nSee [the guide](guide.md).\n"
+        operation = _operation("op-1", "modify", "index.md", content=short_index)
+        counter = TokenCounter()
+
+        # Act
+        impact = await simulator.simulate([operation])
+
+        # Assert
+        assert (memory_bank_dir / "index.md").read_text() == INDEX
+        assert impact.tokens_before == counter.count_tokens(
+            GUIDE
+        ) + counter.count_tokens(INDEX)
+        assert impact.tokens_after == counter.count_tokens(
+            GUIDE
+        ) + counter.count_tokens(short_index)
+        assert impact.token_savings > 0
+        assert impact.files_modified == ["index.md"]
+        assert (impact.transclusions_before, impact.transclusions_after) == (1, 0)
+        assert operation.status == "pending"
+
+    @pytest.mark.asyncio
+    async def test_delete_breaks_links_and_transclusions(
+        self, simulator: ImpactSimulator, memory_bank_dir: Path
+    ) -> None:
+        """Test deleting a referenced file is reported as broken references."""
+        # Arrange
+        operation = _operation("op-1", "delete", "guide.md")
+
+        # Act
+        impact = await simulator.simulate([operation])
+
+        # Assert
+        assert (memory_bank_dir / "guide.md").exists()
+        assert impact.files_deleted == ["guide.md"]
+        assert (impact.broken_links_before, impact.broken_links_after) == (0, 1)
+        assert impact.unresolved_transclusions_before == 0
+        assert impact.unresolved_transclusions_after == 1
+
+    @pytest.mark.asyncio
+    async def test_split_resolves_against_overlay(
+        self, simulator: ImpactSimulator, memory_bank_dir: Path
+    ) -> None:
+        """Test sections split into a new file leave the transclusion dangling."""
+        # Arrange
+        operation = _operation(
+            "op-1",
+            "split",
+            "guide.md",
+            destination_file="setup.md",
+            sections=["Setup"],
+            content="# Setup\n\nInstall everything.\n",
+        )
+
+        # Act
+        impact = await simulator.simulate([operation])
+
+        # Assert
+        assert not (memory_bank_dir / "setup.md").exists()
+        assert impact.files_created == ["setup.md"]
+        assert impact.files_modified == ["guide.md"]
+        assert impact.broken_links_after == 0
+        assert impact.unresolved_transclusions_after == 1
+        assert impact.files_affected == 2
+
+    @pytest.mark.asyncio
+    async def test_failing_operation_raises(self, simulator: ImpactSimulator) -> None:
+        """Test an operation error is raised from the simulation."""
+        # Arrange
+        operation = _operation("op-1", "split", "guide.md")
+
+        # Act / Assert
+        with pytest.raises(ValidationError):
+            _ = await simulator.simulate([operation])
+
+
+class TestSimulateMany:
+    """Tests for ImpactSimulator.simulate_many."""
+
+    @pytest.mark.asyncio
+    async def test_candidates_simulated_independently(
+        self, simulator: ImpactSimulator
+    ) -> None:
+        """Test each candidate gets its own overlay and errors stay isolated."""
+        # Arrange
+        candidates = {
+            "delete": [_operation("op-1", "delete", "guide.md")],
+            "create": [_operation("op-2", "create", "notes.md", content="# Notes\n")],
+            "broken": [_operation("op-3", "split", "guide.md")],
+        }
+
+        # Act
+        results = await simulator.simulate_many(candidates)
+
+        # Assert
+        deleted, created = results["delete"], results["create"]
+        assert isinstance(deleted, SimulatedImpact)
+        assert isinstance(created, SimulatedImpact)
+        assert deleted.files_deleted == ["guide.md"]
+        assert created.files_created == ["notes.md"]
+        assert created.broken_links_after == 0
+        assert isinstance(results["broken"], ValidationError)
+
+    @pytest.mark.asyncio
+    async def test_corpus_measured_once(self, simulator: ImpactSimulator) -> None:
+        """Test the unchanged corpus is loaded once and then reused."""
+        # Act
+        first = await simulator.load_corpus()
+        second = await simulator.load_corpus()
+
+        # Assert
+        assert second is first
+        assert len(first.files) == 2
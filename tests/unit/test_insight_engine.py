@@ -744,6 +744,75 @@ class TestQualityInsights:
         )
 
 
+class TestCategoryCache:
+    """Tests for concurrent, cached category generation."""
+
+    def _make_engine(
+        self, mocker: pytest_mock.MockerFixture
+    ) -> tuple[InsightEngine, AsyncMock, AsyncMock]:
+        """Create an engine over mocked analyzers with pinned input versions."""
+        mock_pattern = mocker.MagicMock()
+        mock_pattern.access_watermark = (0, 0)
+        mock_pattern.get_unused_files = AsyncMock(return_value=[])
+        mock_pattern.get_co_access_patterns = AsyncMock(return_value=[])
+
+        mock_structure = mocker.MagicMock()
+        session = mock_structure.analysis_session.return_value.__aenter__.return_value
+        session.corpus_version = "corpus-1"
+        mock_structure.analyze_file_organization = AsyncMock(
+            return_value=FileOrganizationResult(status="empty", file_count=0, issues=[])
+        )
+        mock_structure.detect_anti_patterns = AsyncMock(return_value=[])
+        mock_structure.measure_complexity_metrics = AsyncMock(
+            return_value=ComplexityAnalysisResult(status="no_files")
+        )
+        engine = InsightEngine(mock_pattern, mock_structure)
+        return (
+            engine,
+            mock_pattern.get_unused_files,
+            mock_structure.detect_anti_patterns,
+        )
+
+    @pytest.mark.asyncio
+    async def test_repeat_call_reuses_all_categories(
+        self, mocker: pytest_mock.MockerFixture
+    ):
+        """Test unchanged inputs serve every category from cache."""
+        # Arrange
+        engine, unused_files, anti_patterns = self._make_engine(mocker)
+        first = await engine.generate_insights()
+
+        # Act
+        second = await engine.generate_insights()
+
+        # Assert
+        assert first.cache is not None
+        assert len(first.cache.recomputed_categories) == 5
+        assert second.cache is not None
+        assert second.cache.recomputed_categories == []
+        assert len(second.cache.cached_categories) == 5
+        assert unused_files.await_count == 1
+        assert anti_patterns.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_access_change_recomputes_only_usage(
+        self, mocker: pytest_mock.MockerFixture
+    ):
+        """Test a new access-log watermark only invalidates usage insights."""
+        # Arrange
+        engine, unused_files, _ = self._make_engine(mocker)
+        _ = await engine.generate_insights()
+        engine.pattern_analyzer.access_watermark = (1, 1)  # type: ignore[misc]
+
+        # Act
+        result = await engine.generate_insights()
+
+        # Assert
+        assert result.cache is not None
+        assert result.cache.recomputed_categories == ["usage"]
+        assert unused_files.await_count == 2
+
+
 class TestSummaryGeneration:
     """Tests for summary generation."""
 
@@ -2,6 +2,7 @@
 
 import json
 from pathlib import Path
+from unittest.mock import Mock
 
 import pytest
 
@@ -140,12 +141,27 @@ class TestLearningDataManagerInitialization:
         assert len(manager.learned_patterns) == 0
 
 
+def _feedback(feedback_id: str, approved: bool) -> FeedbackRecord:
+    """Build a feedback record for aggregate tests."""
+    return FeedbackRecord(
+        feedback_id=feedback_id,
+        suggestion_id=f"sug-{feedback_id}",
+        suggestion_type="consolidation",
+        feedback_type="helpful" if approved else "not_helpful",
+        comment=None,
+        created_at="2025-01-01T12:00:00",
+        suggestion_confidence=0.8,
+        was_approved=approved,
+        was_applied=False,
+    )
+
+
 class TestSaveLearningData:
     """Test saving learning data."""
 
     @pytest.mark.asyncio
-    async def test_save_creates_file_with_data(self, temp_project_root: Path):
-        """Test save creates file with learning data."""
+    async def test_save_persists_feedback(self, temp_project_root: Path):
+        """Test saved feedback is loaded by a fresh manager."""
         # Arrange
         learning_file = temp_project_root / ".cortex/learning.json"
         manager = LearningDataManager(learning_file=learning_file)
@@ -167,10 +183,9 @@ class TestSaveLearningData:
         await manager.save_learning_data()
 
         # Assert
-        assert learning_file.exists()
-        data = json.loads(learning_file.read_text())
-        assert "feedback" in data
-        assert "fb-1" in data["feedback"]
+        reloaded = LearningDataManager(learning_file=learning_file)
+        assert "fb-1" in reloaded.feedback_records
+        assert reloaded.get_feedback_stats()["approved"] == 1
 
     @pytest.mark.asyncio
     async def test_save_preserves_all_data_types(self, temp_project_root: Path):
@@ -213,10 +228,50 @@ class TestSaveLearningData:
         await manager.save_learning_data()
 
         # Assert
+        reloaded = LearningDataManager(learning_file=learning_file)
+        assert len(reloaded.feedback_records) == 1
+        assert reloaded.learned_patterns["pat-1"].approved_count == 4
+        assert reloaded.get_preference("min_confidence") == 0.6
+
+    @pytest.mark.asyncio
+    async def test_save_writes_only_new_feedback(self, temp_project_root: Path):
+        """Test each save writes only the feedback added since the last one."""
+        # Arrange
+        learning_file = temp_project_root / ".cortex/learning.json"
+        manager = LearningDataManager(learning_file=learning_file)
+        for index in range(3):
+            manager.add_feedback(_feedback(f"fb-{index}", approved=index != 1))
+        await manager.save_learning_data()
+        manager.add_feedback(_feedback("fb-3", approved=True))
+        upsert_many = Mock(wraps=manager.state_store.upsert_many)
+        manager.state_store.upsert_many = upsert_many
+
+        # Act
+        await manager.save_learning_data()
+
+        # Assert
+        feedback_rows = upsert_many.call_args_list[0].args[1]
+        assert [row[0] for row in feedback_rows] == ["fb-3"]
+        assert not learning_file.exists()
+
+    @pytest.mark.asyncio
+    async def test_export_writes_legacy_json(self, temp_project_root: Path):
+        """Test export writes every record in the learning.json format."""
+        # Arrange
+        learning_file = temp_project_root / ".cortex/learning.json"
+        manager = LearningDataManager(learning_file=learning_file)
+        manager.add_feedback(_feedback("fb-1", approved=True))
+        manager.update_preference("min_confidence_threshold", 0.6)
+
+        # Act
+        export_path = await manager.export_learning_data()
+
+        # Assert
+        assert export_path == learning_file
         data = json.loads(learning_file.read_text())
-        assert len(data["feedback"]) == 1
-        assert len(data["patterns"]) == 1
-        assert "min_confidence" in data["preferences"]
+        assert "fb-1" in data["feedback"]
+        assert data["preferences"]["min_confidence_threshold"] == 0.6
+        assert not manager.state_store.import_legacy(learning_file, lambda _: {})
 
 
 class TestFeedbackManagement:
@@ -289,6 +344,23 @@ class TestFeedbackManagement:
         assert stats["approved"] == 1
         assert stats["rejected"] == 1
 
+    def test_replacing_feedback_keeps_aggregates_exact(self, temp_project_root: Path):
+        """Test re-adding a feedback ID replaces its contribution."""
+        # Arrange
+        learning_file = temp_project_root / ".cortex/learning.json"
+        manager = LearningDataManager(learning_file=learning_file)
+        manager.add_feedback(_feedback("fb-1", approved=False))
+
+        # Act
+        manager.add_feedback(_feedback("fb-1", approved=True))
+
+        # Assert
+        assert manager.get_feedback_stats() == {
+            "total": 1,
+            "approved": 1,
+            "rejected": 0,
+        }
+
 
 class TestPatternManagement:
     """Test learned pattern management."""
@@ -1056,3 +1056,89 @@ class TestUpdatePatternsCoverage:
         pattern = engine.data_manager.get_pattern(pattern_key)
         assert pattern is not None
         assert pattern.rejected_count > 0
+
+
+class TestFilterSuggestions:
+    """Test batch filtering with compiled policies."""
+
+    @pytest.mark.asyncio
+    async def test_filter_keeps_shown_suggestions_in_order(self, memory_bank_dir: Path):
+        """Test rejected types and low confidence are filtered out."""
+        # Arrange
+        engine = LearningEngine(memory_bank_dir=memory_bank_dir)
+        for i in range(6):
+            _ = await engine.record_feedback(
+                suggestion_id=f"sug-{i}",
+                suggestion_type="split",
+                feedback_type="incorrect",
+                was_approved=False,
+            )
+        suggestions: list[ModelDict] = [
+            {"type": "consolidation", "confidence": 0.9},
+            {"type": "split", "confidence": 1.0},
+            {"type": "reorganization", "confidence": 0.1},
+            {"type": "reorganization", "confidence": 0.8},
+        ]
+
+        # Act
+        kept = await engine.filter_suggestions(suggestions)
+
+        # Assert
+        assert [suggestion for suggestion, _ in kept] == [
+            suggestions[0],
+            suggestions[3],
+        ]
+        assert kept[0][1] == pytest.approx(0.9)
+
+    @pytest.mark.asyncio
+    async def test_policies_follow_new_feedback(self, memory_bank_dir: Path):
+        """Test compiled policies are rebuilt after feedback changes them."""
+        # Arrange
+        engine = LearningEngine(memory_bank_dir=memory_bank_dir)
+        suggestion: ModelDict = {"type": "split", "confidence": 1.0}
+        shown_before, _ = await engine.should_show_suggestion(suggestion)
+
+        # Act
+        for i in range(5):
+            _ = await engine.record_feedback(
+                suggestion_id=f"sug-{i}",
+                suggestion_type="split",
+                feedback_type="incorrect",
+                was_approved=False,
+            )
+        shown_after, reason = await engine.should_show_suggestion(suggestion)
+
+        # Assert
+        assert shown_before is True
+        assert shown_after is False
+        assert "consistently rejects" in reason
+
+    @pytest.mark.asyncio
+    async def test_pattern_decayed_score_favors_recent_feedback(
+        self, memory_bank_dir: Path
+    ):
+        """Test the decayed score ranks recent approvals above old ones."""
+        # Arrange
+        engine = LearningEngine(memory_bank_dir=memory_bank_dir)
+        histories = {
+            "category_based": [False] * 3 + [True] * 5,
+            "dependency_based": [True] * 5 + [False] * 3,
+        }
+
+        # Act
+        for goal, outcomes in histories.items():
+            for i, approved in enumerate(outcomes):
+                _ = await engine.record_feedback(
+                    suggestion_id=f"{goal}-{i}",
+                    suggestion_type="reorganization",
+                    feedback_type="helpful" if approved else "not_helpful",
+                    was_approved=approved,
+                    suggestion_details={"optimization_goal": goal},
+                )
+
+        # Assert
+        patterns = engine.data_manager.learned_patterns
+        improving = patterns["reorganization-category_based"]
+        declining = patterns["reorganization-dependency_based"]
+        assert improving.success_rate == pytest.approx(declining.success_rate)
+        assert improving.decayed_score > declining.decayed_score
@@ -3,7 +3,7 @@ Unit tests for main.py error handling.
 
 Tests the comprehensive error handling for MCP server connection issues,
 including BaseExceptionGroup, anyio.BrokenResourceError, and other
-connection-related exceptions.
+connection-related exceptions, and the selection of the transport.
 """
 
 from builtins import BaseExceptionGroup
@@ -12,6 +12,7 @@ from unittest.mock import MagicMock, patch
 import anyio
 import pytest
 
+from cortex.core.manager_registry import ManagerRegistry
 from cortex.main import main
 
 
@@ -327,3 +328,49 @@ class TestMCPStabilityConnectionErrorDetection:
 
         # Assert
         assert result is False
+
+
+class TestTransportSelection:
+    """Tests for serving over HTTP instead of stdio."""
+
+    @patch("cortex.main.mcp")
+    def test_http_transport_configures_server_and_pool(
+        self, mock_mcp: MagicMock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the HTTP address and manager pool come from the environment."""
+        # Arrange
+        registry = ManagerRegistry()
+        monkeypatch.setenv("CORTEX_TRANSPORT", "streamable-http")
+        monkeypatch.setenv("CORTEX_PORT", "9123")
+        monkeypatch.setenv("CORTEX_MAX_PROJECTS", "4")
+        monkeypatch.setenv("CORTEX_PROJECT_IDLE_SECONDS", "90")
+        monkeypatch.setenv("CORTEX_POOL_MEMORY_MB", "64")
+
+        # Act
+        with patch(
+            "cortex.core.manager_registry.get_default_registry", return_value=registry
+        ):
+            main()
+
+        # Assert
+        mock_mcp.run.assert_called_once_with(transport="streamable-http")
+        assert mock_mcp.settings.port == 9123
+        assert registry.max_projects == 4
+        assert registry.idle_timeout == 90.0
+        assert registry.memory_limit_bytes == 64 * 1024 * 1024
+
+    @patch("cortex.main.mcp")
+    def test_unknown_transport_exits(
+        self, mock_mcp: MagicMock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test an unknown transport is rejected before starting."""
+        # Arrange
+        monkeypatch.setenv("CORTEX_TRANSPORT", "carrier-pigeon")
+
+        # Act
+        with pytest.raises(SystemExit) as exc_info:
+            main()
+
+        # Assert
+        assert exc_info.value.code == 2
+        mock_mcp.run.assert_not_called()
@@ -0,0 +1,175 @@
+"""
+Tests for warmup.py - Background manager warm-up.
+
+This test module covers:
+- Core managers warmed up while lazy managers are left alone
+- Failed steps recorded without stopping the warm-up
+- Cancelling a running warm-up
+- Skipping the warm-up outside a Cortex project
+- Starting hooks after the MCP initialize handshake
+"""
+
+import asyncio
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from mcp.types import InitializedNotification
+
+from cortex.core.manager_registry import ManagerRegistry
+from cortex.main import _warm_up_managers
+from cortex.managers.lazy_manager import LazyManager
+from cortex.managers.types import ManagersDict
+from cortex.managers.warmup import ManagerWarmup
+from cortex.server import CortexMCP
+from tests.helpers.managers import make_test_managers
+
+
+def _patch_initialize(managers: ManagersDict):
+    return patch(
+        "cortex.managers.initialization.initialize_managers",
+        new_callable=AsyncMock,
+        return_value=managers,
+    )
+
+
+class TestManagerWarmup:
+    """Tests for ManagerWarmup."""
+
+    @pytest.mark.asyncio
+    async def test_warms_only_core_managers(self, tmp_path: Path) -> None:
+        """Test core managers are warmed up and lazy managers are not."""
+        # Arrange
+        factory = AsyncMock(return_value=object())
+        managers = make_test_managers(
+            approval_manager=LazyManager(factory, name="approval_manager")
+        )
+        registry = ManagerRegistry()
+        warmup = ManagerWarmup(tmp_path, registry)
+
+        # Act
+        with _patch_initialize(managers):
+            await warmup.run()
+
+        # Assert
+        factory.assert_not_awaited()
+        graph = managers.graph
+        assert isinstance(graph, MagicMock)
+        graph.compute_loading_order.assert_called_once()
+        progress = warmup.progress()
+        assert progress.state == "completed"
+        assert progress.steps_total == 3
+        assert progress.steps_completed == progress.steps_total
+        assert progress.failed_steps == {}
+        assert registry.has_managers(tmp_path)
+
+    @pytest.mark.asyncio
+    async def test_failed_step_is_recorded(self, tmp_path: Path) -> None:
+        """Test a failing step does not stop the remaining steps."""
+        # Arrange
+        graph = MagicMock()
+        graph.compute_loading_order.side_effect = RuntimeError("graph unreadable")
+        managers = make_test_managers(graph=graph)
+        warmup = ManagerWarmup(tmp_path, ManagerRegistry())
+
+        # Act
+        with _patch_initialize(managers):
+            await warmup.run()
+
+        # Assert
+        progress = warmup.progress()
+        assert progress.state == "completed"
+        assert progress.failed_steps == {"dependency_graph": "graph unreadable"}
+        assert progress.steps_completed == progress.steps_total
+
+    @pytest.mark.asyncio
+    async def test_cancel_stops_warmup(self, tmp_path: Path) -> None:
+        """Test cancelling a warm-up blocked on core manager initialization."""
+        # Arrange
+        started = asyncio.Event()
+
+        async def slow(_root: Path) -> ManagersDict:
+            started.set()
+            _ = await asyncio.Event().wait()
+            return make_test_managers()
+
+        warmup = ManagerWarmup(tmp_path, ManagerRegistry())
+
+        # Act
+        with patch(
+            "cortex.managers.initialization.initialize_managers", side_effect=slow
+        ):
+            _ = warmup.start()
+            _ = await started.wait()
+            await warmup.cancel()
+
+        # Assert
+        progress = warmup.progress()
+        assert progress.state == "cancelled"
+        assert progress.current_step is None
+
+
+class TestWarmUpHook:
+    """Tests for the warm-up started by main after the handshake."""
+
+    @pytest.mark.asyncio
+    async def test_skips_directory_without_cortex(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test no warm-up starts where no .cortex directory exists."""
+        # Arrange
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.delenv("CORTEX_TRANSPORT", raising=False)
+        monkeypatch.delenv("CORTEX_WARMUP", raising=False)
+
+        # Act
+        with patch("cortex.managers.warmup.start_warmup") as mock_start:
+            await _warm_up_managers()
+
+        # Assert
+        mock_start.assert_not_called()
+        assert not (tmp_path / ".cortex").exists()
+
+    @pytest.mark.asyncio
+    async def test_starts_in_cortex_project(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the warm-up starts when the working directory is a project."""
+        # Arrange
+        (tmp_path / ".cortex").mkdir()
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.delenv("CORTEX_TRANSPORT", raising=False)
+        monkeypatch.delenv("CORTEX_WARMUP", raising=False)
+
+        # Act
+        with patch("cortex.managers.warmup.start_warmup") as mock_start:
+            await _warm_up_managers()
+
+        # Assert
+        mock_start.assert_called_once_with()
+
+
+class TestInitializedHooks:
+    """Tests for CortexMCP.on_initialized."""
+
+    @pytest.mark.asyncio
+    async def test_hook_runs_after_handshake(self) -> None:
+        """Test hooks start when the client confirms initialization."""
+        # Arrange
+        server = CortexMCP("test")
+        ran = asyncio.Event()
+
+        async def hook() -> None:
+            ran.set()
+
+        server.on_initialized(hook)
+        handler = server._mcp_server.notification_handlers[  # pyright: ignore[reportPrivateUsage]
+            InitializedNotification
+        ]
+
+        # Act
+        await handler(InitializedNotification(method="notifications/initialized"))
+        _ = await asyncio.wait_for(ran.wait(), timeout=1)
+
+        # Assert
+        assert ran.is_set()
@@ -107,6 +107,22 @@ class TestConnectionClosureHandling:
         assert isinstance(health["concurrent_operations"], int)
         assert isinstance(health["max_concurrent"], int)
 
+    @pytest.mark.asyncio
+    async def test_connection_health_reports_pools(self) -> None:
+        """Test connection health includes one entry per concurrency pool."""
+        # Act
+        health = await check_connection_health()
+
+        # Assert
+        assert {pool.cost_class for pool in health.pools} == {
+            "fast",
+            "medium",
+            "complex",
+            "external",
+        }
+        assert health.max_concurrent == sum(p.max_concurrent for p in health.pools)
+        assert health.queued_operations == 0
+
     @pytest.mark.asyncio
     async def test_timeout_error_handling(self) -> None:
         """Test that timeout errors from the stability layer are raised."""
@@ -0,0 +1,64 @@
+"""
+Tests for memory_accounting.py - Memory estimates of object graphs.
+
+This test module covers:
+- Estimates growing with the retained data
+- Shared objects excluded from an estimate
+- Process-wide objects (modules, classes, functions) not walked into
+"""
+
+import logging
+
+from cortex.core.memory_accounting import estimate_size, reachable_objects
+
+
+class _Holder:
+    def __init__(self, data: object) -> None:
+        self.data = data
+        self.logger = logging.getLogger(__name__)
+        self.callback = estimate_size
+
+
+class TestEstimateSize:
+    """Tests for estimate_size() and reachable_objects()."""
+
+    def test_estimate_grows_with_retained_data(self) -> None:
+        """Test an object retaining more data is estimated larger."""
+        # Arrange
+        small = _Holder(["x" * 10 for _ in range(10)])
+        large = _Holder(["x" * 10_000 for _ in range(100)])
+
+        # Act
+        small_size = estimate_size(small)
+        large_size = estimate_size(large)
+
+        # Assert
+        assert large_size > small_size + 100 * 10_000
+
+    def test_excluded_objects_are_not_counted(self) -> None:
+        """Test shared objects passed as exclude are left out."""
+        # Arrange
+        shared = ["y" * 100_000]
+        holder = _Holder(shared)
+
+        # Act
+        with_shared = estimate_size(holder)
+        without_shared = estimate_size(holder, exclude=[shared])
+
+        # Assert
+        assert with_shared - without_shared > 100_000
+
+    def test_process_wide_objects_are_not_walked(self) -> None:
+        """Test modules, loggers and functions are not part of an object."""
+        # Arrange
+        holder = _Holder({"key": "value"})
+
+        # Act
+        objects = list(reachable_objects(holder))
+
+        # Assert
+        assert holder in objects
+        assert holder.data in objects
+        assert holder.logger not in objects
+        assert estimate_size not in objects
+        assert _Holder not in objects
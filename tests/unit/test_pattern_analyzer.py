@@ -246,12 +246,9 @@ class TestAccessRecording:
         await analyzer.record_access(file_path)
 
         # Assert
-        log_path = Path(temp_project_root) / ".cortex/access-log.json"
-        assert log_path.exists()
-
-        with open(log_path) as f:
-            data = json.load(f)
-        assert len(data["accesses"]) == 1
+        reloaded = PatternAnalyzer(temp_project_root)
+        assert len(reloaded.access_data.accesses) == 1
+        assert reloaded.access_data.file_stats[file_path].total_accesses == 1
 
 
 class TestAccessFrequency:
@@ -838,26 +835,15 @@ class TestDataCleanup:
         """Test persists cleaned data to disk."""
         # Arrange
         analyzer = PatternAnalyzer(temp_project_root)
-        now = datetime.now(UTC)
-
-        analyzer.access_data.accesses = [
-            AccessRecord(
-                timestamp=(now - timedelta(days=200)).isoformat(),
-                file="old.md",
-                task_id=None,
-                task_description=None,
-                context_files=[],
-            )
-        ]
+        await analyzer.record_access("old.md", task_id="task-old")
 
         # Act
-        _ = await analyzer.cleanup_old_data(keep_days=180)
+        _ = await analyzer.cleanup_old_data(keep_days=0)
 
         # Assert
-        log_path = Path(temp_project_root) / ".cortex/access-log.json"
-        with open(log_path) as f:
-            data = json.load(f)
-        assert len(data["accesses"]) == 0
+        reloaded = PatternAnalyzer(temp_project_root)
+        assert len(reloaded.access_data.accesses) == 0
+        assert reloaded.access_data.task_patterns == {}
 
 
 class TestHelperFunctions:
@@ -11,6 +11,7 @@ from cortex.core.exceptions import ValidationError
 from cortex.core.file_system import FileSystemManager
 from cortex.core.metadata_index import MetadataIndex
 from cortex.core.models import ModelDict
+from cortex.core.token_counter import TokenCounter
 from cortex.linking.link_parser import LinkParser
 from cortex.refactoring.models import (
     OperationParameters,
@@ -332,6 +333,47 @@ class TestExecuteRefactoring:
         assert result["snapshot_id"] is not None
         version_manager.create_snapshot.assert_called()
 
+    @pytest.mark.asyncio
+    async def test_snapshots_in_same_second_get_distinct_ids(
+        self,
+        memory_bank_dir: Path,
+        mock_file_system: FileSystemManager,
+        mock_metadata_index: MetadataIndex,
+        mock_link_parser: LinkParser,
+    ):
+        """Test two executions started in the same second never share a snapshot."""
+        # Arrange
+        from cortex.core.version_manager import VersionManager
+        from cortex.linking.link_validator import LinkValidator
+
+        version_manager = VersionManager(mock_file_system.project_root)
+        executor = RefactoringExecutor(
+            memory_bank_dir=memory_bank_dir,
+            fs_manager=mock_file_system,
+            version_manager=version_manager,
+            link_validator=LinkValidator(mock_file_system, mock_link_parser),
+            metadata_index=mock_metadata_index,
+        )
+        _ = (memory_bank_dir / "target.md").write_text("Original content")
+        version_manager.create_snapshot = AsyncMock(return_value="snapshot-1")
+        operations = [
+            RefactoringOperationModel(
+                operation_id="op-1",
+                operation_type="rename",
+                target_file="target.md",
+                parameters=OperationParameters(new_name="renamed.md"),
+            )
+        ]
+
+        # Act
+        first = await executor._create_snapshot(operations, "exec-a")
+        second = await executor._create_snapshot(operations, "exec-b")
+
+        # Assert
+        assert first != second
+        assert executor.snapshots.get(first) is not None
+        assert executor.snapshots.get(second) is not None
+
 
 class TestOperationExecution:
     """Test individual operation execution."""
@@ -1106,6 +1148,55 @@ class TestImpactMeasurement:
         assert "operations_completed" in result
         assert result["operations_completed"] == 1
 
+    @pytest.mark.asyncio
+    async def test_dry_run_reports_simulated_impact(
+        self,
+        memory_bank_dir: Path,
+        mock_file_system: FileSystemManager,
+        mock_metadata_index: MetadataIndex,
+        mock_link_parser: LinkParser,
+    ):
+        """Test a dry run returns exact metrics from the overlay simulation."""
+        # Arrange
+        from cortex.core.version_manager import VersionManager
+        from cortex.linking.link_validator import LinkValidator
+
+        executor = RefactoringExecutor(
+            memory_bank_dir=memory_bank_dir,
+            fs_manager=mock_file_system,
+            version_manager=VersionManager(mock_file_system.project_root),
+            link_validator=LinkValidator(mock_file_system, mock_link_parser),
+            metadata_index=mock_metadata_index,
+        )
+        part = "# Part one\n\nSplit content for the new file.\n"
+        suggestion = cast(
+            ModelDict,
+            {
+                "suggestion_id": "sug-1",
+                "type": "split",
+                "file": "test.md",
+                "split_points": [
+                    {"new_file": "part1.md", "sections": [], "content": part}
+                ],
+            },
+        )
+
+        # Act
+        result = await executor.execute_refactoring(
+            suggestion_id="sug-1",
+            approval_id="apr-1",
+            suggestion=suggestion,
+            dry_run=True,
+            validate_first=False,
+        )
+
+        # Assert
+        assert result.simulation is not None
+        assert result.simulation.files_created == ["part1.md"]
+        assert result.actual_impact.token_savings == -TokenCounter().count_tokens(part)
+        assert result.actual_impact.files_affected == 1
+        assert not (memory_bank_dir / "part1.md").exists()
+
 
 class TestExtractOperations:
     """Test operation extraction from suggestions."""
@@ -1251,3 +1342,121 @@ class TestExtractOperations:
         assert len(operations) == 2
         assert operations[0].operation_type == "move"
         assert operations[1].operation_type == "rename"
+
+
+class TestStagedExecution:
+    """Test staged, journaled execution of operation batches."""
+
+    def _create_executor(
+        self,
+        memory_bank_dir: Path,
+        mock_file_system: FileSystemManager,
+        mock_metadata_index: MetadataIndex,
+        mock_link_parser: LinkParser,
+    ) -> RefactoringExecutor:
+        from cortex.core.version_manager import VersionManager
+        from cortex.linking.link_validator import LinkValidator
+
+        return RefactoringExecutor(
+            memory_bank_dir=memory_bank_dir,
+            fs_manager=mock_file_system,
+            version_manager=VersionManager(mock_file_system.project_root),
+            link_validator=LinkValidator(mock_file_system, mock_link_parser),
+            metadata_index=mock_metadata_index,
+        )
+
+    @pytest.mark.asyncio
+    async def test_batch_commits_all_outputs_and_flushes_index(
+        self,
+        memory_bank_dir: Path,
+        mock_file_system: FileSystemManager,
+        mock_metadata_index: MetadataIndex,
+        mock_link_parser: LinkParser,
+    ):
+        """Test independent operations are committed together."""
+        # Arrange
+        memory_bank_dir.mkdir(parents=True, exist_ok=True)
+        _ = (memory_bank_dir / "old.md").write_text("# Old\n")
+        executor = self._create_executor(
+            memory_bank_dir, mock_file_system, mock_metadata_index, mock_link_parser
+        )
+        operations = [
+            RefactoringOperationModel(
+                operation_id=f"op-{i}",
+                operation_type="create",
+                target_file=f"new{i}.md",
+                parameters=OperationParameters(content=f"# New {i}\n"),
+            )
+            for i in range(3)
+        ]
+        operations.append(
+            RefactoringOperationModel(
+                operation_id="op-delete",
+                operation_type="delete",
+                target_file="old.md",
+                parameters=OperationParameters(),
+            )
+        )
+        execution = (
+            executor._create_execution_record(  # pyright: ignore[reportPrivateUsage]
+                "sug-1", "apr-1", operations
+            )
+        )
+
+        # Act
+        await executor._execute_operations_batch(  # pyright: ignore[reportPrivateUsage]
+            execution, operations
+        )
+
+        # Assert
+        assert all(op.status == RefactoringStatus.COMPLETED for op in operations)
+        assert (memory_bank_dir / "new2.md").read_text() == "# New 2\n"
+        assert not (memory_bank_dir / "old.md").exists()
+        assert not executor.staging_root.exists() or not any(
+            executor.staging_root.iterdir()
+        )
+        assert await mock_metadata_index.file_exists_in_index("new0.md")
+
+    @pytest.mark.asyncio
+    async def test_failed_operation_leaves_disk_untouched(
+        self,
+        memory_bank_dir: Path,
+        mock_file_system: FileSystemManager,
+        mock_metadata_index: MetadataIndex,
+        mock_link_parser: LinkParser,
+    ):
+        """Test a failing operation prevents every write of the batch."""
+        # Arrange
+        memory_bank_dir.mkdir(parents=True, exist_ok=True)
+        executor = self._create_executor(
+            memory_bank_dir, mock_file_system, mock_metadata_index, mock_link_parser
+        )
+        operations = [
+            RefactoringOperationModel(
+                operation_id="op-create",
+                operation_type="create",
+                target_file="created.md",
+                parameters=OperationParameters(content="# Created\n"),
+            ),
+            RefactoringOperationModel(
+                operation_id="op-split",
+                operation_type="split",
+                target_file="other.md",
+                parameters=OperationParameters(),
+            ),
+        ]
+        execution = (
+            executor._create_execution_record(  # pyright: ignore[reportPrivateUsage]
+                "sug-1", "apr-1", operations
+            )
+        )
+
+        # Act
+        with pytest.raises(ValidationError):
+            await executor._execute_operations_batch(  # pyright: ignore[reportPrivateUsage]
+                execution, operations
+            )
+
+        # Assert
+        assert not (memory_bank_dir / "created.md").exists()
+        assert operations[1].status == RefactoringStatus.FAILED
@@ -6,6 +6,7 @@ of Memory Bank files to improve dependency structure and optimize file organizat
 """
 
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -17,7 +18,10 @@ from cortex.refactoring.models import (
     ReorganizationImpactModel,
     ReorganizationPlanModel,
 )
-from cortex.refactoring.reorganization_planner import ReorganizationPlanner
+from cortex.refactoring.reorganization_planner import (
+    MAX_CACHED_PLANS,
+    ReorganizationPlanner,
+)
 
 
 @pytest.fixture
@@ -1053,3 +1057,116 @@ class TestHelperMethods:
 
         assert proposed["organization"] == "simplified"
         assert "categories" in proposed
+
+
+class TestPlanCache:
+    """Test cached plans, previews and move evaluation"""
+
+    @pytest.mark.asyncio
+    async def test_same_inputs_reuse_plan_and_analysis(
+        self,
+        reorganization_planner: ReorganizationPlanner,
+        tmp_path: Path,
+        sample_structure_data: MemoryBankStructureData,
+        sample_dependency_graph: DependencyGraphInput,
+    ):
+        """Test repeated requests return the cached plan without re-analysis"""
+        _ = (tmp_path / "projectBrief.md").write_text("# Brief")
+        analyzer = reorganization_planner.analyzer
+
+        with patch.object(
+            analyzer,
+            "analyze_current_structure",
+            wraps=analyzer.analyze_current_structure,
+        ) as spy:
+            first = await reorganization_planner.create_reorganization_plan(
+                "dependency_depth", sample_structure_data, sample_dependency_graph
+            )
+            second = await reorganization_planner.create_reorganization_plan(
+                "dependency_depth", sample_structure_data, sample_dependency_graph
+            )
+            complexity = await reorganization_planner.create_reorganization_plan(
+                "complexity", sample_structure_data, sample_dependency_graph
+            )
+
+        assert first is not None and second is first
+        assert complexity is not None and complexity.plan_id != first.plan_id
+        assert spy.await_count == 1
+
+    def test_plan_index_is_bounded(self, reorganization_planner: ReorganizationPlanner):
+        """Test only the most recent input fingerprints are remembered"""
+        for number in range(MAX_CACHED_PLANS + 5):
+            reorganization_planner._index_plan((f"inputs-{number}", "complexity"), None)
+
+        index = reorganization_planner._plan_index
+        assert len(index) == MAX_CACHED_PLANS
+        assert ("inputs-0", "complexity") not in index
+        assert (f"inputs-{MAX_CACHED_PLANS + 4}", "complexity") in index
+
+    @pytest.mark.asyncio
+    async def test_preview_plan_from_cache(
+        self,
+        reorganization_planner: ReorganizationPlanner,
+        tmp_path: Path,
+        sample_structure_data: MemoryBankStructureData,
+        sample_dependency_graph: DependencyGraphInput,
+    ):
+        """Test cached plans are previewed by id"""
+        _ = (tmp_path / "projectBrief.md").write_text("# Brief")
+        plan = await reorganization_planner.create_reorganization_plan(
+            "dependency_depth", sample_structure_data, sample_dependency_graph
+        )
+        assert plan is not None
+
+        preview = await reorganization_planner.preview_plan(plan.plan_id)
+        missing = await reorganization_planner.preview_plan("REORG-9999")
+
+        assert preview is not None
+        assert preview.plan_id == plan.plan_id
+        assert preview.actions_count == len(plan.actions)
+        assert missing is None
+
+    @pytest.mark.asyncio
+    async def test_move_file_updates_cached_plan(
+        self,
+        reorganization_planner: ReorganizationPlanner,
+        tmp_path: Path,
+        sample_structure_data: MemoryBankStructureData,
+    ):
+        """Test moving one file updates the plan from the category graph"""
+        for name in ["projectBrief.md", "activeContext.md", "glossary.md"]:
+            _ = (tmp_path / name).write_text(f"# {name}")
+        brief = str(tmp_path / "projectBrief.md")
+        glossary = str(tmp_path / "glossary.md")
+        dependency_graph = DependencyGraphInput(
+            dependencies={
+                "glossary.md": DependencyInfo(depends_on=["projectBrief.md"]),
+            }
+        )
+        plan = await reorganization_planner.create_reorganization_plan(
+            "complexity", sample_structure_data, dependency_graph
+        )
+        assert plan is not None
+        assert glossary in plan.proposed_structure.categories["reference"]
+
+        evaluated = reorganization_planner.evaluate_move(plan.plan_id, glossary, "core")
+        moved = await reorganization_planner.move_file(plan.plan_id, glossary, "core")
+        edited = reorganization_planner.get_plan(plan.plan_id)
+        replanned = await reorganization_planner.create_reorganization_plan(
+            "complexity", sample_structure_data, dependency_graph
+        )
+
+        assert moved is not None and moved == evaluated
+        assert moved.cross_dependency_change == -1
+        assert edited is not None and edited is not plan
+        assert sorted(edited.proposed_structure.categories["core"]) == sorted(
+            [brief, glossary]
+        )
+        assert any(
+            action.source == glossary and "core" in action.target
+            for action in edited.actions
+        )
+        assert glossary in plan.proposed_structure.categories["reference"]
+        assert replanned is not None and replanned.plan_id != plan.plan_id
+        assert glossary in replanned.proposed_structure.categories["reference"]
+        assert reorganization_planner.category_metrics(plan.plan_id) == moved.after
@@ -3,13 +3,15 @@
 import json
 from datetime import datetime, timedelta
 from pathlib import Path
-from unittest.mock import AsyncMock, Mock
+from typing import cast
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
 from cortex.core.file_system import FileSystemManager
 from cortex.core.metadata_index import MetadataIndex
 from cortex.core.models import ModelDict
+from cortex.linking.link_parser import LinkParser
 from cortex.refactoring.models import RefactoringStatus
 from cortex.refactoring.rollback_manager import RollbackManager, RollbackRecord
 
@@ -396,8 +398,8 @@ class TestDetectConflicts:
         # Mock file system and metadata
         mock_file_system.read_file = AsyncMock(return_value=("New content", None))
         mock_file_system.compute_hash = Mock(return_value="new_hash")
-        mock_metadata_index.get_file_metadata = AsyncMock(
-            return_value={"content_hash": "old_hash"}
+        mock_metadata_index.get_all_files_metadata = AsyncMock(
+            return_value={"modified.md": {"content_hash": "old_hash"}}
         )
 
         # Act
@@ -468,14 +470,16 @@ class TestRestoreFiles:
         )
 
         # Mock metadata and version manager
-        mock_metadata_index.get_file_metadata = AsyncMock(
+        mock_metadata_index.get_all_files_metadata = AsyncMock(
             return_value={
-                "version_history": [
-                    _make_version_metadata_dict(
-                        version=1,
-                        change_description="Pre-refactoring snapshot: snapshot-1",
-                    )
-                ]
+                "file1.md": {
+                    "version_history": [
+                        _make_version_metadata_dict(
+                            version=1,
+                            change_description="Pre-refactoring snapshot: snapshot-1",
+                        )
+                    ]
+                }
             }
         )
         version_manager.rollback_to_version = AsyncMock(
@@ -982,9 +986,327 @@ class TestSaveRollbacks:
         await manager.save_rollbacks()
 
         # Assert
-        rollback_file = memory_bank_dir.parent / "rollbacks.json"
-        # Ensure parent directory exists
-        rollback_file.parent.mkdir(parents=True, exist_ok=True)
-        assert rollback_file.exists()
-        data = json.loads(rollback_file.read_text())
+        reloaded = RollbackManager(
+            memory_bank_dir=memory_bank_dir,
+            fs_manager=mock_file_system,
+            version_manager=version_manager,
+            metadata_index=mock_metadata_index,
+        )
+        assert "roll-1" in reloaded.rollbacks
+        assert reloaded.rollbacks["roll-1"].status == RefactoringStatus.COMPLETED
+
+    @pytest.mark.asyncio
+    async def test_export_rollbacks_writes_json(
+        self,
+        memory_bank_dir: Path,
+        mock_file_system: FileSystemManager,
+        mock_metadata_index: MetadataIndex,
+    ):
+        """Test export_rollbacks writes the legacy JSON format."""
+        # Arrange
+        from cortex.core.version_manager import VersionManager
+
+        version_manager = VersionManager(memory_bank_dir.parent)
+        manager = RollbackManager(
+            memory_bank_dir=memory_bank_dir,
+            fs_manager=mock_file_system,
+            version_manager=version_manager,
+            metadata_index=mock_metadata_index,
+        )
+        manager.rollbacks["roll-1"] = RollbackRecord(
+            rollback_id="roll-1",
+            execution_id="exec-1",
+            created_at="2025-01-01T12:00:00",
+            status=RefactoringStatus.COMPLETED,
+        )
+
+        # Act
+        export_path = await manager.export_rollbacks()
+
+        # Assert
+        assert export_path == memory_bank_dir.parent / "rollbacks.json"
+        data = json.loads(export_path.read_text())
         assert "roll-1" in data["rollbacks"]
+        assert not manager.state_store.import_legacy(export_path, lambda _: {})
+
+
+class TestBulkRollback:
+    """Test bulk conflict detection and restore."""
+
+    def test_snapshot_version_map_uses_exact_ids(self):
+        """Test snapshot ids map to the earliest version recording them."""
+        # Arrange
+        from cortex.core.models import VersionMetadata
+        from cortex.refactoring.rollback_manager import snapshot_version_map
+
+        history = [
+            VersionMetadata.model_validate(
+                _make_version_metadata_dict(
+                    version=version, change_description=description
+                )
+            )
+            for version, description in [
+                (1, "Initial version"),
+                (2, "Pre-refactoring snapshot: snapshot-10"),
+                (3, "Pre-refactoring snapshot: snapshot-1"),
+                (4, "Pre-refactoring snapshot: snapshot-1"),
+            ]
+        ]
+
+        # Act
+        versions = snapshot_version_map(history)
+
+        # Assert
+        assert versions == {"snapshot-10": 2, "snapshot-1": 3}
+
+    @pytest.mark.asyncio
+    async def test_restore_files_writes_snapshots_back(
+        self,
+        memory_bank_dir: Path,
+        mock_file_system: FileSystemManager,
+        mock_metadata_index: MetadataIndex,
+    ):
+        """Test every affected file is restored with one index save."""
+        # Arrange
+        from cortex.core.version_manager import VersionManager
+
+        version_manager = VersionManager(memory_bank_dir.parent)
+        manager = RollbackManager(
+            memory_bank_dir=memory_bank_dir,
+            fs_manager=mock_file_system,
+            version_manager=version_manager,
+            metadata_index=mock_metadata_index,
+        )
+        files = [f"file{i}.md" for i in range(12)]
+        for file_name in files:
+            full_path = memory_bank_dir / file_name
+            original = f"# {file_name}\nOriginal\n"
+            version_meta = await version_manager.create_snapshot(
+                full_path,
+                version=1,
+                content=original,
+                size_bytes=len(original),
+                token_count=3,
+                content_hash=mock_file_system.compute_hash(original),
+                change_description="Pre-refactoring snapshot: snapshot-1",
+            )
+            _ = await mock_file_system.write_file(full_path, "# Refactored\n")
+            await mock_metadata_index.update_file_metadata(
+                file_name,
+                path=full_path,
+                exists=True,
+                size_bytes=13,
+                token_count=2,
+                content_hash=mock_file_system.compute_hash("# Refactored\n"),
+                sections=[],
+            )
+            await mock_metadata_index.add_version_to_history(file_name, version_meta)
+        from cortex.core import metadata_index as metadata_index_module
+        from cortex.core.retry import retry_async
+
+        index_write = AsyncMock(wraps=retry_async)
+
+        # Act
+        conflicts = await manager.detect_conflicts(files, "snapshot-1")
+        with patch.object(metadata_index_module, "retry_async", index_write):
+            restored = await manager.restore_files(
+                files, "snapshot-1", preserve_manual_changes=True, conflicts=conflicts
+            )
+
+        # Assert
+        assert conflicts == []
+        assert restored == files
+        assert (memory_bank_dir / "file7.md").read_text() == "# file7.md\nOriginal\n"
+        assert index_write.await_count == 1
+        assert await mock_metadata_index.get_expected_hash(
+            "file7.md"
+        ) == mock_file_system.compute_hash("# file7.md\nOriginal\n")
+
+    @pytest.mark.asyncio
+    async def test_detect_conflicts_keeps_input_order(
+        self,
+        memory_bank_dir: Path,
+        mock_file_system: FileSystemManager,
+        mock_metadata_index: MetadataIndex,
+    ):
+        """Test concurrently detected conflicts are reported in file order."""
+        # Arrange
+        from cortex.core.version_manager import VersionManager
+
+        manager = RollbackManager(
+            memory_bank_dir=memory_bank_dir,
+            fs_manager=mock_file_system,
+            version_manager=VersionManager(memory_bank_dir.parent),
+            metadata_index=mock_metadata_index,
+        )
+        files = [f"missing{i}.md" for i in range(20)]
+
+        # Act
+        conflicts = await manager.detect_conflicts(files, "snapshot-1")
+
+        # Assert
+        assert [conflict.split(" - ")[0] for conflict in conflicts] == files
+
+
+class TestSnapshotIndexLookups:
+    """Test rollback lookups through the snapshot index."""
+
+    @pytest.mark.asyncio
+    async def test_rollback_uses_executor_snapshot_index(
+        self,
+        memory_bank_dir: Path,
+        mock_file_system: FileSystemManager,
+        mock_metadata_index: MetadataIndex,
+        mock_link_parser: LinkParser,
+    ):
+        """Test an executed refactoring is found and restored via the index."""
+        # Arrange
+        from cortex.core.version_manager import VersionManager
+        from cortex.linking.link_validator import LinkValidator
+        from cortex.refactoring.refactoring_executor import RefactoringExecutor
+
+        version_manager = VersionManager(memory_bank_dir.parent)
+        executor = RefactoringExecutor(
+            memory_bank_dir=memory_bank_dir,
+            fs_manager=mock_file_system,
+            version_manager=version_manager,
+            link_validator=LinkValidator(mock_file_system, mock_link_parser),
+            metadata_index=mock_metadata_index,
+        )
+        _ = (memory_bank_dir / "target.md").write_text("# Original\n")
+        suggestion = cast(
+            ModelDict,
+            {
+                "suggestion_id": "sug-1",
+                "type": "reorganization",
+                "actions": [
+                    {"action": "rename", "file": "target.md", "new_name": "new.md"}
+                ],
+            },
+        )
+        execution = await executor.execute_refactoring(
+            "sug-1", "apr-1", suggestion, dry_run=False, validate_first=False
+        )
+        execution_id = str(execution["execution_id"])
+        manager = RollbackManager(
+            memory_bank_dir=memory_bank_dir,
+            fs_manager=mock_file_system,
+            version_manager=version_manager,
+            metadata_index=mock_metadata_index,
+        )
+        scan = AsyncMock(wraps=mock_metadata_index.get_file_metadata)
+        mock_metadata_index.get_file_metadata = scan
+
+        # Act
+        snapshot_id = manager.find_snapshot_for_execution(execution_id)
+        affected = await manager.get_affected_files(execution_id, str(snapshot_id))
+        result = await manager.rollback_refactoring(
+            execution_id, preserve_manual_changes=False
+        )
+
+        # Assert
+        assert snapshot_id == execution["snapshot_id"]
+        assert affected == ["target.md"]
+        assert result.status == "success"
+        assert (memory_bank_dir / "target.md").read_text() == "# Original\n"
+        scan.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_finds_snapshot_of_archived_execution(
+        self,
+        memory_bank_dir: Path,
+        mock_file_system: FileSystemManager,
+        mock_metadata_index: MetadataIndex,
+        mock_link_parser: LinkParser,
+    ):
+        """Test an execution compacted into the archive still resolves its snapshot."""
+        # Arrange
+        from cortex.core.version_manager import VersionManager
+        from cortex.linking.link_validator import LinkValidator
+        from cortex.refactoring.refactoring_executor import RefactoringExecutor
+
+        version_manager = VersionManager(memory_bank_dir.parent)
+        executor = RefactoringExecutor(
+            memory_bank_dir=memory_bank_dir,
+            fs_manager=mock_file_system,
+            version_manager=version_manager,
+            link_validator=LinkValidator(mock_file_system, mock_link_parser),
+            metadata_index=mock_metadata_index,
+        )
+        _ = (memory_bank_dir / "target.md").write_text("# Original\n")
+        suggestion = cast(
+            ModelDict,
+            {
+                "suggestion_id": "sug-1",
+                "type": "reorganization",
+                "actions": [
+                    {"action": "rename", "file": "target.md", "new_name": "new.md"}
+                ],
+            },
+        )
+        execution = await executor.execute_refactoring(
+            "sug-1", "apr-1", suggestion, dry_run=False, validate_first=False
+        )
+        execution_id = str(execution["execution_id"])
+        stats = executor.executions.compact(
+            active_days=1, now=datetime.now() + timedelta(days=30)
+        )
+        manager = RollbackManager(
+            memory_bank_dir=memory_bank_dir,
+            fs_manager=mock_file_system,
+            version_manager=version_manager,
+            metadata_index=mock_metadata_index,
+        )
+
+        # Act
+        snapshot_id = manager.find_snapshot_for_execution(execution_id)
+
+        # Assert
+        assert stats.archived == 1
+        assert manager.state_store.get("executions", execution_id) is None
+        assert snapshot_id == execution["snapshot_id"]
+
+    @pytest.mark.asyncio
+    async def test_restore_skips_overwritten_snapshot_blob(
+        self,
+        memory_bank_dir: Path,
+        mock_file_system: FileSystemManager,
+        mock_metadata_index: MetadataIndex,
+    ):
+        """Test a blob that no longer matches its recorded hash is not restored."""
+        # Arrange
+        from cortex.core.version_manager import VersionManager
+        from cortex.refactoring.models import SnapshotFileEntry, SnapshotIndexRecord
+
+        version_manager = VersionManager(memory_bank_dir.parent)
+        manager = RollbackManager(
+            memory_bank_dir=memory_bank_dir,
+            fs_manager=mock_file_system,
+            version_manager=version_manager,
+            metadata_index=mock_metadata_index,
+        )
+        blob = version_manager.get_snapshot_path("file1.md", 1)
+        blob.parent.mkdir(parents=True, exist_ok=True)
+        _ = blob.write_text("# Newer snapshot\n")
+        _ = (memory_bank_dir / "file1.md").write_text("# Current\n")
+        manager.snapshots["snap-1"] = SnapshotIndexRecord(
+            snapshot_id="snap-1",
+            created_at="2025-01-01T12:00:00",
+            files=[
+                SnapshotFileEntry(
+                    file="file1.md",
+                    version=1,
+                    snapshot_path=str(blob),
+                    content_hash=mock_file_system.compute_hash("# Original\n"),
+                )
+            ],
+        )
+
+        # Act
+        restored = await manager.restore_files(
+            ["file1.md"], "snap-1", preserve_manual_changes=False, conflicts=[]
+        )
+
+        # Assert
+        assert restored == []
+        assert (memory_bank_dir / "file1.md").read_text() == "# Current\n"
@@ -5,14 +5,30 @@ import os
 from pathlib import Path
 
 from cortex.core.session_logger import (
+    LoadContextLogEntry,
+    flush_session_logs,
     get_session_id,
     get_session_log_path,
+    get_session_log_paths,
     list_session_logs,
     log_load_context_call,
     read_session_log,
+    read_session_log_entries,
 )
 
 
+def _entry(task_description: str) -> LoadContextLogEntry:
+    """Create a log entry for a task."""
+    return LoadContextLogEntry(
+        timestamp="2026-01-21T10:05",
+        task_description=task_description,
+        token_budget=5000,
+        strategy="dependency_aware",
+        total_tokens=1000,
+        utilization=0.2,
+    )
+
+
 class TestGetSessionId:
     """Tests for session ID generation."""
 
@@ -94,7 +110,10 @@ class TestGetSessionLogPath:
 
             # Assert
             expected = (
-                tmp_path / ".cortex" / ".session" / "context-session-path_test_123.json"
+                tmp_path
+                / ".cortex"
+                / ".session"
+                / "context-session-path_test_123.jsonl"
             )
             assert log_path == expected
         finally:
@@ -152,15 +171,18 @@ class TestLogLoadContextCall:
             )
 
             # Assert - use public API to get path
+            flush_session_logs()
             log_path = get_session_log_path(tmp_path)
             assert log_path.exists()
 
-            with open(log_path) as f:
-                log_data = json.load(f)
+            lines = log_path.read_text().splitlines()
+            assert len(lines) == 1
+            assert json.loads(lines[0])["task_description"] == "Test task"
 
-            assert log_data["session_id"] == "log_test_123"
-            assert len(log_data["load_context_calls"]) == 1
-            assert log_data["load_context_calls"][0]["task_description"] == "Test task"
+            session_log = read_session_log(log_path)
+            assert session_log is not None
+            assert session_log.session_id == "log_test_123"
+            assert len(session_log.load_context_calls) == 1
         finally:
             # Cleanup
             if original:
@@ -205,15 +227,14 @@ class TestLogLoadContextCall:
             )
 
             # Assert - use public API to get path
-            log_path = get_session_log_path(tmp_path)
-            with open(log_path) as f:
-                log_data = json.load(f)
-
-            assert len(log_data["load_context_calls"]) == 2
-            assert log_data["load_context_calls"][0]["task_description"] == "First task"
-            assert (
-                log_data["load_context_calls"][1]["task_description"] == "Second task"
-            )
+            flush_session_logs()
+            session_log = read_session_log(get_session_log_path(tmp_path))
+            assert session_log is not None
+
+            calls = session_log.load_context_calls
+            assert len(calls) == 2
+            assert calls[0].task_description == "First task"
+            assert calls[1].task_description == "Second task"
         finally:
             # Cleanup
             if original:
@@ -239,7 +260,8 @@ class TestListSessionLogs:
         session_dir = tmp_path / ".cortex" / ".session"
         _ = session_dir.mkdir(parents=True)
         _ = (session_dir / "context-session-abc123.json").write_text("{}")
-        _ = (session_dir / "context-session-def456.json").write_text("{}")
+        _ = (session_dir / "context-session-def456.jsonl").write_text("")
+        _ = (session_dir / "context-usage-statistics.json").write_text("{}")
 
         # Act
         logs = list_session_logs(tmp_path)
@@ -280,3 +302,95 @@ class TestReadSessionLog:
         # Assert
         assert result is not None
         assert result["session_id"] == "read_test"
+
+    def test_reads_jsonl_session_log(self, tmp_path: Path) -> None:
+        """Test that the session ID comes from a JSONL log's file name."""
+        # Arrange
+        log_path = tmp_path / "context-session-jsonl_test.jsonl"
+        lines = [_entry("First").model_dump_json(), _entry("Second").model_dump_json()]
+        _ = log_path.write_text("\n".join(lines) + "\n")
+
+        # Act
+        result = read_session_log(log_path)
+
+        # Assert
+        assert result is not None
+        assert result.session_id == "jsonl_test"
+        assert result.session_start == "2026-01-21T10:05"
+        assert [c.task_description for c in result.load_context_calls] == [
+            "First",
+            "Second",
+        ]
+
+
+class TestReadSessionLogEntries:
+    """Tests for incremental reads of JSONL session logs."""
+
+    def test_reads_from_offset(self, tmp_path: Path) -> None:
+        """Test only lines after the offset are read."""
+        # Arrange
+        log_path = tmp_path / "context-session-offset.jsonl"
+        _ = log_path.write_text(_entry("First").model_dump_json() + "\n")
+        _, offset = read_session_log_entries(log_path)
+        with open(log_path, "a") as f:
+            _ = f.write(_entry("Second").model_dump_json() + "\n")
+
+        # Act
+        entries, new_offset = read_session_log_entries(log_path, offset)
+
+        # Assert
+        assert [e.task_description for e in entries] == ["Second"]
+        assert new_offset == log_path.stat().st_size
+
+    def test_leaves_partial_line_for_next_read(self, tmp_path: Path) -> None:
+        """Test a line still being written is not consumed."""
+        # Arrange
+        log_path = tmp_path / "context-session-partial.jsonl"
+        complete = _entry("Complete").model_dump_json() + "\n"
+        _ = log_path.write_text(complete + '{"timestamp": "2026')
+
+        # Act
+        entries, offset = read_session_log_entries(log_path)
+
+        # Assert
+        assert len(entries) == 1
+        assert offset == len(complete.encode())
+
+    def test_skips_malformed_lines(self, tmp_path: Path) -> None:
+        """Test lines that fail to parse are skipped."""
+        # Arrange
+        log_path = tmp_path / "context-session-bad.jsonl"
+        _ = log_path.write_text("not json\n" + _entry("Good").model_dump_json() + "\n")
+
+        # Act
+        entries, _ = read_session_log_entries(log_path)
+
+        # Assert
+        assert [e.task_description for e in entries] == ["Good"]
+
+
+class TestGetSessionLogPaths:
+    """Tests for finding the current session's log files."""
+
+    def test_includes_legacy_json_log(self, tmp_path: Path) -> None:
+        """Test a legacy JSON log of the current session is found first."""
+        # Arrange
+        env_key = "CORTEX_SESSION_ID"
+        original = os.environ.get(env_key)
+        os.environ[env_key] = "paths_test"
+        session_dir = tmp_path / ".cortex" / ".session"
+        _ = session_dir.mkdir(parents=True)
+        _ = (session_dir / "context-session-paths_test.json").write_text("{}")
+        _ = (session_dir / "context-session-paths_test.jsonl").write_text("")
+
+        try:
+            # Act
+            paths = get_session_log_paths(tmp_path)
+
+            # Assert
+            assert [p.suffix for p in paths] == [".json", ".jsonl"]
+        finally:
+            if original:
+                os.environ[env_key] = original
+            else:
+                _ = os.environ.pop(env_key, None)
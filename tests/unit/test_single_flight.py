@@ -0,0 +1,187 @@
+"""
+Tests for single_flight.py - Deduplication of concurrent identical tool calls.
+
+This test module covers:
+- Concurrent identical calls sharing one execution and its result or error
+- Calls with different arguments or memory bank versions executing separately
+- Memory bank version changes after file writes
+- Single-flight routing in with_mcp_stability
+"""
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from cortex.core.mcp_stability import get_single_flight, with_mcp_stability
+from cortex.core.single_flight import SingleFlight, call_key, memory_bank_version
+
+
+def _key(version: str = "v1", **kwargs: str | None) -> tuple[str, str, str, str]:
+    return call_key("tools.validate", (), dict(kwargs), Path("/project"), version)
+
+
+class _SlowCall:
+    """Counting coroutine function that blocks until released."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.release = asyncio.Event()
+
+    async def __call__(self) -> str:
+        self.calls += 1
+        _ = await self.release.wait()
+        return f"result-{self.calls}"
+
+
+class TestCallKey:
+    """Tests for call_key and memory_bank_version."""
+
+    def test_omitted_and_none_arguments_match(self) -> None:
+        """Test None keyword arguments count as omitted."""
+        # Act & Assert
+        assert _key(check_type="schema", file_name=None) == _key(check_type="schema")
+        assert _key(check_type="schema") != _key(check_type="duplications")
+        assert _key("v1") != _key("v2")
+
+    def test_version_changes_after_write(self, tmp_path: Path) -> None:
+        """Test writing a memory bank file changes the version."""
+        # Arrange
+        memory_bank = tmp_path / ".cortex" / "memory-bank"
+        memory_bank.mkdir(parents=True)
+        _ = (memory_bank / "progress.md").write_text("# Progress\n")
+        before = memory_bank_version(tmp_path)
+
+        # Act
+        _ = (memory_bank / "progress.md").write_text("# Progress\n\n- Done\n")
+        after = memory_bank_version(tmp_path)
+
+        # Assert
+        assert before != after
+        assert memory_bank_version(tmp_path) == after
+
+
+class TestSingleFlight:
+    """Tests for SingleFlight."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_calls_execute_once(self) -> None:
+        """Test identical calls in flight share one execution."""
+        # Arrange
+        flight = SingleFlight()
+        call = _SlowCall()
+        tasks = [asyncio.create_task(flight.run(_key(), call)) for _ in range(3)]
+        await asyncio.sleep(0)
+
+        # Act
+        call.release.set()
+        results = await asyncio.gather(*tasks)
+
+        # Assert
+        assert results == ["result-1"] * 3
+        assert call.calls == 1
+        stats = flight.stats()
+        assert (stats.executions, stats.duplicates_saved, stats.in_flight) == (1, 2, 0)
+
+    @pytest.mark.asyncio
+    async def test_different_keys_execute_separately(self) -> None:
+        """Test calls with different keys, or after completion, run again."""
+        # Arrange
+        flight = SingleFlight()
+        call = _SlowCall()
+        call.release.set()
+
+        # Act
+        results = await asyncio.gather(
+            flight.run(_key(check_type="schema"), call),
+            flight.run(_key(check_type="duplications"), call),
+        )
+        later = await flight.run(_key(check_type="schema"), call)
+
+        # Assert
+        assert sorted(results) == ["result-1", "result-2"]
+        assert later == "result-3"
+        assert flight.stats().duplicates_saved == 0
+
+    @pytest.mark.asyncio
+    async def test_exception_is_shared(self) -> None:
+        """Test every waiting caller receives the execution's error."""
+        # Arrange
+        flight = SingleFlight()
+        calls = 0
+
+        async def failing() -> str:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0)
+            raise ValueError("index unreadable")
+
+        # Act
+        results = await asyncio.gather(
+            flight.run(_key(), failing),
+            flight.run(_key(), failing),
+            return_exceptions=True,
+        )
+
+        # Assert
+        assert calls == 1
+        assert all(isinstance(result, ValueError) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_cancelling_one_caller_keeps_shared_execution(self) -> None:
+        """Test the execution survives until its last caller cancels."""
+        # Arrange
+        flight = SingleFlight()
+        call = _SlowCall()
+        first = asyncio.create_task(flight.run(_key(), call))
+        second = asyncio.create_task(flight.run(_key(), call))
+        await asyncio.sleep(0)
+
+        # Act
+        _ = first.cancel()
+        _ = await asyncio.gather(first, return_exceptions=True)
+        call.release.set()
+        result = await second
+
+        # Assert
+        assert first.cancelled()
+        assert result == "result-1"
+
+
+class TestWithMcpStabilitySingleFlight:
+    """Tests for the single_flight option of with_mcp_stability."""
+
+    @pytest.mark.asyncio
+    async def test_identical_tool_calls_share_execution(self, tmp_path: Path) -> None:
+        """Test concurrent identical wrapped calls run the tool once."""
+        # Arrange
+        calls = 0
+        release = asyncio.Event()
+
+        async def read_only_tool(project_root: str) -> str:
+            nonlocal calls
+            calls += 1
+            _ = await release.wait()
+            return "stats"
+
+        saved_before = get_single_flight().stats().duplicates_saved
+        tasks = [
+            asyncio.create_task(
+                with_mcp_stability(
+                    read_only_tool, single_flight=True, project_root=str(tmp_path)
+                )
+            )
+            for _ in range(2)
+        ]
+        for _ in range(20):
+            await asyncio.sleep(0.01)
+            if get_single_flight().stats().duplicates_saved > saved_before:
+                break
+
+        # Act
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        # Assert
+        assert results == ["stats", "stats"]
+        assert calls == 1
@@ -0,0 +1,172 @@
+"""
+Tests for split_planner module.
+
+This test module covers:
+- Per-section feature extraction and independence scoring
+- Boundary costs from internal links and heading nesting
+- Token-weighted DP partitioning of section sequences
+"""
+
+import time
+
+from cortex.core.models import ModelDict
+from cortex.refactoring.split_analyzer import SplitAnalyzer
+from cortex.refactoring.split_planner import (
+    SectionFeatures,
+    balanced_target,
+    boundary_costs,
+    extract_features,
+    heading_anchor,
+    partition_sections,
+    section_features,
+)
+
+
+def _feature(
+    heading: str, tokens: int, level: int = 1, links: tuple[str, ...] = ()
+) -> SectionFeatures:
+    return SectionFeatures(
+        heading=heading,
+        level=level,
+        start_line=1,
+        end_line=1,
+        tokens=tokens,
+        anchor=heading_anchor(heading),
+        link_anchors=links,
+        has_code_blocks=False,
+        has_lists=False,
+        has_subheadings=False,
+    )
+
+
+class TestSectionFeatures:
+    """Tests for section feature extraction."""
+
+    def test_features_match_analyzer_independence(self) -> None:
+        """Test feature independence equals the analyzer's score."""
+        # Arrange
+        content = (
+            "# Intro\n\nSee [setup](#setup-guide).\n\n"
+            "## Setup Guide\n\n- step one\n\n```bash\nmake\n```\n"
+        )
+        analyzer = SplitAnalyzer()
+        sections = analyzer.parse_file_structure(content)
+
+        # Act
+        features = extract_features(sections, lambda text: len(text.split()))
+
+        # Assert
+        assert [f.anchor for f in features] == ["intro", "setup-guide"]
+        assert features[0].link_anchors == ("setup-guide",)
+        assert features[1].has_code_blocks and features[1].has_lists
+        for section, feature in zip(sections, features, strict=True):
+            expected = analyzer.calculate_section_independence(
+                section, sections, content
+            )
+            assert feature.independence == expected
+
+    def test_missing_fields_default(self) -> None:
+        """Test sections without numeric fields default to zero."""
+        # Arrange
+        section: ModelDict = {"heading": "Notes", "content": "text"}
+
+        # Act
+        feature = section_features(section)
+
+        # Assert
+        assert (feature.level, feature.start_line, feature.end_line) == (0, 0, 0)
+        assert feature.tokens == 1
+
+
+class TestBoundaryCosts:
+    """Tests for boundary_costs."""
+
+    def test_links_and_nesting_raise_cut_cost(self) -> None:
+        """Test links spanning a boundary and subsections make it costly."""
+        # Arrange
+        features = [
+            _feature("A", 10, links=("c",)),
+            _feature("B", 10),
+            _feature("C", 10),
+            _feature("C detail", 10, level=2),
+        ]
+
+        # Act
+        costs = boundary_costs(features)
+
+        # Assert
+        assert costs == [0.0, 1.0, 1.0, 0.5]
+
+
+class TestPartitionSections:
+    """Tests for partition_sections."""
+
+    def test_chunks_are_balanced_and_capped(self) -> None:
+        """Test greedy-unfriendly sizes are split into even chunks."""
+        # Arrange
+        features = [_feature(f"S{i}", tokens) for i, tokens in enumerate([40] * 9)]
+
+        # Act
+        chunks = partition_sections(features, balanced_target(360, 3), 150)
+
+        # Assert
+        assert chunks == [(0, 3), (3, 6), (6, 9)]
+
+    def test_avoids_cutting_linked_sections(self) -> None:
+        """Test a boundary crossed by a link moves to a free position."""
+        # Arrange
+        features = [
+            _feature("A", 50),
+            _feature("B", 50, links=("c",)),
+            _feature("C", 50),
+            _feature("D", 50),
+        ]
+
+        # Act
+        chunks = partition_sections(features, 100, 150)
+
+        # Assert
+        assert chunks == [(0, 1), (1, 3), (3, 4)]
+
+    def test_oversized_section_gets_own_chunk(self) -> None:
+        """Test a section above the cap still forms a chunk."""
+        # Arrange
+        features = [_feature("Small", 10), _feature("Huge", 1000), _feature("End", 10)]
+
+        # Act
+        chunks = partition_sections(features, 100, 200)
+
+        # Assert
+        assert (1, 2) in chunks
+        assert chunks[0][0] == 0 and chunks[-1][1] == 3
+
+    def test_empty_input(self) -> None:
+        """Test no sections produce no chunks."""
+        # Act / Assert
+        assert partition_sections([], 100) == []
+        assert boundary_costs([]) == []
+
+    def test_large_file_partitions_quickly(self) -> None:
+        """Test a 10k+ line file is planned well under a second."""
+        # Arrange
+        parts = [
+            f"# Part {i}\n\nSee [next](#part-{i + 1}).\n\n" + "Body line.\n" * 8
+            for i in range(1500)
+        ]
+        content = "\n".join(parts)
+        analyzer = SplitAnalyzer()
+        sections = analyzer.parse_file_structure(content)
+        assert content.count("\n") > 10_000
+
+        # Act
+        started = time.perf_counter()
+        features = extract_features(sections)
+        total = sum(f.tokens for f in features)
+        chunks = partition_sections(features, balanced_target(total, 20))
+        elapsed = time.perf_counter() - started
+
+        # Assert
+        assert elapsed < 1.0
+        assert chunks[0][0] == 0 and chunks[-1][1] == len(features)
+        sizes = [sum(f.tokens for f in features[a:b]) for a, b in chunks]
+        assert max(sizes) <= 2 * balanced_target(total, 20)
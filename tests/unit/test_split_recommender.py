@@ -7,7 +7,7 @@ files into smaller, more focused components for better context management.
 
 from pathlib import Path
 from typing import cast
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -731,6 +731,15 @@ class TestHelperMethods:
         result = split_recommender.get_section_int(section, "missing", 0)
         assert result == 0
 
+    def test_count_tokens_uses_token_counter(self, tmp_path: Path):
+        """Test section weights come from the injected token counter"""
+        token_counter = MagicMock()
+        token_counter.count_tokens.return_value = 7
+        recommender = SplitRecommender(tmp_path, token_counter=token_counter)
+
+        assert recommender.count_tokens("some text") == 7
+        assert SplitRecommender(tmp_path).count_tokens("a" * 40) == 10
+
     def test_get_section_content(self, split_recommender: SplitRecommender):
         """Test extracting content from section dict"""
         section = cast(ModelDict, {"content": "Test content"})
@@ -0,0 +1,246 @@
+"""
+Tests for staged_workspace module.
+
+This test module covers:
+- Copy-on-write reads, writes, renames and deletes
+- Journaled commit
+- Recovery of interrupted commits
+"""
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from cortex.core.exceptions import FileLockTimeoutError, GitConflictError
+from cortex.core.file_system import FileSystemManager
+from cortex.refactoring.staged_workspace import (
+    JOURNAL_NAME,
+    StagedWorkspace,
+    recover_staged_commits,
+)
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    """Create a project with a few files."""
+    _ = (tmp_path / "a.md").write_text("# A\n")
+    (tmp_path / "dir").mkdir()
+    _ = (tmp_path / "dir" / "b.md").write_text("# B\n")
+    return tmp_path
+
+
+@pytest.fixture
+def workspace(project: Path) -> StagedWorkspace:
+    """Create a workspace over the project."""
+    return StagedWorkspace(FileSystemManager(project))
+
+
+class TestStagedWorkspace:
+    """Tests for StagedWorkspace."""
+
+    @pytest.mark.asyncio
+    async def test_writes_are_staged_not_applied(
+        self, project: Path, workspace: StagedWorkspace
+    ) -> None:
+        """Test writes are visible in the workspace but not on disk."""
+        # Act
+        _ = await workspace.write_file(project / "a.md", "# Changed\n")
+        content, _ = await workspace.read_file(project / "a.md")
+
+        # Assert
+        assert content == "# Changed\n"
+        assert (project / "a.md").read_text() == "# A\n"
+
+    @pytest.mark.asyncio
+    async def test_rename_and_delete_are_staged(
+        self, project: Path, workspace: StagedWorkspace
+    ) -> None:
+        """Test renamed and deleted files disappear from the view only."""
+        # Act
+        await workspace.rename(project / "a.md", project / "moved.md")
+        await workspace.delete(project / "dir")
+
+        # Assert
+        assert not workspace.exists(project / "a.md")
+        assert workspace.exists(project / "moved.md")
+        assert not workspace.exists(project / "dir" / "b.md")
+        assert (project / "a.md").exists()
+        assert (project / "dir" / "b.md").exists()
+
+    @pytest.mark.asyncio
+    async def test_directory_move_stages_every_file(
+        self, project: Path, workspace: StagedWorkspace
+    ) -> None:
+        """Test moving a directory moves the files beneath it."""
+        # Act
+        await workspace.rename(project / "dir", project / "archive")
+
+        # Assert
+        assert workspace.written_files == {project / "archive" / "b.md": "# B\n"}
+        assert workspace.deleted_files == [project / "dir" / "b.md"]
+
+    @pytest.mark.asyncio
+    async def test_rejects_paths_outside_project(
+        self, project: Path, workspace: StagedWorkspace
+    ) -> None:
+        """Test staged writes keep the project path check."""
+        # Act / Assert
+        with pytest.raises(PermissionError):
+            _ = await workspace.write_file(project.parent / "outside.md", "x")
+
+    @pytest.mark.asyncio
+    async def test_rejects_git_conflict_markers(
+        self, project: Path, workspace: StagedWorkspace
+    ) -> None:
+        """Test staged writes keep the content check of direct writes."""
+        # Arrange
+        content = "<<<<<<< HEAD\nours\n=======\ntheirs\n>>>>>>> branch\n"
+
+        # Act / Assert
+        with pytest.raises(GitConflictError):
+            _ = await workspace.write_file(project / "a.md", content)
+        assert workspace.written_files == {}
+
+    @pytest.mark.asyncio
+    async def test_commit_waits_for_file_locks(
+        self, project: Path, workspace: StagedWorkspace
+    ) -> None:
+        """Test commit does not apply changes while a file is locked."""
+        # Arrange
+        _ = await workspace.write_file(project / "a.md", "# Changed\n")
+        _ = (project / "a.md.lock").write_text("")
+        workspace.fs_manager.lock_timeout = 0
+
+        # Act / Assert
+        with pytest.raises(FileLockTimeoutError):
+            await workspace.commit(project / ".staging" / "exec-1")
+        assert (project / "a.md").read_text() == "# A\n"
+        assert not (project / ".staging" / "exec-1" / JOURNAL_NAME).exists()
+
+    @pytest.mark.asyncio
+    async def test_commit_applies_changes_and_cleans_up(
+        self, project: Path, workspace: StagedWorkspace
+    ) -> None:
+        """Test commit applies writes, renames and deletes together."""
+        # Arrange
+        _ = await workspace.write_file(project / "new.md", "# New\n")
+        await workspace.rename(project / "dir", project / "archive")
+        await workspace.delete(project / "a.md")
+        staging_dir = project / ".staging" / "exec-1"
+
+        # Act
+        await workspace.commit(staging_dir)
+
+        # Assert
+        assert (project / "new.md").read_text() == "# New\n"
+        assert (project / "archive" / "b.md").read_text() == "# B\n"
+        assert not (project / "dir").exists()
+        assert not (project / "a.md").exists()
+        assert not staging_dir.exists()
+
+    @pytest.mark.asyncio
+    async def test_commit_syncs_outputs_before_journal(
+        self, project: Path, workspace: StagedWorkspace
+    ) -> None:
+        """Test staged outputs are durable before the journal is written."""
+        # Arrange
+        _ = await workspace.write_file(project / "new.md", "# New\n")
+        events: list[str] = []
+
+        def record_fsync(path: Path) -> None:
+            events.append(f"fsync:{path.name}")
+
+        def record_journal(path: Path, journal: object) -> None:
+            events.append("journal")
+
+        # Act
+        with (
+            patch("cortex.refactoring.staged_workspace._fsync_file", record_fsync),
+            patch(
+                "cortex.refactoring.staged_workspace._fsync_directory",
+                lambda path: events.append(f"fsync-dir:{path.name}"),
+            ),
+            patch("cortex.refactoring.staged_workspace._write_journal", record_journal),
+            patch("cortex.refactoring.staged_workspace.apply_journal"),
+        ):
+            await workspace.commit(project / ".staging" / "exec-1")
+
+        # Assert
+        assert events == ["fsync:0.tmp", "fsync-dir:exec-1", "journal"]
+
+
+class TestRecoverStagedCommits:
+    """Tests for recover_staged_commits."""
+
+    def test_rolls_forward_journaled_commit(self, project: Path) -> None:
+        """Test an interrupted commit is finished from its journal."""
+        # Arrange
+        staging_dir = project / ".staging" / "exec-1"
+        staging_dir.mkdir(parents=True)
+        _ = (staging_dir / "0.tmp").write_text("# Recovered\n")
+        journal = {
+            "mkdirs": [],
+            "renames": [[str(staging_dir / "0.tmp"), str(project / "a.md")]],
+            "deletes": [str(project / "dir" / "b.md")],
+            "remove_dirs": [],
+        }
+        _ = (staging_dir / JOURNAL_NAME).write_text(json.dumps(journal))
+
+        # Act
+        recovered = recover_staged_commits(project / ".staging")
+
+        # Assert
+        assert recovered == 1
+        assert (project / "a.md").read_text() == "# Recovered\n"
+        assert not (project / "dir" / "b.md").exists()
+        assert not staging_dir.exists()
+
+    @pytest.mark.asyncio
+    async def test_replay_keeps_outputs_installed_before_crash(
+        self, project: Path, workspace: StagedWorkspace
+    ) -> None:
+        """Test replaying a half-applied commit keeps its installed outputs."""
+        # Arrange: remove a directory, then re-stage files inside it
+        await workspace.delete(project / "dir")
+        _ = await workspace.write_file(project / "dir" / "b.md", "# New B\n")
+        _ = await workspace.write_file(project / "dir" / "c.md", "# New C\n")
+        staging_dir = project / ".staging" / "exec-3"
+        real_replace = Path.replace
+        renamed: list[Path] = []
+
+        def crash_on_second_output(self: Path, target: Path) -> Path:
+            if self.stem.isdigit():
+                if renamed:
+                    raise OSError("simulated crash")
+                renamed.append(self)
+            return real_replace(self, target)
+
+        with patch.object(Path, "replace", crash_on_second_output):
+            with pytest.raises(OSError):
+                await workspace.commit(staging_dir)
+
+        # Act
+        recovered = recover_staged_commits(project / ".staging")
+
+        # Assert
+        assert recovered == 1
+        assert (project / "dir" / "b.md").read_text() == "# New B\n"
+        assert (project / "dir" / "c.md").read_text() == "# New C\n"
+        assert not staging_dir.exists()
+
+    def test_discards_uncommitted_staging(self, project: Path) -> None:
+        """Test staging areas without a journal are discarded untouched."""
+        # Arrange
+        staging_dir = project / ".staging" / "exec-2"
+        staging_dir.mkdir(parents=True)
+        _ = (staging_dir / "0.tmp").write_text("# Partial\n")
+
+        # Act
+        recovered = recover_staged_commits(project / ".staging")
+
+        # Assert
+        assert recovered == 0
+        assert (project / "a.md").read_text() == "# A\n"
+        assert not staging_dir.exists()
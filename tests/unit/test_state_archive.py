@@ -0,0 +1,194 @@
+"""
+Tests for state_archive module.
+
+This test module covers:
+- Moving aged-out records into monthly segments
+- Lookups, iteration and date range reads across live and archived records
+- Reviving and deleting archived records
+- Expiry of whole archive months and daily compaction
+"""
+
+import gzip
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+from pydantic import BaseModel
+
+from cortex.core.state_archive import ArchivedStateTable, StateArchive
+from cortex.core.state_store import StateStore
+
+
+class _Record(BaseModel):
+    """Minimal record model for archive tests."""
+
+    name: str
+    created_at: str
+    status: str = "pending"
+
+
+def _created_at(record: _Record) -> str:
+    return record.created_at
+
+
+def _fail_archive_read(kind: str, key: str) -> str | None:
+    raise AssertionError(f"archive read of {kind}/{key}")
+
+
+NOW = datetime(2025, 6, 15, 12, 0, 0)
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> StateStore:
+    """Create a state store in a temporary .cortex directory."""
+    return StateStore.in_directory(tmp_path / ".cortex")
+
+
+@pytest.fixture
+def archive(store: StateStore, tmp_path: Path) -> StateArchive:
+    """Create an archive next to the state store."""
+    return StateArchive.in_directory(store, tmp_path / ".cortex")
+
+
+@pytest.fixture
+def table(store: StateStore, archive: StateArchive) -> ArchivedStateTable[_Record]:
+    """Create a table with records from January, February and June."""
+    table = ArchivedStateTable(store, "items", _Record, _created_at, archive)
+    for name, created_at in [
+        ("jan", "2025-01-10T00:00:00"),
+        ("feb", "2025-02-20T00:00:00"),
+        ("jun", "2025-06-01T00:00:00"),
+    ]:
+        table[name] = _Record(name=name, created_at=created_at)
+    return table
+
+
+class TestCompact:
+    """Tests for ArchivedStateTable.compact."""
+
+    def test_moves_old_records_into_monthly_segments(
+        self,
+        table: ArchivedStateTable[_Record],
+        store: StateStore,
+        archive: StateArchive,
+    ) -> None:
+        """Test records past the active window leave the live table."""
+        # Act
+        stats = table.compact(active_days=90, now=NOW)
+
+        # Assert
+        assert stats.archived == 2
+        assert store.keys("items") == ["jun"]
+        assert archive.months("items") == ["2025-01", "2025-02"]
+        assert (archive.root / "items" / "2025-01.jsonl.gz").exists()
+
+    def test_archived_records_stay_visible(
+        self, table: ArchivedStateTable[_Record]
+    ) -> None:
+        """Test lookups, iteration and range reads include archived records."""
+        # Arrange
+        _ = table.compact(active_days=90, now=NOW)
+        table.clear_cache()
+
+        # Act
+        since_feb = [record.name for record in table.created_since("2025-02-01")]
+
+        # Assert
+        assert table["jan"].created_at == "2025-01-10T00:00:00"
+        assert "feb" in table
+        assert "missing" not in table
+        assert list(table) == ["jan", "feb", "jun"]
+        assert len(table) == 3
+        assert since_feb == ["feb", "jun"]
+
+    def test_live_items_skip_archived_records(
+        self,
+        table: ArchivedStateTable[_Record],
+        archive: StateArchive,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test live_items reads the live table without loading segments."""
+        # Arrange
+        _ = table.compact(active_days=90, now=NOW)
+        table.clear_cache()
+        monkeypatch.setattr(archive, "get", _fail_archive_read)
+
+        # Act
+        items = table.live_items()
+
+        # Assert
+        assert [(key, record.name) for key, record in items] == [("jun", "jun")]
+
+    def test_expires_whole_months(
+        self, table: ArchivedStateTable[_Record], archive: StateArchive
+    ) -> None:
+        """Test archived months older than the archive retention are dropped."""
+        # Act
+        stats = table.compact(active_days=90, archive_days=130, now=NOW)
+
+        # Assert
+        assert (stats.archived, stats.expired, stats.segments_removed) == (2, 1, 1)
+        assert archive.months("items") == ["2025-02"]
+        assert "jan" not in table
+        assert len(table) == 2
+
+
+class TestArchivedRecords:
+    """Tests for writing and deleting archived records."""
+
+    def test_changed_record_is_revived(
+        self,
+        table: ArchivedStateTable[_Record],
+        store: StateStore,
+        archive: StateArchive,
+    ) -> None:
+        """Test flushing a changed archived record writes it live again."""
+        # Arrange
+        _ = table.compact(active_days=90, now=NOW)
+        table.clear_cache()
+
+        # Act
+        table["jan"].status = "done"
+        written = table.flush()
+
+        # Assert
+        assert written == 1
+        assert store.get("items", "jan") is not None
+        assert not archive.contains("items", "jan")
+        assert len(table) == 3
+
+    def test_rewriting_month_drops_revived_copies(
+        self,
+        table: ArchivedStateTable[_Record],
+        store: StateStore,
+        archive: StateArchive,
+    ) -> None:
+        """Test re-archiving a month keeps one copy of each record."""
+        # Arrange
+        _ = table.compact(active_days=90, now=NOW)
+        table["jan"] = _Record(name="jan", created_at="2025-01-10T00:00:00")
+        del table["feb"]
+
+        # Act
+        stats = table.compact(active_days=90, now=NOW)
+
+        # Assert
+        with gzip.open(archive.root / "items" / "2025-01.jsonl.gz", "rt") as f:
+            january = f.readlines()
+        assert stats.archived == 1
+        assert len(january) == 1
+        assert [row[0] for row in archive.range_rows("items")] == ["jan"]
+        assert store.count("items") == 1
+        assert "feb" not in table
+
+    def test_compact_if_due_runs_once_per_day(
+        self, table: ArchivedStateTable[_Record]
+    ) -> None:
+        """Test daily compaction is skipped after the first run of the day."""
+        # Act
+        first = table.compact_if_due(active_days=90, now=NOW)
+        second = table.compact_if_due(active_days=90, now=NOW)
+
+        # Assert
+        assert first is not None and first.archived == 2
+        assert second is None
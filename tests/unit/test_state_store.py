@@ -0,0 +1,293 @@
+"""
+Tests for state_store module.
+
+This test module covers:
+- WAL-mode database setup
+- Row-level upserts, deletes and indexed range scans
+- One-shot legacy JSON import
+- StateTable write-through and flush behavior
+"""
+
+import json
+import threading
+from pathlib import Path
+
+import pytest
+from pydantic import BaseModel
+
+from cortex.core.state_store import StateRow, StateStore, StateTable, model_rows
+
+
+class _Record(BaseModel):
+    """Minimal record model for table tests."""
+
+    name: str
+    created_at: str
+    status: str = "pending"
+
+
+def _created_at(record: _Record) -> str:
+    return record.created_at
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> StateStore:
+    """Create a state store in a temporary .cortex directory."""
+    return StateStore.in_directory(tmp_path / ".cortex")
+
+
+class TestStateStore:
+    """Tests for StateStore."""
+
+    def test_uses_wal_journal(self, store: StateStore) -> None:
+        """Test the database runs in WAL mode."""
+        # Act
+        mode = store._connection.execute(  # pyright: ignore[reportPrivateUsage]
+            "PRAGMA journal_mode"
+        ).fetchone()
+
+        # Assert
+        assert mode[0] == "wal"
+        assert store.db_path.name == "state.db"
+
+    def test_upsert_replaces_rows(self, store: StateStore) -> None:
+        """Test upserting an existing key replaces its data."""
+        # Arrange
+        store.upsert("items", "a", '{"v": 1}', "2025-01-01")
+
+        # Act
+        store.upsert("items", "a", '{"v": 2}', "2025-01-02")
+
+        # Assert
+        assert store.get("items", "a") == '{"v": 2}'
+        assert store.count("items") == 1
+
+    def test_range_keys_uses_bounds(self, store: StateStore) -> None:
+        """Test range scans honor inclusive and exclusive bounds."""
+        # Arrange
+        rows: list[StateRow] = [
+            ("old", "2025-01-01T00:00:00", "{}"),
+            ("mid", "2025-02-01T00:00:00", "{}"),
+            ("new", "2025-03-01T00:00:00", "{}"),
+        ]
+        _ = store.upsert_many("items", rows)
+
+        # Act
+        since = store.range_keys("items", since="2025-02-01T00:00:00")
+        window = store.range_keys(
+            "items", since="2025-01-01T00:00:00", until="2025-03-01T00:00:00"
+        )
+
+        # Assert
+        assert since == ["mid", "new"]
+        assert window == ["old", "mid"]
+
+    def test_range_rows_returns_data(self, store: StateStore) -> None:
+        """Test range scans can return whole rows."""
+        # Arrange
+        _ = store.upsert_many(
+            "items", [("a", "2025-01-01", '{"v": 1}'), ("b", "2025-06-01", "{}")]
+        )
+
+        # Act
+        rows = store.range_rows("items", until="2025-03-01")
+
+        # Assert
+        assert rows == [("a", "2025-01-01", '{"v": 1}')]
+
+    def test_delete_before(self, store: StateStore) -> None:
+        """Test deleting records older than a timestamp."""
+        # Arrange
+        _ = store.upsert_many(
+            "items", [("a", "2025-01-01", "{}"), ("b", "2025-06-01", "{}")]
+        )
+
+        # Act
+        removed = store.delete_before("items", "2025-03-01")
+
+        # Assert
+        assert removed == 1
+        assert store.keys("items") == ["b"]
+
+    def test_transaction_rolls_back_on_error(self, store: StateStore) -> None:
+        """Test a failed transaction leaves no partial writes."""
+        # Act
+        with pytest.raises(RuntimeError):
+            with store.transaction():
+                store.upsert("items", "a", "{}")
+                raise RuntimeError("boom")
+
+        # Assert
+        assert store.count("items") == 0
+
+    def test_rejects_invalid_kind(self, store: StateStore) -> None:
+        """Test record kinds are restricted to safe table names."""
+        # Act / Assert
+        with pytest.raises(ValueError):
+            _ = store.count("items; DROP TABLE state_meta")
+
+    def test_close_reopens_on_next_use(self, store: StateStore) -> None:
+        """Test a closed store reopens its connection for late callers."""
+        # Arrange
+        _ = store.upsert_many("items", [("a", "", "1")])
+
+        # Act
+        store.close()
+        closed = store.closed
+        count = store.count("items")
+
+        # Assert
+        assert closed
+        assert count == 1
+        assert not store.closed
+
+    async def test_run_executes_work_in_worker_thread(self, store: StateStore) -> None:
+        """Test async callers run blocking queries off the event loop."""
+        # Arrange
+        loop_thread = threading.get_ident()
+        threads: list[int] = []
+
+        def work(kind: str) -> int:
+            threads.append(threading.get_ident())
+            return store.count(kind)
+
+        # Act
+        count = await store.run(work, "items")
+
+        # Assert
+        assert count == 0
+        assert threads and threads[0] != loop_thread
+
+    def test_import_legacy_is_one_shot(self, store: StateStore, tmp_path: Path) -> None:
+        """Test a legacy file is imported once, even after it changes."""
+        # Arrange
+        legacy = tmp_path / "legacy.json"
+        _ = legacy.write_text(json.dumps({"a": 1}))
+        calls: list[Path] = []
+
+        def load(source: Path) -> dict[str, list[StateRow]]:
+            calls.append(source)
+            data = json.loads(source.read_text())
+            return {"items": [(key, "", json.dumps(v)) for key, v in data.items()]}
+
+        # Act
+        first = store.import_legacy(legacy, load)
+        _ = legacy.write_text(json.dumps({"a": 1, "bb": 2}))
+        second = store.import_legacy(legacy, load)
+
+        # Assert
+        assert (first, second) == (True, False)
+        assert len(calls) == 1
+        assert store.keys("items") == ["a"]
+
+    def test_import_legacy_does_not_revive_deleted_records(
+        self, store: StateStore, tmp_path: Path
+    ) -> None:
+        """Test records deleted after the import stay deleted."""
+        # Arrange
+        legacy = tmp_path / "legacy.json"
+        _ = legacy.write_text(json.dumps({"a": 1}))
+
+        def load(source: Path) -> dict[str, list[StateRow]]:
+            data = json.loads(source.read_text())
+            return {"items": [(key, "", json.dumps(v)) for key, v in data.items()]}
+
+        _ = store.import_legacy(legacy, load)
+        _ = store.delete("items", ["a"])
+        _ = legacy.write_text(json.dumps({"a": 1}, indent=2))
+
+        # Act
+        reopened = StateStore(store.db_path)
+        imported = reopened.import_legacy(legacy, load)
+
+        # Assert
+        assert imported is False
+        assert reopened.count("items") == 0
+
+    def test_import_legacy_missing_file(
+        self, store: StateStore, tmp_path: Path
+    ) -> None:
+        """Test a missing legacy file counts as imported with nothing to do."""
+        # Arrange
+        legacy = tmp_path / "missing.json"
+
+        # Act
+        imported = store.import_legacy(legacy, lambda _: {})
+        _ = legacy.write_text(json.dumps({"a": 1}))
+        later = store.import_legacy(legacy, lambda _: {"items": [("a", "", "1")]})
+
+        # Assert
+        assert (imported, later) == (False, False)
+        assert store.count("items") == 0
+
+
+class TestStateTable:
+    """Tests for StateTable."""
+
+    def test_assignment_writes_through(self, store: StateStore) -> None:
+        """Test assigned records are visible to a fresh table."""
+        # Arrange
+        table = StateTable(store, "records", _Record, _created_at)
+
+        # Act
+        table["a"] = _Record(name="a", created_at="2025-01-01")
+
+        # Assert
+        fresh = StateTable(store, "records", _Record, _created_at)
+        assert fresh["a"].name == "a"
+        assert len(fresh) == 1
+        assert "a" in fresh
+
+    def test_flush_writes_only_changed_records(self, store: StateStore) -> None:
+        """Test in-place mutations are written by flush."""
+        # Arrange
+        table = StateTable(store, "records", _Record, _created_at)
+        table["a"] = _Record(name="a", created_at="2025-01-01")
+        table["b"] = _Record(name="b", created_at="2025-01-02")
+        table["a"].status = "done"
+
+        # Act
+        written = table.flush()
+
+        # Assert
+        assert written == 1
+        fresh = StateTable(store, "records", _Record, _created_at)
+        assert fresh["a"].status == "done"
+
+    def test_replace_deletes_missing_keys(self, store: StateStore) -> None:
+        """Test replace leaves exactly the given records."""
+        # Arrange
+        table = StateTable(store, "records", _Record, _created_at)
+        table["a"] = _Record(name="a", created_at="2025-01-01")
+        table["b"] = _Record(name="b", created_at="2025-01-02")
+
+        # Act
+        table.replace({"b": _Record(name="b", created_at="2025-01-02")})
+
+        # Assert
+        assert list(table) == ["b"]
+
+    def test_created_since(self, store: StateStore) -> None:
+        """Test date filtered reads return only newer records."""
+        # Arrange
+        table = StateTable(store, "records", _Record, _created_at)
+        records = {
+            "old": _Record(name="old", created_at="2024-01-01T00:00:00"),
+            "new": _Record(name="new", created_at="2025-01-01T00:00:00"),
+        }
+        _ = store.upsert_many("records", model_rows(records, _created_at))
+
+        # Act
+        result = table.created_since("2024-06-01T00:00:00")
+
+        # Assert
+        assert [record.name for record in result] == ["new"]
+
+    def test_delete_missing_key_raises(self, store: StateStore) -> None:
+        """Test deleting an unknown key raises KeyError."""
+        # Arrange
+        table = StateTable(store, "records", _Record, _created_at)
+
+        # Act / Assert
+        with pytest.raises(KeyError):
+            del table["missing"]
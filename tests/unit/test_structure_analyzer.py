@@ -979,3 +979,89 @@ class TestDependencyChains:
 
         # Assert
         assert len(result) <= 20
+
+
+class TestAnalysisSession:
+    """Tests for sharing one snapshot across structure reports."""
+
+    @pytest.mark.asyncio
+    async def test_session_builds_graph_once_for_all_reports(
+        self,
+        temp_project_root: Path,
+        mocked_dependency_graph: DependencyGraph,
+        mock_file_system: FileSystemManager,
+        mock_metadata_index: MetadataIndex,
+    ):
+        """Test reports inside a session snapshot the graph only once."""
+        # Arrange
+        mocked_dependency_graph.get_all_files.return_value = ["a.md", "b.md"]  # type: ignore[reportAttributeAccessIssue]
+        mocked_dependency_graph.get_dependencies.side_effect = lambda name: (  # type: ignore[reportAttributeAccessIssue]
+            ["b.md"] if name == "a.md" else []
+        )
+        analyzer = StructureAnalyzer(
+            temp_project_root,
+            mocked_dependency_graph,
+            mock_file_system,
+            mock_metadata_index,
+        )
+
+        # Act
+        async with analyzer.analysis_session():
+            _ = await analyzer.detect_anti_patterns()
+            _ = await analyzer.measure_complexity_metrics()
+            _ = await analyzer.find_dependency_chains()
+            _ = await analyzer.measure_complexity_metrics()
+
+        # Assert
+        assert mocked_dependency_graph.get_all_files.call_count == 1  # type: ignore[reportAttributeAccessIssue]
+
+    @pytest.mark.asyncio
+    async def test_calls_outside_session_take_fresh_snapshots(
+        self,
+        temp_project_root: Path,
+        mocked_dependency_graph: DependencyGraph,
+        mock_file_system: FileSystemManager,
+        mock_metadata_index: MetadataIndex,
+    ):
+        """Test reports outside a session see later graph changes."""
+        # Arrange
+        analyzer = StructureAnalyzer(
+            temp_project_root,
+            mocked_dependency_graph,
+            mock_file_system,
+            mock_metadata_index,
+        )
+        first = await analyzer.measure_complexity_metrics()
+        mocked_dependency_graph.get_all_files.return_value = ["a.md"]  # type: ignore[reportAttributeAccessIssue]
+
+        # Act
+        second = await analyzer.measure_complexity_metrics()
+
+        # Assert
+        assert first.status == "no_files"
+        assert second.status == "analyzed"
+
+    @pytest.mark.asyncio
+    async def test_nested_sessions_share_snapshot(
+        self,
+        temp_project_root: Path,
+        mocked_dependency_graph: DependencyGraph,
+        mock_file_system: FileSystemManager,
+        mock_metadata_index: MetadataIndex,
+    ):
+        """Test nested session blocks join the outer session."""
+        # Arrange
+        analyzer = StructureAnalyzer(
+            temp_project_root,
+            mocked_dependency_graph,
+            mock_file_system,
+            mock_metadata_index,
+        )
+
+        # Act
+        async with analyzer.analysis_session() as outer:
+            async with analyzer.analysis_session() as inner:
+                same = inner is outer
+
+        # Assert
+        assert same
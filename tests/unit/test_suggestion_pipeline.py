@@ -0,0 +1,173 @@
+"""
+Tests for suggestion_pipeline module.
+
+This test module covers:
+- One shared corpus read for all suggestion types
+- Parity with the individual generators
+- Caching of analysis and results per corpus version
+- Structure loading for reorganization plans
+"""
+
+import os
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from cortex.core.async_file_utils import open_async_text_file
+from cortex.refactoring.consolidation_detector import (
+    ConsolidationDetector,
+    ConsolidationOpportunity,
+)
+from cortex.refactoring.models import DependencyGraphInput, MemoryBankStructureData
+from cortex.refactoring.reorganization_planner import ReorganizationPlanner
+from cortex.refactoring.split_recommender import (
+    SplitRecommendation,
+    SplitRecommender,
+)
+from cortex.refactoring.suggestion_pipeline import (
+    SuggestionParameters,
+    SuggestionPipeline,
+)
+
+SHARED_SECTION = "## Shared Setup\n\n" + "Install the toolchain and run it. " * 10
+OPENER = "cortex.refactoring.suggestion_pipeline.open_async_text_file"
+
+
+@pytest.fixture
+def corpus_dir(tmp_path: Path) -> Path:
+    """Create a memory bank with one duplicated section and one large file."""
+    _ = (tmp_path / "first.md").write_text("# First\n\nIntro.\n\n" + SHARED_SECTION)
+    _ = (tmp_path / "second.md").write_text("# Second\n\nOther.\n\n" + SHARED_SECTION)
+    large = "\n\n".join(
+        f"# Part {i}\n\n" + f"Part {i} covers item {i * 37}. " * 200 for i in range(12)
+    )
+    _ = (tmp_path / "large.md").write_text(large)
+    return tmp_path
+
+
+def _opportunity_keys(
+    opportunities: list[ConsolidationOpportunity],
+) -> set[tuple[str, tuple[str, ...], int]]:
+    return {
+        (o.opportunity_type, tuple(sorted(o.affected_files)), o.token_savings)
+        for o in opportunities
+    }
+
+
+def _split_keys(recommendations: list[SplitRecommendation]) -> set[tuple[str, int]]:
+    return {(r.file_path, len(r.split_points)) for r in recommendations}
+
+
+def _pipeline(memory_bank_path: Path) -> SuggestionPipeline:
+    return SuggestionPipeline(
+        memory_bank_path,
+        ConsolidationDetector(memory_bank_path),
+        SplitRecommender(memory_bank_path),
+        ReorganizationPlanner(memory_bank_path),
+    )
+
+
+class TestSuggestionPipeline:
+    """Tests for SuggestionPipeline."""
+
+    @pytest.mark.asyncio
+    async def test_matches_individual_generators(self, corpus_dir: Path) -> None:
+        """Test the shared pass finds what each generator finds on its own."""
+        # Arrange
+        pipeline = _pipeline(corpus_dir)
+        detector = ConsolidationDetector(corpus_dir)
+        recommender = SplitRecommender(corpus_dir, max_file_size=2500)
+
+        # Act
+        batch = await pipeline.generate()
+        opportunities = await detector.detect_opportunities()
+        recommendations = await recommender.suggest_file_splits()
+
+        # Assert
+        assert _opportunity_keys(batch.consolidation) == _opportunity_keys(
+            opportunities
+        )
+        assert _split_keys(batch.splits) == _split_keys(recommendations)
+        assert batch.consolidation
+        assert batch.splits
+        assert batch.reorganization is None
+
+    @pytest.mark.asyncio
+    async def test_reads_each_file_once(self, corpus_dir: Path) -> None:
+        """Test repeated runs on an unchanged corpus reuse the cached batch."""
+        # Arrange
+        pipeline = _pipeline(corpus_dir)
+        # Act
+        with patch(OPENER, wraps=open_async_text_file) as spy:
+            first = await pipeline.generate()
+            second = await pipeline.generate()
+
+        # Assert
+        assert spy.call_count == 3
+        assert second is first
+
+    @pytest.mark.asyncio
+    async def test_parameters_reuse_corpus_analysis(self, corpus_dir: Path) -> None:
+        """Test new parameters regenerate results without re-reading files."""
+        # Arrange
+        pipeline = _pipeline(corpus_dir)
+        first = await pipeline.generate()
+        # Act
+        with patch(OPENER, wraps=open_async_text_file) as spy:
+            strict = await pipeline.generate(SuggestionParameters(min_similarity=0.95))
+
+        # Assert
+        assert spy.call_count == 0
+        assert strict is not first
+        assert strict.corpus_version == first.corpus_version
+        assert pipeline.consolidation_detector.min_similarity == 0.95
+
+    @pytest.mark.asyncio
+    async def test_changed_file_invalidates_cache(self, corpus_dir: Path) -> None:
+        """Test editing a file produces a new corpus version and new results."""
+        # Arrange
+        pipeline = _pipeline(corpus_dir)
+        first = await pipeline.generate()
+        second_file = corpus_dir / "second.md"
+        _ = second_file.write_text("# Second\n\nNothing shared any more.\n")
+        stat = second_file.stat()
+        os.utime(second_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        # Act
+        updated = await pipeline.generate()
+
+        # Assert
+        assert updated.corpus_version != first.corpus_version
+        shared = [str(corpus_dir / "first.md"), str(corpus_dir / "second.md")]
+        assert any(sorted(o.affected_files) == shared for o in first.consolidation)
+        assert not any(
+            str(second_file) in o.affected_files for o in updated.consolidation
+        )
+
+    @pytest.mark.asyncio
+    async def test_structure_loaded_once_per_version(self, corpus_dir: Path) -> None:
+        """Test the structure loader runs once and feeds the planner."""
+        # Arrange
+        pipeline = _pipeline(corpus_dir)
+        inputs = (MemoryBankStructureData(), DependencyGraphInput())
+        load_structure = AsyncMock(return_value=inputs)
+        pipeline.reorganization_planner.create_reorganization_plan = AsyncMock(
+            return_value=None
+        )
+
+        # Act
+        _ = await pipeline.generate(
+            SuggestionParameters(goal="complexity"), load_structure
+        )
+        _ = await pipeline.generate(
+            SuggestionParameters(goal="category_based"), load_structure
+        )
+
+        # Assert
+        load_structure.assert_awaited_once()
+        planner = pipeline.reorganization_planner.create_reorganization_plan
+        assert planner.await_count == 2
+        assert planner.await_args is not None
+        assert planner.await_args.kwargs["optimize_for"] == "category_based"
+        assert planner.await_args.kwargs["structure_data"] is inputs[0]
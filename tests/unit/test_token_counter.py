@@ -462,6 +462,21 @@ class TestTokenCounterCaching:
         assert count1 > 0
         assert count2 > 0
 
+    def test_encoding_shared_between_counters(self):
+        """Test counters of different projects share one loaded encoding."""
+        # Arrange
+        first = TokenCounter()
+        _ = first.count_tokens("load the encoding")
+
+        # Act
+        with patch.object(TokenCounter, "_load_tiktoken_with_timeout") as mock_load:
+            second = TokenCounter()
+            _ = second.count_tokens("reuse it")
+
+        # Assert
+        mock_load.assert_not_called()
+        assert second.encoding_impl is first.encoding_impl
+
 
 class TestTokenCounterEdgeCases:
     """Tests for edge cases and error handling."""
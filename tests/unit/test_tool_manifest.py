@@ -0,0 +1,224 @@
+"""
+Tests for tool_manifest and lazy tool registration.
+
+This test module covers:
+- The checked-in tool manifest matching the registered tools
+- Listing tools from the manifest without importing their modules
+- Importing a tool module on first call and retrying after failures
+- Tools loaded from their listed (importable) modules
+- Stale manifests (other tool modules or sources) being ignored
+- Deferred prompt registration
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from mcp.server.fastmcp.exceptions import ToolError
+
+from cortex.server import CortexMCP, LazyTool
+from cortex.tools import TOOL_MODULES
+from cortex.tools.manifest import (
+    MANIFEST_PATH,
+    collect_tool_specs,
+    load_manifest,
+    register_from_manifest,
+    render_manifest,
+    source_digests,
+)
+
+HEALTH_TOOL = "check_mcp_connection_health"
+
+
+@pytest.fixture
+def server() -> CortexMCP:
+    """Create a server with every manifest tool listed lazily."""
+    server = CortexMCP("test")
+    assert register_from_manifest(server)
+    return server
+
+
+class TestManifest:
+    """Tests for the checked-in manifest."""
+
+    def test_manifest_is_up_to_date(self) -> None:
+        """Test the manifest matches the tools the modules register."""
+        # Act (a fresh interpreter registers exactly the production modules)
+        completed = subprocess.run(
+            [sys.executable, "-m", "cortex.tools.manifest", "--check"],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+
+        # Assert
+        assert (
+            completed.returncode == 0
+        ), "Tool manifest is stale; run `python -m cortex.tools.manifest`"
+
+    def test_collected_specs_render_as_manifest(self) -> None:
+        """Test collected specs name each tool's defining module."""
+        # Act
+        modules = ["cortex.tools.connection_health"]
+        specs = collect_tool_specs(modules)
+        rendered = json.loads(render_manifest(specs, modules, source_digests(modules)))
+
+        # Assert
+        health = next(t for t in rendered["tools"] if t["name"] == HEALTH_TOOL)
+        assert health["module"] == "cortex.tools.connection_health"
+        assert health["function"] == HEALTH_TOOL
+        assert list(rendered["sources"]) == ["tools/connection_health.py"]
+
+    def test_tools_load_from_listed_modules(self) -> None:
+        """Test tools are loaded from modules that import on their own."""
+        # Arrange
+        specs = load_manifest()
+        assert specs is not None
+        listed = {f"cortex.tools.{name}" for name in TOOL_MODULES}
+        # load_context is defined in a helper module that imports its facade
+        script = (
+            "from cortex.server import CortexMCP\n"
+            "from cortex.tools.manifest import register_from_manifest\n"
+            "server = CortexMCP('probe')\n"
+            "register_from_manifest(server)\n"
+            "server.load_tool('load_context')\n"
+        )
+
+        # Act
+        completed = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, text=True, check=False
+        )
+
+        # Assert
+        assert {spec.module for spec in specs} <= listed
+        assert completed.returncode == 0, completed.stderr
+
+    def test_invalid_manifest_is_ignored(self, tmp_path: Path) -> None:
+        """Test a manifest of another version is not loaded."""
+        # Arrange
+        path = tmp_path / "manifest.json"
+        _ = path.write_text(json.dumps({"version": 0, "tools": []}))
+
+        # Act / Assert
+        assert load_manifest(path) is None
+        assert load_manifest(tmp_path / "missing.json") is None
+        assert not register_from_manifest(CortexMCP("test"), path)
+
+    def test_manifest_of_other_tool_modules_is_ignored(self) -> None:
+        """Test a manifest is stale once the tool module list changes."""
+        # Arrange
+        modules = [f"cortex.tools.{name}" for name in TOOL_MODULES]
+
+        # Act / Assert
+        assert load_manifest(modules=modules) is not None
+        assert load_manifest(modules=[*modules, "cortex.tools.new_tools"]) is None
+
+    def test_manifest_of_changed_sources_is_ignored(self, tmp_path: Path) -> None:
+        """Test a manifest is stale once a tool source file changes."""
+        # Arrange
+        manifest = json.loads(MANIFEST_PATH.read_text())
+        source = next(iter(manifest["sources"]))
+        manifest["sources"][source] = "0" * 64
+        path = tmp_path / "manifest.json"
+        _ = path.write_text(json.dumps(manifest))
+
+        # Act / Assert
+        assert load_manifest(path) is None
+        assert not register_from_manifest(CortexMCP("test"), path)
+
+
+class TestLazyTools:
+    """Tests for CortexMCP lazy tool registration."""
+
+    @pytest.mark.asyncio
+    async def test_lists_manifest_tools(self, server: CortexMCP) -> None:
+        """Test lazy tools are listed with their manifest schemas."""
+        # Arrange
+        specs = {spec.name: spec for spec in load_manifest() or []}
+
+        # Act
+        tools = await server.list_tools()
+
+        # Assert
+        assert {tool.name for tool in tools} == set(specs)
+        health = next(tool for tool in tools if tool.name == HEALTH_TOOL)
+        assert health.inputSchema == specs[HEALTH_TOOL].parameters
+        assert health.outputSchema == specs[HEALTH_TOOL].output_schema
+        assert not server.is_loaded(HEALTH_TOOL)
+
+    @pytest.mark.asyncio
+    async def test_first_call_loads_module(self, server: CortexMCP) -> None:
+        """Test calling a lazy tool imports it and runs the real function."""
+        # Act
+        result = await server.call_tool(HEALTH_TOOL, {})
+
+        # Assert
+        assert '"status": "success"' in str(result)
+        assert server.is_loaded(HEALTH_TOOL)
+        assert len(await server.list_tools()) == len(load_manifest() or [])
+
+    def test_failed_import_keeps_lazy_tool(self, server: CortexMCP) -> None:
+        """Test a tool whose module fails to import stays listed for retry."""
+        # Arrange
+        server.add_lazy_tool(
+            name="broken",
+            module="cortex.tools.does_not_exist",
+            function="broken",
+            description="Broken tool",
+            parameters={"type": "object", "properties": {}},
+        )
+
+        # Act
+        with pytest.raises(ToolError):
+            _ = server.load_tool("broken")
+
+        # Assert
+        assert isinstance(
+            next(t for t in server.registered_tools() if t.name == "broken"),
+            LazyTool,
+        )
+
+    @pytest.mark.asyncio
+    async def test_prompts_load_on_first_request(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test deferred prompt modules are imported by the first listing."""
+        # Arrange
+        _ = (tmp_path / "deferred_prompts_probe.py").write_text("LOADED = True\n")
+        monkeypatch.setattr(sys, "path", [str(tmp_path), *sys.path])
+        server = CortexMCP("test")
+        server.defer_prompts(["deferred_prompts_probe"])
+        loaded_before = "deferred_prompts_probe" in sys.modules
+
+        # Act
+        prompts = await server.list_prompts()
+
+        # Assert
+        assert not loaded_before
+        assert "deferred_prompts_probe" in sys.modules
+        assert prompts == []
+
+
+class TestServerStartup:
+    """Tests for importing the server entry point."""
+
+    def test_startup_imports_no_tool_modules(self) -> None:
+        """Test the default startup lists tools without importing them."""
+        # Arrange
+        script = (
+            "import sys, cortex.main\n"
+            "print(sorted(m for m in sys.modules if m.startswith('cortex.tools.')))\n"
+        )
+
+        # Act
+        completed = subprocess.run(
+            [sys.executable, "-c", script],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        # Assert
+        assert completed.stdout.strip() == "['cortex.tools.manifest']"
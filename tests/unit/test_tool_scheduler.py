@@ -0,0 +1,213 @@
+"""
+Tests for tool_scheduler.py - Per-cost-class tool concurrency pools.
+
+This test module covers:
+- Cost class derivation from timeout tiers
+- Pool isolation between cost classes
+- Per-project fairness and priority aging of queued calls
+- Queue depth and wait time metrics
+- Project keys of calls scheduled by with_mcp_stability
+"""
+
+import asyncio
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from cortex.core.constants import (
+    MCP_TOOL_TIMEOUT_COMPLEX,
+    MCP_TOOL_TIMEOUT_FAST,
+    MCP_TOOL_TIMEOUT_MEDIUM,
+    MCP_TOOL_TIMEOUT_VERY_COMPLEX,
+)
+from cortex.core.mcp_stability import with_mcp_stability
+from cortex.core.tool_scheduler import CostClass, ToolScheduler, cost_class_for_timeout
+
+
+async def _hold(
+    scheduler: ToolScheduler,
+    release: asyncio.Event,
+    order: list[str],
+    label: str,
+    project: str = "",
+    priority: int = 0,
+) -> None:
+    async with scheduler.slot(CostClass.COMPLEX, project=project, priority=priority):
+        order.append(label)
+        _ = await release.wait()
+
+
+async def _settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestCostClassForTimeout:
+    """Tests for cost_class_for_timeout."""
+
+    def test_timeout_tiers_map_to_cost_classes(self) -> None:
+        """Test each timeout tier selects its pool."""
+        # Act & Assert
+        assert cost_class_for_timeout(MCP_TOOL_TIMEOUT_FAST) == CostClass.FAST
+        assert cost_class_for_timeout(MCP_TOOL_TIMEOUT_MEDIUM) == CostClass.MEDIUM
+        assert cost_class_for_timeout(MCP_TOOL_TIMEOUT_COMPLEX) == CostClass.COMPLEX
+        assert (
+            cost_class_for_timeout(MCP_TOOL_TIMEOUT_VERY_COMPLEX) == CostClass.COMPLEX
+        )
+
+
+class TestToolScheduler:
+    """Tests for ToolScheduler."""
+
+    @pytest.mark.asyncio
+    async def test_full_complex_pool_does_not_block_fast_calls(self) -> None:
+        """Test a saturated pool leaves other cost classes available."""
+        # Arrange
+        scheduler = ToolScheduler({CostClass.COMPLEX: 1})
+        release = asyncio.Event()
+        order: list[str] = []
+        holder = asyncio.create_task(_hold(scheduler, release, order, "complex"))
+        await _settle()
+
+        # Act
+        async with scheduler.slot(CostClass.FAST):
+            fast_ran = True
+        release.set()
+        await holder
+
+        # Assert
+        assert fast_ran
+        assert order == ["complex"]
+
+    @pytest.mark.asyncio
+    async def test_projects_with_fewer_running_calls_go_first(self) -> None:
+        """Test a queued call of an idle project overtakes a busy project."""
+        # Arrange
+        scheduler = ToolScheduler({CostClass.COMPLEX: 2}, aging_seconds=1000)
+        first, rest = asyncio.Event(), asyncio.Event()
+        order: list[str] = []
+        tasks = [
+            asyncio.create_task(_hold(scheduler, first, order, "a1", "a")),
+            asyncio.create_task(_hold(scheduler, rest, order, "a2", "a")),
+        ]
+        await _settle()
+        tasks.append(asyncio.create_task(_hold(scheduler, rest, order, "a3", "a")))
+        await _settle()
+        tasks.append(asyncio.create_task(_hold(scheduler, rest, order, "b1", "b")))
+        await _settle()
+
+        # Act
+        first.set()
+        await _settle()
+        rest.set()
+        _ = await asyncio.gather(*tasks)
+
+        # Assert
+        assert order == ["a1", "a2", "b1", "a3"]
+
+    @pytest.mark.asyncio
+    async def test_waiting_raises_priority(self) -> None:
+        """Test a long-queued call overtakes a newer higher-priority call."""
+        # Arrange
+        scheduler = ToolScheduler({CostClass.COMPLEX: 1}, aging_seconds=0.01)
+        release = asyncio.Event()
+        order: list[str] = []
+        tasks = [asyncio.create_task(_hold(scheduler, release, order, "holder"))]
+        await _settle()
+        tasks.append(asyncio.create_task(_hold(scheduler, release, order, "old")))
+        await asyncio.sleep(0.1)
+        tasks.append(
+            asyncio.create_task(_hold(scheduler, release, order, "new", priority=2))
+        )
+        await _settle()
+
+        # Act
+        release.set()
+        _ = await asyncio.gather(*tasks)
+
+        # Assert
+        assert order == ["holder", "old", "new"]
+
+    @pytest.mark.asyncio
+    async def test_queue_metrics(self) -> None:
+        """Test queue depth and wait times are reported per pool."""
+        # Arrange
+        scheduler = ToolScheduler({CostClass.COMPLEX: 1})
+        release = asyncio.Event()
+        order: list[str] = []
+        tasks = [
+            asyncio.create_task(_hold(scheduler, release, order, label))
+            for label in ("first", "second")
+        ]
+        await _settle()
+        queued = next(s for s in scheduler.stats() if s.cost_class == "complex")
+
+        # Act
+        await asyncio.sleep(0.02)
+        release.set()
+        _ = await asyncio.gather(*tasks)
+        stats = next(s for s in scheduler.stats() if s.cost_class == "complex")
+
+        # Assert
+        assert (queued.active, queued.queued) == (1, 1)
+        assert stats.active == 0
+        assert stats.queued == 0
+        assert stats.max_queue_depth == 1
+        assert stats.completed_waits == 2
+        assert stats.max_wait_ms >= 10
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_leaves_queue(self) -> None:
+        """Test cancelling a queued call frees its queue position."""
+        # Arrange
+        scheduler = ToolScheduler({CostClass.COMPLEX: 1})
+        release = asyncio.Event()
+        order: list[str] = []
+        holder = asyncio.create_task(_hold(scheduler, release, order, "holder"))
+        await _settle()
+        waiter = asyncio.create_task(_hold(scheduler, release, order, "waiter"))
+        await _settle()
+
+        # Act
+        _ = waiter.cancel()
+        _ = await asyncio.gather(waiter, return_exceptions=True)
+        release.set()
+        await holder
+
+        # Assert
+        stats = next(s for s in scheduler.stats() if s.cost_class == "complex")
+        assert (stats.active, stats.queued) == (0, 0)
+        assert order == ["holder"]
+
+
+class TestStabilitySchedulingKey:
+    """Tests for the project key with_mcp_stability schedules calls under."""
+
+    @pytest.mark.asyncio
+    async def test_calls_are_keyed_by_resolved_project_root(
+        self, tmp_path: Path
+    ) -> None:
+        """Test calls without project_root count against the detected project."""
+        # Arrange
+        scheduler = ToolScheduler()
+        projects: list[str] = []
+
+        async def tool() -> None:
+            pool = scheduler._pools[CostClass.EXTERNAL]
+            projects.extend(p for p, n in pool.active_by_project.items() if n)
+
+        # Act
+        with (
+            patch(
+                "cortex.core.mcp_stability.get_tool_scheduler", return_value=scheduler
+            ),
+            patch(
+                "cortex.managers.initialization.get_project_root",
+                return_value=tmp_path,
+            ),
+        ):
+            await with_mcp_stability(tool, cost_class=CostClass.EXTERNAL)
+
+        # Assert
+        assert projects == [str(tmp_path)]
@@ -0,0 +1,179 @@
+"""
+Tests for tracing.py - Span tracing and profiling of MCP tool calls.
+
+This test module covers:
+- Spans as no-ops outside a trace
+- Span nesting through awaits, child tasks and @traced functions
+- Ring buffer and per-trace span limits
+- Latency percentiles per tool and per span
+- cProfile capture armed for the next call of a tool
+- Tracing of every call made through the server
+"""
+
+import asyncio
+
+import pytest
+
+from cortex.core.tracing import Tracer, span, traced
+from cortex.server import CortexMCP
+
+
+@pytest.fixture
+def tracer(monkeypatch: pytest.MonkeyPatch) -> Tracer:
+    """Replace the global tracer with a fresh one."""
+    fresh = Tracer()
+    monkeypatch.setattr("cortex.core.tracing._tracer", fresh)
+    return fresh
+
+
+@traced("test.count")
+def _count(text: str) -> int:
+    return len(text)
+
+
+@traced("test.load")
+async def _load(text: str) -> int:
+    await asyncio.sleep(0)
+    return _count(text)
+
+
+class TestSpans:
+    """Tests for span() and @traced."""
+
+    def test_span_outside_trace_records_nothing(self, tracer: Tracer) -> None:
+        """Test instrumented code runs untraced without a tool call."""
+        # Act
+        with span("test.idle"):
+            result = _count("abc")
+
+        # Assert
+        assert result == 3
+        assert tracer.span_latency() == []
+        assert tracer.recent_traces() == []
+
+    @pytest.mark.asyncio
+    async def test_spans_nest_through_awaits_and_tasks(self, tracer: Tracer) -> None:
+        """Test spans record their parents, including in child tasks."""
+        # Act
+        with tracer.trace_tool("load_context"):
+            with span("test.outer"):
+                _ = await asyncio.gather(_load("a"), _load("bc"))
+
+        # Assert
+        trace = tracer.recent_traces()[0]
+        by_id = {s.span_id: s for s in trace.spans}
+        outer = next(s for s in trace.spans if s.name == "test.outer")
+        loads = [s for s in trace.spans if s.name == "test.load"]
+        counts = [s for s in trace.spans if s.name == "test.count"]
+        assert outer.parent_id is None
+        assert [s.parent_id for s in loads] == [outer.span_id] * 2
+        assert all(by_id[s.parent_id or 0].name == "test.load" for s in counts)
+        assert trace.tool == "load_context"
+        assert trace.duration_ms >= outer.duration_ms
+
+    @pytest.mark.asyncio
+    async def test_errors_are_recorded(self, tracer: Tracer) -> None:
+        """Test a raising span and call record the exception type."""
+        # Act
+        with pytest.raises(ValueError):
+            with tracer.trace_tool("validate"):
+                with span("test.parse"):
+                    raise ValueError("bad schema")
+
+        # Assert
+        trace = tracer.recent_traces()[0]
+        assert trace.error == "ValueError"
+        assert trace.spans[0].error == "ValueError"
+
+
+class TestTracer:
+    """Tests for Tracer."""
+
+    def test_ring_buffer_and_span_limit(self) -> None:
+        """Test old traces and spans beyond the limit are dropped."""
+        # Arrange
+        tracer = Tracer(buffer_size=2, max_spans=3)
+
+        # Act
+        for tool in ("first", "second", "third"):
+            with tracer.trace_tool(tool):
+                for _ in range(5):
+                    with span("test.step"):
+                        pass
+
+        # Assert
+        traces = tracer.recent_traces()
+        assert [t.tool for t in traces] == ["third", "second"]
+        assert (len(traces[0].spans), traces[0].dropped_spans) == (3, 2)
+        assert tracer.span_latency()[0].count == 15
+
+    def test_latency_percentiles(self) -> None:
+        """Test p50 and p95 are taken from the recorded calls."""
+        # Arrange
+        tracer = Tracer()
+
+        # Act
+        for _ in range(20):
+            with tracer.trace_tool("fast"):
+                pass
+        with tracer.trace_tool("slow"):
+            _ = sum(range(200_000))
+
+        # Assert
+        slow, fast = tracer.tool_latency()
+        assert (slow.name, fast.name) == ("slow", "fast")
+        assert fast.count == 20
+        assert fast.p50_ms <= fast.p95_ms <= fast.max_ms
+        assert [s.name for s in tracer.tool_latency("fast")] == ["fast"]
+
+    def test_armed_profile_captures_next_call_only(self) -> None:
+        """Test a requested profile is attached to one trace."""
+        # Arrange
+        tracer = Tracer()
+        tracer.request_profile("validate")
+
+        # Act
+        for _ in range(2):
+            with tracer.trace_tool("validate"):
+                _ = _count("profiled")
+
+        # Assert
+        latest, profiled = tracer.recent_traces()
+        assert latest.profile is None
+        assert profiled.profile is not None
+        assert "function calls" in profiled.profile
+
+    def test_disabled_tracer_records_nothing(self) -> None:
+        """Test tracing can be switched off."""
+        # Arrange
+        tracer = Tracer(enabled=False)
+
+        # Act
+        with tracer.trace_tool("validate"):
+            pass
+
+        # Assert
+        assert tracer.recent_traces() == []
+
+
+class TestServerTracing:
+    """Tests for tracing in CortexMCP.call_tool."""
+
+    @pytest.mark.asyncio
+    async def test_tool_calls_are_traced(self, tracer: Tracer) -> None:
+        """Test calls through the server produce traces with spans."""
+        # Arrange
+        server = CortexMCP("test")
+
+        @server.tool()
+        async def echo(text: str) -> str:
+            return str(await _load(text))
+
+        # Act
+        _ = await server.call_tool("echo", {"text": "hello"})
+
+        # Assert
+        trace = tracer.recent_traces()[0]
+        assert trace.tool == "echo"
+        assert [s.name for s in trace.spans] == ["test.load", "test.count"]
+        assert tracer.tool_latency("echo")[0].count == 1